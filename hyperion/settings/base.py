@@ -19,11 +19,44 @@
 # pylint: disable=line-too-long, invalid-name
 
 import os
+import stat
+import tempfile
 
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 BASE_DIR = Path(__file__).parent.parent.parent
 
+
+def _private_directory(path: Path) -> Path:
+    """Create a directory only accessible by the user running hyperion
+
+    An existing directory must be owned by the user and must not be
+    accessible by others. Otherwise another user could read or inject
+    the pickled cache entries in it.
+    """
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    info = path.stat()
+    if info.st_uid != os.getuid() or stat.S_IMODE(info.st_mode) & 0o077:
+        raise ImproperlyConfigured(
+            f'{path} must be owned by the user running hyperion and must '
+            'only be accessible by this user (mode 0700)'
+        )
+
+    return path
+
+
+# directory for the runtime data of hyperion like the shared caches of the
+# worker processes. all worker processes of a host must use the same
+# directory.
+RUN_DIR = Path(
+    os.environ.get("HYPERION_RUN_DIR")
+    or Path(os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir())
+    / f'hyperion-{os.getuid()}'
+)
+
 DEBUG = 0  # no debug output as default
 
 ENV_HOSTS = os.environ.get("ALLOWED_HOSTS")
@@ -79,9 +112,113 @@ STATIC_ROOT = BASE_DIR / 'static'
 SELENE = {
     'GMP_SOCKET_PATH': os.environ.get(
         "GMP_SOCKET_PATH", '/var/run/gvmd.sock'  # add your gvmd.sock path here
+    ),
+    # max number of idle gvmd connections kept open per worker process
+    'GMP_POOL_SIZE': int(os.environ.get("GMP_POOL_SIZE", 10)),
+    # close idle gvmd connections after this amount of seconds
+    'GMP_POOL_IDLE_TIMEOUT': int(os.environ.get("GMP_POOL_IDLE_TIMEOUT", 60)),
+    # close gvmd connections after this amount of seconds regardless of usage
+    'GMP_POOL_MAX_LIFETIME': int(os.environ.get("GMP_POOL_MAX_LIFETIME", 3600)),
+    # close idle gvmd connections authenticated for a session after this
+    # amount of seconds
+    'GMP_SESSION_IDLE_TIMEOUT': int(
+        os.environ.get("GMP_SESSION_IDLE_TIMEOUT", 30)
+    ),
+    # alias of the django cache for revoking the authenticated gvmd
+    # connections of all worker processes after users have been changed or
+    # deleted. it must be shared by all worker processes. an empty value
+    # disables reusing the connections authenticated for a session
+    'GMP_CREDENTIALS_CACHE': os.environ.get(
+        "GMP_CREDENTIALS_CACHE", 'gmp_credentials'
     )
+    or None,
+    # max number of top-level query fields resolved concurrently per request,
+    # each using a gvmd connection of its own. 0 disables the parallel
+    # execution
+    'PARALLEL_QUERY_FIELDS': int(os.environ.get("PARALLEL_QUERY_FIELDS", 0)),
+    # alias of the django cache for the responses of SecInfo queries, e.g.
+    # 'secinfo' if SECINFO_CACHE_DIR is set. an empty value disables the cache
+    'SECINFO_CACHE': os.environ.get("SECINFO_CACHE") or None,
+    # max number of seconds a SecInfo response is cached
+    'SECINFO_CACHE_TIMEOUT': int(os.environ.get("SECINFO_CACHE_TIMEOUT", 3600)),
+    # request the feed versions from gvmd again after this amount of seconds
+    'SECINFO_FEED_CHECK_INTERVAL': int(
+        os.environ.get("SECINFO_FEED_CHECK_INTERVAL", 60)
+    ),
+    # send identical concurrent SecInfo commands only once per worker process
+    'SECINFO_COALESCE': os.environ.get("SECINFO_COALESCE", '1') == '1',
+    # directory of the lock files for filling the SecInfo cache only once
+    # across all worker processes. it must only be writable by the user
+    # running hyperion. an empty value disables the lock files
+    'SECINFO_LOCK_DIR': os.environ.get("SECINFO_LOCK_DIR") or None,
+    # share the SecInfo responses between all users. only enable it if all
+    # users are allowed to access the SecInfo data and user tags aren't used
+    # for it
+    'SECINFO_SHARED': os.environ.get("SECINFO_SHARED", '0') == '1',
+    # alias of the django cache for scanners, port lists, scan configs, report
+    # formats, credentials and schedules. changes are only seen by all worker
+    # processes if the cache is shared by them, e.g. 'secinfo' if
+    # SECINFO_CACHE_DIR is set. an empty value disables the cache
+    'ENTITY_CACHE': os.environ.get("ENTITY_CACHE") or None,
+    # max number of seconds these entities are cached
+    'ENTITY_CACHE_TIMEOUT': int(os.environ.get("ENTITY_CACHE_TIMEOUT", 300)),
+    # directory for caching the reports of finished scans. an empty value
+    # disables the cache
+    'REPORT_CACHE_DIR': os.environ.get("REPORT_CACHE_DIR") or None,
+    # max number of bytes of all cached reports (1 GiB)
+    'REPORT_CACHE_MAX_SIZE': int(
+        os.environ.get("REPORT_CACHE_MAX_SIZE", 1024 * 1024 * 1024)
+    ),
+    # alias of the django cache for the capabilities of the users. changes of
+    # groups, permissions, roles and users are only seen by all worker
+    # processes if the cache is shared by them, e.g. 'secinfo' if
+    # SECINFO_CACHE_DIR is set. an empty value disables the cache
+    'CAPABILITIES_CACHE': os.environ.get("CAPABILITIES_CACHE") or None,
+    # max number of seconds the capabilities of a user are cached
+    'CAPABILITIES_CACHE_TIMEOUT': int(
+        os.environ.get("CAPABILITIES_CACHE_TIMEOUT", 300)
+    ),
 }
 
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # file based cache for the generation of the credentials of the users.
+    # all worker processes must share it, otherwise changed credentials only
+    # revoke the connections of the worker process handling the change.
+    # workers on several hosts need a cache shared by all hosts instead, e.g.
+    # memcached. its entries are pickled, therefore the directory must only
+    # be accessible by the user running hyperion
+    'gmp_credentials': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': str(
+            _private_directory(
+                Path(
+                    os.environ.get("GMP_CREDENTIALS_CACHE_DIR")
+                    or _private_directory(RUN_DIR) / 'gmp_credentials'
+                )
+            )
+        ),
+    },
+}
+
+# file based cache shared by all worker processes. its entries are pickled,
+# therefore the directory must only be writable by the user running
+# hyperion and must not be placed in a world-writable directory like /tmp
+SECINFO_CACHE_DIR = os.environ.get("SECINFO_CACHE_DIR")
+
+if SECINFO_CACHE_DIR:
+    CACHES['secinfo'] = {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': SECINFO_CACHE_DIR,
+        'OPTIONS': {
+            'MAX_ENTRIES': int(
+                os.environ.get("SECINFO_CACHE_MAX_ENTRIES", 10000)
+            ),
+        },
+    }
+
 SESSION_ENGINE = 'django.contrib.sessions.backends.file'
 
 # session timeout in seconds (15 min)
@@ -0,0 +1,733 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Cache the responses of rarely changing GMP commands across requests
+
+CVE, CPE, CERT-Bund, DFN-CERT and NVT data only changes when gvmd has loaded
+a new version of the corresponding feed. Therefore the responses of the
+SecInfo commands are kept in a django cache keyed by the command, its
+arguments and the current version of the feed. The feed versions are
+requested from gvmd at most once per check interval. Entries of previous
+versions aren't used anymore after a feed has been updated and expire.
+
+Identical SecInfo commands sent concurrently, e.g. after a feed update, are
+coalesced into a single gvmd command per worker process. Optionally the
+worker processes of a host serialize filling the cache via lock files.
+
+The responses contain user specific data like user tags and are only
+returned to gvmd users allowed to access them. Therefore the entries are
+kept per user by default and become invalid as soon as the user changes any
+data.
+
+Optionally the responses for configuration entities like scanners, port
+lists and scan configs are cached per user for a fixed time too. They are
+invalidated for all users whenever an entity of the same type is changed via
+selene.
+"""
+
+import copy
+import fcntl
+import hashlib
+import os
+import threading
+import time
+import uuid
+import zlib
+
+from collections import Counter
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple
+
+from lxml import etree
+
+from django.core.cache.backends.base import BaseCache
+
+from gvm.errors import GvmResponseError
+
+from selene.connections import get_pruned_paths
+from selene.gmp import is_read_only_command
+
+DEFAULT_SECINFO_CACHE_TIMEOUT = 3600  # in seconds
+DEFAULT_SECINFO_FEED_CHECK_INTERVAL = 60  # in seconds
+
+# like the default timeout for reading a response from gvmd
+DEFAULT_LOCK_TIMEOUT = 60  # in seconds
+LOCK_POLL_INTERVAL = 0.05  # in seconds
+LOCK_STRIPES = 256
+
+SECINFO_KEY_PREFIX = 'selene:secinfo'
+SECINFO_FEEDS_KEY = f'{SECINFO_KEY_PREFIX}:feeds'
+
+INFO_TYPE_FEEDS = {
+    'CERT_BUND_ADV': 'CERT',
+    'CPE': 'SCAP',
+    'CVE': 'SCAP',
+    'DFN_CERT_ADV': 'CERT',
+    'NVT': 'NVT',
+    'OVALDEF': 'SCAP',
+}
+
+NVT_COMMANDS = ('get_nvt', 'get_nvts', 'get_nvt_families')
+INFO_COMMANDS = ('get_info', 'get_info_list')
+
+# arguments selecting data of scan configs which may change at any time
+SCAN_CONFIG_ARGUMENTS = ('config_id', 'preferences_config_id')
+
+
+def get_secinfo_feed(
+    command: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Optional[str]:
+    """Return the type of the feed providing the response of a GMP command
+
+    Returns None if the response doesn't consist of SecInfo data only.
+    """
+    if command in NVT_COMMANDS:
+        if any(kwargs.get(name) is not None for name in SCAN_CONFIG_ARGUMENTS):
+            return None
+        return 'NVT'
+
+    if command not in INFO_COMMANDS:
+        return None
+
+    # info_type is the second argument of get_info and the first one of
+    # get_info_list
+    position = 1 if command == 'get_info' else 0
+    info_type = kwargs.get(
+        'info_type', args[position] if len(args) > position else None
+    )
+    info_type = getattr(info_type, 'value', info_type)
+    if info_type is None:
+        return None
+
+    return INFO_TYPE_FEEDS.get(str(info_type).upper())
+
+
+def parse_feed_versions(response: etree.Element) -> Dict[str, str]:
+    """Return the versions of the feeds of a get_feeds response by feed type
+
+    Feeds which are currently synced are left out.
+    """
+    versions = {}
+    for feed in response.iterfind('feed'):
+        if feed.find('currently_syncing') is not None:
+            continue
+
+        feed_type = feed.findtext('type')
+        version = feed.findtext('version')
+        if feed_type and version:
+            versions[feed_type] = version
+    return versions
+
+
+def make_digest(*parts: Hashable) -> str:
+    """Return a digest of the representation of the parts"""
+    return hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()
+
+
+def make_cache_key(prefix: str, *parts: Hashable) -> str:
+    # keys of some cache backends are limited in length and characters
+    return f'{prefix}:{make_digest(*parts)}'
+
+
+def dump_response(response: etree.Element) -> bytes:
+    return etree.tostring(response)
+
+
+def load_response(data: bytes) -> etree.Element:
+    parser = etree.XMLParser(huge_tree=True)
+    return etree.fromstring(data, parser)
+
+
+def _copy_error(error: BaseException) -> BaseException:
+    # raising the same instance in several threads would extend the shared
+    # traceback concurrently. a copy starts with an empty traceback.
+    try:
+        return copy.copy(error)
+    except Exception:  # pylint: disable=broad-except
+        return RuntimeError(f'Shared call failed with {error!r}')
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+    def wait(self) -> Any:
+        self.done.wait()
+        if self.error is not None:
+            raise _copy_error(self.error) from self.error
+        return self.result
+
+
+class SingleFlight:
+    """Share the result of a call between callers running it concurrently
+
+    The first caller for a key runs the function. Callers with the same key
+    arriving while it runs wait for it and get its result or a copy of its
+    error. The result isn't kept afterwards.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def call(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                leader = False
+            else:
+                leader = True
+                flight = _Flight()
+                self._flights[key] = flight
+
+        if not leader:
+            return flight.wait()
+
+        try:
+            flight.result = func()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                # the calls may have been reset meanwhile
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+            flight.done.set()
+
+    def reset(self):
+        """Forget all running calls, e.g. of the threads of the parent
+        process in a forked worker"""
+        self._flights = {}
+        self._lock = threading.Lock()
+
+
+@contextmanager
+def lock_file(
+    directory: Optional[str],
+    key: str,
+    *,
+    timeout: float = DEFAULT_LOCK_TIMEOUT,
+) -> Iterator[bool]:
+    """Hold an exclusive lock for a key shared by all processes using the
+    same directory
+
+    The keys are mapped onto a fixed number of lock files which are never
+    removed. If the lock can't be acquired within the timeout the context is
+    entered without it. Yields whether the lock is held. Without a directory
+    no lock is acquired at all.
+    """
+    if directory is None:
+        yield False
+        return
+
+    # other users must not be able to hold the locks
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    stripe = zlib.crc32(key.encode('utf-8')) % LOCK_STRIPES
+    fd = os.open(
+        os.path.join(directory, f'selene-{stripe:03}.lock'),
+        os.O_RDWR | os.O_CREAT,
+        0o600,
+    )
+
+    locked = False
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                locked = True
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    break
+                time.sleep(LOCK_POLL_INTERVAL)
+
+        yield locked
+    finally:
+        if locked:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+_flights = SingleFlight()
+
+
+class SecInfoCachedGmp:
+    """Keep the responses of SecInfo commands in a django cache and
+    coalesce identical concurrent commands
+
+    Responses are only cached while the version of their feed is known and
+    the feed isn't synced. All other commands are passed through. Calling a
+    command which isn't read-only invalidates the cached entries.
+
+    Args:
+        gmp: The GMP protocol instance to send the commands with
+        cache: The django cache for the responses. If None the commands are
+            only coalesced.
+        username: Name of the gvmd user the commands are sent for. If None
+            the responses are shared between all users.
+        timeout: Max number of seconds a response is kept
+        feed_check_interval: Number of seconds after which the feed versions
+            are requested from gvmd again
+        lock_dir: Directory for the lock files serializing cache misses of
+            all worker processes. If None only the commands of the current
+            worker process are coalesced.
+    """
+
+    def __init__(
+        self,
+        gmp: Any,
+        cache: Optional[BaseCache],
+        username: Optional[str],
+        *,
+        timeout: float = DEFAULT_SECINFO_CACHE_TIMEOUT,
+        feed_check_interval: float = DEFAULT_SECINFO_FEED_CHECK_INTERVAL,
+        lock_dir: Optional[str] = None,
+    ):
+        self._gmp = gmp
+        self._cache = cache
+        self._timeout = timeout
+        self._feed_check_interval = feed_check_interval
+        self._lock_dir = lock_dir
+        self._username = username
+        self._generation_key = (
+            f'{SECINFO_KEY_PREFIX}:generation'
+            if username is None
+            else f'{SECINFO_KEY_PREFIX}:generation:{username}'
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._gmp, name)
+        if not callable(attr):
+            return attr
+
+        if name in NVT_COMMANDS or name in INFO_COMMANDS:
+            return self._cached(name, attr)
+
+        if not is_read_only_command(name):
+            return self._invalidating(attr)
+
+        return attr
+
+    def _cached(self, command: str, func: Callable[..., Any]):
+        def call(*args, **kwargs):
+            feed = get_secinfo_feed(command, args, kwargs)
+            if feed is None or get_pruned_paths():
+                return func(*args, **kwargs)
+
+            version = generation = None
+            if self._cache is not None:
+                versions, generation = self._get_state()
+                version = versions.get(feed)
+
+            key = self._make_key(
+                (command, args, tuple(sorted(kwargs.items()))),
+                version,
+                generation,
+            )
+
+            if version is None:
+                return _flights.call(key, partial(func, *args, **kwargs))
+
+            response = self._get_cached(key)
+            if response is not None:
+                return response
+
+            return _flights.call(
+                key, partial(self._fill, key, partial(func, *args, **kwargs))
+            )
+
+        return call
+
+    def _fill(self, key: str, func: Callable[[], Any]) -> Any:
+        with lock_file(self._lock_dir, key) as locked:
+            if locked:
+                # another worker process may have filled the cache while
+                # waiting for the lock
+                response = self._get_cached(key)
+                if response is not None:
+                    return response
+
+            response = func()
+
+            self._cache.set(key, dump_response(response), self._timeout)
+
+            return response
+
+    def _get_cached(self, key: str) -> Optional[etree.Element]:
+        data = self._cache.get(key)
+        if data is None:
+            return None
+
+        return load_response(data)
+
+    def _invalidating(self, func: Callable[..., Any]):
+        def call(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.invalidate()
+
+        return call
+
+    def invalidate(self):
+        """Invalidate the cached responses of the user"""
+        if self._cache is None:
+            return
+
+        # the generation must only be kept as long as the responses
+        self._cache.set(self._generation_key, uuid.uuid4().hex, self._timeout)
+
+    def _get_state(self) -> Tuple[Dict[str, str], Optional[str]]:
+        values = self._cache.get_many([SECINFO_FEEDS_KEY, self._generation_key])
+
+        versions = values.get(SECINFO_FEEDS_KEY)
+        if versions is None:
+            try:
+                response = self._gmp.get_feeds()
+            except GvmResponseError:
+                # the user may not be allowed to get the feeds
+                return {}, None
+
+            versions = parse_feed_versions(response)
+            self._cache.set(
+                SECINFO_FEEDS_KEY, versions, self._feed_check_interval
+            )
+
+        return versions, values.get(self._generation_key)
+
+    def _make_key(
+        self,
+        command_key: Hashable,
+        version: Optional[str],
+        generation: Optional[str],
+    ) -> str:
+        return make_cache_key(
+            SECINFO_KEY_PREFIX,
+            self._username,
+            command_key,
+            version,
+            generation,
+        )
+
+
+ENTITY_KEY_PREFIX = 'selene:entities'
+
+DEFAULT_ENTITY_CACHE_TIMEOUT = 300  # in seconds
+
+# entity types as named by the GMP commands. config is a scan config.
+CACHED_ENTITY_TYPES = (
+    'config',
+    'credential',
+    'port_list',
+    'report_format',
+    'scanner',
+    'schedule',
+)
+
+# cached entity types containing data of other entities, e.g. scanners
+# contain the name of their credential
+CONTAINING_ENTITY_TYPES = {
+    'credential': ('scanner',),
+    'port_range': ('port_list',),
+}
+
+# changing these entities may change all cached entity types, e.g. the tasks
+# using a scan config or the user tags and permissions of a scanner
+REFERRING_ENTITY_TYPES = (
+    'alert',
+    'audit',
+    'group',
+    'permission',
+    'restore',
+    'role',
+    'tag',
+    'target',
+    'task',
+    'trashcan',
+    'user',
+)
+
+
+# commands which don't change any entities despite their name. starting and
+# stopping a task only changes its status and its reports.
+UNCHANGING_COMMANDS = (
+    'modify_user_setting',
+    'resume_task',
+    'start_task',
+    'stop_task',
+)
+
+
+def _mentions_entity_type(command: str, entity_type: str) -> bool:
+    command = f'_{command}_'
+    return f'_{entity_type}_' in command or f'_{entity_type}s_' in command
+
+
+def get_cached_entity_type(command: str) -> Optional[str]:
+    """Return the cached entity type requested by a get command"""
+    if not command.startswith('get_'):
+        return None
+
+    entity_type = command[len('get_') :]
+    if entity_type.endswith('s'):
+        entity_type = entity_type[:-1]
+
+    return entity_type if entity_type in CACHED_ENTITY_TYPES else None
+
+
+def get_changed_entity_types(command: str) -> Tuple[str, ...]:
+    """Return the cached entity types which may be changed by a command"""
+    if is_read_only_command(command) or command in UNCHANGING_COMMANDS:
+        return ()
+
+    if any(
+        _mentions_entity_type(command, entity_type)
+        for entity_type in REFERRING_ENTITY_TYPES
+    ):
+        return CACHED_ENTITY_TYPES
+
+    changed = set()
+    for entity_type in CACHED_ENTITY_TYPES:
+        if _mentions_entity_type(command, entity_type):
+            changed.add(entity_type)
+    for entity_type, containing in CONTAINING_ENTITY_TYPES.items():
+        if _mentions_entity_type(command, entity_type):
+            changed.update(containing)
+
+    return tuple(sorted(changed))
+
+
+class CacheStatistics:
+    """Count the hits and misses of a cache per entity type
+
+    The counters are kept per worker process.
+    """
+
+    def __init__(self):
+        self._hits: Counter = Counter()
+        self._misses: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def hit(self, entity_type: str):
+        with self._lock:
+            self._hits[entity_type] += 1
+
+    def miss(self, entity_type: str):
+        with self._lock:
+            self._misses[entity_type] += 1
+
+    def get(self) -> Dict[str, Dict[str, int]]:
+        """Return the number of hits and misses by entity type"""
+        with self._lock:
+            return {
+                entity_type: {
+                    'hits': self._hits[entity_type],
+                    'misses': self._misses[entity_type],
+                }
+                for entity_type in sorted(set(self._hits) | set(self._misses))
+            }
+
+    def reset(self):
+        with self._lock:
+            self._hits.clear()
+            self._misses.clear()
+
+
+entity_cache_statistics = CacheStatistics()
+
+
+class SharedCacheStatistics:
+    """Count the hits and misses of a cache per entity type in a django cache
+
+    Unlike CacheStatistics the counters are shared by all worker processes
+    using the same cache. Each count costs an additional cache operation.
+    Concurrent counts may get lost with cache backends not supporting atomic
+    increments like the file based cache.
+
+    Args:
+        cache: The django cache to keep the counters in
+    """
+
+    def __init__(self, cache: BaseCache):
+        self._cache = cache
+
+    def hit(self, entity_type: str):
+        self._count('hits', entity_type)
+
+    def miss(self, entity_type: str):
+        self._count('misses', entity_type)
+
+    def get(self) -> Dict[str, Dict[str, int]]:
+        """Return the number of hits and misses by entity type"""
+        counters = self._cache.get_many(self._get_keys())
+
+        statistics = {}
+        for entity_type in CACHED_ENTITY_TYPES:
+            hits = counters.get(self._get_key('hits', entity_type), 0)
+            misses = counters.get(self._get_key('misses', entity_type), 0)
+            if hits or misses:
+                statistics[entity_type] = {'hits': hits, 'misses': misses}
+
+        return statistics
+
+    def reset(self):
+        self._cache.delete_many(self._get_keys())
+
+    def _count(self, counter: str, entity_type: str):
+        key = self._get_key(counter, entity_type)
+        try:
+            self._cache.incr(key)
+        except ValueError:
+            # the counter doesn't exist yet or has been added concurrently
+            if not self._cache.add(key, 1, None):
+                self._cache.incr(key)
+
+    def _get_keys(self) -> Tuple[str, ...]:
+        return tuple(
+            self._get_key(counter, entity_type)
+            for counter in ('hits', 'misses')
+            for entity_type in CACHED_ENTITY_TYPES
+        )
+
+    @staticmethod
+    def _get_key(counter: str, entity_type: str) -> str:
+        return f'{ENTITY_KEY_PREFIX}:statistics:{counter}:{entity_type}'
+
+
+class EntityCachedGmp:
+    """Keep the responses of get commands for configuration entities of a
+    gvmd user in a django cache
+
+    The list and single entity commands for scanners, port lists, scan
+    configs, report formats, credentials and schedules are cached for a fixed
+    time. Commands which may change entities of a cached type invalidate the
+    entries of that type for all users. Hits and misses are counted in
+    entity_cache_statistics per worker process and in the cache for all
+    worker processes, see the entity_cache_statistics management command.
+
+    Args:
+        gmp: The GMP protocol instance to send the commands with
+        cache: The django cache for the responses
+        username: Name of the gvmd user the commands are sent for
+        timeout: Max number of seconds a response is kept
+    """
+
+    def __init__(
+        self,
+        gmp: Any,
+        cache: BaseCache,
+        username: str,
+        *,
+        timeout: float = DEFAULT_ENTITY_CACHE_TIMEOUT,
+    ):
+        self._gmp = gmp
+        self._cache = cache
+        self._username = username
+        self._timeout = timeout
+        self._statistics = SharedCacheStatistics(cache)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._gmp, name)
+        if not callable(attr):
+            return attr
+
+        entity_type = get_cached_entity_type(name)
+        if entity_type is not None:
+            return self._cached(name, entity_type, attr)
+
+        if not is_read_only_command(name):
+            return self._invalidating(name, attr)
+
+        return attr
+
+    def _cached(self, command: str, entity_type: str, func: Callable[..., Any]):
+        def call(*args, **kwargs):
+            if get_pruned_paths():
+                return func(*args, **kwargs)
+
+            key = make_cache_key(
+                ENTITY_KEY_PREFIX,
+                self._username,
+                command,
+                args,
+                tuple(sorted(kwargs.items())),
+                self._cache.get(self._get_generation_key(entity_type)),
+            )
+
+            data = self._cache.get(key)
+            if data is not None:
+                entity_cache_statistics.hit(entity_type)
+                self._statistics.hit(entity_type)
+                return load_response(data)
+
+            entity_cache_statistics.miss(entity_type)
+            self._statistics.miss(entity_type)
+
+            response = func(*args, **kwargs)
+
+            self._cache.set(key, dump_response(response), self._timeout)
+
+            return response
+
+        return call
+
+    def _invalidating(self, command: str, func: Callable[..., Any]):
+        def call(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.invalidate(*get_changed_entity_types(command))
+
+        return call
+
+    def invalidate(self, *entity_types: str):
+        """Invalidate the cached responses of entity types for all users"""
+        if not entity_types:
+            return
+
+        # the generations must only be kept as long as the responses
+        generation = uuid.uuid4().hex
+        self._cache.set_many(
+            {
+                self._get_generation_key(entity_type): generation
+                for entity_type in entity_types
+            },
+            self._timeout,
+        )
+
+    @staticmethod
+    def _get_generation_key(entity_type: str) -> str:
+        return f'{ENTITY_KEY_PREFIX}:generation:{entity_type}'
+
+
+def _reset_after_fork():
+    # flights of threads of the parent process never finish in a forked
+    # worker
+    _flights.reset()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""GMP connections parsing the responses of gvmd incrementally
+
+python-gvm's connections collect a response into a string while feeding it
+into a pull parser to detect its end. Afterwards the string is parsed again
+by the transform. The connections of this module return the element tree
+built by the pull parser while the response arrives instead. Therefore
+neither the response string nor a second parse is required.
+
+Subtrees of a response which aren't required for answering a query can be
+dropped while parsing, see prune_response_elements.
+"""
+
+import threading
+import time
+
+from contextlib import contextmanager
+from typing import Any, FrozenSet, Iterable, Iterator, Optional, Union
+
+from lxml import etree
+
+from gvm.connections import UnixSocketConnection
+from gvm.errors import GvmError
+from gvm.transforms import (
+    EtreeCheckCommandTransform as GvmEtreeCheckCommandTransform,
+)
+
+from selene.streaming import check_response_status
+
+_pruning = threading.local()
+
+
+def get_pruned_paths() -> FrozenSet[str]:
+    """Return the paths of the elements dropped from the responses read by
+    the current thread"""
+    return getattr(_pruning, 'paths', frozenset())
+
+
+@contextmanager
+def prune_response_elements(paths: Iterable[str]) -> Iterator[None]:
+    """Drop the elements at the passed paths from all responses read by the
+    current thread within the context
+
+    The paths are relative to the root element of a response, e.g.
+    'result/nvt' drops the nvt elements of all results of a get_results
+    response. Nested contexts drop the elements of all of their paths.
+    """
+    previous = get_pruned_paths()
+    _pruning.paths = previous.union(paths)
+    try:
+        yield
+    finally:
+        _pruning.paths = previous
+
+
+@contextmanager
+def keep_response_elements() -> Iterator[None]:
+    """Don't drop any elements from the responses read by the current thread
+    within the context
+
+    The complete responses of read-only commands are shared by all commands
+    of a request, independent of the elements they prune.
+    """
+    previous = get_pruned_paths()
+    _pruning.paths = frozenset()
+    try:
+        yield
+    finally:
+        _pruning.paths = previous
+
+
+class GmpResponseParser:
+    """Parse a GMP response from chunks of data into an element tree
+
+    The status of the response is checked as soon as the root element
+    starts. The content of error responses isn't kept, only their root
+    element is built.
+
+    Args:
+        pruned_paths: Paths of elements relative to the root element which
+            are removed from the tree as soon as they have been parsed
+    """
+
+    def __init__(self, pruned_paths: Iterable[str] = ()):
+        # huge_tree allows very long text content, e.g. for get_reports
+        self._parser = etree.XMLPullParser(
+            events=('start', 'end'),
+            encoding='utf-8',
+            recover=True,
+            huge_tree=True,
+        )
+        self.root: Optional[etree.Element] = None
+        self.failed = False
+        self.finished = False
+
+        self._pruned_paths = frozenset(pruned_paths)
+        self._pruned_tags = frozenset(
+            path.rsplit('/', 1)[-1] for path in self._pruned_paths
+        )
+
+    def feed(self, data: bytes) -> bool:
+        """Feed a chunk of data into the parser
+
+        Returns True if the response is complete.
+        """
+        try:
+            self._parser.feed(data)
+        except etree.ParseError as e:
+            raise GvmError(
+                f'Cannot parse XML response. Response data read {data}', e
+            ) from None
+
+        for event, element in self._parser.read_events():
+            if self.root is None:
+                self.root = element
+                self.failed = not element.get('status', '').startswith('2')
+            elif event == 'end':
+                if element is self.root:
+                    self.finished = True
+                elif self.failed:
+                    # don't keep the content of an error response
+                    element.clear()
+                elif (
+                    self._pruned_tags
+                    and element.tag in self._pruned_tags
+                    and self._get_path(element) in self._pruned_paths
+                ):
+                    # the element has been parsed completely and the parser
+                    # continues with its following siblings. Clearing it
+                    # before removing avoids moving the subtree.
+                    element.clear()
+                    element.getparent().remove(element)
+
+        return self.finished
+
+    def _get_path(self, element: etree.Element) -> str:
+        tags = []
+        while element is not self.root:
+            tags.append(element.tag)
+            element = element.getparent()
+        return '/'.join(reversed(tags))
+
+
+class IncrementalUnixSocketConnection(UnixSocketConnection):
+    """Connection to gvmd via a unix domain socket returning the responses
+    as already parsed element trees
+
+    Must be used with a transform supporting parsed responses, e.g.
+    selene.connections.EtreeCheckCommandTransform.
+    """
+
+    def read(self) -> etree.Element:
+        parser = GmpResponseParser(get_pruned_paths())
+
+        if self._timeout is not None:
+            break_timeout = time.time() + self._timeout
+
+        while True:
+            data = self._read()
+
+            if not data:
+                # Connection was closed by server
+                raise GvmError('Remote closed the connection')
+
+            if parser.feed(data):
+                return parser.root
+
+            if self._timeout is not None and time.time() > break_timeout:
+                raise GvmError('Timeout while reading the response')
+
+
+class EtreeCheckCommandTransform(GvmEtreeCheckCommandTransform):
+    """Transform a response into a lxml.etree root element and raise an error
+    if it is an error response
+
+    In contrast to python-gvm's transform, responses which have already been
+    parsed by the connection are supported too.
+    """
+
+    def __call__(self, response: Union[str, Any]) -> etree.Element:
+        if isinstance(response, (str, bytes)):
+            return super().__call__(response)
+
+        check_response_status(response.attrib)
+
+        return response
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+from graphql.execution import ResolveInfo
+from graphql.execution.executors.utils import process
+from promise import Promise
+
+
+class ParallelQueryExecutor:
+    """graphql executor resolving the top-level fields of a query concurrently
+
+    Each top-level field is resolved in a thread of its own, including all of
+    its sub fields. All other fields and the fields of mutations are resolved
+    synchronously. The gmp instance of a request provides a separate
+    connection for each thread, see selene.views.LazyGmpConnector.
+
+    An executor must only be used for a single request.
+
+    Args:
+        max_workers: Maximum number of fields resolved concurrently
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: List[Future] = []
+
+    @staticmethod
+    def _is_parallel(info: Any) -> bool:
+        if not isinstance(info, ResolveInfo):
+            return False
+
+        return (
+            len(info.path) == 1
+            and info.operation.operation == 'query'
+            and len(info.operation.selection_set.selections) > 1
+        )
+
+    def execute(self, fn: Callable, *args, **kwargs) -> Any:
+        info = args[1] if len(args) > 1 else None
+        if not self._is_parallel(info):
+            return fn(*args, **kwargs)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix='selene-query'
+            )
+
+        promise = Promise()
+        future = self._executor.submit(process, promise, fn, args, kwargs)
+        self._futures.append(future)
+        return promise
+
+    def wait_until_finished(self):
+        while self._futures:
+            futures = self._futures
+            self._futures = []
+            for future in futures:
+                future.result()
+
+    def clean(self):
+        self._futures = []
+
+    def shutdown(self):
+        """Stop the threads of the executor"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
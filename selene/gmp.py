@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import threading
+
+from typing import Any, Callable, Dict, Hashable, Optional, Type
+
+from gvm.connections import GvmConnection
+from gvm.protocols.gmp import Gmp as GvmGmp, SUPPORTED_GMP_VERSIONS
+from gvm.xml import XmlCommand
+
+from selene.connections import EtreeCheckCommandTransform, get_pruned_paths
+
+_protocol_classes: Dict[str, Type[SUPPORTED_GMP_VERSIONS]] = {}
+_protocol_classes_lock = threading.Lock()
+
+_parsed_response_classes: Dict[Type, Type[SUPPORTED_GMP_VERSIONS]] = {}
+
+
+def get_connection_address(connection: GvmConnection) -> Optional[str]:
+    """Return the address of the remote daemon or None if unknown"""
+    path = getattr(connection, 'path', None)
+    if path:
+        return path
+
+    hostname = getattr(connection, 'hostname', None)
+    if hostname:
+        return f'{hostname}:{getattr(connection, "port", "")}'
+
+    return None
+
+
+def forget_supported_gmp(address: str = None):
+    """Forget the cached protocol version of a remote daemon
+
+    The version is requested again for the next connection. If no address is
+    passed the versions of all remote daemons are forgotten.
+    """
+    with _protocol_classes_lock:
+        if address is None:
+            _protocol_classes.clear()
+        else:
+            _protocol_classes.pop(address, None)
+
+
+class ParsedResponseMixin:
+    """Support connections returning parsed responses in all commands
+
+    python-gvm's authenticate parses the raw response string itself.
+    """
+
+    def authenticate(self, username: str, password: str) -> Any:
+        cmd = XmlCommand('authenticate')
+
+        credentials = cmd.add_element('credentials')
+        credentials.add_element('username', username)
+        credentials.add_element('password', password)
+
+        # the transform raises an error if the authentication has failed
+        response = self.send_command(cmd.to_string())
+
+        self._authenticated = True
+
+        return response
+
+
+def get_parsed_response_class(
+    gmp_class: Type[SUPPORTED_GMP_VERSIONS],
+) -> Type[SUPPORTED_GMP_VERSIONS]:
+    """Get a subclass of a GMP protocol class supporting connections which
+    return parsed responses"""
+    with _protocol_classes_lock:
+        cls = _parsed_response_classes.get(gmp_class)
+        if cls is None:
+            cls = type(gmp_class.__name__, (ParsedResponseMixin, gmp_class), {})
+            _parsed_response_classes[gmp_class] = cls
+        return cls
+
+
+class Gmp(GvmGmp):
+    """Select the supported GMP protocol of the remote manager daemon
+
+    In contrast to python-gvm's Gmp class the supported protocol version is
+    only requested for the first connection to a remote daemon. gvmd must be
+    restarted to change its version. Therefore the version must be requested
+    again only after a connection error, see forget_supported_gmp.
+
+    The connection may return already parsed responses, see
+    selene.connections.
+    """
+
+    def __init__(
+        self,
+        connection: GvmConnection,
+        *,
+        transform: Optional[Callable[[str], Any]] = None,
+    ):
+        super().__init__(connection, transform=transform)
+
+        # transform for requesting the version
+        self._transform_callable = EtreeCheckCommandTransform()
+
+    def determine_supported_gmp(self) -> SUPPORTED_GMP_VERSIONS:
+        address = get_connection_address(self._connection)
+
+        with _protocol_classes_lock:
+            gmp_class = _protocol_classes.get(address)
+
+        if gmp_class is not None:
+            return gmp_class(self._connection, transform=self._gmp_transform)
+
+        gmp_class = get_parsed_response_class(
+            type(super().determine_supported_gmp())
+        )
+
+        if address is not None:
+            with _protocol_classes_lock:
+                _protocol_classes[address] = gmp_class
+
+        return gmp_class(self._connection, transform=self._gmp_transform)
+
+
+READ_ONLY_COMMANDS = ('help',)
+
+
+def is_read_only_command(name: str) -> bool:
+    return name.startswith('get_') or name in READ_ONLY_COMMANDS
+
+
+class MemoizedGmp:
+    """Request-scoped memo for the responses of read-only GMP commands
+
+    Responses of get_* and help commands are kept by command name and
+    arguments. Repeated commands return the already parsed response. Calling
+    any other command, e.g. creating or modifying an entity, clears the memo.
+
+    Responses read while elements are pruned are only returned for commands
+    pruning the same elements. Complete responses are returned for all of
+    them.
+
+    Args:
+        gmp: The GMP protocol instance to send the commands with
+        on_change: Called with the name and the arguments of every command
+            which isn't read-only after it has been sent
+    """
+
+    def __init__(
+        self, gmp: Any, *, on_change: Optional[Callable[..., None]] = None
+    ):
+        self._gmp = gmp
+        self._on_change = on_change
+        self._memo: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._gmp, name)
+        if not callable(attr):
+            return attr
+
+        if is_read_only_command(name):
+            return self._memoized(name, attr)
+
+        return self._clearing(name, attr)
+
+    def _memoized(self, command: str, func: Callable[..., Any]):
+        def call(*args, **kwargs):
+            command_key = (command, args, tuple(sorted(kwargs.items())))
+            try:
+                hash(command_key)
+            except TypeError:
+                return func(*args, **kwargs)
+
+            complete_key = command_key + (frozenset(),)
+            key = command_key + (get_pruned_paths(),)
+
+            with self._lock:
+                if complete_key in self._memo:
+                    return self._memo[complete_key]
+                if key in self._memo:
+                    return self._memo[key]
+
+            response = func(*args, **kwargs)
+
+            with self._lock:
+                self._memo[key] = response
+
+            return response
+
+        return call
+
+    def _clearing(self, command: str, func: Callable[..., Any]):
+        def call(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.clear()
+
+                if self._on_change is not None:
+                    self._on_change(command, *args, **kwargs)
+
+        return call
+
+    def clear(self):
+        with self._lock:
+            self._memo.clear()
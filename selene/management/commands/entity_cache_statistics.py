@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+
+from selene.cache import SharedCacheStatistics
+
+
+class Command(BaseCommand):
+    help = (
+        'Print the hits and misses of the entity cache per entity type for '
+        'all worker processes using the cache'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='Reset the counters after printing them',
+        )
+
+    def handle(self, *args, **options):
+        cache_alias = getattr(settings, 'SELENE', {}).get('ENTITY_CACHE')
+        if not cache_alias:
+            raise CommandError('The entity cache is disabled')
+
+        statistics = SharedCacheStatistics(caches[cache_alias])
+
+        self.stdout.write(f'{"entity type":<16}{"hits":>10}{"misses":>10}')
+        for entity_type, counts in statistics.get().items():
+            self.stdout.write(
+                f'{entity_type:<16}{counts["hits"]:>10}{counts["misses"]:>10}'
+            )
+
+        if options['reset']:
+            statistics.reset()
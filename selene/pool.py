@@ -0,0 +1,428 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Pool of open GMP connections to gvmd
+
+Opening a connection to gvmd requires a new socket and a version handshake.
+To avoid this overhead for every HTTP request, each worker process keeps a
+bounded number of idle connections around which can be borrowed by the
+following requests.
+
+Connections authenticated for a user are revoked in all worker processes
+when any user has been changed or deleted, see revoke_credentials.
+"""
+
+import os
+import select
+import threading
+import time
+import uuid
+import weakref
+
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Optional
+
+from gvm.errors import GvmError
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_POOL_IDLE_TIMEOUT = 60  # in seconds
+DEFAULT_POOL_MAX_LIFETIME = 3600  # in seconds
+DEFAULT_SESSION_IDLE_TIMEOUT = 30  # in seconds
+
+# alias of the django cache holding the generation of the credentials
+DEFAULT_CREDENTIALS_CACHE = 'gmp_credentials'
+
+CREDENTIALS_GENERATION_KEY = 'selene:credentials:generation'
+
+# commands changing or removing the credentials of users
+CREDENTIALS_COMMANDS = ('delete_user', 'modify_auth', 'modify_user')
+
+# users change their own password via modify_setting by name. gvmd doesn't
+# allow changing the password via a setting id.
+PASSWORD_SETTING_NAME = 'password'
+
+
+class SessionKey(NamedTuple):
+    """Key for connections authenticated for a user of a django session"""
+
+    username: str
+    session_key: str
+
+
+class PooledConnection:
+    """A connected GMP protocol instance owned by a GmpConnectionPool
+
+    The key identifies for whom the connection has been authenticated. It is
+    None for new connections. The generation is the generation of the
+    credentials at the time of the authentication.
+    """
+
+    def __init__(self, gmp: Any):
+        self.gmp = gmp
+        self.key = None
+        self.generation = None
+        self.idle_timeout = None
+        self.evicted = False
+        self.created = time.monotonic()
+        self.last_used = self.created
+
+    def is_expired(
+        self, now: float, *, idle_timeout: float, max_lifetime: float
+    ) -> bool:
+        """Return True if the connection has been idle or open for too long"""
+        if self.idle_timeout is not None:
+            idle_timeout = min(idle_timeout, self.idle_timeout)
+
+        return (
+            now - self.last_used > idle_timeout
+            or now - self.created > max_lifetime
+        )
+
+    def is_alive(self) -> bool:
+        """Return False if the connection is known to be broken"""
+        if not self.gmp.is_connected():
+            return False
+
+        # python-gvm doesn't provide a public API for accessing the socket
+        connection = getattr(self.gmp, '_connection', None)
+        sock = getattr(connection, '_socket', None)
+        if sock is None:
+            return True
+
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+
+        # an idle connection must not have any pending data. either gvmd has
+        # closed the connection or it is out of sync with our requests
+        return not readable
+
+    def close(self):
+        try:
+            self.gmp.disconnect()
+        except (GvmError, OSError):
+            pass
+
+
+class GmpConnectionPool:
+    """A bounded pool of open GMP connections
+
+    Connections are partitioned by a key. A connection released with a key is
+    only handed out again for the same key. This allows to keep connections
+    which have been authenticated for a specific user apart from each other.
+    Connections released without a key are considered unauthenticated and may
+    be handed out for any key.
+
+    Args:
+        connect: Callable returning a new not yet entered Gmp instance
+        size: Maximum number of idle connections kept open
+        idle_timeout: Number of seconds after an idle connection is closed
+        max_lifetime: Number of seconds after a connection is closed
+            regardless of its usage
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        *,
+        size: int = DEFAULT_POOL_SIZE,
+        idle_timeout: float = DEFAULT_POOL_IDLE_TIMEOUT,
+        max_lifetime: float = DEFAULT_POOL_MAX_LIFETIME,
+    ):
+        self.connect = connect
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+
+        self._idle: Dict[Hashable, List[PooledConnection]] = {}
+        self._borrowed = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count_idle()
+
+    def _is_expired(self, connection: PooledConnection, now: float) -> bool:
+        return connection.is_expired(
+            now, idle_timeout=self.idle_timeout, max_lifetime=self.max_lifetime
+        )
+
+    def _pop_idle(
+        self, key: Hashable, generation: Hashable = None
+    ) -> Optional[PooledConnection]:
+        now = time.monotonic()
+        expired = []
+        connection = None
+
+        with self._lock:
+            connections = self._idle.get(key, [])
+            while connections:
+                # use the most recently returned connection first. it is the
+                # least likely one to be closed by the remote side
+                candidate = connections.pop()
+                if self._is_expired(candidate, now) or (
+                    key is not None and candidate.generation != generation
+                ):
+                    expired.append(candidate)
+                else:
+                    connection = candidate
+                    break
+
+            if not connections:
+                self._idle.pop(key, None)
+
+        for candidate in expired:
+            candidate.close()
+
+        return connection
+
+    def _acquire_idle(
+        self, key: Hashable, generation: Hashable = None
+    ) -> Optional[PooledConnection]:
+        while True:
+            connection = self._pop_idle(key, generation)
+            if connection is None:
+                return None
+
+            if connection.is_alive():
+                return connection
+
+            connection.close()
+
+    def acquire(
+        self, key: Hashable = None, *, generation: Hashable = None
+    ) -> PooledConnection:
+        """Borrow an open connection for the passed key
+
+        If no idle connection for the key is available an idle connection
+        without a key is used. Otherwise a new connection is opened. The key
+        of the returned connection tells which partition it was taken from.
+
+        Idle connections of the key which have been authenticated for another
+        generation of the credentials are closed.
+        """
+        connection = self._acquire_idle(key, generation)
+
+        if connection is None and key is not None:
+            connection = self._acquire_idle(None)
+
+        if connection is None:
+            with ExitStack() as stack:
+                connection = PooledConnection(
+                    stack.enter_context(self.connect())
+                )
+                # the connection is kept open until the pool closes it
+                stack.pop_all()
+
+        connection.last_used = time.monotonic()
+        connection.evicted = False
+
+        with self._lock:
+            self._borrowed.add(connection)
+
+        return connection
+
+    def release(
+        self,
+        connection: PooledConnection,
+        key: Hashable = None,
+        *,
+        idle_timeout: float = None,
+    ):
+        """Return a borrowed connection to the pool
+
+        The connection is closed if it is broken, expired, has been evicted
+        while it was borrowed or if the pool is already full.
+
+        Args:
+            connection: The borrowed connection
+            key: Partition to put the connection into
+            idle_timeout: Optional shorter idle timeout for this connection
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            self._borrowed.discard(connection)
+
+        connection.key = key
+        connection.idle_timeout = idle_timeout
+
+        if (
+            connection.evicted
+            or self._is_expired(connection, now)
+            or not connection.is_alive()
+        ):
+            connection.close()
+            return
+
+        connection.last_used = now
+
+        with self._lock:
+            if self._count_idle() < self.size:
+                self._idle.setdefault(key, []).append(connection)
+                return
+
+        connection.close()
+
+    def discard(self, connection: PooledConnection):
+        """Close a borrowed connection instead of returning it to the pool"""
+        with self._lock:
+            self._borrowed.discard(connection)
+
+        connection.close()
+
+    def evict(self, predicate: Callable[[Hashable], bool]):
+        """Close all connections with a key matching the predicate
+
+        Currently borrowed connections are closed when they are released.
+        """
+        evicted = []
+
+        with self._lock:
+            for key in list(self._idle):
+                if key is not None and predicate(key):
+                    evicted.extend(self._idle.pop(key))
+
+            for connection in self._borrowed:
+                if connection.key is not None and predicate(connection.key):
+                    connection.evicted = True
+
+        for connection in evicted:
+            connection.close()
+
+    def clear(self):
+        """Close all idle connections"""
+        with self._lock:
+            idle = self._idle
+            self._idle = {}
+
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+    def _count_idle(self) -> int:
+        return sum(len(connections) for connections in self._idle.values())
+
+
+_pools: Dict[str, GmpConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_connection_pool(
+    name: str, connect: Callable[[], Any], **kwargs
+) -> GmpConnectionPool:
+    """Get a connection pool of this worker process
+
+    The pool is identified by its name, usually the path of the gvmd socket.
+    It is created on first usage. Further keyword arguments are passed to the
+    GmpConnectionPool.
+    """
+    with _pools_lock:
+        pool = _pools.get(name)
+        if pool is None:
+            pool = GmpConnectionPool(connect, **kwargs)
+            _pools[name] = pool
+        return pool
+
+
+def evict_session_connections(*, username: str = None, session_key: str = None):
+    """Close the authenticated connections of a user or a django session in
+    all pools of this worker process
+
+    Must be called if the credentials of a user have changed or a session has
+    ended.
+    """
+
+    def matches(key: Hashable) -> bool:
+        if not isinstance(key, SessionKey):
+            return False
+        if username is not None and key.username != username:
+            return False
+        if session_key is not None and key.session_key != session_key:
+            return False
+        return True
+
+    with _pools_lock:
+        pools = list(_pools.values())
+
+    for pool in pools:
+        pool.evict(matches)
+
+
+def get_credentials_generation(cache: Any) -> Optional[str]:
+    """Return the current generation of the credentials of all users
+
+    Args:
+        cache: Django cache shared by all worker processes or None
+    """
+    if cache is None:
+        return None
+    return cache.get(CREDENTIALS_GENERATION_KEY)
+
+
+def changes_credentials(command: str, *args, **kwargs) -> bool:
+    if command == 'modify_setting':
+        # modify_setting(setting_id=None, name=None, value=None)
+        name = kwargs.get('name', args[1] if len(args) > 1 else None)
+        return str(name).lower() == PASSWORD_SETTING_NAME
+
+    return command in CREDENTIALS_COMMANDS
+
+
+def revoke_credentials(cache: Any):
+    """Stop reusing all connections authenticated for users
+
+    Must be called if the credentials of a user have changed or a user has
+    been deleted. The connections of this worker process are closed
+    immediately. Other worker processes close them when they are acquired
+    again, if the cache is shared by them.
+
+    Args:
+        cache: Django cache shared by all worker processes or None
+    """
+    if cache is not None:
+        cache.set(CREDENTIALS_GENERATION_KEY, uuid.uuid4().hex, None)
+
+    evict_session_connections()
+
+
+def clear_connection_pools():
+    """Close all idle connections of all pools and drop the pools"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+
+    for pool in pools:
+        pool.clear()
+
+
+def _reset_after_fork():
+    # sockets must not be shared between a parent process and its workers
+    _pools.clear()
+    _pools_lock.release()
+
+
+if hasattr(os, 'register_at_fork'):
+    # hold the lock while forking. otherwise the child may inherit it in the
+    # acquired state.
+    os.register_at_fork(
+        before=_pools_lock.acquire,
+        after_in_parent=_pools_lock.release,
+        after_in_child=_reset_after_fork,
+    )
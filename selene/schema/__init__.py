@@ -249,6 +249,8 @@ from selene.schema.user_settings.mutations import (
 )
 
 
+from selene.schema.node import GetNode, GetNodes
+
 from selene.schema.notes.queries import GetNotes, GetNote
 
 from selene.schema.notes.mutations import (
@@ -751,6 +753,8 @@ class Query(ObjectType):
     host = GetHost()
     hosts = GetHosts()
     ldap_authentication_settings = GetLDAPAuthenticationSettings()
+    node = GetNode()
+    nodes = GetNodes()
     note = GetNote()
     notes = GetNotes()
     nvt = GetNVT()
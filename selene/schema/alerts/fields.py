@@ -35,6 +35,7 @@ from selene.schema.utils import (
     get_boolean_from_element,
     get_int_from_element,
 )
+from selene.schema.node import Node
 
 
 class SeverityDirection(graphene.Enum):
@@ -131,6 +132,7 @@ class Alert(EntityObjectType):
     """Alert entity"""
 
     class Meta:
+        interfaces = (Node,)
         default_resolver = find_resolver
 
     method = graphene.Field(AlertProperty)
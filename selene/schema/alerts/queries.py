@@ -32,6 +32,7 @@ from selene.schema.relay import (
     get_filter_string_for_pagination,
 )
 
+from selene.schema.entities import load_entity
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
 
 
@@ -71,10 +72,7 @@ class GetAlert(graphene.Field):
     @staticmethod
     @require_authentication
     def resolve(_root, info, alert_id: UUID, tasks):
-        gmp = get_gmp(info)
-
-        xml = gmp.get_alert(str(alert_id), tasks=tasks)
-        return xml.find('alert')
+        return load_entity(info, 'alert', alert_id, tasks=tasks)
 
 
 class GetAlerts(EntityConnectionField):
@@ -37,6 +37,7 @@ from selene.schema.base import BaseObjectType
 from selene.schema.entity import EntityObjectType
 from selene.schema.scanners.fields import ScannerType
 from selene.schema.tasks.fields import BaseCounts
+from selene.schema.node import Node
 
 
 class AuditReportsCounts(graphene.ObjectType):
@@ -81,29 +82,23 @@ class AuditLastReport(graphene.ObjectType):
     )
 
     @staticmethod
-    def resolve_compliance_count(root, _info):
-        report = get_subelement(root, 'report')
+    def resolve_compliance_count(report, _info):
         return get_subelement(report, 'compliance_count')
 
     @staticmethod
-    def resolve_uuid(parent, _info):
-        report = parent.find('report')
-        uuid = report.get('id')
-        return uuid
+    def resolve_uuid(report, _info):
+        return report.get('id')
 
     @staticmethod
-    def resolve_creation_time(parent, _info):
-        report = parent.find('report')
+    def resolve_creation_time(report, _info):
         return get_datetime_from_element(report, 'timestamp')
 
     @staticmethod
-    def resolve_scan_start(parent, _info):
-        report = parent.find('report')
+    def resolve_scan_start(report, _info):
         return get_datetime_from_element(report, 'scan_start')
 
     @staticmethod
-    def resolve_scan_end(parent, _info):
-        report = parent.find('report')
+    def resolve_scan_end(report, _info):
         return get_datetime_from_element(report, 'scan_end')
 
 
@@ -120,23 +115,19 @@ class AuditCurrentReport(graphene.ObjectType):
     )
 
     @staticmethod
-    def resolve_uuid(parent, _info):
-        report = parent.find('report')
+    def resolve_uuid(report, _info):
         return report.get('id')
 
     @staticmethod
-    def resolve_scan_start(parent, _info):
-        report = parent.find('report')
+    def resolve_scan_start(report, _info):
         return get_datetime_from_element(report, 'scan_start')
 
     @staticmethod
-    def resolve_scan_end(parent, _info):
-        report = parent.find('report')
+    def resolve_scan_end(report, _info):
         return get_datetime_from_element(report, 'scan_end')
 
     @staticmethod
-    def resolve_creation_time(parent, _info):
-        report = parent.find('report')
+    def resolve_creation_time(report, _info):
         return get_datetime_from_element(report, 'timestamp')
 
 
@@ -162,6 +153,16 @@ class AuditReports(graphene.ObjectType):
     def resolve_counts(root, _info):
         return get_subelement(root, 'report_count')
 
+    # the fields of the reports are resolved from their report element
+
+    @staticmethod
+    def resolve_current_report(root, _info):
+        return get_subelement(get_subelement(root, 'current_report'), 'report')
+
+    @staticmethod
+    def resolve_last_report(root, _info):
+        return get_subelement(get_subelement(root, 'last_report'), 'report')
+
 
 class AuditResultsCounts(BaseCounts):
     """Result count information of an audit"""
@@ -350,6 +351,7 @@ class Audit(EntityObjectType):
     """Audit object type"""
 
     class Meta:
+        interfaces = (Node,)
         default_resolver = find_resolver
 
     average_duration = graphene.Int(
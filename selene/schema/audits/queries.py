@@ -28,13 +28,30 @@ from selene.schema.relay import (
     EntityConnectionField,
     Entities,
     get_filter_string_for_pagination,
+    selects_any_node_field,
 )
 
 from selene.schema.audits.fields import Audit
 
+from selene.schema.entities import load_entity
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
 
 
+# fields of an audit which gvmd only returns with details
+AUDIT_DETAILS_FIELDS = frozenset(
+    [
+        'alerts',
+        'averageDuration',
+        'observers',
+        'preferences',
+        'reports',
+        'results',
+        'trend',
+        'userTags',
+    ]
+)
+
+
 class GetAudit(graphene.Field):
     """Get a single audit
 
@@ -70,10 +87,9 @@ class GetAudit(graphene.Field):
     @staticmethod
     @require_authentication
     def resolve(_root, info, audit_id: UUID):
-        gmp = get_gmp(info)
-
-        xml = gmp.get_audit(str(audit_id))
-        return xml.find('task')
+        return load_entity(
+            info, 'audit', audit_id, gmp_entity_response='task', details=True
+        )
 
 
 class GetAudits(EntityConnectionField):
@@ -138,8 +154,10 @@ class GetAudits(EntityConnectionField):
             filter_string, first=first, last=last, after=after, before=before
         )
 
+        details = selects_any_node_field(info, AUDIT_DETAILS_FIELDS)
+
         xml: XmlElement = gmp.get_audits(
-            filter=filter_string.filter_string, details=True
+            filter=filter_string.filter_string, details=details
         )
 
         audit_elements = xml.findall('task')
@@ -28,6 +28,7 @@ from gvm.errors import GvmResponseError
 
 from selene.errors import AuthenticationFailed
 
+from selene.schema.capabilities import get_capabilities_cache
 from selene.schema.utils import (
     get_gmp,
     get_request,
@@ -105,6 +106,12 @@ class LoginMutation(graphene.Mutation):
             request.session['username'] = username
             request.session['password'] = password
 
+            # the permissions of the user may have been changed by gvmd
+            # directly, e.g. via gvmd --modify-user
+            capabilities_cache = get_capabilities_cache(info)
+            if capabilities_cache is not None:
+                capabilities_cache.remove(username)
+
             timezone = get_text_from_element(response, 'timezone')
 
             # get the timeout from now
@@ -16,16 +16,110 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import uuid
+
+from typing import Callable, List, Optional
+
+from django.core.cache.backends.base import BaseCache
+
 import graphene
 
+from graphql import ResolveInfo
+
+from selene.cache import make_cache_key
 from selene.schema.utils import (
     require_authentication,
     get_gmp,
+    get_request,
     get_text_from_element,
 )
 
+CAPABILITIES_KEY_PREFIX = 'selene:capabilities'
+CAPABILITIES_GENERATION_KEY = f'{CAPABILITIES_KEY_PREFIX}:generation'
+
+DEFAULT_CAPABILITIES_CACHE_TIMEOUT = 300  # in seconds
+
+# commands which may change the capabilities of users besides the commands
+# for groups, permissions, roles and users
+CAPABILITY_COMMANDS = ('empty_trashcan', 'restore')
+CAPABILITY_COMMAND_SUFFIXES = ('_group', '_permission', '_role', '_user')
+
+
+def changes_capabilities(command: str) -> bool:
+    return command in CAPABILITY_COMMANDS or command.endswith(
+        CAPABILITY_COMMAND_SUFFIXES
+    )
+
+
+class CapabilitiesCache:
+    """Keep the capabilities of gvmd users in a django cache
+
+    The entries of all users are keyed by a shared generation. A command
+    which may change the capabilities of any user invalidates all entries by
+    changing the generation. Changes are only seen by all worker processes
+    if the django cache is shared by them.
+
+    Args:
+        cache: The django cache for the capabilities
+        timeout: Max number of seconds the capabilities are kept
+    """
+
+    def __init__(
+        self,
+        cache: BaseCache,
+        *,
+        timeout: float = DEFAULT_CAPABILITIES_CACHE_TIMEOUT,
+    ):
+        self._cache = cache
+        self._timeout = timeout
+
+    def _get_key(self, username: str) -> str:
+        return make_cache_key(
+            CAPABILITIES_KEY_PREFIX,
+            username,
+            self._cache.get(CAPABILITIES_GENERATION_KEY),
+        )
+
+    def get(self, username: str, load: Callable[[], List[str]]) -> List[str]:
+        """Return the cached capabilities of a user or load them"""
+        # capabilities loaded while the generation changes are stored for
+        # the previous generation and aren't used anymore
+        key = self._get_key(username)
+
+        capabilities = self._cache.get(key)
+        if capabilities is not None:
+            return capabilities
+
+        capabilities = load()
+
+        self._cache.set(key, capabilities, self._timeout)
+
+        return capabilities
+
+    def remove(self, username: str):
+        """Remove the cached capabilities of a user"""
+        self._cache.delete(self._get_key(username))
+
+    def invalidate(self):
+        """Invalidate the cached capabilities of all users"""
+        # the generation must only be kept as long as the capabilities
+        self._cache.set(
+            CAPABILITIES_GENERATION_KEY, uuid.uuid4().hex, self._timeout
+        )
+
+
+def get_capabilities_cache(info: ResolveInfo) -> Optional[CapabilitiesCache]:
+    return getattr(get_request(info), 'capabilities_cache', None)
+
 
 class GetCapabilities(graphene.List):
+    """Gets the names of the GMP commands the current user is allowed to use
+
+    If a capabilities cache is configured the capabilities are kept per user
+    until groups, permissions, roles or users are changed or the user logs in
+    again.
+    """
+
     def __init__(self):
         super().__init__(graphene.String, resolver=self.resolve)
 
@@ -34,9 +128,14 @@ class GetCapabilities(graphene.List):
     def resolve(_root, info):
         gmp = get_gmp(info)
 
-        xml = gmp.help(format='xml', help_type='brief')
-        elem_list = xml.find('schema').findall('command')
+        def load() -> List[str]:
+            xml = gmp.help(format='xml', help_type='brief')
+            elem_list = xml.find('schema').findall('command')
+
+            return [get_text_from_element(elem, 'name') for elem in elem_list]
 
-        cap_list = [get_text_from_element(elem, 'name') for elem in elem_list]
+        cache = get_capabilities_cache(info)
+        if cache is None:
+            return load()
 
-        return cap_list
+        return cache.get(get_request(info).session.get('username'), load)
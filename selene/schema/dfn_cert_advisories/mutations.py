@@ -28,7 +28,7 @@ from selene.schema.entities import (
 #   schema: ExportByIds, ExportByIds.'
 
 ExportByIdsClass = create_export_secinfos_by_ids_mutation(
-    info_type=GvmInfoType.DFN_CERT_ADV
+    info_type=GvmInfoType.DFN_CERT_ADV, export_name='dfn_cert_advisories'
 )
 
 
@@ -41,6 +41,7 @@ ExportByFilterClass = create_export_by_filter_mutation(
     entities_name='info_list',
     with_details=True,
     info_type=GvmInfoType.DFN_CERT_ADV,
+    export_name='dfn_cert_advisories',
 )
 
 
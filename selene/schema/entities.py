@@ -16,15 +16,58 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import List
+import threading
+
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
+from uuid import UUID
+
 from lxml import etree
 
 import graphene
+from graphql import ResolveInfo
+from gvm.errors import GvmResponseError
 from gvm.protocols.next import InfoType
+from promise import Promise
+from promise.dataloader import DataLoader
 
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
 
 
+class ExportCommand(NamedTuple):
+    """GMP command for exporting entities of a type
+
+    The name of the command is the name of the method of the GMP protocol
+    class, e.g. 'get_tasks'. Further arguments are passed as kwargs.
+    """
+
+    name: str
+    details: bool = False
+    kwargs: Dict[str, Any] = {}
+
+
+_export_commands: Dict[str, ExportCommand] = {}
+
+
+def register_export_command(export_name: str, command: ExportCommand):
+    """Register how the entities of a type can be exported, e.g. for
+    streaming exports outside of GraphQL"""
+    _export_commands[export_name] = command
+
+
+def get_export_command(export_name: str) -> Optional[ExportCommand]:
+    return _export_commands.get(export_name)
+
+
+def get_export_filter_by_ids(entity_ids: List[Any]) -> str:
+    """Create a filter string selecting the entities of the passed IDs"""
+    filter_string = ''
+
+    for entity_id in entity_ids:
+        filter_string += f'uuid={str(entity_id)} '
+
+    return filter_string
+
+
 class AbstractExportByFilter(graphene.ObjectType):
     class Arguments:
         filter_string = graphene.String(
@@ -39,6 +82,7 @@ def create_export_by_filter_mutation(
     *,
     with_details: bool = None,
     entities_name: str = None,
+    export_name: str = None,
     **kwargs,
 ):
     """
@@ -46,9 +90,17 @@ def create_export_by_filter_mutation(
         entity_name (str): Type of the entity in singular. E.g. 'config'
         with_details (bool, optional): Should entities be returned with details
         entities_name (str, optional): Plural for irregular words
+        export_name (str, optional): Name for registering the export
+            command. Defaults to the plural of the entity name.
         ultimate (bool, optional): Whether to remove entirely, or to the
             trashcan.
     """
+    entities_name = entities_name or f'{entity_name}s'
+
+    register_export_command(
+        export_name or entities_name,
+        ExportCommand(f'get_{entities_name}', bool(with_details), kwargs),
+    )
 
     class ExportByFilter(graphene.Mutation, AbstractExportByFilter):
         @staticmethod
@@ -56,11 +108,7 @@ def create_export_by_filter_mutation(
         def mutate(_root, info, filter_string: str = None):
             gmp = get_gmp(info)
 
-            get_entities = (
-                getattr(gmp, f'get_{entities_name}')
-                if entities_name
-                else getattr(gmp, f'get_{entity_name}s')
-            )
+            get_entities = getattr(gmp, f'get_{entities_name}')
 
             if with_details:
                 # not all get_entities function has details argument
@@ -94,6 +142,7 @@ def create_export_by_ids_mutation(
     *,
     with_details: bool = None,
     entities_name: List[str] = None,
+    export_name: str = None,
     **kwargs,
 ):
     """
@@ -101,9 +150,17 @@ def create_export_by_ids_mutation(
         entity_name (str): Type of the entity in singular. E.g. 'config'
         with_details (bool, optional): Should entities be returned with details
         entities_name (str, optional): Plural for irregular words
+        export_name (str, optional): Name for registering the export
+            command. Defaults to the plural of the entity name.
         ultimate (bool, optional): Whether to remove entirely, or to the
             trashcan.
     """
+    entities_name = entities_name or f'{entity_name}s'
+
+    register_export_command(
+        export_name or entities_name,
+        ExportCommand(f'get_{entities_name}', bool(with_details), kwargs),
+    )
 
     class ExportByIds(graphene.Mutation, AbstractExportByIds):
         @staticmethod
@@ -111,16 +168,9 @@ def create_export_by_ids_mutation(
         def mutate(_root, info, entity_ids: str = None):
             gmp = get_gmp(info)
 
-            get_entities = (
-                getattr(gmp, f'get_{entities_name}')
-                if entities_name
-                else getattr(gmp, f'get_{entity_name}s')
-            )
-
-            filter_string = ''
+            get_entities = getattr(gmp, f'get_{entities_name}')
 
-            for entity_id in entity_ids:
-                filter_string += f'uuid={str(entity_id)} '
+            filter_string = get_export_filter_by_ids(entity_ids)
 
             if with_details:
                 # not all get_entities function has details argument
@@ -151,6 +201,7 @@ def create_delete_by_filter_mutation(
     *,
     entities_name: str = None,
     gmp_entity_response: str = None,
+    on_delete: Callable[[ResolveInfo, str], None] = None,
     **kwargs,
 ):
     """
@@ -161,6 +212,8 @@ def create_delete_by_filter_mutation(
             response.
             E.g.: policy has 'config' and audit has 'task' as entity
             response.
+        on_delete (callable, optional): Called with the resolve info and
+            the id of each deleted entity.
         ultimate (bool, optional): Whether to remove entirely, or to the
             trashcan.
     """
@@ -196,6 +249,9 @@ def create_delete_by_filter_mutation(
                 else:
                     delete_entity(**entity_id)
 
+                if on_delete is not None:
+                    on_delete(info, str(entity.get('id')))
+
             return AbstractDeleteByIds(ok=True)
 
     return DeleteByFilter
@@ -226,6 +282,7 @@ def create_delete_by_ids_mutation(
     entity_name: str,
     entities_name: str = None,
     gmp_entity_response: str = None,
+    on_delete: Callable[[ResolveInfo, str], None] = None,
     **kwargs,
 ):
     """
@@ -235,6 +292,8 @@ def create_delete_by_ids_mutation(
             response.
             E.g.: policy has 'config' and audit has 'task' as entity
             response.
+        on_delete (callable, optional): Called with the resolve info and
+            the id of each deleted entity.
 
     """
 
@@ -283,6 +342,9 @@ def create_delete_by_ids_mutation(
                     else:
                         delete_entity(**entity_id)
 
+                    if on_delete is not None:
+                        on_delete(info, str(entity))
+
             return AbstractDeleteByIds(ok=True)
 
     return DeleteByIds
@@ -302,14 +364,22 @@ class AbstractExportSecInfosByIds(graphene.ObjectType):
 
 def create_export_secinfos_by_ids_mutation(
     info_type: InfoType,
+    *,
+    export_name: str = None,
 ):
     """
     Args:
         info_type (str): Type of the secinfo in singular. E.g. 'nvt'
+        export_name (str, optional): Name for registering the export
+            command. Defaults to the plural of the info type.
         entities_name (str, optional): Plural for irregular words
         ultimate (bool, optional): Whether to remove entirely, or to the
             trashcan.
     """
+    register_export_command(
+        export_name or f'{info_type.value.lower()}s',
+        ExportCommand('get_info_list', True, {'info_type': info_type}),
+    )
 
     class ExportSecInfoByIds(graphene.Mutation, AbstractExportSecInfosByIds):
         @staticmethod
@@ -319,10 +389,7 @@ def create_export_secinfos_by_ids_mutation(
 
             get_entities = getattr(gmp, 'get_info_list')
 
-            filter_string = ''
-
-            for entity_id in entity_ids:
-                filter_string += f'uuid={str(entity_id)} '
+            filter_string = get_export_filter_by_ids(entity_ids)
 
             xml: XmlElement = get_entities(
                 filter=filter_string, info_type=info_type, details=True
@@ -332,3 +399,117 @@ def create_export_secinfos_by_ids_mutation(
             return AbstractExportByIds(exported_entities=serialized_xml)
 
     return ExportSecInfoByIds
+
+
+class EntityLoader(DataLoader):
+    """Load single entities by their id
+
+    All ids requested within one execution tick are loaded with a single
+    get_<entities> command using a uuid filter. A single id is loaded with
+    the get_<entity> command. The uuid filter doesn't match entities in the
+    trashcan. Therefore ids missing in the response of get_<entities> are
+    loaded with the get_<entity> command too.
+
+    Args:
+        info: ResolveInfo of the first load
+        entity_name: Type of the entity in singular. E.g. 'config'
+        entities_name: Plural for irregular words
+        gmp_entity_response: Expected entity name in the gmp response
+        details: Request the details when loading several entities. The
+            get_<entity> commands always include the details.
+        kwargs: Further arguments for the get commands
+    """
+
+    def __init__(
+        self,
+        info: ResolveInfo,
+        entity_name: str,
+        *,
+        entities_name: str = None,
+        gmp_entity_response: str = None,
+        details: bool = False,
+        **kwargs,
+    ):
+        super().__init__()
+
+        self.info = info
+        self.entity_name = entity_name
+        self.entities_name = entities_name or f'{entity_name}s'
+        self.gmp_entity_response = gmp_entity_response or entity_name
+        self.details = details
+        self.kwargs = kwargs
+
+    def batch_load_fn(  # pylint: disable=method-hidden
+        self, keys: List[str]
+    ) -> Promise:
+        gmp = get_gmp(self.info)
+
+        if len(keys) == 1:
+            return Promise.resolve([self._load_single(gmp, keys[0])])
+
+        filter_string = ' '.join(f'uuid={key}' for key in keys)
+        filter_string += f' first=1 rows={len(keys)}'
+
+        kwargs = dict(self.kwargs)
+        if self.details:
+            kwargs['details'] = True
+
+        get_entities = getattr(gmp, f'get_{self.entities_name}')
+        xml = get_entities(filter=filter_string, **kwargs)
+
+        entities = {
+            entity.get('id'): entity
+            for entity in xml.findall(self.gmp_entity_response)
+        }
+
+        return Promise.resolve(
+            [
+                entities[key]
+                if key in entities
+                else self._load_single(gmp, key)
+                for key in keys
+            ]
+        )
+
+    def _load_single(
+        self, gmp, key: str
+    ) -> Union[XmlElement, GvmResponseError]:
+        get_entity = getattr(gmp, f'get_{self.entity_name}')
+        try:
+            xml = get_entity(key, **self.kwargs)
+        except GvmResponseError as e:
+            # only fail the field of this entity
+            return e
+
+        return xml.find(self.gmp_entity_response)
+
+
+def load_entity(
+    info: ResolveInfo,
+    entity_name: str,
+    entity_id: UUID,
+    **kwargs,
+) -> Promise:
+    """Load a single entity by its id
+
+    Lookups of the same entity type are batched, see EntityLoader. Further
+    keyword arguments are passed to the EntityLoader.
+
+    Returns:
+        A promise resolving to the XML element of the entity
+    """
+    request = info.context
+
+    # promises are resolved per thread. therefore each thread resolving
+    # fields of the request needs its own loaders
+    local = request.__dict__.setdefault('_entity_loaders', threading.local())
+    if not hasattr(local, 'loaders'):
+        local.loaders = {}
+
+    key = (entity_name, tuple(sorted(kwargs.items())))
+    loader = local.loaders.get(key)
+    if loader is None:
+        loader = EntityLoader(info, entity_name, **kwargs)
+        local.loaders[key] = loader
+
+    return loader.load(str(entity_id))
@@ -22,6 +22,7 @@ from selene.schema.base import BaseObjectType
 from selene.schema.entity import EntityObjectType
 from selene.schema.utils import get_text, get_text_from_element
 from selene.schema.resolver import text_resolver, boolean_resolver
+from selene.schema.node import Node
 
 
 class Keyword(graphene.ObjectType):
@@ -53,6 +54,9 @@ class FilterDelta(graphene.ObjectType):
 
 
 class Filter(EntityObjectType):
+    class Meta:
+        interfaces = (Node,)
+
     entity_type = graphene.String(name="type")
     term = graphene.String()
     alerts = graphene.List(FilterAlerts)
@@ -32,6 +32,7 @@ from selene.schema.relay import (
     get_filter_string_for_pagination,
 )
 
+from selene.schema.entities import load_entity
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
 
 
@@ -78,10 +79,7 @@ class GetFilter(graphene.Field):
     @staticmethod
     @require_authentication
     def resolve(_root, info, filter_id: UUID, alerts: bool):
-        gmp = get_gmp(info)
-
-        xml = gmp.get_filter(str(filter_id), alerts=alerts)
-        return xml.find('filter')
+        return load_entity(info, 'filter', filter_id, alerts=alerts)
 
 
 class GetFilters(EntityConnectionField):
@@ -194,7 +194,7 @@ class DeleteHostsByFilter(DeleteByFilterClass):
 #   schema: ExportByIds, ExportByIds.'
 
 ExportByIdsClass = create_export_by_ids_mutation(
-    entity_name='asset', asset_type=GvmAssetType.HOST
+    entity_name='asset', asset_type=GvmAssetType.HOST, export_name='hosts'
 )
 
 
@@ -203,7 +203,7 @@ class ExportHostsByIds(ExportByIdsClass):
 
 
 ExportByFilterClass = create_export_by_filter_mutation(
-    entity_name='asset', asset_type=GvmAssetType.HOST
+    entity_name='asset', asset_type=GvmAssetType.HOST, export_name='hosts'
 )
 
 
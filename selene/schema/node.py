@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import graphene
+
+from graphql import ResolveInfo
+from graphql_relay import from_global_id, to_global_id
+
+from gvm.errors import GvmResponseError
+from promise import Promise
+
+from selene.errors import InvalidRequest
+from selene.schema.entities import load_entity
+from selene.schema.parser import parse_uuid
+from selene.schema.utils import (
+    get_text_from_element,
+    require_authentication,
+    XmlElement,
+)
+
+# graphene type name -> (entity name, load_entity arguments)
+#
+# the arguments are the same as for the single entity queries. this allows
+# to share the entity loaders with them.
+NODE_TYPES: Dict[str, Tuple[str, Dict[str, Any]]] = {
+    'Alert': ('alert', {'tasks': True}),
+    'Audit': ('audit', {'gmp_entity_response': 'task', 'details': True}),
+    'Filter': ('filter', {'alerts': False}),
+    'Note': ('note', {'details': True}),
+    'Override': ('override', {'details': True}),
+    'Permission': ('permission', {}),
+    'Policy': (
+        'policy',
+        {
+            'entities_name': 'policies',
+            'gmp_entity_response': 'config',
+            'details': True,
+            'audits': True,
+        },
+    ),
+    'PortList': ('port_list', {'details': True}),
+    'Role': ('role', {}),
+    'ScanConfig': ('config', {'details': True, 'tasks': True}),
+    'Scanner': ('scanner', {'details': True}),
+    'Schedule': ('schedule', {'tasks': True}),
+    'Tag': ('tag', {}),
+    'Target': ('target', {'tasks': True}),
+    'Task': ('task', {'details': True}),
+    'RemediationTicket': ('ticket', {}),
+    'User': ('user', {}),
+}
+
+# graphene type name -> usage type of the XML element. the XML of these types
+# can only be distinguished by the usage type.
+NODE_USAGE_TYPES: Dict[str, str] = {
+    'Audit': 'audit',
+    'Policy': 'policy',
+    'ScanConfig': 'scan',
+    'Task': 'scan',
+}
+
+
+def parse_global_id(global_id: str) -> Tuple[str, str]:
+    """Split a global ID into the type name and the uuid of the object
+
+    Raises:
+        InvalidRequest: If the global ID is invalid or references an
+            unsupported type
+    """
+    try:
+        type_name, entity_id = from_global_id(global_id)
+        uuid = parse_uuid(entity_id)
+    except Exception:  # pylint: disable=broad-except
+        type_name, uuid = None, None
+
+    if type_name not in NODE_TYPES or uuid is None:
+        raise InvalidRequest(f'Invalid global ID {global_id}')
+
+    return type_name, str(uuid)
+
+
+def _get_node_types(info: ResolveInfo) -> Dict[str, Set[str]]:
+    # uuid -> type names of the requested global IDs
+    return info.context.__dict__.setdefault('_node_types', {})
+
+
+def _get_element_name(type_name: str) -> str:
+    entity_name, kwargs = NODE_TYPES[type_name]
+    return kwargs.get('gmp_entity_response', entity_name)
+
+
+class Node(graphene.Interface):
+    """An object with a typed global ID
+
+    The global ID can be used to refetch the object with the node and nodes
+    queries.
+    """
+
+    global_id = graphene.ID(
+        required=True, description='Typed global ID of the object'
+    )
+
+    @staticmethod
+    def resolve_global_id(root: XmlElement, info: ResolveInfo) -> str:
+        return to_global_id(info.parent_type.name, root.get('id'))
+
+    @classmethod
+    def resolve_type(
+        cls, instance: XmlElement, info: ResolveInfo
+    ) -> Optional[str]:
+        # the XML of some types can't be distinguished (e.g. tasks and
+        # audits). therefore use the type of the requested global ID.
+        type_names = sorted(_get_node_types(info)[instance.get('id')])
+        if len(type_names) == 1:
+            return type_names[0]
+
+        # the uuid has been requested with several types
+        usage_type = get_text_from_element(instance, 'usage_type')
+        for type_name in type_names:
+            if _get_element_name(type_name) == instance.tag and (
+                NODE_USAGE_TYPES.get(type_name, usage_type) == usage_type
+            ):
+                return type_name
+
+        return None
+
+
+def load_node(info: ResolveInfo, global_id: str) -> Promise:
+    type_name, entity_id = parse_global_id(global_id)
+    entity_name, kwargs = NODE_TYPES[type_name]
+
+    _get_node_types(info).setdefault(entity_id, set()).add(type_name)
+
+    def not_found_to_none(error: Exception) -> Optional[XmlElement]:
+        if isinstance(error, GvmResponseError) and error.status == '404':
+            return None
+        raise error
+
+    return load_entity(info, entity_name, entity_id, **kwargs).catch(
+        not_found_to_none
+    )
+
+
+class GetNode(graphene.Field):
+    """Get a single object by its typed global ID
+
+    Returns null if the object doesn't exist.
+
+    Example:
+
+        query {
+            node (
+                id: "VGFzazowOGI2OTAwMy01ZmMyLTQwMzctYTQ3OS05M2I0NDAyMTFjNzM="
+            ) {
+                ... on Task {
+                    id
+                    name
+                }
+            }
+        }
+
+    Response:
+
+        {
+            "data": {
+                "node": {
+                    "id": "08b69003-5fc2-4037-a479-93b440211c73",
+                    "name": "foo"
+                }
+            }
+        }
+
+    """
+
+    def __init__(self):
+        super().__init__(
+            Node,
+            global_id=graphene.ID(required=True, name='id'),
+            resolver=self.resolve,
+            description=self.__doc__,
+        )
+
+    @staticmethod
+    @require_authentication
+    def resolve(_root, info, global_id: str) -> Promise:
+        return load_node(info, global_id)
+
+
+class GetNodes(graphene.List):
+    """Get several objects of possibly different types by their typed
+    global IDs
+
+    The objects are loaded with one command per type. The list contains null
+    for objects that don't exist.
+
+    Example:
+
+        query {
+            nodes (ids: [
+                "VGFzazowOGI2OTAwMy01ZmMyLTQwMzctYTQ3OS05M2I0NDAyMTFjNzM=",
+                "VGFyZ2V0OjVmOGJhM2E0LTBkNWMtNGEzZS05YzNhLTU2YzZjN2ZiMGI0YQ=="
+            ]) {
+                globalId
+                ... on Task {
+                    name
+                }
+                ... on Target {
+                    name
+                }
+            }
+        }
+
+    """
+
+    def __init__(self):
+        super().__init__(
+            Node,
+            global_ids=graphene.List(
+                graphene.NonNull(graphene.ID), required=True, name='ids'
+            ),
+            resolver=self.resolve,
+            description=self.__doc__,
+        )
+
+    @staticmethod
+    @require_authentication
+    def resolve(_root, info, global_ids: List[str]) -> Promise:
+        return Promise.all(
+            [load_node(info, global_id) for global_id in global_ids]
+        )
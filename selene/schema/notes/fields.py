@@ -34,6 +34,7 @@ from selene.schema.base import BaseObjectType
 from selene.schema.entity import EntityObjectType
 from selene.schema.nvts.fields import ScanConfigNVT as NVT
 from selene.schema.tasks.fields import Task
+from selene.schema.node import Node
 
 
 class NoteResult(BaseObjectType):
@@ -42,6 +43,7 @@ class NoteResult(BaseObjectType):
 
 class Note(EntityObjectType):
     class Meta:
+        interfaces = (Node,)
         default_resolver = find_resolver
 
     end_time = graphene.DateTime()
@@ -29,11 +29,29 @@ from selene.schema.relay import (
     EntityConnectionField,
     Entities,
     get_filter_string_for_pagination,
+    selects_any_node_field,
 )
 
+from selene.schema.entities import load_entity
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
 
 
+# fields of a note which gvmd only returns with details
+NOTE_DETAILS_FIELDS = frozenset(
+    [
+        'endTime',
+        'hosts',
+        'port',
+        'result',
+        'severity',
+        'task',
+        'text',
+        'threat',
+        'userTags',
+    ]
+)
+
+
 class GetNote(graphene.Field):
     """Gets a single note.
 
@@ -76,10 +94,7 @@ class GetNote(graphene.Field):
     @staticmethod
     @require_authentication
     def resolve(_root, info, note_id: UUID):
-        gmp = get_gmp(info)
-
-        xml = gmp.get_note(str(note_id))
-        return xml.find('note')
+        return load_entity(info, 'note', note_id, details=True)
 
 
 class GetNotes(EntityConnectionField):
@@ -144,8 +159,10 @@ class GetNotes(EntityConnectionField):
             filter_string, first=first, last=last, after=after, before=before
         )
 
+        details = selects_any_node_field(info, NOTE_DETAILS_FIELDS)
+
         xml: XmlElement = gmp.get_notes(
-            filter=filter_string.filter_string, details=True
+            filter=filter_string.filter_string, details=details
         )
 
         note_elements = xml.findall('note')
@@ -16,13 +16,18 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from typing import Dict, Optional
+
 import graphene
 
+from selene.schema.parser import parse_nvt_tags
 from selene.schema.utils import (
     get_datetime_from_element,
     get_int_from_element,
+    get_subelement,
     get_text_from_element,
     get_text,
+    XmlElement,
 )
 from selene.schema.severity import SeverityType
 
@@ -276,6 +281,14 @@ class NvtSolution(graphene.ObjectType):
         return root.text
 
 
+def _parse_tags(nvt: XmlElement) -> Optional[Dict[str, str]]:
+    # the tags are parsed once for all fields of NvtTags
+    tags = get_subelement(nvt, 'tags')
+    if tags is None:
+        return None
+    return parse_nvt_tags(tags.text)
+
+
 class NvtTags(graphene.ObjectType):
     """A NVT Tags field, dissolving the tags element of an NVT"""
 
@@ -447,7 +460,7 @@ class ScanConfigNVT(graphene.ObjectType):
 
     @staticmethod
     def resolve_tags(root, _info):
-        return root.find('tags')
+        return _parse_tags(root)
 
     @staticmethod
     def resolve_preferences(root, _info):
@@ -537,10 +550,7 @@ class NVT(EntityObjectType):
 
     @staticmethod
     def resolve_tags(root, _info):
-        nvt = root.find('nvt')
-        if nvt is not None:
-            return nvt.find('tags')
-        return None
+        return _parse_tags(root.find('nvt'))
 
     @staticmethod
     def resolve_category(root, _info):
@@ -29,7 +29,7 @@ from selene.schema.entities import (
 #   schema: ExportByIds, ExportByIds.'
 
 ExportByIdsClass = create_export_secinfos_by_ids_mutation(
-    info_type=GvmInfoType.NVT
+    info_type=GvmInfoType.NVT, export_name='nvts'
 )
 
 
@@ -42,6 +42,7 @@ ExportByFilterClass = create_export_by_filter_mutation(
     entities_name='info_list',
     with_details=True,
     info_type=GvmInfoType.NVT,
+    export_name='nvts',
 )
 
 
@@ -160,7 +160,9 @@ class DeleteOperatingSystemsByFilter(DeleteByFilterClass):
 #   schema: ExportByIds, ExportByIds.'
 
 ExportByIdsClass = create_export_by_ids_mutation(
-    entity_name='asset', asset_type=GvmAssetType.OPERATING_SYSTEM
+    entity_name='asset',
+    asset_type=GvmAssetType.OPERATING_SYSTEM,
+    export_name='operating_systems',
 )
 
 
@@ -169,7 +171,9 @@ class ExportOperatingSystemsByIds(ExportByIdsClass):
 
 
 ExportByFilterClass = create_export_by_filter_mutation(
-    entity_name='asset', asset_type=GvmAssetType.OPERATING_SYSTEM
+    entity_name='asset',
+    asset_type=GvmAssetType.OPERATING_SYSTEM,
+    export_name='operating_systems',
 )
 
 
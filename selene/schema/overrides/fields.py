@@ -36,10 +36,12 @@ from selene.schema.entity import EntityObjectType
 from selene.schema.nvts.fields import ScanConfigNVT as NVT
 from selene.schema.results.queries import Result
 from selene.schema.tasks.fields import Task
+from selene.schema.node import Node
 
 
 class Override(EntityObjectType):
     class Meta:
+        interfaces = (Node,)
         default_resolver = find_resolver
 
     end_time = graphene.DateTime()
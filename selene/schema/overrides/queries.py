@@ -28,13 +28,31 @@ from selene.schema.relay import (
     EntityConnectionField,
     Entities,
     get_filter_string_for_pagination,
+    selects_any_node_field,
 )
 
+from selene.schema.entities import load_entity
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
 
 from selene.schema.overrides.fields import Override
 
 
+# fields of an override which gvmd only returns with details
+OVERRIDE_DETAILS_FIELDS = frozenset(
+    [
+        'endTime',
+        'hosts',
+        'newSeverity',
+        'port',
+        'result',
+        'severity',
+        'task',
+        'text',
+        'userTags',
+    ]
+)
+
+
 class GetOverride(graphene.Field):
     """Gets a single override.
 
@@ -77,10 +95,7 @@ class GetOverride(graphene.Field):
     @staticmethod
     @require_authentication
     def resolve(_root, info, override_id: UUID):
-        gmp = get_gmp(info)
-
-        xml = gmp.get_override(str(override_id))
-        return xml.find('override')
+        return load_entity(info, 'override', override_id, details=True)
 
 
 class GetOverrides(EntityConnectionField):
@@ -145,8 +160,10 @@ class GetOverrides(EntityConnectionField):
             filter_string, first=first, last=last, after=after, before=before
         )
 
+        details = selects_any_node_field(info, OVERRIDE_DETAILS_FIELDS)
+
         xml: XmlElement = gmp.get_overrides(
-            filter=filter_string.filter_string, details=True
+            filter=filter_string.filter_string, details=details
         )
 
         override_elements = xml.findall('override')
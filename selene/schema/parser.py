@@ -19,14 +19,24 @@
 import datetime
 import re
 
+from functools import lru_cache
 from uuid import UUID
 
-from typing import Union, Optional
+from typing import Dict, Union, Optional
 
 from django.utils.dateparse import parse_datetime as django_parse_datatime
 
 ROWS_RE = re.compile(r'(^|\s+)rows=\S+\s*')
 FIRST_RE = re.compile(r'(^|\s+)first=\S+\s*')
+ROWS_VALUE_RE = re.compile(r'(?:^|\s)rows=(-?\d+)(?=\s|$)')
+FIRST_VALUE_RE = re.compile(r'(?:^|\s)first=(-?\d+)(?=\s|$)')
+GVMD_DATETIME_RE = re.compile(
+    r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:Z|[+-]\d{2}:\d{2})', re.ASCII
+)
+
+# number of distinct values kept by the memoized parsers. lists of results
+# or NVTs contain the same timestamps and ids over and over.
+PARSE_CACHE_SIZE = 4096
 
 
 class FilterString:
@@ -45,6 +55,18 @@ class FilterString:
         filter_string = FIRST_RE.sub(' ', self.filter_string)
         return FilterString(filter_string.strip())
 
+    @property
+    def rows(self) -> Optional[int]:
+        """Value of the rows term or None if the filter has no rows term"""
+        matches = ROWS_VALUE_RE.findall(self.filter_string or '')
+        return int(matches[-1]) if matches else None
+
+    @property
+    def first(self) -> Optional[int]:
+        """Value of the first term or None if the filter has no first term"""
+        matches = FIRST_VALUE_RE.findall(self.filter_string or '')
+        return int(matches[-1]) if matches else None
+
     def add_rows(self, rows: int) -> "FilterString":
         """Add rows filter term"""
         filter_string = self.filter_string + f' rows={rows}'
@@ -82,11 +104,52 @@ def parse_bool(value: Union[str, int]) -> Optional[bool]:
     return False
 
 
+def _parse_gvmd_datetime(value: str) -> Optional[datetime.datetime]:
+    """Parse the datetime formats of gvmd
+
+    Only 'YYYY-MM-DDTHH:MM:SSZ' and 'YYYY-MM-DDTHH:MM:SS+HH:MM' are
+    supported. Returns None for all other formats.
+    """
+    if not GVMD_DATETIME_RE.fullmatch(value):
+        return None
+
+    # fromisoformat supports Z only since python 3.11
+    if value[-1] == 'Z':
+        value = value[:-1] + '+00:00'
+
+    return datetime.datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def parse_datetime(value: str) -> Optional[datetime.datetime]:
-    """Parse a string as datetime"""
-    if value is not None:
-        return django_parse_datatime(value)
-    return None
+    """Parse a string as datetime
+
+    The results are memoized. datetime objects are immutable and can be
+    shared.
+    """
+    if value is None:
+        return None
+
+    parsed = _parse_gvmd_datetime(value)
+    if parsed is not None:
+        return parsed
+
+    return django_parse_datatime(value)
+
+
+def parse_nvt_tags(value: str) -> Dict[str, str]:
+    """Parse the tags string of a NVT like 'summary=foo|insight=bar' as dict"""
+    tags = {}
+
+    if not value:
+        return tags
+
+    for tag in value.split('|'):
+        key, separator, tag_value = tag.strip().partition('=')
+        if separator and key not in tags:
+            tags[key] = tag_value
+
+    return tags
 
 
 def parse_filter_string(value: str) -> FilterString:
@@ -106,8 +169,12 @@ def parse_int(value: str, *, safe: bool = True) -> Optional[int]:
         raise e from None
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def parse_uuid(value: str) -> Optional[UUID]:
-    """Parse a string as UUID"""
+    """Parse a string as UUID
+
+    The results are memoized. UUID objects are immutable and can be shared.
+    """
     if not value:
         return None
 
@@ -28,6 +28,7 @@ from selene.schema.parser import parse_uuid
 from selene.schema.entity import EntityObjectType, EntityPermission
 
 from selene.schema.utils import get_boolean_from_element, get_text_from_element
+from selene.schema.node import Node
 
 # Needed for gmp command in CreatePermission mutation
 class PermissionEntityType(graphene.Enum):
@@ -105,6 +106,9 @@ class PermissionResource(graphene.ObjectType):
 
 
 class Permission(EntityObjectType):
+    class Meta:
+        interfaces = (Node,)
+
     resource = graphene.Field(PermissionResource)
     subject = graphene.Field(PermissionSubject)
 
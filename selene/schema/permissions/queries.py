@@ -24,6 +24,7 @@ import graphene
 from graphql import ResolveInfo
 from selene.schema.parser import FilterString
 
+from selene.schema.entities import load_entity
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
 from selene.schema.permissions.fields import Permission
 
@@ -45,10 +46,7 @@ class GetPermission(graphene.Field):
     @staticmethod
     @require_authentication
     def resolve(_root, info, permission_id: UUID):
-        gmp = get_gmp(info)
-
-        xml = gmp.get_permission(str(permission_id))
-        return xml.find('permission')
+        return load_entity(info, 'permission', permission_id)
 
 
 class GetPermissions(EntityConnectionField):
@@ -28,6 +28,7 @@ from selene.schema.entity import EntityObjectType
 
 from selene.schema.nvts.fields import NvtPreference
 from selene.schema.scan_configs.fields import ScannerPreference
+from selene.schema.node import Node
 
 
 class PolicyFamily(graphene.ObjectType):
@@ -99,6 +100,9 @@ class Policy(EntityObjectType):
     """Policy object type. Can be used in GetPolicy and GetPolicies
     queries."""
 
+    class Meta:
+        interfaces = (Node,)
+
     trash = graphene.Int()
     family_count = graphene.Int()
     family_growing = graphene.Boolean()
@@ -30,6 +30,7 @@ from selene.schema.relay import (
     get_filter_string_for_pagination,
 )
 
+from selene.schema.entities import load_entity
 from selene.schema.utils import require_authentication, get_gmp, XmlElement
 
 from selene.schema.policies.fields import Policy
@@ -84,10 +85,15 @@ class GetPolicy(graphene.Field):
         # - <permissions> subelement of <task>
         # - Not needed for single policy: <filters>, <sort>, <configs>,
         #   <policy_count>
-        gmp = get_gmp(info)
-
-        xml = gmp.get_policy(str(policy_id), audits=True)
-        return xml.find('config')
+        return load_entity(
+            info,
+            'policy',
+            policy_id,
+            entities_name='policies',
+            gmp_entity_response='config',
+            details=True,
+            audits=True,
+        )
 
 
 class GetPolicies(EntityConnectionField):
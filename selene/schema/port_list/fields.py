@@ -28,6 +28,7 @@ from selene.schema.parser import parse_uuid
 from selene.schema.resolver import find_resolver
 
 from selene.schema.utils import get_text_from_element, get_int_from_element
+from selene.schema.node import Node
 
 
 class PortRangeType(graphene.Enum):
@@ -98,6 +99,7 @@ class PortList(EntityObjectType):
     """A list of ports to scan"""
 
     class Meta:
+        interfaces = (Node,)
         default_resolver = find_resolver
 
     port_ranges = graphene.List(
@@ -29,11 +29,23 @@ from selene.schema.relay import (
     EntityConnectionField,
     Entities,
     get_filter_string_for_pagination,
+    selects_any_node_field,
 )
 
+from selene.schema.entities import load_entity
 from selene.schema.utils import require_authentication, get_gmp, XmlElement
 
 
+# fields of a port list which gvmd only returns with details
+PORT_LIST_DETAILS_FIELDS = frozenset(
+    [
+        'portRanges',
+        'targets',
+        'userTags',
+    ]
+)
+
+
 class GetPortList(graphene.Field):
     """Get a single portlist
 
@@ -87,10 +99,7 @@ class GetPortList(graphene.Field):
     @staticmethod
     @require_authentication
     def resolve(_root, info: ResolveInfo, port_list_id: UUID):
-        gmp = get_gmp(info)
-
-        xml: XmlElement = gmp.get_port_list(str(port_list_id))
-        return xml.find('port_list')
+        return load_entity(info, 'port_list', port_list_id, details=True)
 
 
 class GetPortLists(EntityConnectionField):
@@ -151,9 +160,10 @@ class GetPortLists(EntityConnectionField):
             filter_string, first=first, last=last, after=after, before=before
         )
 
-        # details are required for port ranges
+        details = selects_any_node_field(info, PORT_LIST_DETAILS_FIELDS)
+
         xml: XmlElement = gmp.get_port_lists(
-            filter=filter_string.filter_string, details=True
+            filter=filter_string.filter_string, details=details
         )
 
         port_list_elements = xml.findall('port_list')
@@ -19,7 +19,16 @@
 from base64 import b64encode, b64decode
 
 from collections import OrderedDict
-from typing import List, Optional, Type, Tuple, Iterable
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Type,
+    Tuple,
+)
 
 import graphene
 
@@ -95,6 +104,73 @@ def get_filter_string_for_pagination(
     return filter_string
 
 
+def _get_selected_fields(
+    info: ResolveInfo, selection_set: ast.SelectionSet
+) -> Iterator[ast.Field]:
+    if selection_set is None:
+        return
+
+    for selection in selection_set.selections:
+        if isinstance(selection, ast.Field):
+            yield selection
+        elif isinstance(selection, ast.InlineFragment):
+            yield from _get_selected_fields(info, selection.selection_set)
+        elif isinstance(selection, ast.FragmentSpread):
+            fragment = info.fragments[selection.name.value]
+            yield from _get_selected_fields(info, fragment.selection_set)
+
+
+def _get_fields_by_path(info: ResolveInfo, *path: str) -> List[ast.Field]:
+    fields = info.field_asts
+    for name in path:
+        fields = [
+            selected
+            for field in fields
+            for selected in _get_selected_fields(info, field.selection_set)
+            if selected.name.value == name
+        ]
+    return fields
+
+
+def get_selected_field_names(info: ResolveInfo, *path: str) -> Set[str]:
+    """Return the names of the fields selected for the resolved field
+
+    Args:
+        info: ResolveInfo of the resolved field
+        path: Names of nested fields to descend into, e.g. 'edges', 'node'
+    """
+    return {
+        selected.name.value
+        for field in _get_fields_by_path(info, *path)
+        for selected in _get_selected_fields(info, field.selection_set)
+    }
+
+
+def get_node_field_names(info: ResolveInfo) -> Set[str]:
+    """Return the names of the fields selected for the entities of a
+    connection
+
+    Considers the fields selected via `nodes` and `edges { node }` including
+    fragments. The names are the (camel cased) names of the schema and not
+    the aliases.
+    """
+    return get_selected_field_names(info, 'nodes') | get_selected_field_names(
+        info, 'edges', 'node'
+    )
+
+
+def selects_any_node_field(
+    info: ResolveInfo, field_names: Iterable[str]
+) -> bool:
+    """Check whether one of the passed fields is selected for the entities
+    of a connection
+
+    Can be used to request the details of the entities from gvmd only if a
+    field depending on them is queried.
+    """
+    return not get_node_field_names(info).isdisjoint(field_names)
+
+
 class EntitiesCounts(graphene.ObjectType):
     """Counts for the requested entity type"""
 
@@ -178,6 +254,74 @@ class Entities:
         )
 
 
+class ListEntities(Entities):
+    """A page of a list of entities which is paginated by selene
+
+    Some lists, like the hosts of a report, can't be paginated by gvmd. The
+    requested page is sliced from the complete list using the first and rows
+    terms of the filter string.
+    """
+
+    def __init__(self, elements: List, filter_string: FilterStringModel):
+        first = filter_string.first
+        offset = first - 1 if first is not None and first > 0 else 0
+
+        limit = filter_string.rows
+        end = offset + limit if limit is not None and limit >= 0 else None
+
+        super().__init__(elements[offset:end], None, None)
+
+        self.count = len(elements)
+        self.offset = offset
+        self.limit = limit
+
+    def get_filtered_count(self) -> int:
+        return self.count
+
+    def get_total_count(self) -> int:
+        return self.count
+
+    def get_offset(self) -> int:
+        return self.offset
+
+    def get_limit(self) -> Optional[int]:
+        return self.limit
+
+
+class CountsOnlyEntities(Entities):
+    """Entities of a connection for which only the counts are selected
+
+    gvmd is asked for a single entity only. The limit and the length of the
+    page are calculated from the originally requested number of rows.
+    """
+
+    def __init__(self, entities: Entities, limit: Optional[int]):
+        super().__init__(
+            [], entities.counts_element, entities.requested_element
+        )
+        self.entities = entities
+        self.limit = limit
+
+    def get_filtered_count(self) -> Optional[int]:
+        return self.entities.get_filtered_count()
+
+    def get_total_count(self) -> Optional[int]:
+        return self.entities.get_total_count()
+
+    def get_offset(self) -> Optional[int]:
+        return self.entities.get_offset()
+
+    def get_limit(self) -> Optional[int]:
+        return self.limit
+
+    def get_length(self) -> int:
+        offset = self.get_offset() or 0
+        available = max((self.get_filtered_count() or 0) - offset, 0)
+        if self.limit is not None and self.limit > 0:
+            return min(available, self.limit)
+        return available
+
+
 def create_edge_graphene_type(
     name: str, type_name, entity: Type[graphene.ObjectType]
 ) -> Type[graphene.ObjectType]:
@@ -347,9 +491,19 @@ class EntityConnection(graphene.ObjectType):
         return root.get_entities_counts()
 
 
+_connection_types: Dict[Type[graphene.ObjectType], Type[EntityConnection]] = {}
+
+
 def create_entity_connection_type(
     entity_type: graphene.ObjectType,
 ) -> Type[EntityConnection]:
+    # several fields may return a connection for the same entity type. the
+    # type names in the schema must be unique therefore the connection type
+    # is created only once.
+    connection_type = _connection_types.get(entity_type)
+    if connection_type is not None:
+        return connection_type
+
     entity_type_name = entity_type.__name__
     connection_type = type(
         f"{entity_type_name}Connection",
@@ -362,6 +516,7 @@ def create_entity_connection_type(
             }
         },
     )
+    _connection_types[entity_type] = connection_type
     return connection_type
 
 
@@ -457,11 +612,71 @@ class EntityConnectionField(graphene.Field):
                 description="Show the last number of nodes using the before "
                 "cursor"
             ),
-            resolver=self.resolve_entities,
+            resolver=self.resolve_connection,
             description=description,
             **kwargs,
         )
 
+    def resolve_connection(
+        self,
+        root,
+        info: ResolveInfo,
+        filter_string: FilterStringModel = None,
+        after: str = None,
+        before: str = None,
+        first: int = None,
+        last: int = None,
+        **kwargs,
+    ) -> Optional[Entities]:
+        """Resolve the entities of the connection
+
+        If neither nodes nor edges are selected only a single entity is
+        requested from gvmd because the counts don't depend on the loaded
+        entities.
+        """
+        if _get_fields_by_path(info, 'nodes') or _get_fields_by_path(
+            info, 'edges'
+        ):
+            return self.resolve_entities(
+                root,
+                info,
+                filter_string=filter_string,
+                after=after,
+                before=before,
+                first=first,
+                last=last,
+                **kwargs,
+            )
+
+        filter_string = get_filter_string_for_pagination(
+            filter_string, first=first, last=last, after=after, before=before
+        )
+        limit = filter_string.rows
+
+        if limit is None and (
+            _get_fields_by_path(info, 'pageInfo')
+            or not get_selected_field_names(info, 'counts').isdisjoint(
+                ['limit', 'length']
+            )
+        ):
+            # the number of rows per page is a setting of the user in
+            # gvmd. load the page to get the limit and length.
+            return self.resolve_entities(
+                root, info, filter_string=filter_string, **kwargs
+            )
+
+        filter_string = FilterStringModel(str(filter_string))
+        entities = self.resolve_entities(
+            root,
+            info,
+            filter_string=filter_string.remove_rows().add_rows(1),
+            **kwargs,
+        )
+        if entities is None:
+            return None
+
+        return CountsOnlyEntities(entities, limit)
+
     @staticmethod
     def resolve_entities(*args, **kwargs) -> Entities:
         """Implementation should return an Entities instance"""
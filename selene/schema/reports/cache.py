@@ -0,0 +1,365 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019-2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Disk cache for the responses of finished reports
+
+A report of a finished scan doesn't change anymore. Only the notes and
+overrides applied to its results may change. Therefore the responses of
+finished reports are kept on disk keyed by the report, the filter, the
+report format, the pruned elements, the current state of the notes and
+overrides and the user settings changing the response like the timezone and
+the severity class. Repeated queries of a report only request a summary of
+it, the notes, the overrides and the settings from gvmd and read the
+response from disk.
+
+The summary is requested for every query. It verifies that the user is still
+allowed to access the report, that it still exists and that its scan is
+done. The summary and the state are requested once per request for all
+connections of a report. Therefore a cache hit costs four small gvmd
+commands instead of the detailed report. That only pays off for reports with
+many results. Smaller reports are always requested from gvmd after their
+summary.
+"""
+
+import os
+import tempfile
+
+from typing import Dict, Hashable, Iterator, Optional, Tuple
+from uuid import UUID
+
+from graphql import ResolveInfo
+
+from gvm.errors import GvmResponseError
+
+from selene.cache import dump_response, load_response, make_digest
+from selene.connections import get_pruned_paths, keep_response_elements
+from selene.schema.parser import parse_int
+from selene.schema.utils import (
+    XmlElement,
+    get_gmp,
+    get_request,
+    get_text_from_element,
+)
+
+DEFAULT_REPORT_CACHE_MAX_SIZE = 1024 * 1024 * 1024  # 1 GiB
+
+# the notes and overrides changed most recently and their number identify
+# their current state. inactive ones don't apply to results.
+ANNOTATION_STATE_FILTER = 'active=1 rows=1 first=1 sort-reverse=modified'
+
+FINISHED_SCAN_RUN_STATUS = 'Done'
+
+# requesting smaller reports from gvmd is faster than requesting their state,
+# see bench_report_cache
+MIN_CACHED_RESULT_COUNT = 200
+
+# user settings changing the severities and threat levels of the results
+REPORT_SETTING_IDS = (
+    'f16bb236-a32d-4cd5-a880-e0fcf2599f59',  # Severity Class
+    '77ec2444-e7f2-4a80-a59b-f4237782d93f',  # Dynamic Severity
+)
+
+
+class ReportCache:
+    """Size bounded least recently used cache of report responses in a
+    directory
+
+    The responses of a report are stored in a sub directory named by the ID
+    of the report. The modification time of the files marks their last
+    usage. Several processes may use the same directory. Errors of the file
+    system are treated like missing entries.
+
+    Args:
+        directory: Directory of the cached responses
+        max_size: Max number of bytes of all cached responses
+    """
+
+    def __init__(
+        self, directory: str, max_size: int = DEFAULT_REPORT_CACHE_MAX_SIZE
+    ):
+        self.directory = directory
+        self.max_size = max_size
+
+    def _get_report_directory(self, report_id: str) -> str:
+        # raises ValueError for anything else than an UUID
+        return os.path.join(self.directory, str(UUID(report_id)))
+
+    def _get_path(self, report_id: str, key: str) -> str:
+        return os.path.join(self._get_report_directory(report_id), f'{key}.xml')
+
+    def get(self, report_id: str, key: str) -> Optional[XmlElement]:
+        path = self._get_path(report_id, key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            return None
+
+        return load_response(data)
+
+    def put(self, report_id: str, key: str, response: XmlElement):
+        data = dump_response(response)
+        if len(data) > self.max_size:
+            return
+
+        path = self._get_path(report_id, key)
+        try:
+            # the responses contain the data of other users
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+
+            # the file is created with mode 0600
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(path), suffix='.tmp'
+            )
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                # readers never see partially written files
+                os.replace(tmp_path, path)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            return
+
+        self.evict()
+
+    def remove(self, report_id: str):
+        """Remove all cached responses of a report"""
+        try:
+            report_directory = self._get_report_directory(report_id)
+        except ValueError:
+            return
+
+        for path in self._iter_files(report_directory):
+            _remove_file(path)
+
+        _remove_directory(report_directory)
+
+    def size(self) -> int:
+        """Return the number of bytes of all cached responses"""
+        return sum(size for _, size, _ in self._iter_entries())
+
+    def evict(self):
+        """Remove the least recently used responses until the cache doesn't
+        exceed its max size anymore"""
+        entries = list(self._iter_entries())
+        size = sum(size for _, size, _ in entries)
+        if size <= self.max_size:
+            return
+
+        for _, file_size, path in sorted(entries):
+            _remove_file(path)
+            _remove_directory(os.path.dirname(path))
+
+            size -= file_size
+            if size <= self.max_size:
+                return
+
+    def _iter_entries(self) -> Iterator[Tuple[float, int, str]]:
+        try:
+            report_directories = [
+                entry.path
+                for entry in os.scandir(self.directory)
+                if entry.is_dir()
+            ]
+        except OSError:
+            return
+
+        for report_directory in report_directories:
+            for path in self._iter_files(report_directory):
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield stat.st_mtime, stat.st_size, path
+
+    @staticmethod
+    def _iter_files(directory: str) -> Iterator[str]:
+        try:
+            paths = [
+                entry.path
+                for entry in os.scandir(directory)
+                if entry.name.endswith('.xml')
+            ]
+        except OSError:
+            return
+
+        yield from paths
+
+
+def _remove_file(path: str):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _remove_directory(path: str):
+    # only empty directories are removed
+    try:
+        os.rmdir(path)
+    except OSError:
+        pass
+
+
+def get_report_cache(info: ResolveInfo) -> Optional[ReportCache]:
+    return getattr(get_request(info), 'report_cache', None)
+
+
+def _get_annotation_state(response: XmlElement, name: str) -> Hashable:
+    element = response.find(name)
+    count = response.find(f'{name}_count')
+
+    return (
+        get_text_from_element(count, 'filtered'),
+        None if element is None else element.get('id'),
+        get_text_from_element(element, 'modification_time'),
+    )
+
+
+def get_annotation_state(gmp) -> Hashable:
+    """Return the state of the active notes and overrides of the user"""
+    return (
+        _get_annotation_state(
+            gmp.get_notes(filter=ANNOTATION_STATE_FILTER), 'note'
+        ),
+        _get_annotation_state(
+            gmp.get_overrides(filter=ANNOTATION_STATE_FILTER), 'override'
+        ),
+    )
+
+
+def get_user_settings(gmp) -> Dict[str, Optional[str]]:
+    """Return the values of the settings of the current user by id"""
+    with keep_response_elements():
+        response = gmp.get_settings()
+
+    return {
+        setting.get('id'): get_text_from_element(setting, 'value')
+        for setting in response.findall('setting')
+    }
+
+
+def get_report_settings(gmp, summary: XmlElement) -> Hashable:
+    """Return the user settings changing the response of a report
+
+    The timestamps of a report are in the timezone of the user, which is
+    contained in the summary of the report.
+    """
+    inner_report = summary.find('report/report')
+    values = get_user_settings(gmp)
+
+    return (
+        get_text_from_element(inner_report, 'timezone'),
+        tuple(values.get(setting_id) for setting_id in REPORT_SETTING_IDS),
+    )
+
+
+def is_finished_report(response: XmlElement) -> bool:
+    inner_report = response.find('report/report')
+    return (
+        get_text_from_element(inner_report, 'scan_run_status')
+        == FINISHED_SCAN_RUN_STATUS
+    )
+
+
+def is_small_report(response: XmlElement) -> bool:
+    count = response.find('report/report/result_count')
+    if count is None:
+        return False
+
+    # older gvmd versions don't send the full element
+    full = parse_int(get_text_from_element(count, 'full') or count.text)
+    return full is not None and full < MIN_CACHED_RESULT_COUNT
+
+
+def get_report_state(gmp, report_id: str) -> Optional[Hashable]:
+    """Return the state of a report or None if its responses must not be
+    cached
+
+    The commands are sent without pruning any elements. Therefore they are
+    only sent once per request for all connections of a report.
+    """
+    with keep_response_elements():
+        summary = gmp.get_report(report_id, details=False)
+        if not is_finished_report(summary) or is_small_report(summary):
+            return None
+
+        try:
+            return (
+                get_annotation_state(gmp),
+                get_report_settings(gmp, summary),
+            )
+        except GvmResponseError:
+            # the user may not be allowed to get notes, overrides or settings
+            return None
+
+
+def get_report(
+    info: ResolveInfo,
+    report_id: str,
+    *,
+    filter_string: Optional[str] = None,
+    report_format_id: Optional[str] = None,
+    delta_report_id: Optional[str] = None,
+) -> XmlElement:
+    """Get a report with details from gvmd or the report cache
+
+    Delta reports aren't cached because the scan of the other report may
+    still be running.
+    """
+    gmp = get_gmp(info)
+
+    def load():
+        return gmp.get_report(
+            report_id,
+            filter=filter_string,
+            report_format_id=report_format_id,
+            delta_report_id=delta_report_id,
+            details=True,
+        )
+
+    cache = get_report_cache(info)
+    if cache is None or delta_report_id is not None:
+        return load()
+
+    state = get_report_state(gmp, report_id)
+    if state is None:
+        return load()
+
+    # the order of sets isn't stable across processes
+    key = make_digest(
+        get_request(info).session.get('username'),
+        filter_string,
+        report_format_id,
+        tuple(sorted(get_pruned_paths())),
+        state,
+    )
+
+    response = cache.get(report_id, key)
+    if response is not None:
+        return response
+
+    response = load()
+
+    cache.put(report_id, key, response)
+
+    return response
@@ -16,28 +16,55 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import abc
+
+from typing import List, Optional, Tuple
+
 import graphene
 
+from graphql import ResolveInfo
+
+from gvm.errors import GvmResponseError
+
 from selene.schema.resolver import text_resolver, int_resolver
 from selene.schema.base import BaseObjectType
 from selene.schema.entity import EntityUserTags
 from selene.schema.severity import SeverityType
 
+from selene.connections import prune_response_elements
+from selene.schema.reports.cache import get_report, get_user_settings
 from selene.schema.utils import (
+    get_gmp,
+    get_subelement,
     get_text,
     get_owner,
     get_boolean_from_element,
     get_datetime_from_element,
     get_int_from_element,
     get_text_from_element,
+    XmlElement,
+)
+from selene.schema.parser import parse_uuid, parse_int, FilterString
+from selene.schema.relay import (
+    Entities,
+    EntityConnectionField,
+    ListEntities,
+    get_filter_string_for_pagination,
 )
-from selene.schema.parser import parse_uuid, parse_int
 from selene.schema.tasks.fields import Task
-from selene.schema.results.queries import Result
+from selene.schema.results.queries import (
+    Result,
+    get_unselected_result_elements,
+)
 from selene.schema.hosts.fields import ReportHost
 from selene.schema.nvts.fields import ScanConfigNVT
 from selene.schema.permissions.fields import Permission
 
+RESULT_HOSTS_ONLY_TERM = 'result_hosts_only='
+
+# user setting containing the id of the default filter for results
+RESULTS_FILTER_SETTING_ID = '739ab810-163d-11e3-9af6-406186ea4fc5'
+
 
 class CountType(graphene.ObjectType):
     class Meta:
@@ -225,6 +252,414 @@ class ReportModel:
     def __init__(self):
         self.outer_report = None
         self.inner_report = None
+        self.report_format_id = None
+        self.delta_report_id = None
+
+    @property
+    def report_id(self) -> str:
+        return self.outer_report.get('id')
+
+
+def get_default_results_filter(info: ResolveInfo) -> FilterString:
+    """Return the default filter of the current user for results
+
+    gvmd applies this filter to the results of a report only if no filter is
+    passed. A filter containing only pagination terms like rows=1 replaces
+    it and changes the counts of the report. Therefore the default filter
+    must be passed explicitly together with these terms.
+
+    The settings and the filter are requested once per request. The report
+    cache uses the same settings.
+    """
+    gmp = get_gmp(info)
+
+    try:
+        filter_id = get_user_settings(gmp).get(RESULTS_FILTER_SETTING_ID)
+        if not filter_id or filter_id == '0':
+            return FilterString('')
+
+        filter_element = get_subelement(gmp.get_filter(filter_id), 'filter')
+    except GvmResponseError:
+        # e.g. the filter has been deleted
+        return FilterString('')
+
+    return FilterString(get_text_from_element(filter_element, 'term') or '')
+
+
+def get_report_filter_string(
+    info: ResolveInfo, filter_string: Optional[FilterString]
+) -> Optional[FilterString]:
+    """Return the filter string of a connection of a report
+
+    If the filter string contains pagination terms only, e.g. rows=1 for
+    querying the counts, the default filter for results is combined with
+    them.
+    """
+    terms = FilterString(str(filter_string or ''))
+    if str(terms.remove_first().remove_rows()):
+        return filter_string
+
+    default_filter_string = get_default_results_filter(info)
+    if not str(default_filter_string):
+        return filter_string
+
+    if terms.first is not None:
+        default_filter_string = default_filter_string.remove_first().add_first(
+            terms.first
+        )
+    if terms.rows is not None:
+        default_filter_string = default_filter_string.remove_rows().add_rows(
+            terms.rows
+        )
+
+    return default_filter_string
+
+
+def _load_inner_report(
+    root: ReportModel, info: ResolveInfo, filter_string: Optional[str]
+) -> Optional[XmlElement]:
+    xml: XmlElement = get_report(
+        info,
+        root.report_id,
+        filter_string=filter_string,
+        report_format_id=root.report_format_id,
+        delta_report_id=root.delta_report_id,
+    )
+
+    return xml.find('report').find('report')
+
+
+class ReportResults(EntityConnectionField):
+    """Results of a report with pagination
+
+    The results are requested from gvmd page by page. The filter string is
+    applied to the results of the report.
+
+    Example:
+
+        query {
+            report (id: "e501545c-0c4d-47d9-a9f8-28da34c6b958") {
+                results (filterString: "severity>5", first: 10) {
+                    nodes {
+                        id
+                        name
+                    }
+                    counts {
+                        filtered
+                    }
+                }
+            }
+        }
+    """
+
+    entity_type = Result
+
+    @staticmethod
+    def resolve_entities(  # pylint: disable=arguments-differ
+        root: ReportModel,
+        info: ResolveInfo,
+        filter_string: FilterString = None,
+        after: str = None,
+        before: str = None,
+        first: int = None,
+        last: int = None,
+    ) -> Optional[Entities]:
+        filter_string = get_filter_string_for_pagination(
+            get_report_filter_string(info, filter_string),
+            first=first,
+            last=last,
+            after=after,
+            before=before,
+        )
+
+        pruned_paths = [
+            f'report/report/results/result/{name}'
+            for name in get_unselected_result_elements(info)
+        ]
+
+        with prune_response_elements(pruned_paths):
+            inner_report = _load_inner_report(
+                root, info, filter_string.filter_string
+            )
+        if inner_report is None:
+            return None
+
+        results = inner_report.find('results')
+        if results is None:
+            return None
+
+        return Entities(
+            results.findall('result'),
+            inner_report.find('result_count'),
+            results,
+        )
+
+
+class ReportPortsEntities(Entities):
+    """The ports of a report only have a single count"""
+
+    def get_filtered_count(self) -> Optional[int]:
+        return self.get_total_count()
+
+
+class ReportPorts(EntityConnectionField):
+    """Ports of a report with pagination
+
+    gvmd paginates the ports of a report like the results. Therefore the
+    ports are requested from gvmd page by page.
+    """
+
+    entity_type = ReportPort
+
+    @staticmethod
+    def resolve_entities(  # pylint: disable=arguments-differ
+        root: ReportModel,
+        info: ResolveInfo,
+        filter_string: FilterString = None,
+        after: str = None,
+        before: str = None,
+        first: int = None,
+        last: int = None,
+    ) -> Optional[Entities]:
+        filter_string = get_filter_string_for_pagination(
+            get_report_filter_string(info, filter_string),
+            first=first,
+            last=last,
+            after=after,
+            before=before,
+        )
+
+        inner_report = _load_inner_report(
+            root, info, filter_string.filter_string
+        )
+        if inner_report is None:
+            return None
+
+        ports = inner_report.find('ports')
+        if ports is None:
+            return None
+
+        return ReportPortsEntities(
+            ports.findall('port'), ports.find('count'), ports
+        )
+
+
+class ReportListConnectionField(EntityConnectionField, abc.ABC):
+    """Base class for connections of lists in a report which gvmd doesn't
+    paginate
+
+    The filter terms besides first and rows are applied by gvmd. The page is
+    sliced from the complete list of the report. The subtrees of the report
+    listed in pruned_elements aren't required for the list and are dropped
+    while parsing the response.
+
+    gvmd only lists the hosts having results on the requested page of results
+    by default. Therefore the report is requested again with
+    result_hosts_only=0 and a single result, unless the filter string
+    contains a result_hosts_only term itself.
+    """
+
+    # child elements of the inner report which aren't required for the list
+    pruned_elements: Tuple[str, ...] = ()
+
+    @staticmethod
+    @abc.abstractmethod
+    def get_elements(inner_report: XmlElement) -> Optional[List]:
+        """Return the complete list from the inner report or None if the
+        report doesn't contain the list"""
+
+    @classmethod
+    def resolve_entities(  # pylint: disable=arguments-differ
+        cls,
+        root: ReportModel,
+        info: ResolveInfo,
+        filter_string: FilterString = None,
+        after: str = None,
+        before: str = None,
+        first: int = None,
+        last: int = None,
+    ) -> Optional[Entities]:
+        filter_string = get_filter_string_for_pagination(
+            get_report_filter_string(info, filter_string),
+            first=first,
+            last=last,
+            after=after,
+            before=before,
+        )
+        filter_string = FilterString(str(filter_string))
+
+        report_filter = str(filter_string.remove_first().remove_rows())
+        if RESULT_HOSTS_ONLY_TERM not in report_filter:
+            report_filter = f'{report_filter} {RESULT_HOSTS_ONLY_TERM}0'
+
+        pruned_paths = [f'report/report/{name}' for name in cls.pruned_elements]
+
+        # the lists don't depend on the pagination of the results
+        with prune_response_elements(pruned_paths):
+            inner_report = _load_inner_report(
+                root, info, f'{report_filter.strip()} rows=1'
+            )
+        if inner_report is None:
+            return None
+
+        elements = cls.get_elements(inner_report)
+        if elements is None:
+            return None
+
+        return ListEntities(elements, filter_string)
+
+
+class ReportHosts(ReportListConnectionField):
+    """Hosts of a report with pagination"""
+
+    entity_type = ReportHost
+
+    pruned_elements = ('results', 'ports', 'errors')
+
+    @staticmethod
+    def get_elements(inner_report: XmlElement) -> List[XmlElement]:
+        return inner_report.findall('host')
+
+
+class ReportErrors(ReportListConnectionField):
+    """Errors of a report with pagination"""
+
+    entity_type = Error
+
+    pruned_elements = ('results', 'ports', 'host')
+
+    @staticmethod
+    def get_elements(inner_report: XmlElement) -> Optional[List[XmlElement]]:
+        errors = inner_report.find('errors')
+        if errors is None:
+            return None
+        return errors.findall('error')
+
+
+class ReportTLSCertificateModel:
+    """A TLS certificate found at a host during the scan
+
+    gvmd doesn't list the certificates of a report. They are collected from
+    the details of the report hosts.
+    """
+
+    def __init__(self, ip: str, hostname: str, fingerprint: str):
+        self.ip = ip
+        self.hostname = hostname
+        self.fingerprint = fingerprint
+        self.ports = []
+        self.certificate = None
+        self.details = {}
+
+
+def get_report_tls_certificates(
+    inner_report: XmlElement,
+) -> List[ReportTLSCertificateModel]:
+    certificates = []
+
+    for host in inner_report.findall('host'):
+        details = {
+            get_text_from_element(detail, 'name'): get_text_from_element(
+                detail, 'value'
+            )
+            for detail in host.findall('detail')
+        }
+
+        host_certificates = {}
+
+        for detail in host.findall('detail'):
+            if get_text_from_element(detail, 'name') != 'SSLInfo':
+                continue
+
+            # <port>::<fingerprint>
+            port, _, fingerprint = (
+                get_text_from_element(detail, 'value') or ''
+            ).partition('::')
+
+            certificate = host_certificates.get(fingerprint)
+            if certificate is None:
+                certificate = ReportTLSCertificateModel(
+                    get_text_from_element(host, 'ip'),
+                    details.get('hostname'),
+                    fingerprint,
+                )
+
+                data = details.get(f'Cert:{fingerprint}')
+                if data and data.startswith('x509:'):
+                    certificate.certificate = data[len('x509:') :]
+
+                # <key>:<value>|<key>:<value>|...
+                ssl_details = details.get(f'SSLDetails:{fingerprint}') or ''
+                for item in ssl_details.split('|'):
+                    key, _, value = item.partition(':')
+                    certificate.details[key] = value
+
+                host_certificates[fingerprint] = certificate
+                certificates.append(certificate)
+
+            port = parse_int(port)
+            if port is not None:
+                certificate.ports.append(port)
+
+    return certificates
+
+
+class ReportTLSCertificate(graphene.ObjectType):
+    """TLS certificate found at a host of a report"""
+
+    ip = graphene.String(description="IP of the host")
+    hostname = graphene.String(description="Hostname of the host")
+    ports = graphene.List(
+        graphene.Int, description="Ports using the certificate"
+    )
+    fingerprint = graphene.String(
+        description="SHA-256 fingerprint of the certificate"
+    )
+    certificate = graphene.String(description="Base64 encoded DER certificate")
+    subject_dn = graphene.String(description="Subject of the certificate")
+    issuer_dn = graphene.String(description="Issuer of the certificate")
+    serial = graphene.String(description="Serial of the certificate")
+    activation_time = graphene.String(
+        description="Start of the validity of the certificate"
+    )
+    expiration_time = graphene.String(
+        description="End of the validity of the certificate"
+    )
+
+    @staticmethod
+    def resolve_subject_dn(root: ReportTLSCertificateModel, _info):
+        return root.details.get('subject')
+
+    @staticmethod
+    def resolve_issuer_dn(root: ReportTLSCertificateModel, _info):
+        return root.details.get('issuer')
+
+    @staticmethod
+    def resolve_serial(root: ReportTLSCertificateModel, _info):
+        return root.details.get('serial')
+
+    @staticmethod
+    def resolve_activation_time(root: ReportTLSCertificateModel, _info):
+        return root.details.get('notBefore')
+
+    @staticmethod
+    def resolve_expiration_time(root: ReportTLSCertificateModel, _info):
+        return root.details.get('notAfter')
+
+
+class ReportTLSCertificates(ReportListConnectionField):
+    """TLS certificates of a report with pagination"""
+
+    entity_type = ReportTLSCertificate
+
+    # the same elements as for the hosts. both lists share the response.
+    pruned_elements = ReportHosts.pruned_elements
+
+    @staticmethod
+    def get_elements(
+        inner_report: XmlElement,
+    ) -> List[ReportTLSCertificateModel]:
+        return get_report_tls_certificates(inner_report)
 
 
 class Report(graphene.ObjectType):
@@ -237,16 +672,18 @@ class Report(graphene.ObjectType):
         timezone (str): Timezone
         timezone_abbreviation (str)
         port_count (List(TaskAlert)): Port count
-        ports (List(Port)): Ports involved in this report
+        ports (ReportPorts): Paginated ports involved in this report
         permissions (List(Permissions)): Permissions for this report
         result_count (ResultCount): Result count
-        results (List(Results)): Results in this report
+        results (ReportResults): Paginated results in this report
         severity (Severity):
-        host (Host): Host for this report
+        hosts (ReportHosts): Paginated hosts of this report
         scan_start (DateTime)
         scan_end (DateTime)
         error_count (int): Error count
-        errors = (List(Error)): Errors occurred
+        errors (ReportErrors): Paginated errors occurred
+        tls_certificates (ReportTLSCertificates): Paginated TLS
+            certificates found at the hosts
         report_format (str): Format from this report
     """
 
@@ -276,7 +713,7 @@ class Report(graphene.ObjectType):
     scan_end = graphene.DateTime()
 
     hosts_count = graphene.Field(CountType, description="Host counts")
-    hosts = graphene.List(ReportHost, description="The hosts for this report")
+    hosts = ReportHosts()
 
     closed_cves = graphene.Field(ReportEntities, description="Closed CVE count")
     vulnerabilities = graphene.Field(
@@ -288,22 +725,20 @@ class Report(graphene.ObjectType):
     applications = graphene.Field(
         ReportEntities, description="Application count"
     )
-    tls_certificates = graphene.Field(
-        ReportEntities, description="TLS certificate count"
-    )
+    tls_certificates = ReportTLSCertificates()
 
     ports_count = graphene.Field(CountType, description="Port counts")
-    ports = graphene.List(ReportPort, description="The ports in this report")
+    ports = ReportPorts()
 
     results_count = graphene.Field(
         ReportResultCount, description="Result counts"
     )
-    results = graphene.List(Result, description="The results for this report")
+    results = ReportResults()
 
     severity = graphene.Field(ReportSeverity)
 
     error_count = graphene.Field(CountType)
-    errors = graphene.List(Error)
+    errors = ReportErrors()
 
     permissions = graphene.List(Permission)
 
@@ -422,10 +857,6 @@ class Report(graphene.ObjectType):
     def resolve_applications(root, _info):
         return root.inner_report.find('apps')
 
-    @staticmethod
-    def resolve_tls_certificates(root, _info):
-        return root.inner_report.find('ssl_certs')
-
     @staticmethod
     def resolve_operating_systems(root, _info):
         return root.inner_report.find('os')
@@ -438,36 +869,11 @@ class Report(graphene.ObjectType):
     def resolve_ports_count(root, _info):
         return root.inner_report.find('ports')
 
-    @staticmethod
-    def resolve_ports(root, _info):
-        ports = root.inner_report.find('ports')
-        if ports is not None:
-            ports = ports.findall('port')
-            if len(ports) > 0:
-                return ports
-        return None
-
     @staticmethod
     def resolve_hosts_count(root, _info):
         hosts = root.inner_report.find('hosts')
         return hosts
 
-    @staticmethod
-    def resolve_hosts(root, _info):
-        hosts = root.inner_report.findall('host')
-        if hosts is not None and len(hosts) > 0:
-            return hosts
-        return None
-
-    @staticmethod
-    def resolve_results(root, _info):
-        results = root.inner_report.find('results')
-        if results is not None:
-            results = results.findall('result')
-            if len(results) > 0:
-                return results
-        return None
-
     @staticmethod
     def resolve_results_count(root, _info):
         return root.inner_report.find('result_count')
@@ -478,12 +884,3 @@ class Report(graphene.ObjectType):
         if errors is not None:
             return errors.find('count')
         return None
-
-    @staticmethod
-    def resolve_errors(root, _info):
-        errors = root.inner_report.find('errors')
-        if errors is not None:
-            errors = errors.findall('error')
-            if len(errors) > 0:
-                return errors
-        return None
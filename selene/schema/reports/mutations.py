@@ -20,15 +20,24 @@ from uuid import UUID
 
 import graphene
 
+from graphql import ResolveInfo
+
 from selene.schema.entities import (
     create_export_by_filter_mutation,
     create_export_by_ids_mutation,
     create_delete_by_ids_mutation,
     create_delete_by_filter_mutation,
 )
+from selene.schema.reports.cache import get_report_cache
 from selene.schema.utils import get_gmp, require_authentication
 
 
+def remove_cached_report(info: ResolveInfo, report_id: str):
+    cache = get_report_cache(info)
+    if cache is not None:
+        cache.remove(report_id)
+
+
 class DeleteReport(graphene.Mutation):
     """Deletes a report
 
@@ -49,6 +58,9 @@ class DeleteReport(graphene.Mutation):
     def mutate(_root, info, report_id):
         gmp = get_gmp(info)
         gmp.delete_report(report_id)
+
+        remove_cached_report(info, report_id)
+
         return DeleteReport(ok=True)
 
 
@@ -56,7 +68,9 @@ class DeleteReport(graphene.Mutation):
 # 'AssertionError: Found different types with the same name in the
 #   schema: DeleteByIds, DeleteByIds.'
 
-DeleteByIdsClass = create_delete_by_ids_mutation(entity_name='report')
+DeleteByIdsClass = create_delete_by_ids_mutation(
+    entity_name='report', on_delete=remove_cached_report
+)
 
 
 class DeleteReportsByIds(DeleteByIdsClass):
@@ -70,7 +84,9 @@ class DeleteReportsByIds(DeleteByIdsClass):
     """
 
 
-DeleteByFilterClass = create_delete_by_filter_mutation(entity_name='report')
+DeleteByFilterClass = create_delete_by_filter_mutation(
+    entity_name='report', on_delete=remove_cached_report
+)
 
 
 class DeleteReportsByFilter(DeleteByFilterClass):
@@ -22,7 +22,12 @@ from graphql import ResolveInfo
 
 import graphene
 
-from selene.schema.reports.fields import Report, ReportModel
+from selene.schema.reports.cache import get_report
+from selene.schema.reports.fields import (
+    Report,
+    ReportModel,
+    get_default_results_filter,
+)
 from selene.schema.parser import FilterString
 from selene.schema.relay import (
     EntityConnectionField,
@@ -85,17 +90,25 @@ class GetReport(graphene.Field):
         report_format_id: UUID = None,
         delta_report_id: UUID = None,
     ):
-        gmp = get_gmp(info)
         report = ReportModel()
-        xml: XmlElement = gmp.get_report(
+
+        if report_format_id is not None:
+            report.report_format_id = str(report_format_id)
+        if delta_report_id is not None:
+            report.delta_report_id = str(delta_report_id)
+
+        # the results and ports are loaded page by page by their
+        # connections. therefore only a single result is requested. the
+        # default filter of the user must be kept, it determines the counts.
+        filter_string = (
+            get_default_results_filter(info).remove_first().remove_rows()
+        )
+        xml: XmlElement = get_report(
+            info,
             str(report_id),
-            report_format_id=(
-                str(report_format_id) if report_format_id is not None else None
-            ),
-            delta_report_id=(
-                str(delta_report_id) if delta_report_id is not None else None
-            ),
-            details=True,
+            filter_string=f'{filter_string} rows=1'.strip(),
+            report_format_id=report.report_format_id,
+            delta_report_id=report.delta_report_id,
         )
         report.outer_report = xml.find('report')
         report.inner_report = report.outer_report.find('report')
@@ -17,10 +17,10 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from selene.schema.utils import (
-    get_text,
     get_text_from_element,
     get_boolean_from_element,
     get_int_from_element,
+    get_subelement,
 )
 
 
@@ -41,16 +41,10 @@ def int_resolver(attname, default_value, root, info, **args):
 
 def find_resolver(attname, default_value, root, info, **args):
     # pylint: disable=unused-argument
-    return root.find(attname)
+    return get_subelement(root, attname)
 
 
 def nvt_tags_resolver(attname, default_value, root, info, **args):
     # pylint: disable=unused-argument
-    tags = get_text(root)
-    if tags is not None:
-        tags = tags.split('|')
-        for tag in tags:
-            key, value = tag.strip().split('=', 1)
-            if key == attname:
-                return value
-    return None
+    # root is the dict of the tags, see parse_nvt_tags
+    return root.get(attname)
@@ -16,21 +16,47 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from typing import FrozenSet
 from uuid import UUID
 
 import graphene
 
 from graphql import ResolveInfo
 
+from selene.connections import prune_response_elements
 from selene.schema.parser import FilterString
 from selene.schema.relay import (
     EntityConnectionField,
     Entities,
     get_filter_string_for_pagination,
+    get_node_field_names,
 )
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
 from selene.schema.results.fields import Result
 
+# large child elements of a result and the fields resolved from them
+RESULT_ELEMENT_FIELDS = {
+    'description': frozenset(['description']),
+    'detection': frozenset(['originResult']),
+    'host': frozenset(['host']),
+    'notes': frozenset(['notes']),
+    'nvt': frozenset(['information', 'type']),
+    'overrides': frozenset(['overrides']),
+    'tickets': frozenset(['tickets']),
+}
+
+
+def get_unselected_result_elements(info: ResolveInfo) -> FrozenSet[str]:
+    """Return the names of the child elements of the results which aren't
+    required for resolving the fields selected for the results of a
+    connection"""
+    field_names = get_node_field_names(info)
+    return frozenset(
+        name
+        for name, fields in RESULT_ELEMENT_FIELDS.items()
+        if fields.isdisjoint(field_names)
+    )
+
 
 class GetResult(graphene.Field):
     """Gets a single result.
@@ -88,7 +114,14 @@ class GetResults(EntityConnectionField):
             filter_string, first=first, last=last, after=after, before=before
         )
 
-        xml: XmlElement = gmp.get_results(filter=filter_string.filter_string)
+        pruned_paths = [
+            f'result/{name}' for name in get_unselected_result_elements(info)
+        ]
+
+        with prune_response_elements(pruned_paths):
+            xml: XmlElement = gmp.get_results(
+                filter=filter_string.filter_string
+            )
 
         result_elements = xml.findall('result')
         counts = xml.find('result_count')
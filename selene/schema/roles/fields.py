@@ -23,6 +23,7 @@ import graphene
 from selene.schema.entity import EntityObjectType
 
 from selene.schema.utils import get_text_from_element
+from selene.schema.node import Node
 
 
 class BaseRoleType(EntityObjectType):
@@ -30,6 +31,9 @@ class BaseRoleType(EntityObjectType):
 
 
 class Role(BaseRoleType):
+    class Meta:
+        interfaces = (Node,)
+
     users = graphene.List(graphene.String)
 
     @staticmethod
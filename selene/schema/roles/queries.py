@@ -24,6 +24,7 @@ import graphene
 from graphql import ResolveInfo
 from selene.schema.parser import FilterString
 
+from selene.schema.entities import load_entity
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
 from selene.schema.roles.fields import Role
 
@@ -47,10 +48,7 @@ class GetRole(graphene.Field):
     @staticmethod
     @require_authentication
     def resolve(_root, info, role_id: UUID):
-        gmp = get_gmp(info)
-
-        xml = gmp.get_role(str(role_id))
-        return xml.find('role')
+        return load_entity(info, 'role', role_id)
 
 
 class GetRoles(EntityConnectionField):
@@ -28,6 +28,7 @@ from selene.schema.utils import (
 from selene.schema.entity import EntityObjectType
 
 from selene.schema.nvts.fields import NvtPreference
+from selene.schema.node import Node
 
 
 class ScannerPreference(graphene.ObjectType):
@@ -165,6 +166,9 @@ class ScanConfig(EntityObjectType):
     """Scan config object type. Can be used in GetScanConfig and GetScanConfigs
     queries."""
 
+    class Meta:
+        interfaces = (Node,)
+
     scan_config_type = graphene.Field(
         ScanConfigType, name='type', description="Type of the scan config"
     )
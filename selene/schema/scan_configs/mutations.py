@@ -197,7 +197,7 @@ class CloneScanConfig(graphene.Mutation):
 #   schema: ExportByIds, ExportByIds.'
 
 ExportByIdsClass = create_export_by_ids_mutation(
-    entity_name='config', with_details=True
+    entity_name='config', with_details=True, export_name='scan_configs'
 )
 
 
@@ -206,7 +206,7 @@ class ExportScanConfigsByIds(ExportByIdsClass):
 
 
 ExportByFilterClass = create_export_by_filter_mutation(
-    entity_name='config', with_details=True
+    entity_name='config', with_details=True, export_name='scan_configs'
 )
 
 
@@ -30,6 +30,7 @@ from selene.schema.relay import (
     get_filter_string_for_pagination,
 )
 
+from selene.schema.entities import load_entity
 from selene.schema.utils import require_authentication, get_gmp, XmlElement
 
 from selene.schema.scan_configs.fields import ScanConfig
@@ -84,10 +85,7 @@ class GetScanConfig(graphene.Field):
         # - <permissions> subelement of <task>
         # - Not needed for single scan config: <filters>, <sort>, <configs>,
         #   <config_count>
-        gmp = get_gmp(info)
-
-        xml = gmp.get_config(str(config_id), tasks=True)
-        return xml.find('config')
+        return load_entity(info, 'config', config_id, details=True, tasks=True)
 
 
 class GetScanConfigs(EntityConnectionField):
@@ -32,6 +32,7 @@ from selene.schema.base import BaseObjectType
 from selene.schema.entity import EntityObjectType
 
 from selene.schema.scan_configs.fields import ScanConfig
+from selene.schema.node import Node
 
 
 class Param(graphene.ObjectType):
@@ -131,6 +132,8 @@ class ScannerType(graphene.Enum):
 
 
 class Scanner(EntityObjectType):
+    class Meta:
+        interfaces = (Node,)
 
     host = graphene.String()
     port = graphene.String()
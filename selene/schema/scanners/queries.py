@@ -28,13 +28,26 @@ from selene.schema.relay import (
     EntityConnectionField,
     Entities,
     get_filter_string_for_pagination,
+    selects_any_node_field,
 )
 
 from selene.schema.scanners.fields import Scanner
 
+from selene.schema.entities import load_entity
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
 
 
+# fields of a scanner which gvmd only returns with details
+SCANNER_DETAILS_FIELDS = frozenset(
+    [
+        'configs',
+        'info',
+        'tasks',
+        'userTags',
+    ]
+)
+
+
 class GetScanner(graphene.Field):
     """Gets a single scanner.
 
@@ -77,10 +90,7 @@ class GetScanner(graphene.Field):
     @staticmethod
     @require_authentication
     def resolve(_root, info, scanner_id: UUID):
-        gmp = get_gmp(info)
-
-        xml = gmp.get_scanner(str(scanner_id))
-        return xml.find('scanner')
+        return load_entity(info, 'scanner', scanner_id, details=True)
 
 
 class GetScanners(EntityConnectionField):
@@ -148,8 +158,10 @@ class GetScanners(EntityConnectionField):
             filter_string, first=first, last=last, after=after, before=before
         )
 
+        details = selects_any_node_field(info, SCANNER_DETAILS_FIELDS)
+
         xml: XmlElement = gmp.get_scanners(
-            filter=filter_string.filter_string, details=True
+            filter=filter_string.filter_string, details=details
         )
 
         scanner_elements = xml.findall('scanner')
@@ -24,10 +24,12 @@ from selene.schema.utils import get_text_from_element
 
 from selene.schema.tasks.fields import Task
 from selene.schema.entity import EntityObjectType
+from selene.schema.node import Node
 
 
 class Schedule(EntityObjectType):
     class Meta:
+        interfaces = (Node,)
         default_resolver = find_resolver
 
     icalendar = graphene.String()
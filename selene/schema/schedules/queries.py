@@ -32,6 +32,7 @@ from selene.schema.relay import (
 
 from selene.schema.schedules.fields import Schedule
 
+from selene.schema.entities import load_entity
 from selene.schema.utils import require_authentication, get_gmp, XmlElement
 
 
@@ -80,10 +81,7 @@ class GetSchedule(graphene.Field):
     @staticmethod
     @require_authentication
     def resolve(_root, info, schedule_id: UUID, tasks):
-        gmp = get_gmp(info)
-
-        xml = gmp.get_schedule(str(schedule_id), tasks=tasks)
-        return xml.find('schedule')
+        return load_entity(info, 'schedule', schedule_id, tasks=tasks)
 
 
 class GetSchedules(EntityConnectionField):
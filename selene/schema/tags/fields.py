@@ -23,6 +23,7 @@ from gvm.protocols.next import EntityType as GvmEntityType
 from selene.schema.resolver import text_resolver
 
 from selene.schema.base import BaseObjectType
+from selene.schema.node import Node
 
 
 class EntityType(graphene.Enum):
@@ -38,6 +39,7 @@ class ResourceAction(graphene.Enum):
 
 class Tag(BaseObjectType):
     class Meta:
+        interfaces = (Node,)
         default_resolver = text_resolver
 
     value = graphene.String()
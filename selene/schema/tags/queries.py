@@ -33,6 +33,7 @@ from selene.schema.relay import (
 
 from selene.schema.tags.fields import Tag
 
+from selene.schema.entities import load_entity
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
 
 
@@ -78,10 +79,7 @@ class GetTag(graphene.Field):
     @staticmethod
     @require_authentication
     def resolve(_root, info, tag_id: UUID):
-        gmp = get_gmp(info)
-
-        xml = gmp.get_tag(str(tag_id))
-        return xml.find('tag')
+        return load_entity(info, 'tag', tag_id)
 
 
 class GetTags(EntityConnectionField):
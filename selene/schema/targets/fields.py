@@ -29,6 +29,7 @@ from selene.schema.utils import (
     get_text_from_element,
     get_boolean_from_element,
 )
+from selene.schema.node import Node
 
 
 class AliveTest(graphene.Enum):
@@ -89,6 +90,9 @@ class TargetCredentials(graphene.ObjectType):
 class Target(EntityObjectType):
     """Target ObjectType"""
 
+    class Meta:
+        interfaces = (Node,)
+
     hosts = graphene.List(
         graphene.String,
         description="List of IPs, host names or address ranges to scan as a "
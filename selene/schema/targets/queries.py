@@ -30,6 +30,7 @@ from selene.schema.relay import (
     get_filter_string_for_pagination,
 )
 from selene.schema.targets.fields import Target
+from selene.schema.entities import load_entity
 from selene.schema.utils import require_authentication, get_gmp, XmlElement
 
 
@@ -79,10 +80,7 @@ class GetTarget(graphene.Field):
     @staticmethod
     @require_authentication
     def resolve(_root, info, target_id: UUID):
-        gmp = get_gmp(info)
-
-        xml = gmp.get_target(str(target_id), tasks=True)
-        return xml.find('target')
+        return load_entity(info, 'target', target_id, tasks=True)
 
 
 class GetTargets(EntityConnectionField):
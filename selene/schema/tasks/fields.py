@@ -38,6 +38,7 @@ from selene.schema.base import BaseObjectType
 from selene.schema.entity import EntityObjectType
 from selene.schema.scanners.fields import ScannerType
 from selene.schema.scan_configs.fields import ScanConfigType
+from selene.schema.node import Node
 
 
 class TaskReportsCounts(graphene.ObjectType):
@@ -71,30 +72,23 @@ class LastReport(graphene.ObjectType):
     )
 
     @staticmethod
-    def resolve_uuid(parent, _info):
-        report = parent.find('report')
-        uuid = report.get('id')
-        return uuid
+    def resolve_uuid(report, _info):
+        return report.get('id')
 
     @staticmethod
-    def resolve_severity(parent, _info):
-        report = parent.find('report')
-        severity = report.find('severity')
-        return get_text(severity)
+    def resolve_severity(report, _info):
+        return get_text_from_element(report, 'severity')
 
     @staticmethod
-    def resolve_creation_time(parent, _info):
-        report = parent.find('report')
+    def resolve_creation_time(report, _info):
         return get_datetime_from_element(report, 'timestamp')
 
     @staticmethod
-    def resolve_scan_start(parent, _info):
-        report = parent.find('report')
+    def resolve_scan_start(report, _info):
         return get_datetime_from_element(report, 'scan_start')
 
     @staticmethod
-    def resolve_scan_end(parent, _info):
-        report = parent.find('report')
+    def resolve_scan_end(report, _info):
         return get_datetime_from_element(report, 'scan_end')
 
 
@@ -109,23 +103,19 @@ class CurrentReport(graphene.ObjectType):
     )
 
     @staticmethod
-    def resolve_uuid(parent, _info):
-        report = parent.find('report')
+    def resolve_uuid(report, _info):
         return report.get('id')
 
     @staticmethod
-    def resolve_scan_start(parent, _info):
-        report = parent.find('report')
+    def resolve_scan_start(report, _info):
         return get_datetime_from_element(report, 'scan_start')
 
     @staticmethod
-    def resolve_scan_end(parent, _info):
-        report = parent.find('report')
+    def resolve_scan_end(report, _info):
         return get_datetime_from_element(report, 'scan_end')
 
     @staticmethod
-    def resolve_creation_time(parent, _info):
-        report = parent.find('report')
+    def resolve_creation_time(report, _info):
         return get_datetime_from_element(report, 'timestamp')
 
 
@@ -151,6 +141,16 @@ class TaskReports(graphene.ObjectType):
     def resolve_counts(root, _info):
         return get_subelement(root, 'report_count')
 
+    # the fields of the reports are resolved from their report element
+
+    @staticmethod
+    def resolve_current_report(root, _info):
+        return get_subelement(get_subelement(root, 'current_report'), 'report')
+
+    @staticmethod
+    def resolve_last_report(root, _info):
+        return get_subelement(get_subelement(root, 'last_report'), 'report')
+
 
 class TaskSubObjectType(BaseObjectType):
 
@@ -351,6 +351,7 @@ class Task(EntityObjectType):
     """Task object type"""
 
     class Meta:
+        interfaces = (Node,)
         default_resolver = find_resolver
 
     average_duration = graphene.Int(
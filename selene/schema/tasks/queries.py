@@ -28,13 +28,30 @@ from selene.schema.relay import (
     EntityConnectionField,
     Entities,
     get_filter_string_for_pagination,
+    selects_any_node_field,
 )
 
 from selene.schema.tasks.fields import Task
 
+from selene.schema.entities import load_entity
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
 
 
+# fields of a task which gvmd only returns with details
+TASK_DETAILS_FIELDS = frozenset(
+    [
+        'alerts',
+        'averageDuration',
+        'observers',
+        'preferences',
+        'reports',
+        'results',
+        'trend',
+        'userTags',
+    ]
+)
+
+
 class GetTask(graphene.Field):
     """Get a single task.
 
@@ -70,10 +87,7 @@ class GetTask(graphene.Field):
     @staticmethod
     @require_authentication
     def resolve(_root, info, task_id: UUID):
-        gmp = get_gmp(info)
-
-        xml = gmp.get_task(str(task_id))
-        return xml.find('task')
+        return load_entity(info, 'task', task_id, details=True)
 
 
 class GetTasks(EntityConnectionField):
@@ -138,8 +152,10 @@ class GetTasks(EntityConnectionField):
             filter_string, first=first, last=last, after=after, before=before
         )
 
+        details = selects_any_node_field(info, TASK_DETAILS_FIELDS)
+
         xml: XmlElement = gmp.get_tasks(
-            filter=filter_string.filter_string, details=True
+            filter=filter_string.filter_string, details=details
         )
 
         task_elements = xml.findall('task')
@@ -31,6 +31,7 @@ from selene.schema.entity import EntityObjectType
 from selene.schema.severity import SeverityType
 from selene.schema.tasks.fields import Task
 from selene.schema.users.fields import User
+from selene.schema.node import Node
 
 
 class TicketStatus(graphene.Enum):
@@ -59,6 +60,7 @@ class RemediationTicket(EntityObjectType):
     """
 
     class Meta:
+        interfaces = (Node,)
         default_resolver = text_resolver
 
     assigned_to = graphene.Field(User)
@@ -32,6 +32,7 @@ from selene.schema.relay import (
 
 from selene.schema.tickets.fields import RemediationTicket
 
+from selene.schema.entities import load_entity
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
 
 
@@ -77,10 +78,7 @@ class GetTicket(graphene.Field):
     @staticmethod
     @require_authentication
     def resolve(_root, info, ticket_id: UUID):
-        gmp = get_gmp(info)
-
-        xml = gmp.get_ticket(str(ticket_id))
-        return xml.find('ticket')
+        return load_entity(info, 'ticket', ticket_id)
 
 
 class GetTickets(EntityConnectionField):
@@ -25,6 +25,7 @@ from selene.schema.base import BaseObjectType
 from selene.schema.roles.fields import BaseRoleType
 
 from selene.schema.utils import get_text_from_element
+from selene.schema.node import Node
 
 
 class UserRole(BaseRoleType):
@@ -52,6 +53,9 @@ class UserGroup(BaseObjectType):
 
 
 class User(EntityObjectType):
+    class Meta:
+        interfaces = (Node,)
+
     roles = graphene.List(UserRole, description="The roles of the user.")
     group_list = graphene.List(
         UserGroup, name="groups", description="The groups the user belongs to."
@@ -24,6 +24,7 @@ from graphql import ResolveInfo
 
 from selene.schema.parser import FilterString
 
+from selene.schema.entities import load_entity
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
 from selene.schema.users.fields import User
 
@@ -47,10 +48,7 @@ class GetUser(graphene.Field):
     @staticmethod
     @require_authentication
     def resolve(_root, info, user_id: UUID):
-        gmp = get_gmp(info)
-
-        xml = gmp.get_user(str(user_id))
-        return xml.find('user')
+        return load_entity(info, 'user', user_id)
 
 
 class GetUsers(EntityConnectionField):
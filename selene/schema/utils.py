@@ -48,10 +48,18 @@ def has_id(element: XmlElement) -> bool:
 
 
 def get_subelement(element: XmlElement, name: str) -> Optional[str]:
-    """Return a sub-element of element if available or None"""
+    """Return a sub-element of element if available or None
+
+    name may be a tag name or an ElementPath expression like 'owner/name'.
+    """
     if element is None:
         return None
 
+    if name.isidentifier():
+        # lxml evaluates the argument of find as ElementPath expression on
+        # every call. Filtering the children by tag avoids this overhead.
+        return next(element.iterchildren(name), None)
+
     return element.find(name)
 
 
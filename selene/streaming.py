@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Stream GMP responses from gvmd to HTTP clients
+
+Large responses like rendered reports are passed on to the client chunk by
+chunk while they are read from the gvmd socket. In contrast to the
+responses of the GMP protocol classes they are never held in memory
+completely.
+"""
+
+import binascii
+import copy
+import zlib
+
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from xml.parsers import expat
+from xml.sax.saxutils import escape, quoteattr
+
+from gvm.connections import GvmConnection
+from gvm.errors import GvmError, GvmResponseError, GvmServerError
+
+READ_SIZE = 64 * 1024
+
+
+def get_gvm_connection(gmp: Any) -> GvmConnection:
+    """Get the connection of a connected GMP protocol instance"""
+    # python-gvm doesn't provide a public API for accessing the connection
+    return gmp._connection  # pylint: disable=protected-access
+
+
+def build_gmp_command(gmp: Any, name: str, *args, **kwargs) -> str:
+    """Return the XML of a GMP command instead of sending it
+
+    The command is created by calling the method of the passed GMP protocol
+    instance. This allows to use its argument handling for commands sent via
+    a GmpResponseStream.
+    """
+    commands = []
+
+    recorder = copy.copy(gmp)
+    recorder.send_command = commands.append
+
+    getattr(recorder, name)(*args, **kwargs)
+
+    return commands[0]
+
+
+def gzip_chunks(chunks: Iterator[bytes], level: int = 6) -> Iterator[bytes]:
+    """Compress a stream of chunks in gzip format"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+
+    yield compressor.flush()
+
+
+def check_response_status(attributes: Dict[str, str]):
+    """Raise an error if the status attribute of a GMP response isn't OK
+
+    Works like the status check of python-gvm's EtreeCheckCommandTransform.
+    """
+    status = attributes.get('status')
+
+    if status is None:
+        raise GvmServerError('No status in response.')
+
+    if status[0] == '4':
+        raise GvmResponseError(
+            status=status, message=attributes.get('status_text')
+        )
+    if status[0] == '5':
+        raise GvmServerError(
+            status=status, message=attributes.get('status_text')
+        )
+    if status[0] != '2':
+        raise GvmError(f'Error in response. {attributes.get("status_text")}')
+
+
+class Base64Decoder:
+    """Decode base64 encoded text arriving in arbitrary pieces"""
+
+    def __init__(self):
+        self._pending = ''
+
+    def decode(self, text: str) -> bytes:
+        data = self._pending + ''.join(text.split())
+        end = len(data) - len(data) % 4
+        self._pending = data[end:]
+
+        try:
+            return binascii.a2b_base64(data[:end])
+        except binascii.Error as e:
+            raise GvmError(f'Invalid base64 data in response. {e}') from None
+
+    def finish(self):
+        if self._pending:
+            raise GvmError('Incomplete base64 data in response.')
+
+
+class GmpResponseStream:
+    """Send a GMP command and iterate over output generated from its
+    response while the response is read
+
+    The response is fed chunk by chunk into an expat parser. Subclasses get
+    notified about the elements and the text of the response via the
+    start_element, end_element and character_data methods and pass their
+    output to write. The status of the response is checked as soon as the
+    root element has been read.
+
+    Args:
+        connection: Connected GvmConnection not used for anything else while
+            the response is read
+        read_size: Max number of bytes read from the socket at once
+    """
+
+    def __init__(self, connection: GvmConnection, read_size: int = READ_SIZE):
+        self.connection = connection
+        self.read_size = read_size
+        self.depth = 0
+        self.finished = False
+
+        self._output: List[bytes] = []
+        self._parser = expat.ParserCreate()
+        self._parser.buffer_text = True
+        self._parser.buffer_size = read_size
+        self._parser.StartElementHandler = self._start_element
+        self._parser.EndElementHandler = self._end_element
+        self._parser.CharacterDataHandler = self.character_data
+
+    def send(self, command: str):
+        self.connection.send(command)
+
+    def read(self) -> bool:
+        """Read and parse the next chunk of the response
+
+        Returns False if the response has been read completely.
+        """
+        if self.finished:
+            return False
+
+        # pylint: disable=protected-access
+        sock = self.connection._socket
+        if sock is None:
+            raise GvmError('Socket is not connected')
+
+        data = sock.recv(self.read_size)
+        if not data:
+            raise GvmError('Remote closed the connection')
+
+        self.received(data)
+
+        try:
+            self._parser.Parse(data, False)
+        except expat.ExpatError as e:
+            raise GvmError(f'Cannot parse XML response. {e}') from None
+
+        return True
+
+    def read_header(self):
+        """Read the response until its status has been checked"""
+        self.read_until(lambda: self.depth > 0 or self.finished)
+
+    def read_until(self, condition: Callable[[], bool]) -> bool:
+        """Read the response until the condition callable returns True
+
+        Returns False if the response has been read completely before.
+        """
+        while not condition():
+            if not self.read():
+                return False
+        return True
+
+    def write(self, data: bytes):
+        if data:
+            self._output.append(data)
+
+    def take_output(self) -> bytes:
+        output = b''.join(self._output)
+        self._output = []
+        return output
+
+    def __iter__(self) -> Iterator[bytes]:
+        output = self.take_output()
+        if output:
+            yield output
+
+        while self.read():
+            output = self.take_output()
+            if output:
+                yield output
+
+    def _start_element(self, name: str, attributes: Dict[str, str]):
+        self.depth += 1
+        if self.depth == 1:
+            check_response_status(attributes)
+
+        self.start_element(name, attributes)
+
+    def _end_element(self, name: str):
+        self.end_element(name)
+
+        self.depth -= 1
+        if self.depth == 0:
+            self.finished = True
+            self.finish()
+
+    def received(self, data: bytes):
+        pass
+
+    def start_element(self, name: str, attributes: Dict[str, str]):
+        pass
+
+    def end_element(self, name: str):
+        pass
+
+    def character_data(self, text: str):
+        pass
+
+    def finish(self):
+        pass
+
+
+class StreamContent:
+    """Iterable content of a HTTP response passing on the output of a
+    GmpResponseStream
+
+    The callback is called once when the content is closed, regardless
+    whether it has been iterated at all. This allows to return the connection
+    of the stream even if the client never reads the response, e.g. for HEAD
+    requests.
+
+    Args:
+        stream: The stream to iterate over
+        on_close: Called with True if the response has been read completely
+    """
+
+    def __init__(
+        self, stream: GmpResponseStream, on_close: Callable[[bool], None]
+    ):
+        self.stream = stream
+        self.on_close = on_close
+        self.finished = False
+        self.closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self.stream
+        self.finished = True
+
+    def close(self):
+        if self.closed:
+            return
+
+        self.closed = True
+        self.on_close(self.finished)
+
+
+class XmlResponseStream(GmpResponseStream):
+    """Stream a GMP response as it is received"""
+
+    def received(self, data: bytes):
+        self.write(data)
+
+
+class ReportContentStream(GmpResponseStream):
+    """Stream the content of a report rendered by a report format
+
+    gvmd sends the content of non XML report formats base64 encoded as text
+    of the report element. It is decoded while streaming. The content of XML
+    report formats is embedded as report element into the report element of
+    the response and is serialized again while streaming.
+    """
+
+    def __init__(self, connection: GvmConnection, read_size: int = READ_SIZE):
+        super().__init__(connection, read_size)
+
+        self.content_type: Optional[str] = None
+        self.extension: Optional[str] = None
+        self.is_xml = False
+
+        self._in_report = False
+        self._in_content = False
+        self._decoder = Base64Decoder()
+
+    def read_header(self):
+        """Read the response until the content type of the report is known
+
+        Raises GvmError if the response doesn't contain a report.
+        """
+        if not self.read_until(lambda: self.content_type is not None):
+            raise GvmError('Response doesn\'t contain a report.')
+
+    def start_element(self, name: str, attributes: Dict[str, str]):
+        if self.depth == 2 and name == 'report':
+            self.content_type = attributes.get('content_type') or ''
+            self.extension = attributes.get('extension')
+            self.is_xml = self.content_type == 'text/xml'
+            self._in_report = True
+            return
+
+        if self.is_xml and self._in_report:
+            if self.depth == 3 and name == 'report':
+                self._in_content = True
+
+            if self._in_content:
+                attrs = ''.join(
+                    f' {key}={quoteattr(value)}'
+                    for key, value in attributes.items()
+                )
+                self.write(f'<{name}{attrs}>'.encode('utf-8'))
+
+    def end_element(self, name: str):
+        if self.depth == 2:
+            self._in_report = False
+            return
+
+        if self._in_content:
+            self.write(f'</{name}>'.encode('utf-8'))
+
+            if self.depth == 3:
+                self._in_content = False
+
+    def character_data(self, text: str):
+        if self._in_content:
+            self.write(escape(text).encode('utf-8'))
+        elif self._in_report and not self.is_xml and self.depth == 2:
+            # the base64 encoded content follows the report format element
+            self.write(self._decoder.decode(text))
+
+    def finish(self):
+        if self.content_type is None:
+            raise GvmError('Response doesn\'t contain a report.')
+
+        if not self.is_xml:
+            self._decoder.finish()
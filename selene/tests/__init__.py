@@ -29,6 +29,7 @@ from gvm.errors import GvmResponseError
 from gvm.protocols.gmpv214 import Gmp
 
 
+from selene.pool import clear_connection_pools
 from selene.schema import schema
 
 
@@ -40,6 +41,14 @@ class GmpMockFactory:
         self.gmp = MagicMock()
         self.gmp.__enter__.return_value = gmp_protocol_mock
 
+        # users have no settings by default
+        gmp_protocol_mock.get_setting.return_value = ET.fromstring(
+            '<get_settings_response status="200" status_text="OK"/>'
+        )
+        gmp_protocol_mock.get_settings.return_value = ET.fromstring(
+            '<get_settings_response status="200" status_text="OK"/>'
+        )
+
     def __call__(self, *args, **kwargs):
         return self.gmp
 
@@ -62,6 +71,10 @@ class SeleneTestCase(TestCase):
     GRAPHQL_SCHEMA = schema
     GRAPHQL_URL = "/graphql/"
 
+    def tearDown(self):
+        # don't leak pooled connections of the gmp mock into other tests
+        clear_connection_pools()
+
     def login(self, username: str, password: str):
         session = self.client.session
 
@@ -22,7 +22,7 @@ from unittest.mock import patch
 
 from selene.tests import SeleneTestCase, GmpMockFactory
 
-from selene.tests.entity import make_test_get_entity
+from selene.tests.entity import make_test_get_entity, make_test_load_entities
 
 CWD = Path(__file__).absolute().parent
 
@@ -296,3 +296,9 @@ class AuditGetEntityTestCase(SeleneTestCase):
     test_get_entity = make_test_get_entity(
         gmp_name=gmp_name, selene_name=selene_name, gmp_cmd=gmp_cmd
     )
+    test_load_entities = make_test_load_entities(
+        gmp_name=gmp_name,
+        selene_name=selene_name,
+        gmp_cmd=gmp_cmd,
+        details=True,
+    )
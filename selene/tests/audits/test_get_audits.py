@@ -154,7 +154,7 @@ class AuditsPaginationTestCase(SeleneTestCase):
         gmp_name=gmp_name,
         selene_name=selene_name,
         gmp_cmd=gmp_cmd,
-        details=True,
+        details=False,
     )
     test_counts = make_test_counts(
         gmp_name=gmp_name, selene_name=selene_name, gmp_cmd=gmp_cmd
@@ -172,13 +172,13 @@ class AuditsPaginationTestCase(SeleneTestCase):
         gmp_name=gmp_name,
         selene_name=selene_name,
         gmp_cmd=gmp_cmd,
-        details=True,
+        details=False,
     )
     test_after_first_before_last = make_test_after_first_before_last(
         gmp_name=gmp_name,
         selene_name=selene_name,
         gmp_cmd=gmp_cmd,
-        details=True,
+        details=False,
     )
 
 
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks for selene
+
+The benchmarks aren't run by the test runner. Each benchmark is a module which
+can be run directly, e.g.
+
+    python -m selene.tests.benchmarks.bench_protocol_version
+"""
+
+import atexit
+import json
+import multiprocessing
+import shutil
+import tempfile
+import time
+
+from typing import Any, Callable, Dict, Tuple
+
+import django
+
+
+def setup_django(**selene_settings):
+    """Configure django with the test settings and the passed SELENE
+    settings"""
+    # pylint: disable=import-outside-toplevel
+    from django.conf import settings
+
+    from selene.pool import DEFAULT_CREDENTIALS_CACHE
+    from selene.tests import settings as test_settings
+
+    options = {
+        name: getattr(test_settings, name)
+        for name in dir(test_settings)
+        if name.isupper()
+    }
+    # use a file based credentials cache like hyperion does
+    credentials_dir = tempfile.mkdtemp(prefix='selene-bench-credentials-')
+    atexit.register(shutil.rmtree, credentials_dir, ignore_errors=True)
+
+    options['CACHES'] = {
+        **test_settings.CACHES,
+        DEFAULT_CREDENTIALS_CACHE: {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': credentials_dir,
+        },
+    }
+    options['SELENE'] = selene_settings
+
+    settings.configure(**options)
+    django.setup()
+
+
+def create_client(username: str = None, password: str = None):
+    """Create a django test client, optionally with a logged in session"""
+    # pylint: disable=import-outside-toplevel
+    from django.test import Client
+
+    client = Client()
+
+    if username is not None:
+        session = client.session
+        session['username'] = username
+        session['password'] = password
+        session.save()
+
+    return client
+
+
+def query(client, query_string: str, variables: Dict[str, Any] = None):
+    body = {'query': query_string}
+    if variables is not None:
+        body['variables'] = variables
+
+    response = client.post(
+        '/graphql/', json.dumps(body), content_type='application/json'
+    )
+    if response.status_code != 200:
+        raise RuntimeError(
+            f'Query failed with {response.status_code}: {response.content}'
+        )
+    return response
+
+
+def measure(func: Callable[[], Any], *, repeat: int = 5) -> Tuple[float, Any]:
+    """Run func repeatedly and return the best runtime and the last result"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        duration = time.perf_counter() - start
+        if best is None or duration < best:
+            best = duration
+    return best, result
+
+
+def _reset_peak_rss():
+    # linux only. resets the peak resident set size of the process.
+    with open('/proc/self/clear_refs', 'w', encoding='ascii') as f:
+        f.write('5')
+
+
+def _get_rss(name: str) -> int:
+    # in KiB
+    with open('/proc/self/status', encoding='ascii') as f:
+        for line in f:
+            if line.startswith(f'{name}:'):
+                return int(line.split()[1])
+    return 0
+
+
+def _run_measured(func: Callable[[], Any], results: multiprocessing.Queue):
+    _reset_peak_rss()
+    before = _get_rss('VmRSS')
+    duration, _ = measure(func, repeat=1)
+    results.put((_get_rss('VmHWM') - before, duration))
+
+
+def measure_in_process(func: Callable[[], Any]) -> Tuple[float, float]:
+    """Run func once in a forked process
+
+    Returns the additional peak memory of the process in MiB and the runtime
+    of func. Works on linux only.
+    """
+    context = multiprocessing.get_context('fork')
+    results = context.Queue()
+    process = context.Process(target=_run_measured, args=(func, results))
+    process.start()
+    memory, duration = results.get()
+    process.join()
+    return memory / 1024, duration
+
+
+def print_table(header: Tuple[str, ...], rows):
+    rows = [tuple(str(column) for column in row) for row in rows]
+    widths = [
+        max(len(row[i]) for row in [header, *rows]) for i in range(len(header))
+    ]
+
+    def format_row(row):
+        return '  '.join(
+            column.ljust(width) for column, width in zip(row, widths)
+        ).rstrip()
+
+    print(format_row(header))
+    print('  '.join('-' * width for width in widths))
+    for row in rows:
+        print(format_row(row))
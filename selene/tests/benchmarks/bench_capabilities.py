@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Duration of querying the capabilities of the current user
+
+The capabilities are requested from gvmd for the first query of a user only
+if a capabilities cache is configured. Compares this uncached query with the
+following ones answered from the cache. The uncached queries use the same
+authenticated gvmd connection.
+"""
+
+import time
+
+from selene.tests.benchmarks import (
+    create_client,
+    measure,
+    print_table,
+    query,
+    setup_django,
+)
+from selene.tests.benchmarks.fakegvmd import FakeGvmd
+
+# gvmd 21.04 knows about 180 commands
+COMMAND_COUNT = 180
+REPEAT = 20
+
+CAPABILITIES_QUERY = '''
+query {
+    capabilities
+}
+'''
+
+
+def create_help_response(count: int) -> str:
+    commands = ''.join(
+        f'<command><name>COMMAND_{i}</name>'
+        f'<summary>Summary of command {i}.</summary></command>'
+        for i in range(count)
+    )
+    return (
+        '<help_response status="200" status_text="OK">'
+        '<schema format="XML" extension="xml" content_type="text/xml">'
+        f'{commands}'
+        '</schema>'
+        '</help_response>'
+    )
+
+
+def query_uncached(client) -> float:
+    # pylint: disable=import-outside-toplevel
+    from django.core.cache import caches
+
+    caches['default'].clear()
+
+    start = time.perf_counter()
+    query(client, CAPABILITIES_QUERY)
+    return time.perf_counter() - start
+
+
+def main():
+    with FakeGvmd() as gvmd:
+        gvmd.set_response('help', create_help_response(COMMAND_COUNT))
+
+        setup_django(GMP_SOCKET_PATH=gvmd.path, CAPABILITIES_CACHE='default')
+
+        client = create_client('admin', 'admin')
+
+        # warm up the connection pool
+        query(client, CAPABILITIES_QUERY)
+        gvmd.reset()
+
+        uncached = min(query_uncached(client) for _ in range(REPEAT))
+        uncached_commands = gvmd.commands['help']
+        gvmd.reset()
+
+        cached, _ = measure(
+            lambda: query(client, CAPABILITIES_QUERY), repeat=REPEAT
+        )
+        cached_commands = gvmd.commands['help']
+
+    print(f'{COMMAND_COUNT} GMP commands, best of {REPEAT} queries\n')
+    print_table(
+        ('capabilities', 'ms/query', 'help commands'),
+        [
+            ('uncached', f'{uncached * 1000:.2f}', uncached_commands),
+            ('cached', f'{cached * 1000:.2f}', cached_commands),
+        ],
+    )
+
+
+if __name__ == '__main__':
+    main()
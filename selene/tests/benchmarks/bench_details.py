@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Response size and duration of a task list query with and without details
+
+gvmd answers get_tasks with a much larger XML document if the details are
+requested. Compares a query selecting only fields of the brief task XML with
+a query selecting the reports of the tasks, which requires the details.
+"""
+
+from uuid import uuid4
+
+from selene.tests.benchmarks import (
+    create_client,
+    measure,
+    print_table,
+    query,
+    setup_django,
+)
+from selene.tests.benchmarks.fakegvmd import FakeGvmd
+
+TASK_COUNTS = (100, 1000, 5000)
+
+BRIEF_QUERY = '''
+query {
+    tasks (filterString: "rows=-1") {
+        nodes {
+            id
+            name
+            status
+        }
+    }
+}
+'''
+
+DETAILS_QUERY = '''
+query {
+    tasks (filterString: "rows=-1") {
+        nodes {
+            id
+            name
+            status
+            reports {
+                counts {
+                    total
+                }
+            }
+        }
+    }
+}
+'''
+
+BRIEF_TASK = '''
+<task id="{id}">
+    <owner><name>admin</name></owner>
+    <name>task {index}</name>
+    <comment/>
+    <creation_time>2021-01-01T10:00:00Z</creation_time>
+    <modification_time>2021-01-01T10:00:00Z</modification_time>
+    <writable>1</writable>
+    <in_use>0</in_use>
+    <permissions><permission><name>Everything</name></permission></permissions>
+    <status>Done</status>
+    <progress>-1</progress>
+    <alterable>0</alterable>
+    <usage_type>scan</usage_type>
+    <config id="{config_id}"><name>Full and fast</name><trash>0</trash></config>
+    <target id="{target_id}"><name>target {index}</name><trash>0</trash></target>
+    <scanner id="{scanner_id}"><name>OpenVAS</name><type>2</type></scanner>
+</task>
+'''
+
+DETAILS = '''
+    <alert id="{alert_id}"><name>alert {index}</name><trash>0</trash></alert>
+    <observers>admin<group id="{group_id}"><name>group</name></group></observers>
+    <report_count>12<finished>12</finished></report_count>
+    <trend>same</trend>
+    <average_duration>3600</average_duration>
+    <schedule_periods>0</schedule_periods>
+    <result_count>1234</result_count>
+    <last_report>
+        <report id="{report_id}">
+            <timestamp>2021-01-01T10:00:00Z</timestamp>
+            <scan_start>2021-01-01T10:00:00Z</scan_start>
+            <scan_end>2021-01-01T11:00:00Z</scan_end>
+            <result_count>
+                <hole>10</hole><info>20</info><log>30</log><warning>40</warning>
+                <false_positive>0</false_positive>
+            </result_count>
+            <severity>10.0</severity>
+        </report>
+    </last_report>
+    <preferences>
+        <preference>
+            <name>Maximum concurrently executed NVTs per host</name>
+            <scanner_name>max_checks</scanner_name>
+            <value>4</value>
+        </preference>
+        <preference>
+            <name>Maximum concurrently scanned hosts</name>
+            <scanner_name>max_hosts</scanner_name>
+            <value>20</value>
+        </preference>
+        <preference>
+            <name>Add results to Asset Management</name>
+            <scanner_name>in_assets</scanner_name>
+            <value>yes</value>
+        </preference>
+        <preference>
+            <name>Auto Delete Reports</name>
+            <scanner_name>auto_delete</scanner_name>
+            <value>0</value>
+        </preference>
+    </preferences>
+</task>
+'''
+
+
+def create_response(count: int, details: bool) -> str:
+    tasks = []
+    for index in range(count):
+        ids = dict(
+            id=uuid4(),
+            index=index,
+            config_id=uuid4(),
+            target_id=uuid4(),
+            scanner_id=uuid4(),
+            alert_id=uuid4(),
+            group_id=uuid4(),
+            report_id=uuid4(),
+        )
+        task = BRIEF_TASK.format(**ids)
+        if details:
+            task = task.replace('</task>\n', DETAILS.format(**ids))
+        tasks.append(task)
+
+    return (
+        '<get_tasks_response status="200" status_text="OK">'
+        + ''.join(tasks)
+        + '<filters id=""><term>first=1 rows=-1</term></filters>'
+        + '<tasks start="1" max="-1"/>'
+        + f'<task_count>{count}<filtered>{count}</filtered></task_count>'
+        + '</get_tasks_response>'
+    )
+
+
+def run_scenario(gvmd: FakeGvmd, query_string: str):
+    client = create_client('admin', 'admin')
+
+    # warm up the connection pool
+    query(client, query_string)
+    gvmd.reset()
+
+    duration, _ = measure(lambda: query(client, query_string), repeat=3)
+
+    size = gvmd.bytes_sent / gvmd.commands['get_tasks']
+    gvmd.reset()
+
+    return f'{size / 1024:.0f}', f'{duration * 1000:.0f}'
+
+
+def main():
+    rows = []
+
+    with FakeGvmd() as gvmd:
+        setup_django(GMP_SOCKET_PATH=gvmd.path)
+
+        for count in TASK_COUNTS:
+            gvmd.set_response(
+                'get_tasks',
+                create_response(count, details=False),
+                attributes={'details': '0'},
+            )
+            gvmd.set_response(
+                'get_tasks',
+                create_response(count, details=True),
+                attributes={'details': '1'},
+            )
+
+            rows.append(
+                (count, 'id, name, status', *run_scenario(gvmd, BRIEF_QUERY))
+            )
+            rows.append(
+                (count, 'with reports', *run_scenario(gvmd, DETAILS_QUERY))
+            )
+
+    print_table(
+        ('tasks', 'selected fields', 'get_tasks KiB', 'ms/request'), rows
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Wall-clock time of the query of a task form with and without the entity
+cache
+
+The form lists the scanners, port lists, scan configs, credentials,
+schedules and report formats. gvmd answers each command with a delay
+simulating its database query.
+"""
+
+from selene.tests.benchmarks import (
+    create_client,
+    measure,
+    print_table,
+    query,
+    setup_django,
+)
+from selene.tests.benchmarks.fakegvmd import FakeGvmd
+
+DELAY = 0.02  # in seconds
+REQUESTS = 10
+
+COMMANDS = {
+    'get_scanners': 'scanner',
+    'get_port_lists': 'port_list',
+    'get_configs': 'config',
+    'get_credentials': 'credential',
+    'get_schedules': 'schedule',
+    'get_report_formats': 'report_format',
+}
+
+TASK_FORM_QUERY = '''
+query {
+    scanners { nodes { id name } }
+    portLists { nodes { id name } }
+    scanConfigs { nodes { id name } }
+    credentials { nodes { id name } }
+    schedules { nodes { id name } }
+    reportFormats { nodes { id name } }
+}
+'''
+
+
+def create_response(command: str, entity_type: str, count: int = 20) -> str:
+    entities = ''.join(
+        f'<{entity_type} id="00000000-0000-0000-0000-{i:012}">'
+        f'<name>{entity_type} {i}</name>'
+        f'</{entity_type}>'
+        for i in range(count)
+    )
+    return (
+        f'<{command}_response status="200" status_text="OK">'
+        f'{entities}'
+        f'<{entity_type}_count>{count}<filtered>{count}</filtered>'
+        f'</{entity_type}_count>'
+        f'</{command}_response>'
+    )
+
+
+def run_scenario(gvmd: FakeGvmd, cache_alias: str = None):
+    # pylint: disable=import-outside-toplevel
+    from django.conf import settings
+    from django.core.cache import caches
+
+    from selene.cache import entity_cache_statistics
+    from selene.pool import clear_connection_pools
+
+    settings.SELENE = {
+        'GMP_SOCKET_PATH': gvmd.path,
+        'ENTITY_CACHE': cache_alias,
+    }
+
+    clear_connection_pools()
+    caches['default'].clear()
+
+    client = create_client('admin', 'admin')
+
+    # warm up the connection pool and the cache
+    query(client, TASK_FORM_QUERY)
+    gvmd.reset()
+    entity_cache_statistics.reset()
+
+    duration, _ = measure(
+        lambda: [query(client, TASK_FORM_QUERY) for _ in range(REQUESTS)],
+        repeat=3,
+    )
+
+    commands = sum(gvmd.commands[command] for command in COMMANDS)
+    gvmd.reset()
+
+    statistics = entity_cache_statistics.get()
+    hits = sum(counts['hits'] for counts in statistics.values())
+    misses = sum(counts['misses'] for counts in statistics.values())
+
+    return f'{duration / REQUESTS * 1000:.1f}', commands, hits, misses
+
+
+def main():
+    with FakeGvmd() as gvmd:
+        for command, entity_type in COMMANDS.items():
+            gvmd.set_response(
+                command, create_response(command, entity_type), delay=DELAY
+            )
+
+        setup_django(GMP_SOCKET_PATH=gvmd.path)
+
+        rows = [
+            ('disabled', *run_scenario(gvmd)),
+            ('enabled', *run_scenario(gvmd, 'default')),
+        ]
+
+    print(
+        f'task form query with {len(COMMANDS)} lists, gvmd delay '
+        f'{DELAY * 1000:.0f} ms per command, {REQUESTS} requests x 3\n'
+    )
+    print_table(
+        ('entity cache', 'ms/request', 'gvmd commands', 'hits', 'misses'),
+        rows,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Peak memory and duration of reading large get_reports responses
+
+Compares python-gvm's connection, which collects the response into a string
+and parses it again in the transform, with the incremental parsing of
+selene's connection. The responses are created from the report fixtures in
+selene/tests/reports by repeating their result.
+"""
+
+import copy
+
+from pathlib import Path
+from uuid import uuid4
+
+from lxml import etree
+
+from gvm.connections import UnixSocketConnection
+from gvm.protocols.gmp import Gmp as GvmGmp
+from gvm.transforms import (
+    EtreeCheckCommandTransform as GvmEtreeCheckCommandTransform,
+)
+
+from selene.connections import (
+    EtreeCheckCommandTransform,
+    IncrementalUnixSocketConnection,
+)
+from selene.gmp import Gmp
+from selene.tests.benchmarks import measure_in_process, print_table
+from selene.tests.benchmarks.fakegvmd import FakeGvmd
+
+REPORTS_DIR = Path(__file__).absolute().parent.parent / 'reports'
+
+RESULT_COUNTS = (1000, 10000, 50000)
+
+
+def create_response(count: int) -> str:
+    root = etree.parse(str(REPORTS_DIR / 'example-report-2.xml')).getroot()
+    results = root.find('report/report/results')
+    result = results.find('result')
+    results.remove(result)
+
+    for _ in range(count):
+        new_result = copy.deepcopy(result)
+        new_result.set('id', str(uuid4()))
+        results.append(new_result)
+
+    return etree.tostring(root, encoding='unicode')
+
+
+def read_report(gvmd: FakeGvmd, incremental: bool):
+    if incremental:
+        gmp = Gmp(
+            IncrementalUnixSocketConnection(path=gvmd.path),
+            transform=EtreeCheckCommandTransform(),
+        )
+    else:
+        gmp = GvmGmp(
+            UnixSocketConnection(path=gvmd.path),
+            transform=GvmEtreeCheckCommandTransform(),
+        )
+
+    with gmp as protocol:
+        protocol.get_report(str(uuid4()), details=True)
+
+
+def main():
+    rows = []
+
+    with FakeGvmd() as gvmd:
+        for count in RESULT_COUNTS:
+            response = create_response(count)
+            gvmd.set_response('get_reports', response)
+
+            for name, incremental in (('python-gvm', False), ('selene', True)):
+                memory, duration = measure_in_process(
+                    lambda inc=incremental: read_report(gvmd, inc)
+                )
+                rows.append(
+                    (
+                        count,
+                        f'{len(response) / 1024 / 1024:.0f}',
+                        name,
+                        f'{memory:.0f}',
+                        f'{duration * 1000:.0f}',
+                    )
+                )
+
+    print_table(
+        (
+            'results',
+            'response MiB',
+            'connection',
+            'additional peak MiB',
+            'ms/response',
+        ),
+        rows,
+    )
+
+
+if __name__ == '__main__':
+    main()
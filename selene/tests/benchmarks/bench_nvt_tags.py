@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Duration of resolving all tags of NVT lists
+
+Compares splitting the tags string of a NVT for every resolved NvtTags
+field with parsing the tags once per NVT. The responses are created from
+the NVT fixture with tags like the ones of the greenbone community feed.
+"""
+
+import copy
+
+from pathlib import Path
+from types import SimpleNamespace
+
+from lxml import etree
+
+from selene.connections import GmpResponseParser
+from selene.schema.parser import parse_nvt_tags
+from selene.tests.benchmarks import measure, print_table, setup_django
+
+NVTS_DIR = Path(__file__).absolute().parent.parent / 'nvts'
+
+NVT_COUNTS = (1000, 5000)
+
+TAG_FIELDS = (
+    'cvss_base_vector',
+    'summary',
+    'insight',
+    'affected',
+    'impact',
+    'vuldetect',
+)
+
+TAGS = (
+    'cvss_base_vector=AV:N/AC:L/Au:N/C:P/I:P/A:P|'
+    'last_modification=2021-03-11 08:51:12 +0000 (Thu, 11 Mar 2021)|'
+    'creation_date=2021-03-10 07:22:51 +0000 (Wed, 10 Mar 2021)|'
+    'summary=The remote host is missing an update for the package announced '
+    'via the referenced advisory.|'
+    'insight=Multiple vulnerabilities have been discovered in the package '
+    'which could allow a remote attacker to execute arbitrary code.|'
+    'affected=The package on the affected operating system releases.|'
+    'impact=Successful exploitation allows an attacker to execute '
+    'arbitrary code.|'
+    'vuldetect=Checks if a vulnerable package version is present on the '
+    'target host.|'
+    'solution=Please install the updated package(s).|'
+    'solution_type=VendorFix|'
+    'qod_type=package'
+)
+
+NVTS_QUERY = '''
+query {
+    nvts (filterString: "rows=-1") {
+        nodes {
+            id
+            name
+            tags {
+                cvssBaseVector
+                summary
+                insight
+                affected
+                impact
+                detectionMethod
+            }
+        }
+    }
+}
+'''
+
+
+def create_response(count: int) -> bytes:
+    root = etree.parse(str(NVTS_DIR / 'example-nvt.xml')).getroot()
+    info = root.find('info')
+    root.remove(info)
+
+    info.find('nvt/tags').text = TAGS
+
+    for index in range(count):
+        new_info = copy.deepcopy(info)
+        oid = f'1.3.6.1.4.1.25623.1.0.{index}'
+        new_info.set('id', oid)
+        new_info.find('nvt').set('oid', oid)
+        root.append(new_info)
+
+    return etree.tostring(root)
+
+
+def split_per_field(tags: str, field: str):
+    # the tags resolver before parsing the tags once
+    for tag in tags.split('|'):
+        key, value = tag.strip().split('=', 1)
+        if key == field:
+            return value
+    return None
+
+
+def resolve_split_per_field(tags_strings):
+    for tags in tags_strings:
+        for field in TAG_FIELDS:
+            split_per_field(tags, field)
+
+
+def resolve_parsed_once(tags_strings):
+    for tags in tags_strings:
+        parsed = parse_nvt_tags(tags)
+        for field in TAG_FIELDS:
+            parsed.get(field)
+
+
+class FakeGmp:
+    def __init__(self, response: etree.Element):
+        self.response = response
+
+    def __getattr__(self, name: str):
+        return lambda *args, **kwargs: self.response
+
+
+def resolve_query(response: etree.Element):
+    # pylint: disable=import-outside-toplevel
+    from selene.schema import schema
+
+    context = SimpleNamespace(
+        gmp=FakeGmp(response), session={'username': 'foo'}
+    )
+    result = schema.execute(NVTS_QUERY, context_value=context)
+    if result.errors:
+        raise RuntimeError(result.errors)
+
+
+def main():
+    setup_django()
+
+    tags_rows = []
+    query_rows = []
+
+    for count in NVT_COUNTS:
+        parser = GmpResponseParser()
+        parser.feed(create_response(count))
+        response = parser.root
+
+        tags_strings = [tags.text for tags in response.iter('tags')]
+
+        for name, resolve in (
+            ('split per field', resolve_split_per_field),
+            ('parsed once', resolve_parsed_once),
+        ):
+            duration, _ = measure(
+                lambda resolve=resolve, tags=tags_strings: resolve(tags)
+            )
+            tags_rows.append((count, name, f'{duration * 1000:.1f}'))
+
+        duration, _ = measure(lambda response=response: resolve_query(response))
+        query_rows.append((count, f'{duration * 1000:.0f}'))
+
+    print_table(('nvts', 'tags', 'ms'), tags_rows)
+    print()
+    print_table(('nvts', 'nvts query ms'), query_rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Wall-clock time of a dashboard like query with several top-level fields
+
+gvmd answers the commands of the fields with different delays. Compares
+resolving the fields one after another with resolving them concurrently.
+"""
+
+from selene.tests.benchmarks import (
+    create_client,
+    measure,
+    print_table,
+    query,
+    setup_django,
+)
+from selene.tests.benchmarks.fakegvmd import FakeGvmd
+
+DELAYS = {  # in seconds
+    'get_tasks': 0.2,
+    'get_reports': 0.3,
+    'get_results': 0.4,
+    'get_feeds': 0.1,
+}
+
+DASHBOARD_QUERY = '''
+query {
+    tasks {
+        nodes {
+            id
+        }
+    }
+    reports {
+        nodes {
+            id
+        }
+    }
+    results {
+        nodes {
+            id
+        }
+    }
+    feeds {
+        name
+    }
+}
+'''
+
+
+def run_scenario(gvmd: FakeGvmd, parallel_fields: int):
+    # pylint: disable=import-outside-toplevel
+    from django.conf import settings
+
+    from selene.pool import clear_connection_pools
+
+    settings.SELENE = {
+        'GMP_SOCKET_PATH': gvmd.path,
+        'PARALLEL_QUERY_FIELDS': parallel_fields,
+    }
+
+    clear_connection_pools()
+
+    client = create_client('admin', 'admin')
+
+    # warm up the connection pool
+    query(client, DASHBOARD_QUERY)
+    gvmd.reset()
+
+    duration, _ = measure(lambda: query(client, DASHBOARD_QUERY), repeat=3)
+
+    connections = gvmd.connections
+    gvmd.reset()
+
+    return f'{duration * 1000:.0f}', connections
+
+
+def main():
+    with FakeGvmd() as gvmd:
+        for command, delay in DELAYS.items():
+            gvmd.set_response(
+                command,
+                f'<{command}_response status="200" status_text="OK"/>',
+                delay=delay,
+            )
+
+        setup_django(GMP_SOCKET_PATH=gvmd.path)
+
+        rows = [
+            (
+                'sequential',
+                *run_scenario(gvmd, 0),
+            ),
+            (
+                'parallel',
+                *run_scenario(gvmd, len(DELAYS)),
+            ),
+        ]
+
+    print(
+        'dashboard query, gvmd delays: '
+        + ', '.join(
+            f'{command} {delay * 1000:.0f} ms'
+            for command, delay in DELAYS.items()
+        )
+        + f', sum {sum(DELAYS.values()) * 1000:.0f} ms'
+        + f', slowest {max(DELAYS.values()) * 1000:.0f} ms\n'
+    )
+    print_table(('execution', 'ms/request', 'new gvmd connections'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Duration of parsing the datetimes and UUIDs of gvmd responses
+
+Compares django's parse_datetime and creating UUID objects, which were used
+before, with the fast path and the memoized parsers of
+selene.schema.parser. The values are either all distinct or, like in lists
+of results, repeat a few distinct values.
+"""
+
+import datetime
+
+from uuid import UUID, uuid4
+
+from django.utils.dateparse import parse_datetime as django_parse_datetime
+
+from selene.schema.parser import parse_datetime, parse_uuid
+from selene.tests.benchmarks import measure, print_table, setup_django
+
+COUNT = 100000
+
+REPEATED_DISTINCT = 100
+
+START = datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def create_datetimes(distinct: int):
+    values = []
+    for i in range(distinct):
+        value = START + datetime.timedelta(seconds=i * 37)
+        if i % 2:
+            values.append(value.strftime('%Y-%m-%dT%H:%M:%SZ'))
+        else:
+            values.append(value.strftime('%Y-%m-%dT%H:%M:%S+01:00'))
+    return values
+
+
+def repeat(values, count: int):
+    return [values[i % len(values)] for i in range(count)]
+
+
+def parse_all(func, values):
+    for value in values:
+        func(value)
+
+
+def main():
+    setup_django()
+
+    rows = []
+
+    datetime_parsers = (
+        ('django', django_parse_datetime),
+        ('fast path', parse_datetime.__wrapped__),
+        ('memoized', parse_datetime),
+    )
+    uuid_parsers = (
+        ('UUID', UUID),
+        ('memoized', parse_uuid),
+    )
+
+    workloads = (
+        ('datetime', datetime_parsers, create_datetimes),
+        ('uuid', uuid_parsers, lambda n: [str(uuid4()) for _ in range(n)]),
+    )
+
+    for value_type, parsers, create in workloads:
+        for distribution, values in (
+            ('distinct', create(COUNT)),
+            (
+                f'{REPEATED_DISTINCT} repeated',
+                repeat(create(REPEATED_DISTINCT), COUNT),
+            ),
+        ):
+            for name, func in parsers:
+                parse_datetime.cache_clear()
+                parse_uuid.cache_clear()
+
+                duration, _ = measure(
+                    lambda func=func, values=values: parse_all(func, values)
+                )
+                rows.append(
+                    (
+                        value_type,
+                        distribution,
+                        name,
+                        f'{duration / COUNT * 1000 * 1000:.2f}',
+                    )
+                )
+
+    print_table(('values', 'distribution', 'parser', 'us/value'), rows)
+
+
+if __name__ == '__main__':
+    main()
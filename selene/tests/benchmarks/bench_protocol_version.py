@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Count the gvmd round trips of a simple tasks query
+
+Compares requesting the GMP protocol version for every new connection (like
+python-gvm's Gmp class does) with caching the version per socket path.
+"""
+
+from unittest.mock import patch
+
+from selene.tests.benchmarks import (
+    create_client,
+    measure,
+    print_table,
+    query,
+    setup_django,
+)
+from selene.tests.benchmarks.fakegvmd import FakeGvmd
+
+REQUESTS = 100
+
+TASKS_QUERY = '''
+query {
+    tasks {
+        nodes {
+            id
+        }
+    }
+}
+'''
+
+
+def run_requests(client):
+    for _ in range(REQUESTS):
+        query(client, TASKS_QUERY)
+
+
+def run_scenario(gvmd: FakeGvmd, *, pool_size: int, cache_version: bool):
+    # pylint: disable=import-outside-toplevel
+    from django.test import override_settings
+
+    from selene.gmp import forget_supported_gmp
+    from selene.pool import clear_connection_pools
+
+    clear_connection_pools()
+    forget_supported_gmp()
+
+    client = create_client('admin', 'admin')
+
+    with override_settings(
+        SELENE={'GMP_SOCKET_PATH': gvmd.path, 'GMP_POOL_SIZE': pool_size}
+    ):
+        if cache_version:
+            duration, _ = measure(lambda: run_requests(client), repeat=1)
+        else:
+            # without an address the version is requested for every new
+            # connection like python-gvm's Gmp class does
+            with patch('selene.gmp.get_connection_address', return_value=None):
+                duration, _ = measure(lambda: run_requests(client), repeat=1)
+
+    connections = gvmd.connections
+    round_trips = gvmd.round_trips
+    versions = gvmd.commands['get_version']
+    gvmd.reset()
+
+    return (
+        f'{connections / REQUESTS:.2f}',
+        f'{versions / REQUESTS:.2f}',
+        f'{round_trips / REQUESTS:.2f}',
+        f'{duration / REQUESTS * 1000:.3f}',
+    )
+
+
+def main():
+    with FakeGvmd() as gvmd:
+        setup_django(GMP_SOCKET_PATH=gvmd.path)
+
+        rows = []
+        for name, pool_size, cache_version in (
+            ('no pool, python-gvm version selection', 0, False),
+            ('no pool, cached version', 0, True),
+            ('pool, python-gvm version selection', 10, False),
+            ('pool, cached version', 10, True),
+        ):
+            rows.append(
+                (
+                    name,
+                    *run_scenario(
+                        gvmd, pool_size=pool_size, cache_version=cache_version
+                    ),
+                )
+            )
+
+    print(f'tasks query, {REQUESTS} requests\n')
+    print_table(
+        (
+            'scenario',
+            'connects/request',
+            'get_version/request',
+            'round trips/request',
+            'ms/request',
+        ),
+        rows,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Peak memory and duration of reading large get_reports responses with
+and without pruning the result elements not selected by a query
+
+The pruned paths are the ones of a report results query selecting only the
+id, name and severity of the results.
+"""
+
+from uuid import uuid4
+
+from selene.connections import (
+    EtreeCheckCommandTransform,
+    IncrementalUnixSocketConnection,
+    prune_response_elements,
+)
+from selene.gmp import Gmp
+from selene.schema.results.queries import RESULT_ELEMENT_FIELDS
+from selene.tests.benchmarks import measure_in_process, print_table
+from selene.tests.benchmarks.bench_incremental_parse import create_response
+from selene.tests.benchmarks.fakegvmd import FakeGvmd
+
+RESULT_COUNTS = (1000, 10000, 50000)
+
+PRUNED_PATHS = [
+    f'report/report/results/result/{name}' for name in RESULT_ELEMENT_FIELDS
+]
+
+
+def read_report(gvmd: FakeGvmd, pruned_paths):
+    gmp = Gmp(
+        IncrementalUnixSocketConnection(path=gvmd.path),
+        transform=EtreeCheckCommandTransform(),
+    )
+
+    with gmp as protocol, prune_response_elements(pruned_paths):
+        protocol.get_report(str(uuid4()), details=True)
+
+
+def main():
+    rows = []
+
+    with FakeGvmd() as gvmd:
+        for count in RESULT_COUNTS:
+            response = create_response(count)
+            gvmd.set_response('get_reports', response)
+
+            for name, pruned_paths in (
+                ('complete', []),
+                ('pruned', PRUNED_PATHS),
+            ):
+                memory, duration = measure_in_process(
+                    lambda paths=pruned_paths: read_report(gvmd, paths)
+                )
+                rows.append(
+                    (
+                        count,
+                        name,
+                        f'{memory:.0f}',
+                        f'{duration * 1000:.0f}',
+                    )
+                )
+
+    print_table(
+        ('results', 'parse', 'additional peak MiB', 'ms/response'),
+        rows,
+    )
+
+
+if __name__ == '__main__':
+    main()
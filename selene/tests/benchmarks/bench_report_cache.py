@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Wall-clock time of reopening a finished report with and without the report
+cache
+
+The query requests the results of the report. gvmd sends them for every
+detailed get_reports command. With the cache only a summary of the report and
+the state of the notes, overrides and settings are requested and the results
+are read from disk. A miss requests both. gvmd answers every command after a
+fixed delay.
+"""
+
+import os
+import shutil
+import tempfile
+
+from selene.tests.benchmarks import (
+    create_client,
+    measure,
+    print_table,
+    query,
+    setup_django,
+)
+from selene.tests.benchmarks.fakegvmd import FakeGvmd
+
+RESULT_COUNTS = (10, 100, 300, 1000, 10000)
+REQUESTS = 5
+DELAY = 0.002  # in seconds
+
+REPORT_ID = 'f0fdf522-276d-4893-9274-fb8699dc2270'
+
+REPORT_QUERY = f'''
+query {{
+    report (id: "{REPORT_ID}") {{
+        id
+        name
+        results (filterString: "sort-reverse=severity", first: 10000) {{
+            nodes {{
+                id
+                name
+                severity
+            }}
+        }}
+    }}
+}}
+'''
+
+
+def create_result(i: int) -> str:
+    return (
+        f'<result id="00000000-0000-0000-0000-{i:012}">'
+        f'<name>Result {i}</name>'
+        '<creation_time>2021-01-01T10:00:00Z</creation_time>'
+        '<modification_time>2021-01-01T10:00:00Z</modification_time>'
+        f'<host>192.168.{i // 256 % 256}.{i % 256}</host>'
+        '<port>443/tcp</port>'
+        '<nvt oid="1.3.6.1.4.1.25623.1.0.100000">'
+        '<type>nvt</type><name>Vulnerability</name>'
+        '<tags>cvss_base_vector=AV:N/AC:L/Au:N/C:P/I:P/A:P|summary=Foo|'
+        'insight=Bar|affected=Baz|impact=Foo|solution=Bar</tags>'
+        '</nvt>'
+        '<threat>High</threat><severity>7.5</severity>'
+        f'<description>{"Lorem ipsum dolor sit amet. " * 10}</description>'
+        '</result>'
+    )
+
+
+def create_response(result_count: int, details: bool = True) -> str:
+    if result_count and details:
+        results = ''.join(create_result(i) for i in range(result_count))
+        results = f'<results>{results}</results>'
+    else:
+        results = ''
+
+    return (
+        '<get_reports_response status="200" status_text="OK">'
+        f'<report id="{REPORT_ID}">'
+        '<name>2021-01-01T10:00:00Z</name>'
+        f'<report id="{REPORT_ID}">'
+        '<scan_run_status>Done</scan_run_status>'
+        f'{results}'
+        f'<result_count>{result_count}<full>{result_count}</full>'
+        f'<filtered>{result_count}</filtered></result_count>'
+        '</report>'
+        '</report>'
+        '</get_reports_response>'
+    )
+
+
+def clear_directory(directory: str):
+    for name in os.listdir(directory):
+        shutil.rmtree(os.path.join(directory, name), ignore_errors=True)
+
+
+def run_scenario(gvmd: FakeGvmd, result_count: int, cache: str, cache_dir: str):
+    # pylint: disable=import-outside-toplevel
+    from django.test import override_settings
+
+    from selene.pool import clear_connection_pools
+
+    # the report query itself requests a single result only
+    gvmd.set_response(
+        'get_reports',
+        create_response(1),
+        attributes={'details': '1', 'filter': 'rows=1'},
+    )
+    gvmd.set_response(
+        'get_reports',
+        create_response(result_count),
+        attributes={'details': '1'},
+    )
+    # the summary contains the counts but no results
+    gvmd.set_response(
+        'get_reports',
+        create_response(result_count, details=False),
+        attributes={'details': '0'},
+    )
+
+    clear_connection_pools()
+    clear_directory(cache_dir)
+
+    client = create_client('admin', 'admin')
+
+    with override_settings(
+        SELENE={
+            'GMP_SOCKET_PATH': gvmd.path,
+            'REPORT_CACHE_DIR': None if cache == 'disabled' else cache_dir,
+        }
+    ):
+        # warm up the connection pool and the cache
+        query(client, REPORT_QUERY)
+        gvmd.reset()
+
+        def run_requests():
+            for _ in range(REQUESTS):
+                if cache == 'miss':
+                    clear_directory(cache_dir)
+                query(client, REPORT_QUERY)
+
+        duration, _ = measure(run_requests, repeat=3)
+
+    commands = sum(gvmd.commands.values())
+    sent = gvmd.bytes_sent
+    gvmd.reset()
+
+    return (
+        result_count,
+        cache,
+        f'{duration / REQUESTS * 1000:.1f}',
+        f'{commands / (REQUESTS * 3):.1f}',
+        f'{sent / (REQUESTS * 3) / 1024:.1f}',
+    )
+
+
+def main():
+    with FakeGvmd(
+        delay=DELAY
+    ) as gvmd, tempfile.TemporaryDirectory() as cache_dir:
+        setup_django(GMP_SOCKET_PATH=gvmd.path)
+
+        rows = [
+            run_scenario(gvmd, result_count, cache, cache_dir)
+            for result_count in RESULT_COUNTS
+            for cache in ('disabled', 'miss', 'hit')
+        ]
+
+    print(
+        f'report query of a finished report, gvmd delay {DELAY * 1000:.0f} ms '
+        f'per command, {REQUESTS} requests x 3\n'
+    )
+    print_table(
+        (
+            'results',
+            'report cache',
+            'ms/request',
+            'gvmd commands/request',
+            'KiB from gvmd/request',
+        ),
+        rows,
+    )
+
+
+if __name__ == '__main__':
+    main()
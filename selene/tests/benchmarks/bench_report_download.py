@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Memory usage of loading a rendered report
+
+Compares querying a report with a report format via GraphQL, which parses
+the whole gvmd response, with streaming it via the report download view.
+Each scenario runs in a forked process to measure its peak memory usage.
+"""
+
+import base64
+import os
+
+from selene.tests.benchmarks import (
+    create_client,
+    measure_in_process,
+    print_table,
+    query,
+    setup_django,
+)
+from selene.tests.benchmarks.fakegvmd import FakeGvmd
+
+REPORT_SIZES = (10, 50, 200)  # in MiB
+
+REPORT_ID = 'f0fdf522-276d-4893-9274-fb8699dc2270'
+REPORT_FORMAT_ID = 'c402cc3e-b531-11e1-9163-406186ea4fc5'
+
+REPORT_QUERY = f'''
+query {{
+    report (id: "{REPORT_ID}", reportFormatId: "{REPORT_FORMAT_ID}") {{
+        id
+        name
+    }}
+}}
+'''
+
+
+def create_response(size: int) -> str:
+    content = base64.encodebytes(os.urandom(size * 1024 * 1024))
+    return (
+        '<get_reports_response status="200" status_text="OK">'
+        f'<report id="{REPORT_ID}" format_id="{REPORT_FORMAT_ID}" '
+        'extension="pdf" content_type="application/pdf">'
+        '<name>2021-01-01T10:00:00Z</name>'
+        f'<report_format id="{REPORT_FORMAT_ID}"><name>PDF</name>'
+        '</report_format>'
+        f'{content.decode("ascii")}'
+        '</report>'
+        '<report_count>1<filtered>1</filtered></report_count>'
+        '</get_reports_response>'
+    )
+
+
+def run_graphql(client):
+    query(client, REPORT_QUERY)
+
+
+def run_download(client):
+    response = client.get(
+        f'/reports/{REPORT_ID}/download/',
+        {'report_format_id': REPORT_FORMAT_ID},
+    )
+    for _ in response.streaming_content:
+        pass
+
+
+def run_scenario(func):
+    client = create_client('admin', 'admin')
+
+    memory, duration = measure_in_process(lambda: func(client))
+    return f'{memory:.0f}', f'{duration * 1000:.0f}'
+
+
+def main():
+    rows = []
+
+    with FakeGvmd() as gvmd:
+        setup_django(GMP_SOCKET_PATH=gvmd.path)
+
+        for size in REPORT_SIZES:
+            gvmd.set_response('get_reports', create_response(size))
+
+            rows.append((size, 'graphql', *run_scenario(run_graphql)))
+            rows.append((size, 'download', *run_scenario(run_download)))
+
+    print_table(
+        ('report MiB', 'endpoint', 'additional peak MiB', 'ms/request'), rows
+    )
+
+
+if __name__ == '__main__':
+    main()
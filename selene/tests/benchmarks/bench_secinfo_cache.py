@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Wall-clock time of a CVE list query with and without the SecInfo cache
+
+gvmd answers get_info with a delay simulating its database query. With the
+cache only the first request and the periodic feed version checks reach
+gvmd.
+"""
+
+from selene.tests.benchmarks import (
+    create_client,
+    measure,
+    print_table,
+    query,
+    setup_django,
+)
+from selene.tests.benchmarks.fakegvmd import FakeGvmd
+
+CVE_COUNT = 100
+GET_INFO_DELAY = 0.2  # in seconds
+REQUESTS = 10
+
+FEEDS_RESPONSE = (
+    '<get_feeds_response status="200" status_text="OK">'
+    '<feed><type>SCAP</type><version>202104020000</version></feed>'
+    '</get_feeds_response>'
+)
+
+CVES_QUERY = '''
+query {
+    cves(filterString: "rows=100") {
+        nodes {
+            id
+            name
+            score
+            description
+        }
+    }
+}
+'''
+
+
+def create_info_response(count: int) -> str:
+    infos = ''.join(
+        f'<info id="CVE-2021-{i:05}">'
+        f'<name>CVE-2021-{i:05}</name>'
+        '<modification_time>2021-04-01T10:00:00Z</modification_time>'
+        '<cve><score>7.5</score>'
+        f'<description>{"Lorem ipsum dolor sit amet. " * 10}</description>'
+        '</cve>'
+        '</info>'
+        for i in range(count)
+    )
+    return (
+        '<get_info_response status="200" status_text="OK">'
+        f'{infos}'
+        f'<info_count>{count}<filtered>{count}</filtered></info_count>'
+        '</get_info_response>'
+    )
+
+
+def run_scenario(gvmd: FakeGvmd, cache_alias: str = None):
+    # pylint: disable=import-outside-toplevel
+    from django.conf import settings
+    from django.core.cache import caches
+
+    from selene.pool import clear_connection_pools
+
+    settings.SELENE = {
+        'GMP_SOCKET_PATH': gvmd.path,
+        'SECINFO_CACHE': cache_alias,
+    }
+
+    clear_connection_pools()
+    caches['default'].clear()
+
+    client = create_client('admin', 'admin')
+
+    # warm up the connection pool and the cache
+    query(client, CVES_QUERY)
+    gvmd.reset()
+
+    duration, _ = measure(
+        lambda: [query(client, CVES_QUERY) for _ in range(REQUESTS)], repeat=3
+    )
+
+    commands = gvmd.commands['get_info']
+    gvmd.reset()
+
+    return f'{duration / REQUESTS * 1000:.1f}', commands
+
+
+def main():
+    with FakeGvmd() as gvmd:
+        gvmd.set_response('get_feeds', FEEDS_RESPONSE)
+        gvmd.set_response(
+            'get_info', create_info_response(CVE_COUNT), delay=GET_INFO_DELAY
+        )
+
+        setup_django(GMP_SOCKET_PATH=gvmd.path)
+
+        rows = [
+            ('disabled', *run_scenario(gvmd)),
+            ('enabled', *run_scenario(gvmd, 'default')),
+        ]
+
+    print(
+        f'{CVE_COUNT} CVEs per request, get_info delay '
+        f'{GET_INFO_DELAY * 1000:.0f} ms, {REQUESTS} requests x 3\n'
+    )
+    print_table(('secinfo cache', 'ms/request', 'get_info commands'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Identical CVE list queries of several clients arriving at the same time
+
+gvmd answers get_info with a delay simulating its database query. Without
+coalescing each request sends its own get_info command. With coalescing the
+concurrent requests of a user share a single one.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from selene.tests.benchmarks import (
+    create_client,
+    measure,
+    print_table,
+    query,
+    setup_django,
+)
+from selene.tests.benchmarks.bench_secinfo_cache import (
+    CVES_QUERY,
+    FEEDS_RESPONSE,
+    create_info_response,
+)
+from selene.tests.benchmarks.fakegvmd import FakeGvmd
+
+CLIENTS = 20
+GET_INFO_DELAY = 0.5  # in seconds
+
+
+def run_scenario(gvmd: FakeGvmd, coalesce: bool):
+    # pylint: disable=import-outside-toplevel
+    from django.conf import settings
+
+    from selene.pool import clear_connection_pools
+
+    settings.SELENE = {
+        'GMP_SOCKET_PATH': gvmd.path,
+        'GMP_POOL_SIZE': CLIENTS,
+        'SECINFO_COALESCE': coalesce,
+    }
+
+    clear_connection_pools()
+
+    clients = [create_client('admin', 'admin') for _ in range(CLIENTS)]
+
+    with ThreadPoolExecutor(CLIENTS) as executor:
+
+        def run():
+            list(
+                executor.map(lambda client: query(client, CVES_QUERY), clients)
+            )
+
+        # warm up the connection pool
+        run()
+        gvmd.reset()
+
+        duration, _ = measure(run, repeat=3)
+
+    commands = gvmd.commands['get_info']
+    gvmd.reset()
+
+    return f'{duration * 1000:.0f}', commands
+
+
+def main():
+    with FakeGvmd() as gvmd:
+        gvmd.set_response('get_feeds', FEEDS_RESPONSE)
+        gvmd.set_response(
+            'get_info', create_info_response(100), delay=GET_INFO_DELAY
+        )
+
+        setup_django(GMP_SOCKET_PATH=gvmd.path)
+
+        rows = [
+            ('disabled', *run_scenario(gvmd, False)),
+            ('enabled', *run_scenario(gvmd, True)),
+        ]
+
+    print(
+        f'{CLIENTS} concurrent requests of one user, get_info delay '
+        f'{GET_INFO_DELAY * 1000:.0f} ms, 3 rounds\n'
+    )
+    print_table(('coalescing', 'ms/round', 'get_info commands'), rows)
+
+
+if __name__ == '__main__':
+    main()
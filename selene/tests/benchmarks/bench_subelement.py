@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Duration of looking up child elements and of resolving task and report
+queries
+
+Compares lxml's find with selene's get_subelement for all children of the
+elements of the task and report fixtures. The responses for the queries are
+created from the fixtures by repeating their task or result.
+"""
+
+import copy
+
+from pathlib import Path
+from types import SimpleNamespace
+from uuid import uuid4
+
+from lxml import etree
+
+from selene.connections import GmpResponseParser
+from selene.schema.utils import get_subelement
+from selene.tests.benchmarks import measure, print_table, setup_django
+
+TESTS_DIR = Path(__file__).absolute().parent.parent
+
+COUNT = 1000
+
+TASKS_QUERY = '''
+query {
+    tasks {
+        nodes {
+            id
+            name
+            comment
+            owner
+            alterable
+            creationTime
+            modificationTime
+            writable
+            inUse
+            permissions {
+                name
+            }
+            userTags {
+                count
+            }
+            status
+            progress
+            trend
+            scanConfig {
+                id
+                name
+            }
+            target {
+                id
+                name
+            }
+            scanner {
+                id
+                name
+                type
+            }
+            schedule {
+                id
+                name
+            }
+            reports {
+                counts {
+                    total
+                    finished
+                }
+                lastReport {
+                    id
+                    severity
+                    creationTime
+                }
+            }
+        }
+    }
+}
+'''
+
+REPORT_QUERY = '''
+query {
+    report(id: "f0fdf522-276d-4893-9274-fb8699dc2270") {
+        id
+        name
+        results (filterString: "rows=-1") {
+            nodes {
+                id
+                name
+                owner
+                creationTime
+                modificationTime
+                description
+                type
+                severity
+                originalSeverity
+                location
+                qod {
+                    value
+                    type
+                }
+                host {
+                    ip
+                    id
+                    hostname
+                }
+                report {
+                    id
+                }
+                task {
+                    id
+                    name
+                }
+                information {
+                    ... on ResultNVT {
+                        id
+                        name
+                        family
+                        score
+                        version
+                    }
+                }
+            }
+        }
+    }
+}
+'''
+
+
+def repeat_child(path: str, parent_path: str, tag: str, count: int) -> bytes:
+    root = etree.parse(str(TESTS_DIR / path)).getroot()
+    parent = root.find(parent_path) if parent_path else root
+    child = parent.find(tag)
+    parent.remove(child)
+
+    for _ in range(count):
+        new_child = copy.deepcopy(child)
+        new_child.set('id', str(uuid4()))
+        parent.append(new_child)
+
+    return etree.tostring(root)
+
+
+def parse(data: bytes) -> etree.Element:
+    parser = GmpResponseParser()
+    parser.feed(data)
+    return parser.root
+
+
+def get_lookups(root: etree.Element):
+    """Return all elements of the tree with the tags of their children"""
+    return [
+        (element, [child.tag for child in element.iterchildren(etree.Element)])
+        for element in root.iter(etree.Element)
+    ]
+
+
+def lookup_find(lookups):
+    for element, tags in lookups:
+        for tag in tags:
+            element.find(tag)
+
+
+def lookup_subelement(lookups):
+    for element, tags in lookups:
+        for tag in tags:
+            get_subelement(element, tag)
+
+
+class FakeGmp:
+    def __init__(self, response: etree.Element):
+        self.response = response
+
+    def __getattr__(self, name: str):
+        return lambda *args, **kwargs: self.response
+
+
+def resolve(query_string: str, response: etree.Element):
+    # pylint: disable=import-outside-toplevel
+    from selene.schema import schema
+
+    context = SimpleNamespace(
+        gmp=FakeGmp(response), session={'username': 'foo'}
+    )
+    result = schema.execute(query_string, context_value=context)
+    if result.errors:
+        raise RuntimeError(result.errors)
+
+
+def main():
+    setup_django()
+
+    fixtures = (
+        (
+            'tasks',
+            TASKS_QUERY,
+            repeat_child('tasks/example-task.xml', None, 'task', COUNT),
+        ),
+        (
+            'report results',
+            REPORT_QUERY,
+            repeat_child(
+                'reports/example-report-2.xml',
+                'report/report/results',
+                'result',
+                COUNT,
+            ),
+        ),
+    )
+
+    lookup_rows = []
+    query_rows = []
+
+    for name, query_string, data in fixtures:
+        lookups = get_lookups(parse(data))
+        count = sum(len(tags) for _, tags in lookups)
+
+        for lookup_name, lookup in (
+            ('find', lookup_find),
+            ('get_subelement', lookup_subelement),
+        ):
+            duration, _ = measure(
+                lambda lookup=lookup, lookups=lookups: lookup(lookups)
+            )
+            lookup_rows.append(
+                (
+                    f'{COUNT} {name}',
+                    lookup_name,
+                    count,
+                    f'{duration / count * 1000 * 1000:.2f}',
+                )
+            )
+
+        durations = []
+        for _ in range(5):
+            response = parse(data)
+            duration, _ = measure(
+                lambda q=query_string, r=response: resolve(q, r), repeat=1
+            )
+            durations.append(duration)
+
+        query_rows.append((f'{COUNT} {name}', f'{min(durations) * 1000:.0f}'))
+
+    print_table(('fixture', 'lookup', 'lookups', 'us/lookup'), lookup_rows)
+    print()
+    print_table(('query', 'resolve ms'), query_rows)
+
+
+if __name__ == '__main__':
+    main()
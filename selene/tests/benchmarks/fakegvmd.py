@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""A fake gvmd listening on a unix socket
+
+The fake daemon answers each GMP command with a canned response and counts
+the connections and commands it has received.
+"""
+
+import os
+import socketserver
+import tempfile
+import threading
+import time
+
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from lxml import etree
+
+DEFAULT_VERSION = '21.4'
+
+
+class _GmpRequestHandler(socketserver.BaseRequestHandler):
+    server: '_FakeGvmdServer'
+
+    def handle(self):
+        gvmd = self.server.gvmd
+        gvmd.count_connection()
+
+        parser = etree.XMLPullParser(events=('start', 'end'))
+        command = None
+        attributes = None
+        depth = 0
+
+        while True:
+            data = self.request.recv(16 * 1024)
+            if not data:
+                return
+
+            parser.feed(data)
+
+            for event, element in parser.read_events():
+                if event == 'start':
+                    if depth == 0:
+                        command = element.tag
+                        attributes = dict(element.attrib)
+                    depth += 1
+                    continue
+
+                depth -= 1
+                if depth == 0:
+                    try:
+                        self.request.sendall(gvmd.respond(command, attributes))
+                    except (BrokenPipeError, ConnectionResetError):
+                        # the client has gone away, e.g. after a timeout
+                        return
+                    parser = etree.XMLPullParser(events=('start', 'end'))
+
+
+class _FakeGvmdServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    # allow many concurrent clients for load tests
+    request_queue_size = 1024
+
+    def __init__(self, path: str, gvmd: 'FakeGvmd'):
+        super().__init__(path, _GmpRequestHandler)
+        self.gvmd = gvmd
+
+
+class FakeGvmd:
+    """A fake gvmd for benchmarks
+
+    Example:
+
+        .. code-block:: python
+
+            with FakeGvmd() as gvmd:
+                gvmd.set_response('get_tasks', '<get_tasks_response .../>')
+                ...
+                print(gvmd.commands['get_tasks'])
+
+    Args:
+        path: Path of the unix socket. A temporary path is used by default.
+        version: GMP version to report for get_version
+        delay: Default delay in seconds before a response is sent
+    """
+
+    def __init__(
+        self,
+        path: str = None,
+        *,
+        version: str = DEFAULT_VERSION,
+        delay: float = 0.0,
+    ):
+        if path is None:
+            self._tmpdir = tempfile.mkdtemp()
+            path = os.path.join(self._tmpdir, 'gvmd.sock')
+        else:
+            self._tmpdir = None
+
+        self.path = path
+        self.delay = delay
+        self.connections = 0
+        self.commands = Counter()
+        self.bytes_sent = 0
+
+        self._responses: Dict[str, bytes] = {}
+        self._attribute_responses: Dict[
+            str, List[Tuple[Dict[str, str], bytes]]
+        ] = {}
+        self._delays: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[_FakeGvmdServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+        self.set_response(
+            'get_version',
+            '<get_version_response status="200" status_text="OK">'
+            f'<version>{version}</version>'
+            '</get_version_response>',
+        )
+        self.set_response(
+            'authenticate',
+            '<authenticate_response status="200" status_text="OK">'
+            '<role>Admin</role><timezone>UTC</timezone>'
+            '</authenticate_response>',
+        )
+
+    def set_response(
+        self,
+        command: str,
+        response: str,
+        delay: float = None,
+        *,
+        attributes: Dict[str, str] = None,
+    ):
+        """Set the response and optionally a delay for a GMP command
+
+        If attributes are passed the response is only sent for commands
+        having these attributes, e.g. {'details': '1'}.
+        """
+        if attributes is None:
+            self._responses[command] = response.encode('utf-8')
+        else:
+            responses = [
+                (expected, content)
+                for expected, content in self._attribute_responses.get(
+                    command, []
+                )
+                if expected != attributes
+            ]
+            responses.append((attributes, response.encode('utf-8')))
+            self._attribute_responses[command] = responses
+        if delay is not None:
+            self._delays[command] = delay
+
+    def _get_response(
+        self, command: str, attributes: Dict[str, str]
+    ) -> Optional[bytes]:
+        for expected, response in self._attribute_responses.get(command, []):
+            if all(
+                attributes.get(name) == value
+                for name, value in expected.items()
+            ):
+                return response
+        return self._responses.get(command)
+
+    def respond(self, command: str, attributes: Dict[str, str] = None) -> bytes:
+        with self._lock:
+            self.commands[command] += 1
+
+        delay = self._delays.get(command, self.delay)
+        if delay:
+            time.sleep(delay)
+
+        response = self._get_response(command, attributes or {})
+        if response is None:
+            response = (
+                f'<{command}_response status="200" status_text="OK"/>'
+            ).encode('utf-8')
+
+        with self._lock:
+            self.bytes_sent += len(response)
+
+        return response
+
+    def count_connection(self):
+        with self._lock:
+            self.connections += 1
+
+    @property
+    def round_trips(self) -> int:
+        """Number of received commands"""
+        return sum(self.commands.values())
+
+    def reset(self):
+        """Reset the counters"""
+        with self._lock:
+            self.connections = 0
+            self.bytes_sent = 0
+            self.commands.clear()
+
+    def start(self):
+        self._server = _FakeGvmdServer(self.path, self)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+        if self._tmpdir is not None:
+            os.rmdir(self._tmpdir)
+            self._tmpdir = None
+
+    def __enter__(self) -> 'FakeGvmd':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
@@ -18,9 +18,33 @@
 
 from unittest.mock import patch
 
+from django.core.cache import caches
+from django.test import SimpleTestCase
+
+from selene.schema.capabilities import changes_capabilities
 from selene.tests import SeleneTestCase, GmpMockFactory
 
 
+HELP_RESPONSE = '''
+<help_response status="200" status_text="OK">
+    <schema format="XML" extension="xml" content_type="text/xml">
+        <command>
+            <name>AUTHENTICATE</name>
+        </command>
+        <command>
+            <name>GET_TASKS</name>
+        </command>
+    </schema>
+</help_response>
+'''
+
+CAPABILITIES_QUERY = '''
+query {
+    capabilities
+}
+'''
+
+
 @patch('selene.views.Gmp', new_callable=GmpMockFactory)
 class CapabilitiesTestCase(SeleneTestCase):
     def test_require_authentication(self, _mock_gmp: GmpMockFactory):
@@ -77,3 +101,198 @@ class CapabilitiesTestCase(SeleneTestCase):
         self.assertEqual(caps[0], 'AUTHENTICATE')
         self.assertEqual(caps[1], 'COMMANDS')
         self.assertEqual(caps[2], 'CREATE_AGENT')
+
+    def test_request_capabilities_without_cache(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response('help', HELP_RESPONSE)
+
+        self.login('foo', 'bar')
+
+        self.query(CAPABILITIES_QUERY)
+        self.query(CAPABILITIES_QUERY)
+
+        self.assertEqual(mock_gmp.gmp_protocol.help.call_count, 2)
+
+
+@patch('selene.views.Gmp', new_callable=GmpMockFactory)
+class CachedCapabilitiesTestCase(SeleneTestCase):
+    def setUp(self):
+        self.settings_override = self.settings(
+            SELENE={'CAPABILITIES_CACHE': 'default'}
+        )
+        self.settings_override.enable()
+
+        caches['default'].clear()
+
+    def tearDown(self):
+        super().tearDown()
+
+        caches['default'].clear()
+
+        self.settings_override.disable()
+
+    def test_keep_capabilities(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response('help', HELP_RESPONSE)
+
+        self.login('foo', 'bar')
+
+        response = self.query(CAPABILITIES_QUERY)
+        self.assertResponseNoErrors(response)
+
+        response = self.query(CAPABILITIES_QUERY)
+        self.assertResponseNoErrors(response)
+
+        self.assertEqual(
+            response.json()['data']['capabilities'],
+            ['AUTHENTICATE', 'GET_TASKS'],
+        )
+        mock_gmp.gmp_protocol.help.assert_called_once_with(
+            format='xml', help_type='brief'
+        )
+
+    def test_keep_capabilities_per_user(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response('help', HELP_RESPONSE)
+
+        self.login('foo', 'bar')
+
+        self.query(CAPABILITIES_QUERY)
+
+        response = self.query(
+            '''
+            mutation {
+                login(username: "bar", password: "baz") {
+                    ok
+                }
+            }
+            '''
+        )
+        self.assertResponseNoErrors(response)
+
+        self.query(CAPABILITIES_QUERY)
+
+        self.login('foo', 'bar')
+
+        self.query(CAPABILITIES_QUERY)
+
+        self.assertEqual(mock_gmp.gmp_protocol.help.call_count, 2)
+
+    def test_forget_capabilities_on_login(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response('help', HELP_RESPONSE)
+
+        self.login('foo', 'bar')
+
+        self.query(CAPABILITIES_QUERY)
+
+        # the permissions of foo may have changed outside of selene
+        response = self.query(
+            '''
+            mutation {
+                login(username: "foo", password: "bar") {
+                    ok
+                }
+            }
+            '''
+        )
+        self.assertResponseNoErrors(response)
+
+        self.query(CAPABILITIES_QUERY)
+
+        self.assertEqual(mock_gmp.gmp_protocol.help.call_count, 2)
+
+    def test_forget_capabilities_on_role_change(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response('help', HELP_RESPONSE)
+
+        self.login('foo', 'bar')
+
+        self.query(CAPABILITIES_QUERY)
+
+        response = self.query(
+            '''
+            mutation {
+                deleteRole(
+                    id: "08b69003-5fc2-4037-a479-93b440211c73", ultimate: false
+                ) {
+                    ok
+                }
+            }
+            '''
+        )
+        self.assertResponseNoErrors(response)
+
+        self.query(CAPABILITIES_QUERY)
+
+        self.assertEqual(mock_gmp.gmp_protocol.help.call_count, 2)
+
+    def test_forget_capabilities_on_role_change_of_other_user(
+        self, mock_gmp: GmpMockFactory
+    ):
+        mock_gmp.mock_response('help', HELP_RESPONSE)
+
+        self.login('foo', 'bar')
+
+        self.query(CAPABILITIES_QUERY)
+
+        # e.g. an admin changes the roles of foo in another session
+        self.login('admin', 'admin')
+
+        response = self.query(
+            '''
+            mutation {
+                deleteRole(
+                    id: "08b69003-5fc2-4037-a479-93b440211c73", ultimate: false
+                ) {
+                    ok
+                }
+            }
+            '''
+        )
+        self.assertResponseNoErrors(response)
+
+        self.login('foo', 'bar')
+
+        self.query(CAPABILITIES_QUERY)
+
+        self.assertEqual(mock_gmp.gmp_protocol.help.call_count, 2)
+
+    def test_keep_capabilities_on_other_changes(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response('help', HELP_RESPONSE)
+
+        self.login('foo', 'bar')
+
+        self.query(CAPABILITIES_QUERY)
+
+        response = self.query(
+            '''
+            mutation {
+                stopTask(id: "08b69003-5fc2-4037-a479-93b440211c73") {
+                    ok
+                }
+            }
+            '''
+        )
+        self.assertResponseNoErrors(response)
+
+        self.query(CAPABILITIES_QUERY)
+
+        mock_gmp.gmp_protocol.help.assert_called_once()
+
+
+class ChangesCapabilitiesTestCase(SimpleTestCase):
+    def test_capability_commands(self):
+        for command in (
+            'create_group',
+            'modify_permission',
+            'clone_role',
+            'delete_user',
+            'empty_trashcan',
+            'restore',
+        ):
+            self.assertTrue(changes_capabilities(command), command)
+
+    def test_other_commands(self):
+        for command in (
+            'authenticate',
+            'create_task',
+            'modify_user_setting',
+            'delete_target',
+        ):
+            self.assertFalse(changes_capabilities(command), command)
@@ -18,3 +18,4 @@
 
 from .make_test_get_entity import make_test_get_entity
 from .make_test_get_entities import make_test_get_entities
+from .make_test_load_entities import make_test_load_entities
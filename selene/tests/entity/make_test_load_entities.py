@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from selene.tests import GmpMockFactory
+
+from selene.tests.utils.utils import return_gmp_methods
+
+ID1 = '08b69003-5fc2-4037-a479-93b440211c73'
+ID2 = 'c4e3a6f2-39f3-4a7a-a4b9-3b3c0f0c4f0e'
+
+
+def compose_mock_response(entity_name, entities_cmd):
+    xml_response = f'''
+        <{entities_cmd}_response>
+            <{entity_name} id="{ID1}">
+                <name>foo</name>
+            </{entity_name}>
+            <{entity_name} id="{ID2}">
+                <name>bar</name>
+            </{entity_name}>
+        </{entities_cmd}_response>
+    '''
+    return xml_response
+
+
+def compose_mock_query(entity_name):
+    query = f'''
+            query {{
+                first: {entity_name} (id: "{ID2}") {{
+                    id
+                    name
+                }}
+                second: {entity_name} (id: "{ID1}") {{
+                    id
+                    name
+                }}
+            }}
+            '''
+    return query
+
+
+def make_test_load_entities(
+    gmp_name: str,
+    *,
+    selene_name: str = None,
+    gmp_cmd: str = None,
+    gmp_entities_cmd: str = None,
+    **kwargs,
+):
+    """Test that several entities requested by id are loaded with a single
+    get_<entities> command
+
+    Further keyword arguments are the expected arguments of the
+    get_<entities> command.
+    """
+
+    if not selene_name:
+        selene_name = gmp_name
+
+    if not gmp_cmd:
+        gmp_cmd = 'get_' + gmp_name
+
+    if not gmp_entities_cmd:
+        gmp_entities_cmd = gmp_cmd + 's'
+
+    @unittest.mock.patch('selene.views.Gmp', new_callable=GmpMockFactory)
+    def test(self, mock_gmp: GmpMockFactory):
+
+        gmp_commands = return_gmp_methods(mock_gmp.gmp_protocol)
+
+        mock_gmp.mock_response(
+            gmp_entities_cmd, compose_mock_response(gmp_name, gmp_entities_cmd)
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(compose_mock_query(selene_name))
+
+        json = response.json()
+
+        self.assertResponseNoErrors(response)
+
+        gmp_commands[gmp_entities_cmd].assert_called_once_with(
+            filter=f'uuid={ID2} uuid={ID1} first=1 rows=2', **kwargs
+        )
+        gmp_commands[gmp_cmd].assert_not_called()
+
+        first = json['data']['first']
+        second = json['data']['second']
+
+        self.assertEqual(first['id'], ID2)
+        self.assertEqual(first['name'], 'bar')
+        self.assertEqual(second['id'], ID1)
+        self.assertEqual(second['name'], 'foo')
+
+    return test
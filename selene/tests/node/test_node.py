@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2020-2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from base64 import b64encode
+from unittest.mock import patch
+
+from gvm.errors import GvmResponseError
+
+from selene.tests import SeleneTestCase, GmpMockFactory
+
+
+def to_global_id(type_name: str, entity_id: str) -> str:
+    return b64encode(f'{type_name}:{entity_id}'.encode()).decode()
+
+
+TASK_ID = '75d23ba8-3d23-11ea-858e-b7c2cb43e815'
+TASK_ID_2 = '05d1edfa-3df8-11ea-9651-7b09b3acce77'
+TARGET_ID = '5f8ba3a4-0d5c-4a3e-9c3a-56c6c7fb0b4a'
+
+
+@patch('selene.views.Gmp', new_callable=GmpMockFactory)
+class NodeTestCase(SeleneTestCase):
+    def test_require_authentication(self, _mock_gmp: GmpMockFactory):
+        response = self.query(
+            f'''
+            query {{
+                node(id: "{to_global_id('Task', TASK_ID)}") {{
+                    globalId
+                }}
+            }}
+            '''
+        )
+
+        self.assertResponseAuthenticationRequired(response)
+
+    def test_get_node(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_task',
+            f'''
+            <get_tasks_response>
+                <task id="{TASK_ID}">
+                    <name>a</name>
+                </task>
+            </get_tasks_response>
+            ''',
+        )
+
+        self.login('foo', 'bar')
+
+        global_id = to_global_id('Task', TASK_ID)
+
+        response = self.query(
+            f'''
+            query {{
+                node(id: "{global_id}") {{
+                    globalId
+                    ... on Task {{
+                        id
+                        name
+                    }}
+                }}
+            }}
+            '''
+        )
+
+        json = response.json()
+
+        self.assertResponseNoErrors(response)
+
+        node = json['data']['node']
+
+        self.assertEqual(node['globalId'], global_id)
+        self.assertEqual(node['id'], TASK_ID)
+        self.assertEqual(node['name'], 'a')
+
+        mock_gmp.gmp_protocol.get_task.assert_called_with(TASK_ID)
+
+    def test_get_audit_node(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_audit',
+            f'''
+            <get_tasks_response>
+                <task id="{TASK_ID}">
+                    <name>a</name>
+                </task>
+            </get_tasks_response>
+            ''',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                node(id: "{to_global_id('Audit', TASK_ID)}") {{
+                    __typename
+                }}
+            }}
+            '''
+        )
+
+        json = response.json()
+
+        self.assertResponseNoErrors(response)
+
+        self.assertEqual(json['data']['node']['__typename'], 'Audit')
+
+    def test_get_nodes_of_several_types_with_same_id(
+        self, mock_gmp: GmpMockFactory
+    ):
+        mock_gmp.mock_response(
+            'get_task',
+            f'''
+            <get_tasks_response>
+                <task id="{TASK_ID}">
+                    <name>a</name>
+                    <usage_type>scan</usage_type>
+                </task>
+            </get_tasks_response>
+            ''',
+        )
+        mock_gmp.gmp_protocol.get_audit.side_effect = GvmResponseError(
+            status='404', message=f"Failed to find audit '{TASK_ID}'"
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                a: node(id: "{to_global_id('Task', TASK_ID)}") {{
+                    __typename
+                }}
+                b: node(id: "{to_global_id('Audit', TASK_ID)}") {{
+                    __typename
+                }}
+            }}
+            '''
+        )
+
+        json = response.json()
+
+        self.assertResponseNoErrors(response)
+
+        self.assertEqual(json['data']['a']['__typename'], 'Task')
+        self.assertIsNone(json['data']['b'])
+
+    def test_get_node_not_found(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_tasks',
+            f'''
+            <get_tasks_response>
+                <task id="{TASK_ID}">
+                    <name>a</name>
+                </task>
+            </get_tasks_response>
+            ''',
+        )
+        mock_gmp.gmp_protocol.get_task.side_effect = GvmResponseError(
+            status='404', message=f"Failed to find task '{TASK_ID_2}'"
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                a: node(id: "{to_global_id('Task', TASK_ID)}") {{
+                    globalId
+                }}
+                b: node(id: "{to_global_id('Task', TASK_ID_2)}") {{
+                    globalId
+                }}
+            }}
+            '''
+        )
+
+        json = response.json()
+
+        self.assertResponseNoErrors(response)
+
+        self.assertIsNotNone(json['data']['a'])
+        self.assertIsNone(json['data']['b'])
+
+    def test_invalid_global_id(self, _mock_gmp: GmpMockFactory):
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                node(id: "{to_global_id('Foo', TASK_ID)}") {{
+                    globalId
+                }}
+            }}
+            '''
+        )
+
+        self.assertResponseHasErrorMessage(
+            response, f'Invalid global ID {to_global_id("Foo", TASK_ID)}'
+        )
+
+    def test_get_nodes(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_tasks',
+            f'''
+            <get_tasks_response>
+                <task id="{TASK_ID_2}">
+                    <name>b</name>
+                </task>
+                <task id="{TASK_ID}">
+                    <name>a</name>
+                </task>
+            </get_tasks_response>
+            ''',
+        )
+        mock_gmp.mock_response(
+            'get_target',
+            f'''
+            <get_targets_response>
+                <target id="{TARGET_ID}">
+                    <name>c</name>
+                </target>
+            </get_targets_response>
+            ''',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                nodes(ids: [
+                    "{to_global_id('Task', TASK_ID)}",
+                    "{to_global_id('Target', TARGET_ID)}",
+                    "{to_global_id('Task', TASK_ID_2)}"
+                ]) {{
+                    __typename
+                    ... on Task {{
+                        name
+                    }}
+                    ... on Target {{
+                        name
+                    }}
+                }}
+            }}
+            '''
+        )
+
+        json = response.json()
+
+        self.assertResponseNoErrors(response)
+
+        nodes = json['data']['nodes']
+
+        self.assertEqual(
+            [(node['__typename'], node['name']) for node in nodes],
+            [('Task', 'a'), ('Target', 'c'), ('Task', 'b')],
+        )
+
+        mock_gmp.gmp_protocol.get_tasks.assert_called_once()
+        mock_gmp.gmp_protocol.get_task.assert_not_called()
+        mock_gmp.gmp_protocol.get_target.assert_called_once_with(
+            TARGET_ID, tasks=True
+        )
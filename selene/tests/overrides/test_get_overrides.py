@@ -208,14 +208,14 @@ class OverrideTestCase(SeleneTestCase):
 class OverridesPaginationTestCase(SeleneTestCase):
     entity_name = 'override'
     test_pagination_with_after_and_first = make_test_after_first(
-        entity_name, details=True
+        entity_name, details=False
     )
     test_counts = make_test_counts(entity_name)
     test_page_info = make_test_page_info(entity_name, query=GetOverrides)
     test_pagination_with_before_and_last = make_test_before_last(
-        entity_name, details=True
+        entity_name, details=False
     )
     test_edges = make_test_edges(entity_name)
     test_after_first_before_last = make_test_after_first_before_last(
-        entity_name, details=True
+        entity_name, details=False
     )
@@ -24,7 +24,7 @@ from unittest.mock import patch
 
 from selene.tests import SeleneTestCase, GmpMockFactory
 
-from selene.tests.entity import make_test_get_entity
+from selene.tests.entity import make_test_get_entity, make_test_load_entities
 
 CWD = Path(__file__).absolute().parent
 
@@ -310,3 +310,11 @@ class PolicyGetEntityTestCase(SeleneTestCase):
     test_get_entity = make_test_get_entity(
         gmp_name, selene_name=selene_name, gmp_cmd=gmp_cmd, audits=True
     )
+    test_load_entities = make_test_load_entities(
+        gmp_name,
+        selene_name=selene_name,
+        gmp_cmd=gmp_cmd,
+        gmp_entities_cmd='get_policies',
+        details=True,
+        audits=True,
+    )
@@ -289,16 +289,16 @@ class PortListsPaginationTestCase(SeleneTestCase):
     gmp_name = 'port_list'
     selene_name = 'portList'
     test_pagination_with_after_and_first = make_test_after_first(
-        gmp_name, selene_name=selene_name, details=True
+        gmp_name, selene_name=selene_name, details=False
     )
     test_counts = make_test_counts(gmp_name, selene_name=selene_name)
     test_page_info = make_test_page_info(
         gmp_name, selene_name=selene_name, query=GetPortLists
     )
     test_pagination_with_before_and_last = make_test_before_last(
-        gmp_name, selene_name=selene_name, details=True
+        gmp_name, selene_name=selene_name, details=False
     )
     test_edges = make_test_edges(gmp_name, selene_name=selene_name)
     test_after_first_before_last = make_test_after_first_before_last(
-        gmp_name, selene_name=selene_name, details=True
+        gmp_name, selene_name=selene_name, details=False
     )
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import base64
+
+from selene.gmp import forget_supported_gmp
+from selene.tests import SeleneTestCase
+from selene.tests.benchmarks.fakegvmd import FakeGvmd
+
+REPORT_ID = 'f0fdf522-276d-4893-9274-fb8699dc2270'
+PDF_FORMAT_ID = 'c402cc3e-b531-11e1-9163-406186ea4fc5'
+XML_FORMAT_ID = 'a994b278-1f62-11e1-96ac-406186ea4fc5'
+
+
+def compose_report_response(content: str, **attributes) -> str:
+    attrs = ' '.join(f'{key}="{value}"' for key, value in attributes.items())
+    return (
+        '<get_reports_response status="200" status_text="OK">'
+        f'<report id="{REPORT_ID}" {attrs}>'
+        '<owner><name>admin</name></owner>'
+        f'<report_format id="{PDF_FORMAT_ID}"><name>PDF</name></report_format>'
+        f'{content}'
+        '</report>'
+        '<filters id=""><term>first=1 rows=-1</term></filters>'
+        '<report_count>1<filtered>1</filtered></report_count>'
+        '</get_reports_response>'
+    )
+
+
+class ReportDownloadTestCase(SeleneTestCase):
+    def setUp(self):
+        forget_supported_gmp()
+
+        self.gvmd = FakeGvmd()
+        self.gvmd.start()
+
+        self.settings_override = self.settings(
+            SELENE={'GMP_SOCKET_PATH': self.gvmd.path}
+        )
+        self.settings_override.enable()
+
+    def tearDown(self):
+        super().tearDown()
+
+        self.settings_override.disable()
+        self.gvmd.stop()
+
+        forget_supported_gmp()
+
+    def download(self, **params):
+        return self.client.get(
+            f'/reports/{REPORT_ID}/download/',
+            {'report_format_id': PDF_FORMAT_ID, **params},
+        )
+
+    def test_require_authentication(self):
+        response = self.download()
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(self.gvmd.connections, 0)
+
+    def test_require_report_format(self):
+        self.login('foo', 'bar')
+
+        response = self.client.get(f'/reports/{REPORT_ID}/download/')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.gvmd.connections, 0)
+
+    def test_download_base64_content(self):
+        content = bytes(range(256)) * 1000
+        encoded = base64.encodebytes(content).decode('ascii')
+
+        self.gvmd.set_response(
+            'get_reports',
+            compose_report_response(
+                encoded,
+                format_id=PDF_FORMAT_ID,
+                extension='pdf',
+                content_type='application/pdf',
+            ),
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.download(filter='severity>5')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+        self.assertEqual(
+            response['Content-Disposition'],
+            f'attachment; filename="report-{REPORT_ID}.pdf"',
+        )
+        self.assertEqual(b''.join(response.streaming_content), content)
+
+        self.assertEqual(self.gvmd.commands['authenticate'], 1)
+        self.assertEqual(self.gvmd.commands['get_reports'], 1)
+
+    def test_download_xml_content(self):
+        self.gvmd.set_response(
+            'get_reports',
+            compose_report_response(
+                f'<report id="{REPORT_ID}"><result id="1">'
+                '<name>a &amp; b</name></result></report>',
+                format_id=XML_FORMAT_ID,
+                extension='xml',
+                content_type='text/xml',
+            ),
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.download(report_format_id=XML_FORMAT_ID)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/xml')
+        self.assertEqual(
+            b''.join(response.streaming_content),
+            f'<report id="{REPORT_ID}"><result id="1">'
+            '<name>a &amp; b</name></result></report>'.encode('utf-8'),
+        )
+
+    def test_reuse_connection(self):
+        self.gvmd.set_response(
+            'get_reports',
+            compose_report_response(
+                base64.b64encode(b'foo').decode('ascii'),
+                content_type='text/plain',
+                extension='txt',
+            ),
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.download()
+        self.assertEqual(b''.join(response.streaming_content), b'foo')
+
+        self.gvmd.reset()
+
+        for _ in range(2):
+            response = self.download()
+            self.assertEqual(b''.join(response.streaming_content), b'foo')
+
+        self.assertEqual(self.gvmd.connections, 0)
+        self.assertEqual(self.gvmd.commands['authenticate'], 0)
+        self.assertEqual(self.gvmd.commands['get_reports'], 2)
+
+    def test_discard_partially_read_response(self):
+        self.gvmd.set_response(
+            'get_reports',
+            compose_report_response(
+                base64.encodebytes(b'x' * 1024 * 1024).decode('ascii'),
+                content_type='text/plain',
+                extension='txt',
+            ),
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.download()
+        next(iter(response.streaming_content))
+        response.close()
+
+        self.gvmd.reset()
+
+        response = self.download()
+
+        self.assertEqual(
+            b''.join(response.streaming_content), b'x' * 1024 * 1024
+        )
+        # the partially read connection must not be reused
+        self.assertEqual(self.gvmd.connections, 1)
+
+    def test_report_not_found(self):
+        self.gvmd.set_response(
+            'get_reports',
+            '<get_reports_response status="404" '
+            'status_text="Failed to find report"/>',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.download()
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_authentication_failed(self):
+        self.gvmd.set_response(
+            'authenticate',
+            '<authenticate_response status="400" '
+            'status_text="Authentication failed"/>',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.download()
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(self.gvmd.commands['get_reports'], 0)
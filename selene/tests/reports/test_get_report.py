@@ -20,6 +20,8 @@ from pathlib import Path
 
 from unittest.mock import patch
 
+import lxml.etree as ET
+
 from selene.tests import SeleneTestCase, GmpMockFactory
 
 CWD = Path(__file__).absolute().parent
@@ -71,7 +73,11 @@ class ReportTestCase(SeleneTestCase):
         )
 
         mock_gmp.gmp_protocol.get_report.assert_called_with(
-            self.id, report_format_id=None, delta_report_id=None, details=True
+            self.id,
+            filter='rows=1',
+            report_format_id=None,
+            delta_report_id=None,
+            details=True,
         )
 
         json = response.json()
@@ -84,6 +90,91 @@ class ReportTestCase(SeleneTestCase):
         self.assertEqual(report['id'], self.id)
         self.assertIsNone(report['owner'])
 
+    def test_keep_default_results_filter(self, mock_gmp: GmpMockFactory):
+        filter_id = 'f8a7a6f0-3cb2-4a55-8d94-7ac2f1cd6f6d'
+        mock_gmp.mock_response(
+            'get_settings',
+            f'''
+            <get_settings_response status="200" status_text="OK">
+                <setting id="739ab810-163d-11e3-9af6-406186ea4fc5">
+                    <name>Results Filter</name>
+                    <value>{filter_id}</value>
+                </setting>
+            </get_settings_response>
+            ''',
+        )
+        mock_gmp.mock_response(
+            'get_filter',
+            f'''
+            <get_filters_response status="200" status_text="OK">
+                <filter id="{filter_id}">
+                    <term>apply_overrides=1 min_qod=70 first=1 rows=100</term>
+                </filter>
+            </get_filters_response>
+            ''',
+        )
+
+        def get_report(_report_id, *, filter=None, **_kwargs):
+            # pylint: disable=redefined-builtin
+            # like gvmd the counts depend on the filter
+            if filter is None or 'min_qod=70' in filter:
+                filtered, severity = 2, 5.0
+            else:
+                filtered, severity = 3, 7.5
+
+            return ET.fromstring(
+                f'''
+                <get_report_response>
+                    <report id="{self.id}">
+                        <report id="{self.id}">
+                            <result_count>
+                                <full>3</full>
+                                <filtered>{filtered}</filtered>
+                            </result_count>
+                            <severity>
+                                <full>7.5</full>
+                                <filtered>{severity}</filtered>
+                            </severity>
+                        </report>
+                    </report>
+                </get_report_response>
+                '''
+            )
+
+        mock_gmp.gmp_protocol.get_report.side_effect = get_report
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                report(id: "{self.id}") {{
+                    resultsCount {{
+                        filtered
+                    }}
+                    severity {{
+                        filtered
+                    }}
+                }}
+            }}
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        # the counts are the same as without a filter
+        report = response.json()['data']['report']
+        self.assertEqual(report['resultsCount']['filtered'], 2)
+        self.assertEqual(report['severity']['filtered'], 5.0)
+
+        mock_gmp.gmp_protocol.get_report.assert_called_with(
+            self.id,
+            filter='apply_overrides=1 min_qod=70 rows=1',
+            report_format_id=None,
+            delta_report_id=None,
+            details=True,
+        )
+
     def test_get_report_none_fields(self, mock_gmp: GmpMockFactory):
         mock_gmp.mock_response(
             'get_report',
@@ -150,7 +241,7 @@ class ReportTestCase(SeleneTestCase):
                 }
                 tlsCertificates {
                     counts {
-                        current
+                        total
                     }
                 }
                 task {
@@ -163,13 +254,17 @@ class ReportTestCase(SeleneTestCase):
                     current
                 }
                 ports {
-                    port
+                    nodes {
+                        port
+                    }
                 }
                 resultsCount {
                     current
                 }
                 results {
-                    name
+                    nodes {
+                        name
+                    }
                 }
                 severity {
                     total
@@ -177,8 +272,10 @@ class ReportTestCase(SeleneTestCase):
                 hostsCount {
                     current
                 }
-                hosts{
-                    ip
+                hosts {
+                    nodes {
+                        ip
+                    }
                 }
                 scanStart
                 scanEnd
@@ -186,8 +283,10 @@ class ReportTestCase(SeleneTestCase):
                     current
                 }
                 errors {
-                    host {
-                        name
+                    nodes {
+                        host {
+                            name
+                        }
                     }
                 }
             }
@@ -207,10 +306,9 @@ class ReportTestCase(SeleneTestCase):
         self.assertIsNone(nvt['scanRunStatus'])
         self.assertIsNone(nvt['closedCves'])
         self.assertIsNone(nvt['vulnerabilities'])
-        self.assertIsNone(nvt['tlsCertificates'])
+        self.assertEqual(nvt['tlsCertificates']['counts']['total'], 0)
         self.assertIsNone(nvt['operatingSystems'])
         self.assertIsNone(nvt['applications'])
-        self.assertIsNone(nvt['tlsCertificates'])
         self.assertIsNone(nvt['deltaReport'])
         self.assertIsNone(nvt['task'])
         self.assertIsNone(nvt['timestamp'])
@@ -223,7 +321,7 @@ class ReportTestCase(SeleneTestCase):
         self.assertIsNone(nvt['results'])
         self.assertIsNone(nvt['severity'])
         self.assertIsNone(nvt['hostsCount'])
-        self.assertIsNone(nvt['hosts'])
+        self.assertEqual(nvt['hosts']['nodes'], [])
         self.assertIsNone(nvt['scanStart'])
         self.assertIsNone(nvt['scanEnd'])
         self.assertIsNone(nvt['errors'])
@@ -286,7 +384,7 @@ class ReportTestCase(SeleneTestCase):
                 }
                 tlsCertificates {
                     counts {
-                        current
+                        total
                     }
                 }
                 task {
@@ -305,8 +403,10 @@ class ReportTestCase(SeleneTestCase):
                     current
                 }
                 ports {
-                    port
-                    host
+                    nodes {
+                        port
+                        host
+                    }
                 }
                 resultsCount {
                     current
@@ -314,18 +414,20 @@ class ReportTestCase(SeleneTestCase):
                     total
                 }
                 results {
-                    name
-                    creationTime
-                    host {
-                        ip
-                        id
-                        hostname
-                    }
-                    location
-                    severity
-                    qod {
-                        value
-                        type
+                    nodes {
+                        name
+                        creationTime
+                        host {
+                            ip
+                            id
+                            hostname
+                        }
+                        location
+                        severity
+                        qod {
+                            value
+                            type
+                        }
                     }
                 }
                 severity {
@@ -336,24 +438,26 @@ class ReportTestCase(SeleneTestCase):
                     current
                 }
                 hosts {
-                    ip
-                    id
-                    start
-                    end
-                    ports {
-                        counts {
-                            current
+                    nodes {
+                        ip
+                        id
+                        start
+                        end
+                        ports {
+                            counts {
+                                current
+                            }
                         }
-                    }
-                    details {
-                        name
-                        value
-                        source {
-                            type
+                        details {
                             name
-                            description
+                            value
+                            source {
+                                type
+                                name
+                                description
+                            }
+                            extra
                         }
-                        extra
                     }
                 }
                 scanStart
@@ -362,8 +466,10 @@ class ReportTestCase(SeleneTestCase):
                     current
                 }
                 errors {
-                    host {
-                        name
+                    nodes {
+                        host {
+                            name
+                        }
                     }
                 }
             }
@@ -371,8 +477,9 @@ class ReportTestCase(SeleneTestCase):
             '''
         )
 
-        mock_gmp.gmp_protocol.get_report.assert_called_with(
+        mock_gmp.gmp_protocol.get_report.assert_any_call(
             '52704aa8-0576-4a5c-993c-c4d25ca130f5',
+            filter=None,
             report_format_id='5057e5cc-b825-11e4-9d0e-28d24461215b',
             delta_report_id=None,
             details=True,
@@ -396,7 +503,8 @@ class ReportTestCase(SeleneTestCase):
         self.assertIsNotNone(report['reportFormat'])
 
         self.assertEqual(
-            report["reportFormat"]['id'], 'a994b278-1f62-11e1-96ac-406186ea4fc5'
+            report["reportFormat"]['id'],
+            'a994b278-1f62-11e1-96ac-406186ea4fc5',
         )
 
         self.assertIsNotNone(report['userTags'])
@@ -426,7 +534,7 @@ class ReportTestCase(SeleneTestCase):
         self.assertIsNotNone(report['resultsCount'])
         self.assertIsNotNone(report['results'])
 
-        results = report['results']
+        results = report['results']['nodes']
 
         self.assertIsNotNone(results)
 
@@ -436,152 +544,7 @@ class ReportTestCase(SeleneTestCase):
         self.assertEqual(report['severity']['filtered'], 5.0)
 
         self.assertEqual(report['errorCount']['current'], 0)
-        self.assertIsNone(report['errors'])
-
-    def test_error_report(self, mock_gmp: GmpMockFactory):
-        report_xml_path = CWD / 'example-error-report.xml'
-        report_xml_str = report_xml_path.read_text()
-
-        mock_gmp.mock_response('get_report', report_xml_str)
-
-        self.login('foo', 'bar')
-
-        response = self.query(
-            '''
-        query {
-            report(
-                id: "ab814d38-e135-4c24-8bd2-339554ff9696"
-            ) {
-                id
-                name
-                owner
-                comment
-                creationTime
-                modificationTime
-                inUse
-                writable
-                results {
-                    name
-                    creationTime
-                    host {
-                        ip
-                        id
-                        hostname
-                    }
-                    location
-                    severity
-                    qod {
-                        value
-                        type
-                    }
-                }
-                severity {
-                    total
-                    filtered
-                }
-                hostsCount {
-                    current
-                }
-                hosts {
-                    ip
-                    id
-                    start
-                    end
-                    ports {
-                        counts {
-                            current
-                        }
-                    }
-                    details {
-                        name
-                        value
-                        source {
-                            type
-                            name
-                            description
-                        }
-                        extra
-                    }
-                }
-                scanStart
-                scanEnd
-                scanRunStatus
-                timestamp
-                timezone
-                timezoneAbbreviation
-                errorCount {
-                    current
-                }
-                errors {
-                    host {
-                        name
-                        id
-                    }
-                    port
-                    description
-                    nvt {
-                        id
-                        name
-                        cvssBase
-                        score
-                    }
-                    scanNvtVersion
-                    severity
-                }
-            }
-        }
-            '''
-        )
-
-        json = response.json()
-        self.assertResponseNoErrors(response)
-
-        mock_gmp.gmp_protocol.get_report.assert_called_with(
-            'ab814d38-e135-4c24-8bd2-339554ff9696',
-            report_format_id=None,
-            delta_report_id=None,
-            details=True,
-        )
-
-        report = json['data']['report']
-
-        self.assertEqual(report['name'], 'foo')
-        self.assertEqual(report['id'], 'ab814d38-e135-4c24-8bd2-339554ff9696')
-        self.assertEqual(report['owner'], 'admin')
-        self.assertIsNone(report['comment'])
-        self.assertEqual(report['creationTime'], '2021-03-09T13:21:35+00:00')
-        self.assertEqual(
-            report['modificationTime'], '2021-03-09T13:21:55+00:00'
-        )
-        self.assertFalse(report['inUse'])
-        self.assertFalse(report['writable'])
-        self.assertIsNone(report['results'])
-
-        self.assertEqual(report['timestamp'], '2021-03-09T13:21:27+00:00')
-        self.assertEqual(report['timezone'], 'Coordinated Universal Time')
-        self.assertEqual(report['timezoneAbbreviation'], 'UTC')
-
-        self.assertEqual(report['scanStart'], '2021-03-09T13:21:35+00:00')
-        self.assertEqual(report['scanEnd'], '2021-03-09T13:21:55+00:00')
-        self.assertEqual(report['scanRunStatus'], "Interrupted")
-
-        self.assertEqual(report['errorCount']['current'], 3)
-        self.assertIsNotNone(report['errors'])
-
-        errors = report['errors']
-        self.assertEqual(
-            errors[0]['host']['id'], '1f6c301a-76e3-4f15-a7e1-3489876e399f'
-        )
-        self.assertEqual(errors[0]['host']['name'], '127.0.0.1')
-        self.assertEqual(errors[0]['description'], 'Scan process Failure')
-        self.assertEqual(errors[0]['nvt']['id'], '12345')
-        self.assertEqual(errors[0]['nvt']['name'], 'foo')
-        self.assertEqual(errors[0]['nvt']['cvssBase'], 2.0)
-        self.assertIsNone(errors[0]['nvt']['score'])
-        self.assertEqual(errors[0]['severity'], -3.0)
-        self.assertEqual(
-            errors[0]['scanNvtVersion'], '2021-03-09T13:21:55+00:00'
-        )
+        self.assertEqual(report['errors']['nodes'], [])
 
     def test_report_sub_objects(self, mock_gmp: GmpMockFactory):
         report_xml_path = CWD / 'example-report-2.xml'
@@ -630,7 +593,7 @@ class ReportTestCase(SeleneTestCase):
                 }
                 tlsCertificates {
                     counts {
-                        current
+                        total
                     }
                 }
                 task {
@@ -650,8 +613,10 @@ class ReportTestCase(SeleneTestCase):
                     current
                 }
                 ports {
-                    port
-                    host
+                    nodes {
+                        port
+                        host
+                    }
                 }
                 resultsCount {
                     current
@@ -659,64 +624,66 @@ class ReportTestCase(SeleneTestCase):
                     total
                 }
                 results {
-                    name
-                    originalSeverity
-                    creationTime
-                    host {
-                        ip
-                        id
-                        hostname
-                    }
-                    location
-                    information {
-                        __typename
-                        ... on ResultNVT{
-                        id
+                    nodes {
                         name
-                        family
-                        cvssBase
-                        referenceWarning
-                        certReferences{
-                            id
-                            type
-                        }
-                        cveReferences{
-                            id
-                            type
-                        }
-                        bidReferences{
+                        originalSeverity
+                        creationTime
+                        host {
+                            ip
                             id
-                            type
+                            hostname
                         }
-                        otherReferences{
+                        location
+                        information {
+                            __typename
+                            ... on ResultNVT{
                             id
-                            type
-                        }
-                        tags {
-                            cvssBaseVector
-                            summary
-                            insight
-                            impact
-                            affected
-                            detectionMethod
-                        }
-                        score
-                        severities {
-                            type
+                            name
+                            family
+                            cvssBase
+                            referenceWarning
+                            certReferences{
+                                id
+                                type
+                            }
+                            cveReferences{
+                                id
+                                type
+                            }
+                            bidReferences{
+                                id
+                                type
+                            }
+                            otherReferences{
+                                id
+                                type
+                            }
+                            tags {
+                                cvssBaseVector
+                                summary
+                                insight
+                                impact
+                                affected
+                                detectionMethod
+                            }
                             score
-                            vector
+                            severities {
+                                type
+                                score
+                                vector
+                            }
+                            }
+                            ... on ResultCVE{
+                                id
+                                severity
+                            }
                         }
-                        }
-                        ... on ResultCVE{
-                            id
-                            severity
+                        severity
+                        qod {
+                            value
+                            type
                         }
                     }
-                    severity
-                    qod {
-                        value
-                        type
-                    }
                 }
                 severity {
                     total
@@ -725,35 +692,37 @@ class ReportTestCase(SeleneTestCase):
                 hostsCount {
                     current
                 }
-                hosts{
-                    ip
-                    id
-                    start
-                    end
-                    ports {
-                        counts {
-                            current
+                hosts {
+                    nodes {
+                        ip
+                        id
+                        start
+                        end
+                        ports {
+                            counts {
+                                current
+                            }
                         }
-                    }
-                    results {
-                        counts {
-                            current
-                            high
-                            medium
-                            low
-                            log
-                            falsePositive
+                        results {
+                            counts {
+                                current
+                                high
+                                medium
+                                low
+                                log
+                                falsePositive
+                            }
                         }
-                    }
-                    details {
-                        name
-                        value
-                        source {
-                            type
+                        details {
                             name
-                            description
+                            value
+                            source {
+                                type
+                                name
+                                description
+                            }
+                            extra
                         }
-                        extra
                     }
                 }
                 scanStart
@@ -762,8 +731,10 @@ class ReportTestCase(SeleneTestCase):
                     current
                 }
                 errors {
-                    host {
-                        name
+                    nodes {
+                        host {
+                            name
+                        }
                     }
                 }
             }
@@ -775,8 +746,9 @@ class ReportTestCase(SeleneTestCase):
 
         self.assertResponseNoErrors(response)
 
-        mock_gmp.gmp_protocol.get_report.assert_called_with(
+        mock_gmp.gmp_protocol.get_report.assert_any_call(
             '52704aa8-0576-4a5c-993c-c4d25ca130f5',
+            filter=None,
             report_format_id=None,
             delta_report_id=None,
             details=True,
@@ -810,7 +782,7 @@ class ReportTestCase(SeleneTestCase):
 
         self.assertEqual(report['hostsCount']['current'], 2)
 
-        hosts = report['hosts']
+        hosts = report['hosts']['nodes']
         self.assertIsNotNone(hosts)
         self.assertEqual(len(hosts), 1)
 
@@ -837,7 +809,7 @@ class ReportTestCase(SeleneTestCase):
         self.assertIsNotNone(report['ports'])
 
         port_counts = report['portsCount']
-        ports = report['ports']
+        ports = report['ports']['nodes']
 
         self.assertEqual(port_counts['current'], 3)
 
@@ -850,7 +822,7 @@ class ReportTestCase(SeleneTestCase):
         self.assertIsNotNone(report['results'])
 
         result_counts = report['resultsCount']
-        results = report['results']
+        results = report['results']['nodes']
 
         self.assertEqual(result_counts['current'], 5)
         self.assertEqual(result_counts['total'], 5)
@@ -921,19 +893,23 @@ class ReportTestCase(SeleneTestCase):
                         scanEnd
                     }
                     hosts {
-                        ip
-                        details {
-                            name
+                        nodes {
+                            ip
+                            details {
+                                name
+                            }
                         }
                     }
                     results {
-                        id
-                        host {
-                            ip
+                        nodes {
                             id
-                            hostname
+                            host {
+                                ip
+                                id
+                                hostname
+                            }
+                            severity
                         }
-                        severity
                     }
                 }
             }
@@ -946,6 +922,7 @@ class ReportTestCase(SeleneTestCase):
 
         mock_gmp.gmp_protocol.get_report.assert_called_with(
             'e501545c-0c4d-47d9-a9f8-28da34c6b958',
+            filter=None,
             report_format_id=None,
             delta_report_id='88f353d3-4535-49a3-a4f7-fdc427af29cb',
             details=True,
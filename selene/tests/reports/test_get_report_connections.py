@@ -0,0 +1,725 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from pathlib import Path
+
+from unittest.mock import call, patch
+
+import lxml.etree as ET
+
+from selene.connections import get_pruned_paths
+from selene.tests import SeleneTestCase, GmpMockFactory
+
+CWD = Path(__file__).absolute().parent
+
+REPORT_ID = '52704aa8-0576-4a5c-993c-c4d25ca130f5'
+
+SSL_DETAILS = (
+    'issuer:CN=Bar|serial:0123|subject:CN=Foo|'
+    'notBefore:20200101T000000|notAfter:20300101T000000'
+)
+
+
+def create_report_response(content: str) -> str:
+    return f'''
+        <get_report_response>
+            <report id="{REPORT_ID}">
+                <name>a</name>
+                <report id="{REPORT_ID}">
+                    {content}
+                </report>
+            </report>
+        </get_report_response>
+        '''
+
+
+def create_host(ip: str, fingerprint: str) -> str:
+    return f'''
+        <host>
+            <ip>{ip}</ip>
+            <detail>
+                <name>SSLInfo</name>
+                <value>443::{fingerprint}</value>
+            </detail>
+        </host>
+        '''
+
+
+def create_error(ip: str) -> str:
+    return f'''
+        <error>
+            <host>{ip}<asset asset_id=""/></host>
+            <description>failed</description>
+        </error>
+        '''
+
+
+@patch('selene.views.Gmp', new_callable=GmpMockFactory)
+class ReportConnectionsTestCase(SeleneTestCase):
+    def test_get_report_results_page(self, mock_gmp: GmpMockFactory):
+        report_xml_path = CWD / 'example-report-2.xml'
+        report_xml_str = report_xml_path.read_text()
+
+        mock_gmp.mock_response('get_report', report_xml_str)
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                report(id: "{REPORT_ID}") {{
+                    name
+                    results (filterString: "severity>5", first: 10) {{
+                        nodes {{
+                            id
+                        }}
+                        counts {{
+                            filtered
+                            total
+                            offset
+                            limit
+                        }}
+                    }}
+                }}
+            }}
+            '''
+        )
+
+        json = response.json()
+
+        self.assertResponseNoErrors(response)
+
+        results = json['data']['report']['results']
+
+        self.assertEqual(
+            results['nodes'][0]['id'], 'bfb3a5bb-c321-4c22-a10f-1665eaf806fc'
+        )
+        self.assertEqual(results['counts']['filtered'], 1)
+        self.assertEqual(results['counts']['total'], 5)
+        self.assertEqual(results['counts']['offset'], 0)
+        self.assertEqual(results['counts']['limit'], -1)
+
+        get_report = mock_gmp.gmp_protocol.get_report
+
+        self.assertEqual(get_report.call_count, 2)
+
+        # the report itself is loaded with a single result
+        get_report.assert_any_call(
+            REPORT_ID,
+            filter='rows=1',
+            report_format_id=None,
+            delta_report_id=None,
+            details=True,
+        )
+        get_report.assert_any_call(
+            REPORT_ID,
+            filter='severity>5 rows=10',
+            report_format_id=None,
+            delta_report_id=None,
+            details=True,
+        )
+
+    def test_counts_only_keep_default_results_filter(
+        self, mock_gmp: GmpMockFactory
+    ):
+        filter_id = 'f8a7a6f0-3cb2-4a55-8d94-7ac2f1cd6f6d'
+        mock_gmp.mock_response(
+            'get_settings',
+            f'''
+            <get_settings_response status="200" status_text="OK">
+                <setting id="739ab810-163d-11e3-9af6-406186ea4fc5">
+                    <value>{filter_id}</value>
+                </setting>
+            </get_settings_response>
+            ''',
+        )
+        mock_gmp.mock_response(
+            'get_filter',
+            f'''
+            <get_filters_response status="200" status_text="OK">
+                <filter id="{filter_id}">
+                    <term>apply_overrides=1 min_qod=70 first=1 rows=100</term>
+                </filter>
+            </get_filters_response>
+            ''',
+        )
+
+        def get_report(_report_id, *, filter=None, **_kwargs):
+            # pylint: disable=redefined-builtin
+            # like gvmd the counts depend on the filter
+            filtered = 2 if filter is None or 'min_qod=70' in filter else 3
+            return ET.fromstring(
+                create_report_response(
+                    f'''
+                    <results start="1" max="1"/>
+                    <result_count>
+                        3<filtered>{filtered}</filtered>
+                    </result_count>
+                    '''
+                )
+            )
+
+        mock_gmp.gmp_protocol.get_report.side_effect = get_report
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                report(id: "{REPORT_ID}") {{
+                    results {{
+                        counts {{
+                            filtered
+                        }}
+                    }}
+                }}
+            }}
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        results = response.json()['data']['report']['results']
+        self.assertEqual(results['counts']['filtered'], 2)
+
+        mock_gmp.gmp_protocol.get_report.assert_any_call(
+            REPORT_ID,
+            filter='apply_overrides=1 min_qod=70 first=1 rows=1',
+            report_format_id=None,
+            delta_report_id=None,
+            details=True,
+        )
+
+    def test_get_report_hosts_page(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_report',
+            create_report_response(
+                '''
+                <host><ip>10.0.0.1</ip></host>
+                <host><ip>10.0.0.2</ip></host>
+                <host><ip>10.0.0.3</ip></host>
+                '''
+            ),
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                report(id: "{REPORT_ID}") {{
+                    hosts (filterString: "first=2 rows=1") {{
+                        nodes {{
+                            ip
+                        }}
+                        counts {{
+                            filtered
+                            total
+                            offset
+                            limit
+                            length
+                        }}
+                    }}
+                }}
+            }}
+            '''
+        )
+
+        json = response.json()
+
+        self.assertResponseNoErrors(response)
+
+        hosts = json['data']['report']['hosts']
+
+        self.assertEqual(len(hosts['nodes']), 1)
+        self.assertEqual(hosts['nodes'][0]['ip'], '10.0.0.2')
+        self.assertEqual(hosts['counts']['filtered'], 3)
+        self.assertEqual(hosts['counts']['total'], 3)
+        self.assertEqual(hosts['counts']['offset'], 1)
+        self.assertEqual(hosts['counts']['limit'], 1)
+        self.assertEqual(hosts['counts']['length'], 1)
+
+        # the hosts are sliced from a report listing all hosts
+        mock_gmp.gmp_protocol.get_report.assert_called_with(
+            REPORT_ID,
+            filter='result_hosts_only=0 rows=1',
+            report_format_id=None,
+            delta_report_id=None,
+            details=True,
+        )
+
+    def test_get_report_lists_of_all_hosts(self, mock_gmp: GmpMockFactory):
+        # gvmd only lists the hosts of the requested results by default
+        result_hosts_response = ET.fromstring(
+            create_report_response(
+                create_host('10.0.0.1', 'AAAA')
+                + '<errors>'
+                + create_error('10.0.0.1')
+                + '</errors>'
+            )
+        )
+        all_hosts_response = ET.fromstring(
+            create_report_response(
+                create_host('10.0.0.1', 'AAAA')
+                + create_host('10.0.0.2', 'BBBB')
+                + create_host('10.0.0.3', 'CCCC')
+                + '<errors>'
+                + create_error('10.0.0.1')
+                + create_error('10.0.0.2')
+                + '</errors>'
+            )
+        )
+
+        def get_report(_report_id, *, filter=None, **_kwargs):
+            # pylint: disable=redefined-builtin
+            if 'result_hosts_only=0' in filter:
+                return all_hosts_response
+            return result_hosts_response
+
+        mock_gmp.gmp_protocol.get_report.side_effect = get_report
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                report(id: "{REPORT_ID}") {{
+                    hosts {{
+                        nodes {{
+                            ip
+                        }}
+                        counts {{
+                            total
+                        }}
+                    }}
+                    errors {{
+                        nodes {{
+                            host {{
+                                name
+                            }}
+                        }}
+                        counts {{
+                            total
+                        }}
+                    }}
+                    tlsCertificates {{
+                        nodes {{
+                            ip
+                            fingerprint
+                        }}
+                        counts {{
+                            total
+                        }}
+                    }}
+                }}
+            }}
+            '''
+        )
+
+        json = response.json()
+
+        self.assertResponseNoErrors(response)
+
+        report = json['data']['report']
+
+        self.assertEqual(report['hosts']['counts']['total'], 3)
+        self.assertEqual(
+            [host['ip'] for host in report['hosts']['nodes']],
+            ['10.0.0.1', '10.0.0.2', '10.0.0.3'],
+        )
+
+        self.assertEqual(report['errors']['counts']['total'], 2)
+        self.assertEqual(
+            [error['host']['name'] for error in report['errors']['nodes']],
+            ['10.0.0.1', '10.0.0.2'],
+        )
+
+        certificates = report['tlsCertificates']
+        self.assertEqual(certificates['counts']['total'], 3)
+        self.assertEqual(
+            certificates['nodes'],
+            [
+                {'ip': '10.0.0.1', 'fingerprint': 'AAAA'},
+                {'ip': '10.0.0.2', 'fingerprint': 'BBBB'},
+                {'ip': '10.0.0.3', 'fingerprint': 'CCCC'},
+            ],
+        )
+
+    def test_prune_unused_report_elements(self, mock_gmp: GmpMockFactory):
+        pruned_paths = []
+
+        def get_report(_report_id, **_kwargs):
+            pruned_paths.append(get_pruned_paths())
+            return ET.fromstring(
+                create_report_response(
+                    create_host('10.0.0.1', 'AAAA')
+                    + '<errors>'
+                    + create_error('10.0.0.1')
+                    + '</errors>'
+                )
+            )
+
+        mock_gmp.gmp_protocol.get_report.side_effect = get_report
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                report(id: "{REPORT_ID}") {{
+                    hosts {{
+                        nodes {{
+                            ip
+                        }}
+                    }}
+                    errors {{
+                        nodes {{
+                            description
+                        }}
+                    }}
+                    tlsCertificates {{
+                        nodes {{
+                            fingerprint
+                        }}
+                    }}
+                }}
+            }}
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        # the hosts and the TLS certificates share the same response
+        self.assertEqual(
+            pruned_paths[1:],
+            [
+                frozenset(
+                    [
+                        'report/report/results',
+                        'report/report/ports',
+                        'report/report/errors',
+                    ]
+                ),
+                frozenset(
+                    [
+                        'report/report/results',
+                        'report/report/ports',
+                        'report/report/host',
+                    ]
+                ),
+            ],
+        )
+
+    def test_get_report_hosts_of_results(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_report',
+            create_report_response('<host><ip>10.0.0.1</ip></host>'),
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                report(id: "{REPORT_ID}") {{
+                    hosts (filterString: "result_hosts_only=1 rows=10") {{
+                        nodes {{
+                            ip
+                        }}
+                    }}
+                }}
+            }}
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        # an explicit result_hosts_only term of the filter is kept
+        mock_gmp.gmp_protocol.get_report.assert_has_calls(
+            [
+                call(
+                    REPORT_ID,
+                    filter='result_hosts_only=1 rows=1',
+                    report_format_id=None,
+                    delta_report_id=None,
+                    details=True,
+                )
+            ]
+        )
+
+    def test_error_report(self, mock_gmp: GmpMockFactory):
+        report_xml_path = CWD / 'example-error-report.xml'
+        report_xml_str = report_xml_path.read_text()
+
+        mock_gmp.mock_response('get_report', report_xml_str)
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            '''
+        query {
+            report(
+                id: "ab814d38-e135-4c24-8bd2-339554ff9696"
+            ) {
+                id
+                name
+                owner
+                comment
+                creationTime
+                modificationTime
+                inUse
+                writable
+                results {
+                    nodes {
+                        name
+                        creationTime
+                        host {
+                            ip
+                            id
+                            hostname
+                        }
+                        location
+                        severity
+                        qod {
+                            value
+                            type
+                        }
+                    }
+                }
+                severity {
+                    total
+                    filtered
+                }
+                hostsCount {
+                    current
+                }
+                hosts {
+                    nodes {
+                        ip
+                        id
+                        start
+                        end
+                        ports {
+                            counts {
+                                current
+                            }
+                        }
+                        details {
+                            name
+                            value
+                            source {
+                                type
+                                name
+                                description
+                            }
+                            extra
+                        }
+                    }
+                }
+                scanStart
+                scanEnd
+                scanRunStatus
+                timestamp
+                timezone
+                timezoneAbbreviation
+                errorCount {
+                    current
+                }
+                errors {
+                    nodes {
+                        host {
+                            name
+                            id
+                        }
+                        port
+                        description
+                        nvt {
+                            id
+                            name
+                            cvssBase
+                            score
+                        }
+                        scanNvtVersion
+                        severity
+                    }
+                }
+            }
+        }
+            '''
+        )
+
+        json = response.json()
+        self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp_protocol.get_report.assert_any_call(
+            'ab814d38-e135-4c24-8bd2-339554ff9696',
+            filter=None,
+            report_format_id=None,
+            delta_report_id=None,
+            details=True,
+        )
+
+        report = json['data']['report']
+
+        self.assertEqual(report['name'], 'foo')
+        self.assertEqual(report['id'], 'ab814d38-e135-4c24-8bd2-339554ff9696')
+        self.assertEqual(report['owner'], 'admin')
+        self.assertIsNone(report['comment'])
+        self.assertEqual(report['creationTime'], '2021-03-09T13:21:35+00:00')
+        self.assertEqual(
+            report['modificationTime'], '2021-03-09T13:21:55+00:00'
+        )
+        self.assertFalse(report['inUse'])
+        self.assertFalse(report['writable'])
+        self.assertEqual(report['results']['nodes'], [])
+
+        self.assertEqual(report['timestamp'], '2021-03-09T13:21:27+00:00')
+        self.assertEqual(report['timezone'], 'Coordinated Universal Time')
+        self.assertEqual(report['timezoneAbbreviation'], 'UTC')
+
+        self.assertEqual(report['scanStart'], '2021-03-09T13:21:35+00:00')
+        self.assertEqual(report['scanEnd'], '2021-03-09T13:21:55+00:00')
+        self.assertEqual(report['scanRunStatus'], "Interrupted")
+
+        self.assertEqual(report['errorCount']['current'], 3)
+        self.assertIsNotNone(report['errors'])
+
+        errors = report['errors']['nodes']
+        self.assertEqual(
+            errors[0]['host']['id'], '1f6c301a-76e3-4f15-a7e1-3489876e399f'
+        )
+        self.assertEqual(errors[0]['host']['name'], '127.0.0.1')
+        self.assertEqual(errors[0]['description'], 'Scan process Failure')
+        self.assertEqual(errors[0]['nvt']['id'], '12345')
+        self.assertEqual(errors[0]['nvt']['name'], 'foo')
+        self.assertEqual(errors[0]['nvt']['cvssBase'], 2.0)
+        self.assertIsNone(errors[0]['nvt']['score'])
+        self.assertEqual(errors[0]['severity'], -3.0)
+        self.assertEqual(
+            errors[0]['scanNvtVersion'], '2021-03-09T13:21:55+00:00'
+        )
+
+    def test_get_report_missing_errors_counts(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response('get_report', create_report_response(''))
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                report(id: "{REPORT_ID}") {{
+                    errors {{
+                        counts {{
+                            total
+                        }}
+                    }}
+                }}
+            }}
+            '''
+        )
+
+        json = response.json()
+
+        self.assertResponseNoErrors(response)
+
+        self.assertIsNone(json['data']['report']['errors'])
+
+    def test_get_report_tls_certificates(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_report',
+            create_report_response(
+                f'''
+                <host>
+                    <ip>10.0.0.1</ip>
+                    <detail>
+                        <name>hostname</name>
+                        <value>foo.example.com</value>
+                    </detail>
+                    <detail>
+                        <name>SSLInfo</name>
+                        <value>443::ABCD</value>
+                    </detail>
+                    <detail>
+                        <name>SSLInfo</name>
+                        <value>8443::ABCD</value>
+                    </detail>
+                    <detail>
+                        <name>Cert:ABCD</name>
+                        <value>x509:MIIFoo</value>
+                    </detail>
+                    <detail>
+                        <name>SSLDetails:ABCD</name>
+                        <value>{SSL_DETAILS}</value>
+                    </detail>
+                </host>
+                '''
+            ),
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                report(id: "{REPORT_ID}") {{
+                    tlsCertificates {{
+                        nodes {{
+                            ip
+                            hostname
+                            ports
+                            fingerprint
+                            certificate
+                            subjectDn
+                            issuerDn
+                            serial
+                            activationTime
+                            expirationTime
+                        }}
+                        counts {{
+                            total
+                        }}
+                    }}
+                }}
+            }}
+            '''
+        )
+
+        json = response.json()
+
+        self.assertResponseNoErrors(response)
+
+        certificates = json['data']['report']['tlsCertificates']
+
+        self.assertEqual(certificates['counts']['total'], 1)
+        self.assertEqual(
+            certificates['nodes'],
+            [
+                {
+                    'ip': '10.0.0.1',
+                    'hostname': 'foo.example.com',
+                    'ports': [443, 8443],
+                    'fingerprint': 'ABCD',
+                    'certificate': 'MIIFoo',
+                    'subjectDn': 'CN=Foo',
+                    'issuerDn': 'CN=Bar',
+                    'serial': '0123',
+                    'activationTime': '20200101T000000',
+                    'expirationTime': '20300101T000000',
+                }
+            ],
+        )
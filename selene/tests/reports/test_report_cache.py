@@ -0,0 +1,449 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import stat
+import tempfile
+
+from unittest.mock import patch
+
+import lxml.etree as ET
+
+from django.test import SimpleTestCase
+
+from selene.schema.reports.cache import ReportCache
+from selene.tests import SeleneTestCase, GmpMockFactory
+
+REPORT_ID = 'f0fdf522-276d-4893-9274-fb8699dc2270'
+OTHER_REPORT_ID = '52704aa8-0576-4a5c-993c-c4d25ca130f5'
+
+
+def create_report_response(
+    scan_run_status: str = 'Done',
+    timezone: str = 'UTC',
+    result_count: int = 1000,
+) -> str:
+    return f'''
+        <get_reports_response status="200" status_text="OK">
+            <report id="{REPORT_ID}">
+                <name>2021-01-01T12:00:00Z</name>
+                <report id="{REPORT_ID}">
+                    <scan_run_status>{scan_run_status}</scan_run_status>
+                    <timezone>{timezone}</timezone>
+                    <result_count>
+                        {result_count}<full>{result_count}</full>
+                    </result_count>
+                </report>
+            </report>
+        </get_reports_response>
+        '''
+
+
+def create_notes_response(modification_time: str) -> str:
+    return f'''
+        <get_notes_response status="200" status_text="OK">
+            <note id="6b4b1a1e-bd8d-4b41-a6a8-4b4e0b6b4e7d">
+                <modification_time>{modification_time}</modification_time>
+            </note>
+            <note_count>3<filtered>1</filtered></note_count>
+        </get_notes_response>
+        '''
+
+
+def create_settings_response(severity_class: str) -> str:
+    return f'''
+        <get_settings_response status="200" status_text="OK">
+            <setting id="f16bb236-a32d-4cd5-a880-e0fcf2599f59">
+                <name>Severity Class</name>
+                <value>{severity_class}</value>
+            </setting>
+        </get_settings_response>
+        '''
+
+
+OVERRIDES_RESPONSE = '''
+    <get_overrides_response status="200" status_text="OK">
+        <override_count>0<filtered>0</filtered></override_count>
+    </get_overrides_response>
+    '''
+
+
+class ReportCacheTestCase(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ReportCache(self.directory.name, max_size=1024)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def create_response(self, size: int = 0) -> ET.Element:
+        response = ET.Element('get_reports_response', status='200')
+        response.text = 'x' * size
+        return response
+
+    def test_get_missing(self):
+        self.assertIsNone(self.cache.get(REPORT_ID, 'foo'))
+
+    def test_put_and_get(self):
+        self.cache.put(REPORT_ID, 'foo', self.create_response(10))
+
+        response = self.cache.get(REPORT_ID, 'foo')
+
+        self.assertEqual(response.tag, 'get_reports_response')
+        self.assertEqual(response.text, 'x' * 10)
+        self.assertIsNone(self.cache.get(REPORT_ID, 'bar'))
+        self.assertIsNone(self.cache.get(OTHER_REPORT_ID, 'foo'))
+        self.assertEqual(
+            os.listdir(self.directory.name),
+            [REPORT_ID],
+        )
+
+    def test_private_files(self):
+        directory = os.path.join(self.directory.name, 'reports')
+        cache = ReportCache(directory)
+
+        cache.put(REPORT_ID, 'foo', self.create_response(10))
+
+        report_directory = os.path.join(directory, REPORT_ID)
+        for path, mode in (
+            (directory, 0o700),
+            (report_directory, 0o700),
+            (os.path.join(report_directory, 'foo.xml'), 0o600),
+        ):
+            self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), mode, path)
+
+    def test_invalid_report_id(self):
+        with self.assertRaises(ValueError):
+            self.cache.put('../foo', 'foo', self.create_response())
+
+        # removing is a no-op
+        self.cache.remove('../foo')
+
+    def test_skip_too_large_response(self):
+        self.cache.put(REPORT_ID, 'foo', self.create_response(2048))
+
+        self.assertIsNone(self.cache.get(REPORT_ID, 'foo'))
+        self.assertEqual(self.cache.size(), 0)
+
+    def test_evict_least_recently_used(self):
+        self.cache.put(REPORT_ID, 'foo', self.create_response(400))
+        self.cache.put(REPORT_ID, 'bar', self.create_response(400))
+
+        path = os.path.join(self.directory.name, REPORT_ID, 'foo.xml')
+        os.utime(path, (0, 0))
+        path = os.path.join(self.directory.name, REPORT_ID, 'bar.xml')
+        os.utime(path, (1, 1))
+
+        # reading marks foo as used recently
+        self.assertIsNotNone(self.cache.get(REPORT_ID, 'foo'))
+
+        self.cache.put(OTHER_REPORT_ID, 'baz', self.create_response(400))
+
+        self.assertIsNotNone(self.cache.get(REPORT_ID, 'foo'))
+        self.assertIsNone(self.cache.get(REPORT_ID, 'bar'))
+        self.assertIsNotNone(self.cache.get(OTHER_REPORT_ID, 'baz'))
+        self.assertLessEqual(self.cache.size(), 1024)
+
+    def test_remove(self):
+        self.cache.put(REPORT_ID, 'foo', self.create_response())
+        self.cache.put(REPORT_ID, 'bar', self.create_response())
+        self.cache.put(OTHER_REPORT_ID, 'foo', self.create_response())
+
+        self.cache.remove(REPORT_ID)
+
+        self.assertIsNone(self.cache.get(REPORT_ID, 'foo'))
+        self.assertIsNone(self.cache.get(REPORT_ID, 'bar'))
+        self.assertIsNotNone(self.cache.get(OTHER_REPORT_ID, 'foo'))
+        self.assertEqual(os.listdir(self.directory.name), [OTHER_REPORT_ID])
+
+
+@patch('selene.views.Gmp', new_callable=GmpMockFactory)
+class GetCachedReportTestCase(SeleneTestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+        self.settings_override = self.settings(
+            SELENE={'REPORT_CACHE_DIR': self.directory.name}
+        )
+        self.settings_override.enable()
+
+    def tearDown(self):
+        super().tearDown()
+
+        self.settings_override.disable()
+        self.directory.cleanup()
+
+    def query_report(self):
+        response = self.query(
+            f'''
+            query {{
+                report(id: "{REPORT_ID}") {{
+                    id
+                    name
+                }}
+            }}
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        json = response.json()
+        self.assertEqual(json['data']['report']['id'], REPORT_ID)
+        self.assertEqual(json['data']['report']['name'], '2021-01-01T12:00:00Z')
+
+    def get_detailed_report_calls(self, mock_gmp: GmpMockFactory) -> int:
+        return sum(
+            1
+            for call in mock_gmp.gmp_protocol.get_report.call_args_list
+            if call.kwargs.get('details')
+        )
+
+    def test_cache_finished_report(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response('get_report', create_report_response())
+        mock_gmp.mock_response(
+            'get_notes', create_notes_response('2021-01-01T12:00:00Z')
+        )
+        mock_gmp.mock_response('get_overrides', OVERRIDES_RESPONSE)
+
+        self.login('foo', 'bar')
+
+        self.query_report()
+        self.query_report()
+
+        self.assertEqual(self.get_detailed_report_calls(mock_gmp), 1)
+        mock_gmp.gmp_protocol.get_report.assert_called_with(
+            REPORT_ID, details=False
+        )
+
+    def test_changed_notes(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response('get_report', create_report_response())
+        mock_gmp.mock_response(
+            'get_notes', create_notes_response('2021-01-01T12:00:00Z')
+        )
+        mock_gmp.mock_response('get_overrides', OVERRIDES_RESPONSE)
+
+        self.login('foo', 'bar')
+
+        self.query_report()
+
+        mock_gmp.mock_response(
+            'get_notes', create_notes_response('2021-01-02T12:00:00Z')
+        )
+
+        self.query_report()
+
+        self.assertEqual(self.get_detailed_report_calls(mock_gmp), 2)
+
+    def test_changed_timezone(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response('get_report', create_report_response())
+        mock_gmp.mock_response(
+            'get_notes', create_notes_response('2021-01-01T12:00:00Z')
+        )
+        mock_gmp.mock_response('get_overrides', OVERRIDES_RESPONSE)
+
+        self.login('foo', 'bar')
+
+        self.query_report()
+
+        mock_gmp.mock_response(
+            'get_report', create_report_response(timezone='Europe/Berlin')
+        )
+
+        self.query_report()
+
+        self.assertEqual(self.get_detailed_report_calls(mock_gmp), 2)
+
+    def test_changed_severity_class(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response('get_report', create_report_response())
+        mock_gmp.mock_response(
+            'get_notes', create_notes_response('2021-01-01T12:00:00Z')
+        )
+        mock_gmp.mock_response('get_overrides', OVERRIDES_RESPONSE)
+        mock_gmp.mock_response('get_settings', create_settings_response('nist'))
+
+        self.login('foo', 'bar')
+
+        self.query_report()
+        self.query_report()
+
+        self.assertEqual(self.get_detailed_report_calls(mock_gmp), 1)
+
+        mock_gmp.mock_response('get_settings', create_settings_response('bsi'))
+
+        self.query_report()
+
+        self.assertEqual(self.get_detailed_report_calls(mock_gmp), 2)
+
+    def test_small_report(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_report', create_report_response(result_count=10)
+        )
+
+        self.login('foo', 'bar')
+
+        self.query_report()
+        self.query_report()
+
+        self.assertEqual(self.get_detailed_report_calls(mock_gmp), 2)
+        mock_gmp.gmp_protocol.get_notes.assert_not_called()
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+    def test_request_state_once_per_request(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response('get_report', create_report_response())
+        mock_gmp.mock_response(
+            'get_notes', create_notes_response('2021-01-01T12:00:00Z')
+        )
+        mock_gmp.mock_response('get_overrides', OVERRIDES_RESPONSE)
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                report(id: "{REPORT_ID}") {{
+                    id
+                    results {{
+                        counts {{
+                            total
+                        }}
+                    }}
+                    hosts {{
+                        counts {{
+                            total
+                        }}
+                    }}
+                }}
+            }}
+            '''
+        )
+        self.assertResponseNoErrors(response)
+
+        # the report and its connections are loaded separately
+        self.assertEqual(self.get_detailed_report_calls(mock_gmp), 3)
+        mock_gmp.gmp_protocol.get_report.assert_any_call(
+            REPORT_ID, details=False
+        )
+        self.assertEqual(
+            len(
+                [
+                    call
+                    for call in mock_gmp.gmp_protocol.get_report.call_args_list
+                    if not call.kwargs.get('details')
+                ]
+            ),
+            1,
+        )
+        mock_gmp.gmp_protocol.get_notes.assert_called_once()
+        mock_gmp.gmp_protocol.get_overrides.assert_called_once()
+        mock_gmp.gmp_protocol.get_settings.assert_called_once()
+
+    def test_unfinished_report(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response('get_report', create_report_response('Running'))
+
+        self.login('foo', 'bar')
+
+        self.query_report()
+        self.query_report()
+
+        self.assertEqual(self.get_detailed_report_calls(mock_gmp), 2)
+        mock_gmp.gmp_protocol.get_notes.assert_not_called()
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+    def test_delete_report(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response('get_report', create_report_response())
+        mock_gmp.mock_response(
+            'get_notes', create_notes_response('2021-01-01T12:00:00Z')
+        )
+        mock_gmp.mock_response('get_overrides', OVERRIDES_RESPONSE)
+        mock_gmp.mock_response(
+            'delete_report',
+            '<delete_report_response status="200" status_text="OK"/>',
+        )
+
+        self.login('foo', 'bar')
+
+        self.query_report()
+
+        self.assertEqual(os.listdir(self.directory.name), [REPORT_ID])
+
+        response = self.query(
+            f'''
+            mutation {{
+                deleteReport(id: "{REPORT_ID}") {{
+                    ok
+                }}
+            }}
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+    def test_delete_reports_by_ids(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response('get_report', create_report_response())
+        mock_gmp.mock_response(
+            'get_notes', create_notes_response('2021-01-01T12:00:00Z')
+        )
+        mock_gmp.mock_response('get_overrides', OVERRIDES_RESPONSE)
+        mock_gmp.mock_response('get_reports', create_report_response())
+
+        self.login('foo', 'bar')
+
+        self.query_report()
+
+        self.assertEqual(os.listdir(self.directory.name), [REPORT_ID])
+
+        response = self.query(
+            f'''
+            mutation {{
+                deleteReportsByIds(ids: ["{REPORT_ID}"]) {{
+                    ok
+                }}
+            }}
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+    def test_delete_reports_by_filter(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response('get_report', create_report_response())
+        mock_gmp.mock_response(
+            'get_notes', create_notes_response('2021-01-01T12:00:00Z')
+        )
+        mock_gmp.mock_response('get_overrides', OVERRIDES_RESPONSE)
+        mock_gmp.mock_response('get_reports', create_report_response())
+
+        self.login('foo', 'bar')
+
+        self.query_report()
+
+        self.assertEqual(os.listdir(self.directory.name), [REPORT_ID])
+
+        response = self.query(
+            '''
+            mutation {
+                deleteReportsByFilter(filterString: "name~2021") {
+                    ok
+                }
+            }
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+        self.assertEqual(os.listdir(self.directory.name), [])
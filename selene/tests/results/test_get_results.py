@@ -18,6 +18,9 @@
 
 from unittest.mock import patch
 
+from lxml import etree
+
+from selene.connections import get_pruned_paths
 from selene.tests import SeleneTestCase, GmpMockFactory
 from selene.tests.pagination import (
     make_test_counts,
@@ -107,6 +110,88 @@ class ResultsTestCase(SeleneTestCase):
         self.assertEqual(result2['name'], 'def')
         self.assertEqual(result2['id'], '83c907a4-b2e4-403e-a5ba-9f831092b106')
 
+    def _record_pruned_paths(self, mock_gmp: GmpMockFactory):
+        pruned_paths = []
+
+        def get_results(**_kwargs):
+            pruned_paths.append(get_pruned_paths())
+            return etree.fromstring(self.resp)
+
+        mock_gmp.gmp_protocol.get_results.side_effect = get_results
+
+        return pruned_paths
+
+    def test_prune_unselected_elements(self, mock_gmp: GmpMockFactory):
+        pruned_paths = self._record_pruned_paths(mock_gmp)
+
+        self.login('foo', 'bar')
+
+        response = self.query(self.qu)
+
+        self.assertResponseNoErrors(response)
+
+        self.assertEqual(
+            pruned_paths,
+            [
+                frozenset(
+                    [
+                        'result/description',
+                        'result/detection',
+                        'result/host',
+                        'result/notes',
+                        'result/nvt',
+                        'result/overrides',
+                        'result/tickets',
+                    ]
+                )
+            ],
+        )
+
+    def test_keep_selected_elements(self, mock_gmp: GmpMockFactory):
+        pruned_paths = self._record_pruned_paths(mock_gmp)
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            '''
+            query {
+                results {
+                    nodes {
+                        id
+                        ... on Result {
+                            information {
+                                ... on ResultNVT {
+                                    id
+                                }
+                            }
+                            notes {
+                                id
+                            }
+                        }
+                    }
+                }
+            }
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        self.assertEqual(
+            pruned_paths,
+            [
+                frozenset(
+                    [
+                        'result/description',
+                        'result/detection',
+                        'result/host',
+                        'result/overrides',
+                        'result/tickets',
+                    ]
+                )
+            ],
+        )
+        self.assertEqual(get_pruned_paths(), frozenset())
+
 
 class ResultsPaginationTestCase(SeleneTestCase):
     entity_name = 'result'
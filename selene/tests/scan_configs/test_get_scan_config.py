@@ -26,7 +26,7 @@ from selene.schema.scan_configs.fields import ScanConfigType
 
 from selene.tests import SeleneTestCase, GmpMockFactory
 
-from selene.tests.entity import make_test_get_entity
+from selene.tests.entity import make_test_get_entity, make_test_load_entities
 
 CWD = Path(__file__).absolute().parent
 
@@ -322,3 +322,6 @@ class ScanConfigGetEntityTestCase(SeleneTestCase):
     test_get_entity = make_test_get_entity(
         gmp_name, selene_name=selene_name, tasks=True
     )
+    test_load_entities = make_test_load_entities(
+        gmp_name, selene_name=selene_name, details=True, tasks=True
+    )
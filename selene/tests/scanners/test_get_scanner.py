@@ -22,7 +22,7 @@ from unittest.mock import patch
 
 from selene.tests import SeleneTestCase, GmpMockFactory
 
-from selene.tests.entity import make_test_get_entity
+from selene.tests.entity import make_test_get_entity, make_test_load_entities
 
 CWD = Path(__file__).absolute().parent
 
@@ -233,3 +233,4 @@ class ScannerTestCase(SeleneTestCase):
 class ScannerGetEntityTestCase(SeleneTestCase):
     gmp_name = 'scanner'
     test_get_entity = make_test_get_entity(gmp_name)
+    test_load_entities = make_test_load_entities(gmp_name, details=True)
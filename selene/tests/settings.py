@@ -1,6 +1,6 @@
 SECRET_KEY = 'fake-key'
 
-INSTALLED_APPS = ['graphene_django']
+INSTALLED_APPS = ['graphene_django', 'selene']
 
 MIDDLEWARE = ['django.contrib.sessions.middleware.SessionMiddleware']
 
@@ -10,6 +10,14 @@ DATABASES = {
 
 ROOT_URLCONF = 'selene.urls'
 
+CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'gmp_credentials': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'selene-test-gmp-credentials',
+    },
+}
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -20,7 +20,7 @@ from unittest.mock import patch
 
 from selene.tests import SeleneTestCase, GmpMockFactory
 
-from selene.tests.entity import make_test_get_entity
+from selene.tests.entity import make_test_get_entity, make_test_load_entities
 
 
 @patch('selene.views.Gmp', new_callable=GmpMockFactory)
@@ -253,3 +253,4 @@ class TargetTestCase(SeleneTestCase):
 class TargetGetEntityTestCase(SeleneTestCase):
     gmp_name = 'target'
     test_get_entity = make_test_get_entity(gmp_name, tasks=True)
+    test_load_entities = make_test_load_entities(gmp_name, tasks=True)
@@ -21,6 +21,7 @@ from pathlib import Path
 
 from unittest.mock import patch
 
+from gvm.errors import GvmResponseError
 from gvm.protocols.next import ScannerType
 
 from selene.schema.scan_configs.fields import ScanConfigType
@@ -29,7 +30,7 @@ from selene.schema.tasks.fields import TaskStatus
 
 from selene.tests import SeleneTestCase, GmpMockFactory
 
-from selene.tests.entity import make_test_get_entity
+from selene.tests.entity import make_test_get_entity, make_test_load_entities
 
 CWD = Path(__file__).absolute().parent
 
@@ -86,6 +87,106 @@ class TaskTestCase(SeleneTestCase):
         self.assertEqual(task['id'], '75d23ba8-3d23-11ea-858e-b7c2cb43e815')
         self.assertIsNone(task['owner'])
 
+    def test_get_tasks_batched_missing_task(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_tasks',
+            '''
+            <get_tasks_response>
+                <task id="75d23ba8-3d23-11ea-858e-b7c2cb43e815">
+                    <name>a</name>
+                </task>
+            </get_tasks_response>
+            ''',
+        )
+        mock_gmp.gmp_protocol.get_task.side_effect = GvmResponseError(
+            status='404',
+            message="Failed to find task "
+            "'05d1edfa-3df8-11ea-9651-7b09b3acce77'",
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            '''
+            query {
+                a: task(id: "75d23ba8-3d23-11ea-858e-b7c2cb43e815") {
+                    name
+                }
+                b: task(id: "05d1edfa-3df8-11ea-9651-7b09b3acce77") {
+                    name
+                }
+            }
+            '''
+        )
+
+        json = response.json()
+
+        self.assertEqual(json['data']['a']['name'], 'a')
+        self.assertIsNone(json['data']['b'])
+
+        errors = json['errors']
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0]['path'], ['b'])
+        self.assertEqual(
+            errors[0]['message'],
+            "Response Error 404. Failed to find task "
+            "'05d1edfa-3df8-11ea-9651-7b09b3acce77'",
+        )
+
+        mock_gmp.gmp_protocol.get_task.assert_called_once_with(
+            '05d1edfa-3df8-11ea-9651-7b09b3acce77'
+        )
+
+    def test_get_tasks_batched_trashcan_task(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_tasks',
+            '''
+            <get_tasks_response>
+                <task id="75d23ba8-3d23-11ea-858e-b7c2cb43e815">
+                    <name>a</name>
+                </task>
+            </get_tasks_response>
+            ''',
+        )
+        mock_gmp.mock_response(
+            'get_task',
+            '''
+            <get_tasks_response>
+                <task id="05d1edfa-3df8-11ea-9651-7b09b3acce77">
+                    <name>b</name>
+                    <trash>1</trash>
+                </task>
+            </get_tasks_response>
+            ''',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            '''
+            query {
+                a: task(id: "75d23ba8-3d23-11ea-858e-b7c2cb43e815") {
+                    name
+                }
+                b: task(id: "05d1edfa-3df8-11ea-9651-7b09b3acce77") {
+                    name
+                }
+            }
+            '''
+        )
+
+        json = response.json()
+
+        self.assertResponseNoErrors(response)
+
+        self.assertEqual(json['data']['a']['name'], 'a')
+        self.assertEqual(json['data']['b']['name'], 'b')
+
+        mock_gmp.gmp_protocol.get_tasks.assert_called_once()
+        mock_gmp.gmp_protocol.get_task.assert_called_once_with(
+            '05d1edfa-3df8-11ea-9651-7b09b3acce77'
+        )
+
     def test_complex_task(self, mock_gmp: GmpMockFactory):
         task_xml_path = CWD / 'example-task.xml'
         task_xml_str = task_xml_path.read_text()
@@ -357,3 +458,4 @@ class TaskTestCase(SeleneTestCase):
 class TaskGetEntityTestCase(SeleneTestCase):
     gmp_name = 'task'
     test_get_entity = make_test_get_entity(gmp_name)
+    test_load_entities = make_test_load_entities(gmp_name, details=True)
@@ -145,20 +145,282 @@ class TasksTestCase(SeleneTestCase):
         self.assertEqual(task2['name'], 'b')
         self.assertEqual(task2['id'], '0778ac90-3d24-11ea-b722-fff755412c48')
 
+    def test_get_tasks_without_details(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_tasks',
+            '''
+            <get_tasks_response>
+                <task id="15085a9a-3d24-11ea-944a-6f78adc016ea">
+                    <name>a</name>
+                </task>
+            </get_tasks_response>
+            ''',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            '''
+            query {
+                tasks (filterString: "lorem") {
+                    nodes {
+                        id
+                        name
+                        status
+                    }
+                }
+            }
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp_protocol.get_tasks.assert_called_with(
+            filter='lorem', details=False
+        )
+
+    def test_get_tasks_with_details(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_tasks',
+            '''
+            <get_tasks_response>
+                <task id="15085a9a-3d24-11ea-944a-6f78adc016ea">
+                    <name>a</name>
+                    <report_count>2<finished>1</finished></report_count>
+                </task>
+                <tasks start="1" max="10"/>
+            </get_tasks_response>
+            ''',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            '''
+            query {
+                tasks (filterString: "lorem") {
+                    edges {
+                        node {
+                            ...TaskReports
+                        }
+                    }
+                }
+            }
+
+            fragment TaskReports on Task {
+                reports {
+                    counts {
+                        total
+                    }
+                }
+            }
+            '''
+        )
+
+        json = response.json()
+
+        self.assertResponseNoErrors(response)
+
+        task = json['data']['tasks']['edges'][0]['node']
+        self.assertEqual(task['reports']['counts']['total'], 2)
+
+        mock_gmp.gmp_protocol.get_tasks.assert_called_with(
+            filter='lorem', details=True
+        )
+
+    def test_get_tasks_with_user_tags(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_tasks',
+            '''
+            <get_tasks_response>
+                <task id="15085a9a-3d24-11ea-944a-6f78adc016ea">
+                    <name>a</name>
+                    <user_tags>
+                        <count>1</count>
+                        <tag id="480cdbd9-c4a1-4a4e-a4b4-2e6d2d12fd3c">
+                            <name>foo</name>
+                            <value>bar</value>
+                            <comment/>
+                        </tag>
+                    </user_tags>
+                </task>
+                <tasks start="1" max="10"/>
+            </get_tasks_response>
+            ''',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            '''
+            query {
+                tasks (filterString: "lorem") {
+                    nodes {
+                        userTags {
+                            count
+                        }
+                    }
+                }
+            }
+            '''
+        )
+
+        json = response.json()
+
+        self.assertResponseNoErrors(response)
+
+        task = json['data']['tasks']['nodes'][0]
+        self.assertEqual(task['userTags']['count'], 1)
+
+        mock_gmp.gmp_protocol.get_tasks.assert_called_with(
+            filter='lorem', details=True
+        )
+
+    def test_get_tasks_counts_only(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_tasks',
+            '''
+            <get_tasks_response>
+                <task id="15085a9a-3d24-11ea-944a-6f78adc016ea">
+                    <name>a</name>
+                </task>
+                <tasks start="11" max="1"/>
+                <task_count>42<filtered>25</filtered></task_count>
+            </get_tasks_response>
+            ''',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            '''
+            query {
+                tasks (filterString: "status=Running first=11 rows=10") {
+                    counts {
+                        filtered
+                        total
+                        offset
+                        limit
+                        length
+                    }
+                    pageInfo {
+                        hasNextPage
+                        hasPreviousPage
+                    }
+                }
+            }
+            '''
+        )
+
+        json = response.json()
+
+        self.assertResponseNoErrors(response)
+
+        counts = json['data']['tasks']['counts']
+
+        self.assertEqual(counts['filtered'], 25)
+        self.assertEqual(counts['total'], 42)
+        self.assertEqual(counts['offset'], 10)
+        self.assertEqual(counts['limit'], 10)
+        self.assertEqual(counts['length'], 10)
+
+        page_info = json['data']['tasks']['pageInfo']
+
+        self.assertTrue(page_info['hasNextPage'])
+        self.assertTrue(page_info['hasPreviousPage'])
+
+        mock_gmp.gmp_protocol.get_tasks.assert_called_with(
+            filter='status=Running first=11 rows=1', details=False
+        )
+
+    def test_get_tasks_counts_only_without_rows(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_tasks',
+            '''
+            <get_tasks_response>
+                <task id="15085a9a-3d24-11ea-944a-6f78adc016ea">
+                    <name>a</name>
+                </task>
+                <tasks start="1" max="1"/>
+                <task_count>42<filtered>12</filtered></task_count>
+            </get_tasks_response>
+            ''',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            '''
+            query {
+                tasks (filterString: "status=Running") {
+                    counts {
+                        filtered
+                    }
+                }
+            }
+            '''
+        )
+
+        json = response.json()
+
+        self.assertResponseNoErrors(response)
+
+        self.assertEqual(json['data']['tasks']['counts']['filtered'], 12)
+
+        mock_gmp.gmp_protocol.get_tasks.assert_called_with(
+            filter='status=Running rows=1', details=False
+        )
+
+    def test_get_tasks_page_info_without_rows(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_tasks',
+            '''
+            <get_tasks_response>
+                <task id="15085a9a-3d24-11ea-944a-6f78adc016ea">
+                    <name>a</name>
+                </task>
+                <tasks start="1" max="10"/>
+                <task_count>1<filtered>1</filtered></task_count>
+            </get_tasks_response>
+            ''',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            '''
+            query {
+                tasks (filterString: "status=Running") {
+                    pageInfo {
+                        hasNextPage
+                    }
+                }
+            }
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        # the default number of rows is unknown. therefore the page must be
+        # loaded
+        mock_gmp.gmp_protocol.get_tasks.assert_called_with(
+            filter='status=Running', details=False
+        )
+
 
 class TasksPaginationTestCase(SeleneTestCase):
     entity_name = 'task'
     test_pagination_with_after_and_first = make_test_after_first(
-        entity_name, details=True
+        entity_name, details=False
     )
     test_counts = make_test_counts(entity_name)
     test_page_info = make_test_page_info(entity_name, query=GetTasks)
     test_edges = make_test_edges(entity_name)
     test_pagination_with_before_and_last = make_test_before_last(
-        entity_name, details=True
+        entity_name, details=False
     )
     test_after_first_before_last = make_test_after_first_before_last(
-        entity_name, details=True
+        entity_name, details=False
     )
 
 
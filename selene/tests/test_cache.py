@@ -0,0 +1,922 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import io
+import os
+import tempfile
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from lxml import etree
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, override_settings
+
+from gvm.errors import GvmResponseError
+from gvm.protocols.next import InfoType as GvmInfoType
+
+from selene import cache as cache_module
+from selene.cache import (
+    CACHED_ENTITY_TYPES,
+    SECINFO_FEEDS_KEY,
+    CacheStatistics,
+    EntityCachedGmp,
+    SecInfoCachedGmp,
+    SharedCacheStatistics,
+    SingleFlight,
+    entity_cache_statistics,
+    get_cached_entity_type,
+    get_changed_entity_types,
+    get_secinfo_feed,
+    lock_file,
+    parse_feed_versions,
+)
+from selene.connections import prune_response_elements
+from selene.gmp import forget_supported_gmp
+from selene.tests import SeleneTestCase
+from selene.tests.benchmarks.fakegvmd import FakeGvmd
+
+FEEDS_RESPONSE = (
+    '<get_feeds_response status="200" status_text="OK">'
+    '<feed><type>NVT</type><version>202104010000</version></feed>'
+    '<feed><type>SCAP</type><version>202104020000</version></feed>'
+    '<feed><type>CERT</type><version>202104030000</version>'
+    '<currently_syncing><timestamp>1</timestamp></currently_syncing>'
+    '</feed>'
+    '</get_feeds_response>'
+)
+
+INFO_RESPONSE = (
+    '<get_info_response status="200" status_text="OK">'
+    '<info id="CVE-2021-0001"><name>CVE-2021-0001</name></info>'
+    '</get_info_response>'
+)
+
+
+class GetSecInfoFeedTestCase(SimpleTestCase):
+    def test_info_commands(self):
+        self.assertEqual(
+            get_secinfo_feed('get_info', ('foo',), {'info_type': 'CVE'}),
+            'SCAP',
+        )
+        self.assertEqual(
+            get_secinfo_feed('get_info', ('foo', GvmInfoType.CPE), {}),
+            'SCAP',
+        )
+        self.assertEqual(
+            get_secinfo_feed(
+                'get_info_list', (), {'info_type': GvmInfoType.CERT_BUND_ADV}
+            ),
+            'CERT',
+        )
+        self.assertEqual(
+            get_secinfo_feed('get_info_list', (GvmInfoType.NVT,), {}), 'NVT'
+        )
+
+    def test_nvt_commands(self):
+        self.assertEqual(get_secinfo_feed('get_nvt', ('1.2.3',), {}), 'NVT')
+        self.assertEqual(
+            get_secinfo_feed('get_nvt_families', (), {'sort_order': None}),
+            'NVT',
+        )
+        self.assertEqual(
+            get_secinfo_feed('get_nvts', (), {'config_id': None}), 'NVT'
+        )
+
+    def test_scan_config_nvts(self):
+        self.assertIsNone(
+            get_secinfo_feed('get_nvts', (), {'config_id': 'foo'})
+        )
+        self.assertIsNone(
+            get_secinfo_feed('get_nvts', (), {'preferences_config_id': 'foo'})
+        )
+
+    def test_other_commands(self):
+        self.assertIsNone(get_secinfo_feed('get_tasks', (), {}))
+        self.assertIsNone(get_secinfo_feed('get_info', ('foo',), {}))
+        self.assertIsNone(
+            get_secinfo_feed('get_info', ('foo',), {'info_type': 'FOO'})
+        )
+
+
+class ParseFeedVersionsTestCase(SimpleTestCase):
+    def test_skip_syncing_feeds(self):
+        self.assertEqual(
+            parse_feed_versions(etree.fromstring(FEEDS_RESPONSE)),
+            {'NVT': '202104010000', 'SCAP': '202104020000'},
+        )
+
+
+class Waiters:
+    """Count the callers waiting for the call of another thread"""
+
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def add(self):
+        with self._lock:
+            self.count += 1
+
+    def wait_for(self, count: int):
+        deadline = time.monotonic() + 5
+        while self.count < count:
+            if time.monotonic() > deadline:
+                raise AssertionError(f'{count} callers are not waiting')
+            time.sleep(0.001)
+
+
+def count_waiters(test_case: SimpleTestCase) -> Waiters:
+    waiters = Waiters()
+    # pylint: disable=protected-access
+    wait = cache_module._Flight.wait
+
+    def counting_wait(flight):
+        waiters.add()
+        return wait(flight)
+
+    patcher = patch.object(cache_module._Flight, 'wait', counting_wait)
+    patcher.start()
+    test_case.addCleanup(patcher.stop)
+
+    return waiters
+
+
+class SingleFlightTestCase(SimpleTestCase):
+    def setUp(self):
+        self.waiters = count_waiters(self)
+
+    def test_share_result(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def func():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return object()
+
+        with ThreadPoolExecutor(5) as executor:
+            leader = executor.submit(flight.call, 'foo', func)
+            started.wait(5)
+
+            followers = [
+                executor.submit(flight.call, 'foo', func) for _ in range(3)
+            ]
+            self.waiters.wait_for(3)
+            other = executor.submit(flight.call, 'bar', lambda: 'bar')
+            self.assertEqual(other.result(5), 'bar')
+
+            release.set()
+
+            result = leader.result(5)
+            for follower in followers:
+                self.assertIs(follower.result(5), result)
+
+        self.assertEqual(len(calls), 1)
+
+    def test_share_error(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def func():
+            started.set()
+            release.wait(5)
+            raise ValueError('foo')
+
+        with ThreadPoolExecutor(2) as executor:
+            leader = executor.submit(flight.call, 'foo', func)
+            started.wait(5)
+            follower = executor.submit(flight.call, 'foo', func)
+            self.waiters.wait_for(1)
+
+            release.set()
+
+            with self.assertRaisesRegex(ValueError, 'foo') as leader_error:
+                leader.result(5)
+            with self.assertRaisesRegex(ValueError, 'foo') as follower_error:
+                follower.result(5)
+
+        # the follower raises a copy to not share the traceback
+        self.assertIsNot(follower_error.exception, leader_error.exception)
+        self.assertIs(
+            follower_error.exception.__cause__, leader_error.exception
+        )
+
+    def test_forget_result(self):
+        flight = SingleFlight()
+
+        self.assertEqual(flight.call('foo', lambda: 1), 1)
+        self.assertEqual(flight.call('foo', lambda: 2), 2)
+
+    def test_reset(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def func():
+            started.set()
+            release.wait(5)
+            return 'foo'
+
+        with ThreadPoolExecutor(1) as executor:
+            leader = executor.submit(flight.call, 'foo', func)
+            started.wait(5)
+
+            # e.g. in a forked worker the running call never finishes
+            flight.reset()
+
+            self.assertEqual(flight.call('foo', lambda: 'bar'), 'bar')
+
+            release.set()
+            self.assertEqual(leader.result(5), 'foo')
+
+
+class LockFileTestCase(SimpleTestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmpdir.name, 'locks')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_no_directory(self):
+        with lock_file(None, 'foo') as locked:
+            self.assertFalse(locked)
+
+    def test_lock(self):
+        with lock_file(self.directory, 'foo') as locked:
+            self.assertTrue(locked)
+
+            # flock locks of different open files exclude each other
+            with lock_file(self.directory, 'foo', timeout=0.1) as locked2:
+                self.assertFalse(locked2)
+
+        with lock_file(self.directory, 'foo', timeout=0.1) as locked:
+            self.assertTrue(locked)
+
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+
+
+class SecInfoCachedGmpTestCase(SimpleTestCase):
+    def setUp(self):
+        self.cache = LocMemCache('selene-test-secinfo', {})
+        self.cache.clear()
+
+        self.gmp = MagicMock()
+        self.gmp.get_feeds.side_effect = lambda: etree.fromstring(
+            FEEDS_RESPONSE
+        )
+        self.gmp.get_info.side_effect = lambda *args, **kwargs: (
+            etree.fromstring(INFO_RESPONSE)
+        )
+
+    def tearDown(self):
+        self.cache.clear()
+
+    def create_gmp(self, username: str = 'foo') -> SecInfoCachedGmp:
+        return SecInfoCachedGmp(self.gmp, self.cache, username)
+
+    def get_cve(self, gmp: SecInfoCachedGmp) -> etree.Element:
+        return gmp.get_info('CVE-2021-0001', info_type=GvmInfoType.CVE)
+
+    def test_cache_response(self):
+        response = self.get_cve(self.create_gmp())
+        cached = self.get_cve(self.create_gmp())
+
+        self.assertEqual(etree.tostring(cached), etree.tostring(response))
+        self.gmp.get_info.assert_called_once_with(
+            'CVE-2021-0001', info_type=GvmInfoType.CVE
+        )
+        self.gmp.get_feeds.assert_called_once_with()
+
+    def test_cache_per_arguments(self):
+        gmp = self.create_gmp()
+
+        gmp.get_info('CVE-2021-0001', info_type=GvmInfoType.CVE)
+        gmp.get_info('CVE-2021-0002', info_type=GvmInfoType.CVE)
+
+        self.assertEqual(self.gmp.get_info.call_count, 2)
+
+    def test_cache_per_user(self):
+        self.get_cve(self.create_gmp('foo'))
+        self.get_cve(self.create_gmp('bar'))
+
+        self.assertEqual(self.gmp.get_info.call_count, 2)
+
+    def test_feed_version_changed(self):
+        self.get_cve(self.create_gmp())
+
+        self.gmp.get_feeds.side_effect = lambda: etree.fromstring(
+            FEEDS_RESPONSE.replace('202104020000', '202104050000')
+        )
+        # the check interval has passed
+        self.cache.delete(SECINFO_FEEDS_KEY)
+
+        self.get_cve(self.create_gmp())
+        self.get_cve(self.create_gmp())
+
+        self.assertEqual(self.gmp.get_info.call_count, 2)
+        self.assertEqual(self.gmp.get_feeds.call_count, 2)
+
+    def test_feed_syncing(self):
+        gmp = self.create_gmp()
+
+        gmp.get_info_list(filter='rows=10', info_type=GvmInfoType.DFN_CERT_ADV)
+        gmp.get_info_list(filter='rows=10', info_type=GvmInfoType.DFN_CERT_ADV)
+
+        self.assertEqual(self.gmp.get_info_list.call_count, 2)
+
+    def test_feeds_not_allowed(self):
+        self.gmp.get_feeds.side_effect = GvmResponseError(
+            status='403', message='Permission denied'
+        )
+
+        self.get_cve(self.create_gmp())
+        self.get_cve(self.create_gmp())
+
+        self.assertEqual(self.gmp.get_info.call_count, 2)
+
+    def test_invalidate_on_modification(self):
+        gmp = self.create_gmp()
+
+        self.get_cve(gmp)
+        gmp.modify_tag('foo', name='bar')
+        self.get_cve(gmp)
+        self.get_cve(gmp)
+
+        self.gmp.modify_tag.assert_called_once_with('foo', name='bar')
+        self.assertEqual(self.gmp.get_info.call_count, 2)
+
+    def test_invalidate_per_user(self):
+        self.get_cve(self.create_gmp('foo'))
+        self.create_gmp('bar').modify_tag('foo', name='bar')
+        self.get_cve(self.create_gmp('foo'))
+
+        self.gmp.get_info.assert_called_once()
+
+    def test_pruned_response(self):
+        gmp = self.create_gmp()
+
+        with prune_response_elements(['info/foo']):
+            self.get_cve(gmp)
+            self.get_cve(gmp)
+
+        self.assertEqual(self.gmp.get_info.call_count, 2)
+        self.gmp.get_feeds.assert_not_called()
+
+    def test_pass_other_commands(self):
+        gmp = self.create_gmp()
+
+        gmp.get_tasks(filter_string='foo')
+        gmp.get_tasks(filter_string='foo')
+
+        self.assertEqual(self.gmp.get_tasks.call_count, 2)
+        self.gmp.get_feeds.assert_not_called()
+
+
+class SecInfoCoalescingTestCase(SimpleTestCase):
+    def setUp(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+        def get_info_list(**_kwargs):
+            self.started.set()
+            self.release.wait(5)
+            return etree.fromstring(INFO_RESPONSE)
+
+        self.gmp = MagicMock()
+        self.gmp.get_info_list.side_effect = get_info_list
+
+        self.flight = SingleFlight()
+        patcher = patch.object(cache_module, '_flights', self.flight)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.waiters = count_waiters(self)
+
+    def get_cves(self, username: str = 'foo', cache: LocMemCache = None):
+        gmp = SecInfoCachedGmp(self.gmp, cache, username)
+        return gmp.get_info_list(filter='rows=10', info_type=GvmInfoType.CVE)
+
+    def run_concurrently(self, *calls, waiters: int = 0):
+        with ThreadPoolExecutor(len(calls)) as executor:
+            first = executor.submit(*calls[0])
+            self.started.wait(5)
+
+            futures = [executor.submit(*call) for call in calls[1:]]
+            if waiters:
+                self.waiters.wait_for(waiters)
+
+            self.release.set()
+
+            return [first.result(5)] + [future.result(5) for future in futures]
+
+    def test_coalesce(self):
+        results = self.run_concurrently(*[(self.get_cves,)] * 3, waiters=2)
+
+        self.gmp.get_info_list.assert_called_once()
+        self.assertIs(results[1], results[0])
+        self.assertIs(results[2], results[0])
+        self.gmp.get_feeds.assert_not_called()
+
+    def test_coalesce_per_user(self):
+        self.release.set()
+
+        self.run_concurrently((self.get_cves, 'foo'), (self.get_cves, 'bar'))
+
+        self.assertEqual(self.gmp.get_info_list.call_count, 2)
+
+    def test_coalesce_shared(self):
+        results = self.run_concurrently(
+            (self.get_cves, None), (self.get_cves, None), waiters=1
+        )
+
+        self.gmp.get_info_list.assert_called_once()
+        self.assertIs(results[1], results[0])
+
+    def test_coalesce_cache_misses(self):
+        cache = LocMemCache('selene-test-secinfo', {})
+        cache.clear()
+        self.gmp.get_feeds.side_effect = lambda: etree.fromstring(
+            FEEDS_RESPONSE
+        )
+
+        try:
+            self.run_concurrently(
+                (self.get_cves, 'foo', cache),
+                (self.get_cves, 'foo', cache),
+                waiters=1,
+            )
+            self.get_cves('foo', cache)
+        finally:
+            cache.clear()
+
+        self.gmp.get_info_list.assert_called_once()
+
+    def test_lock_dir(self):
+        cache = LocMemCache('selene-test-secinfo', {})
+        cache.clear()
+        self.gmp.get_feeds.side_effect = lambda: etree.fromstring(
+            FEEDS_RESPONSE
+        )
+        self.release.set()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            gmp = SecInfoCachedGmp(self.gmp, cache, 'foo', lock_dir=tmpdir)
+            try:
+                gmp.get_info_list(filter='rows=10', info_type=GvmInfoType.CVE)
+                gmp.get_info_list(filter='rows=10', info_type=GvmInfoType.CVE)
+            finally:
+                cache.clear()
+
+            self.assertEqual(len(os.listdir(tmpdir)), 1)
+
+        self.gmp.get_info_list.assert_called_once()
+
+
+class SecInfoCacheViewTestCase(SeleneTestCase):
+    def setUp(self):
+        forget_supported_gmp()
+
+        self.gvmd = FakeGvmd()
+        self.gvmd.set_response('get_feeds', FEEDS_RESPONSE)
+        self.gvmd.set_response('get_info', INFO_RESPONSE)
+        self.gvmd.start()
+
+        self.cache = LocMemCache('selene-test-secinfo', {})
+        self.cache.clear()
+
+    def tearDown(self):
+        super().tearDown()
+
+        self.gvmd.stop()
+        self.cache.clear()
+
+        forget_supported_gmp()
+
+    def query_cve(self):
+        response = self.query(
+            '''
+            query {
+                cve(id: "CVE-2021-0001") {
+                    name
+                }
+            }
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+        self.assertEqual(
+            response.json()['data']['cve']['name'], 'CVE-2021-0001'
+        )
+
+    def test_cache_disabled(self):
+        with self.settings(
+            SELENE={
+                'GMP_SOCKET_PATH': self.gvmd.path,
+                'SECINFO_COALESCE': False,
+            }
+        ):
+            self.login('foo', 'bar')
+
+            self.query_cve()
+            self.query_cve()
+
+        self.assertEqual(self.gvmd.commands['get_info'], 2)
+        self.assertEqual(self.gvmd.commands['get_feeds'], 0)
+
+    def test_cache_enabled(self):
+        with self.settings(
+            SELENE={'GMP_SOCKET_PATH': self.gvmd.path, 'SECINFO_CACHE': 'foo'},
+            CACHES={
+                'default': {
+                    'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'
+                },
+                'foo': {
+                    'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                    'LOCATION': 'selene-test-secinfo',
+                },
+                'gmp_credentials': {
+                    'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                    'LOCATION': 'selene-test-gmp-credentials',
+                },
+            },
+        ):
+            self.login('foo', 'bar')
+
+            self.query_cve()
+            self.query_cve()
+
+        self.assertEqual(self.gvmd.commands['get_info'], 1)
+        self.assertEqual(self.gvmd.commands['get_feeds'], 1)
+
+
+SCANNERS_RESPONSE = (
+    '<get_scanners_response status="200" status_text="OK">'
+    '<scanner id="08b69003-5fc2-4037-a479-93b440211c73">'
+    '<name>OpenVAS Default</name>'
+    '</scanner>'
+    '<scanner_count>1<filtered>1</filtered></scanner_count>'
+    '</get_scanners_response>'
+)
+
+
+class GetCachedEntityTypeTestCase(SimpleTestCase):
+    def test_cached_entity_types(self):
+        for command, entity_type in (
+            ('get_configs', 'config'),
+            ('get_credential', 'credential'),
+            ('get_port_lists', 'port_list'),
+            ('get_report_format', 'report_format'),
+            ('get_scanners', 'scanner'),
+            ('get_schedules', 'schedule'),
+        ):
+            self.assertEqual(get_cached_entity_type(command), entity_type)
+
+    def test_other_commands(self):
+        for command in (
+            'get_tasks',
+            'get_config_nvts',
+            'get_policies',
+            'create_scanner',
+            'help',
+        ):
+            self.assertIsNone(get_cached_entity_type(command), command)
+
+
+class GetChangedEntityTypesTestCase(SimpleTestCase):
+    def test_changed_entity_types(self):
+        for command, entity_types in (
+            ('create_scanner', ('scanner',)),
+            ('verify_scanner', ('scanner',)),
+            ('modify_config_set_nvt_selection', ('config',)),
+            ('create_config_from_osp_scanner', ('config', 'scanner')),
+            ('create_port_range', ('port_list',)),
+            ('modify_credential', ('credential', 'scanner')),
+            ('import_report_format', ('report_format',)),
+            ('delete_schedule', ('schedule',)),
+            ('clone_port_list', ('port_list',)),
+        ):
+            self.assertEqual(
+                get_changed_entity_types(command), entity_types, command
+            )
+
+    def test_referring_entity_types(self):
+        for command in (
+            'create_task',
+            'delete_target',
+            'modify_tag',
+            'create_permission',
+            'restore',
+            'empty_trashcan',
+        ):
+            self.assertEqual(
+                get_changed_entity_types(command), CACHED_ENTITY_TYPES
+            )
+
+    def test_unchanged_entity_types(self):
+        for command in (
+            'get_scanners',
+            'help',
+            'create_note',
+            'modify_user_setting',
+            'start_task',
+            'stop_task',
+            'resume_task',
+        ):
+            self.assertEqual(get_changed_entity_types(command), (), command)
+
+
+class CacheStatisticsTestCase(SimpleTestCase):
+    def test_count(self):
+        statistics = CacheStatistics()
+
+        statistics.hit('scanner')
+        statistics.hit('scanner')
+        statistics.miss('scanner')
+        statistics.miss('config')
+
+        self.assertEqual(
+            statistics.get(),
+            {
+                'config': {'hits': 0, 'misses': 1},
+                'scanner': {'hits': 2, 'misses': 1},
+            },
+        )
+
+        statistics.reset()
+
+        self.assertEqual(statistics.get(), {})
+
+
+class SharedCacheStatisticsTestCase(SimpleTestCase):
+    def setUp(self):
+        self.cache = LocMemCache('selene-test-statistics', {})
+        self.cache.clear()
+
+    def tearDown(self):
+        self.cache.clear()
+
+    def test_count(self):
+        SharedCacheStatistics(self.cache).hit('scanner')
+        SharedCacheStatistics(self.cache).hit('scanner')
+        SharedCacheStatistics(self.cache).miss('scanner')
+        SharedCacheStatistics(self.cache).miss('config')
+
+        statistics = SharedCacheStatistics(self.cache)
+
+        self.assertEqual(
+            statistics.get(),
+            {
+                'config': {'hits': 0, 'misses': 1},
+                'scanner': {'hits': 2, 'misses': 1},
+            },
+        )
+
+        statistics.reset()
+
+        self.assertEqual(statistics.get(), {})
+
+    @override_settings(
+        SELENE={'ENTITY_CACHE': 'entities'},
+        CACHES={
+            'default': {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'
+            },
+            'entities': {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                'LOCATION': 'selene-test-statistics',
+            },
+        },
+    )
+    def test_management_command(self):
+        SharedCacheStatistics(self.cache).hit('scanner')
+        SharedCacheStatistics(self.cache).miss('port_list')
+
+        out = io.StringIO()
+        call_command('entity_cache_statistics', '--reset', stdout=out)
+
+        self.assertEqual(
+            out.getvalue().splitlines(),
+            [
+                'entity type           hits    misses',
+                'port_list                0         1',
+                'scanner                  1         0',
+            ],
+        )
+        self.assertEqual(SharedCacheStatistics(self.cache).get(), {})
+
+    @override_settings(SELENE={})
+    def test_management_command_without_cache(self):
+        with self.assertRaises(CommandError):
+            call_command('entity_cache_statistics', stdout=io.StringIO())
+
+
+class EntityCachedGmpTestCase(SimpleTestCase):
+    def setUp(self):
+        self.cache = LocMemCache('selene-test-entities', {})
+        self.cache.clear()
+
+        self.gmp = MagicMock()
+        self.gmp.get_scanners.side_effect = lambda **kwargs: etree.fromstring(
+            SCANNERS_RESPONSE
+        )
+
+        entity_cache_statistics.reset()
+
+    def tearDown(self):
+        self.cache.clear()
+        entity_cache_statistics.reset()
+
+    def create_gmp(self, username: str = 'foo') -> EntityCachedGmp:
+        return EntityCachedGmp(self.gmp, self.cache, username)
+
+    def test_cache_response(self):
+        response = self.create_gmp().get_scanners(filter='rows=10')
+        cached = self.create_gmp().get_scanners(filter='rows=10')
+
+        self.assertEqual(etree.tostring(cached), etree.tostring(response))
+        self.gmp.get_scanners.assert_called_once_with(filter='rows=10')
+        self.assertEqual(
+            entity_cache_statistics.get(),
+            {'scanner': {'hits': 1, 'misses': 1}},
+        )
+        self.assertEqual(
+            SharedCacheStatistics(self.cache).get(),
+            {'scanner': {'hits': 1, 'misses': 1}},
+        )
+
+    def test_cache_per_arguments(self):
+        gmp = self.create_gmp()
+
+        gmp.get_scanners(filter='rows=10')
+        gmp.get_scanners(filter='rows=20')
+        gmp.get_scanners(filter='rows=10', details=True)
+
+        self.assertEqual(self.gmp.get_scanners.call_count, 3)
+
+    def test_cache_per_user(self):
+        self.create_gmp('foo').get_scanners(filter='rows=10')
+        self.create_gmp('bar').get_scanners(filter='rows=10')
+
+        self.assertEqual(self.gmp.get_scanners.call_count, 2)
+
+    def test_invalidate_entity_type(self):
+        self.create_gmp('foo').get_scanners(filter='rows=10')
+        self.create_gmp('bar').get_scanners(filter='rows=10')
+
+        self.create_gmp('foo').modify_scanner('foo', name='bar')
+
+        self.create_gmp('foo').get_scanners(filter='rows=10')
+        self.create_gmp('bar').get_scanners(filter='rows=10')
+
+        self.gmp.modify_scanner.assert_called_once_with('foo', name='bar')
+        self.assertEqual(self.gmp.get_scanners.call_count, 4)
+
+    def test_invalidate_after_failed_command(self):
+        self.gmp.delete_scanner.side_effect = GvmResponseError(
+            status='400', message='Scanner in use'
+        )
+        gmp = self.create_gmp()
+
+        gmp.get_scanners(filter='rows=10')
+
+        with self.assertRaises(GvmResponseError):
+            gmp.delete_scanner('foo')
+
+        gmp.get_scanners(filter='rows=10')
+
+        self.assertEqual(self.gmp.get_scanners.call_count, 2)
+
+    def test_keep_other_entity_types(self):
+        gmp = self.create_gmp()
+
+        gmp.get_scanners(filter='rows=10')
+        gmp.create_port_list('foo', 'T:1-10')
+        gmp.create_note('foo', 'bar')
+        gmp.get_scanners(filter='rows=10')
+
+        self.gmp.get_scanners.assert_called_once()
+
+    def test_invalidate_containing_entity_types(self):
+        gmp = self.create_gmp()
+
+        gmp.get_scanners(filter='rows=10')
+        gmp.modify_credential('foo', name='bar')
+        gmp.get_scanners(filter='rows=10')
+
+        self.assertEqual(self.gmp.get_scanners.call_count, 2)
+
+    def test_invalidate_all_entity_types(self):
+        gmp = self.create_gmp()
+
+        gmp.get_scanners(filter='rows=10')
+        gmp.create_task('foo', 'bar', 'baz', 'qux')
+        gmp.get_scanners(filter='rows=10')
+
+        self.assertEqual(self.gmp.get_scanners.call_count, 2)
+
+    def test_pass_other_commands(self):
+        gmp = self.create_gmp()
+
+        gmp.get_tasks(filter_string='foo')
+        gmp.get_tasks(filter_string='foo')
+
+        self.assertEqual(self.gmp.get_tasks.call_count, 2)
+        self.assertEqual(entity_cache_statistics.get(), {})
+
+
+class EntityCacheViewTestCase(SeleneTestCase):
+    def setUp(self):
+        forget_supported_gmp()
+
+        self.gvmd = FakeGvmd()
+        self.gvmd.set_response('get_scanners', SCANNERS_RESPONSE)
+        self.gvmd.start()
+
+        self.cache = LocMemCache('selene-test-entities', {})
+        self.cache.clear()
+
+    def tearDown(self):
+        super().tearDown()
+
+        self.gvmd.stop()
+        self.cache.clear()
+
+        forget_supported_gmp()
+
+    def query_scanners(self):
+        response = self.query(
+            '''
+            query {
+                scanners {
+                    nodes {
+                        name
+                    }
+                }
+            }
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+        self.assertEqual(
+            response.json()['data']['scanners']['nodes'],
+            [{'name': 'OpenVAS Default'}],
+        )
+
+    def test_cache_disabled(self):
+        with self.settings(SELENE={'GMP_SOCKET_PATH': self.gvmd.path}):
+            self.login('foo', 'bar')
+
+            self.query_scanners()
+            self.query_scanners()
+
+        self.assertEqual(self.gvmd.commands['get_scanners'], 2)
+
+    def test_cache_enabled(self):
+        with self.settings(
+            SELENE={'GMP_SOCKET_PATH': self.gvmd.path, 'ENTITY_CACHE': 'foo'},
+            CACHES={
+                'default': {
+                    'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'
+                },
+                'foo': {
+                    'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                    'LOCATION': 'selene-test-entities',
+                },
+                'gmp_credentials': {
+                    'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                    'LOCATION': 'selene-test-gmp-credentials',
+                },
+            },
+        ):
+            self.login('foo', 'bar')
+
+            self.query_scanners()
+            self.query_scanners()
+
+        self.assertEqual(self.gvmd.commands['get_scanners'], 1)
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from django.test import SimpleTestCase
+
+from gvm.errors import GvmResponseError
+
+from selene.connections import (
+    EtreeCheckCommandTransform,
+    GmpResponseParser,
+    IncrementalUnixSocketConnection,
+    get_pruned_paths,
+    prune_response_elements,
+)
+from selene.gmp import Gmp, forget_supported_gmp
+from selene.tests.benchmarks.fakegvmd import FakeGvmd
+
+
+class GmpResponseParserTestCase(SimpleTestCase):
+    def test_parse_chunks(self):
+        response = (
+            b'<get_tasks_response status="200" status_text="OK">'
+            b'<task id="1"><name>foo</name></task>'
+            b'</get_tasks_response>'
+        )
+
+        parser = GmpResponseParser()
+
+        head, tail = response[:-1], response[-1:]
+
+        for i in range(0, len(head), 5):
+            self.assertFalse(parser.feed(head[i : i + 5]))
+
+        self.assertTrue(parser.feed(tail))
+        self.assertFalse(parser.failed)
+        self.assertEqual(parser.root.tag, 'get_tasks_response')
+        self.assertEqual(parser.root.find('task/name').text, 'foo')
+
+    def test_drop_content_of_error_response(self):
+        parser = GmpResponseParser()
+
+        self.assertTrue(
+            parser.feed(
+                b'<get_tasks_response status="400" status_text="Bogus">'
+                b'<task id="1"><name>foo</name></task>'
+                b'</get_tasks_response>'
+            )
+        )
+        self.assertTrue(parser.failed)
+        self.assertEqual(parser.root.get('status'), '400')
+        self.assertEqual(len(parser.root.find('task')), 0)
+
+    def test_prune_elements(self):
+        response = (
+            b'<get_results_response status="200" status_text="OK">'
+            b'<result id="1"><name>foo</name><nvt oid="1"/></result>'
+            b'<result id="2"><name>bar</name><nvt oid="2"/></result>'
+            b'<nvt oid="3"/>'
+            b'</get_results_response>'
+        )
+
+        parser = GmpResponseParser(['result/nvt'])
+
+        for i in range(0, len(response), 7):
+            parser.feed(response[i : i + 7])
+
+        self.assertTrue(parser.finished)
+
+        results = parser.root.findall('result')
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0].find('name').text, 'foo')
+        self.assertIsNone(results[0].find('nvt'))
+        self.assertEqual(results[1].find('name').text, 'bar')
+        self.assertIsNone(results[1].find('nvt'))
+
+        # only elements at the pruned path are dropped
+        self.assertEqual(parser.root.find('nvt').get('oid'), '3')
+
+
+class PruneResponseElementsTestCase(SimpleTestCase):
+    def test_nested_contexts(self):
+        self.assertEqual(get_pruned_paths(), frozenset())
+
+        with prune_response_elements(['result/nvt']):
+            with prune_response_elements(['result/notes']):
+                self.assertEqual(
+                    get_pruned_paths(),
+                    frozenset(['result/nvt', 'result/notes']),
+                )
+
+            self.assertEqual(get_pruned_paths(), frozenset(['result/nvt']))
+
+        self.assertEqual(get_pruned_paths(), frozenset())
+
+
+class EtreeCheckCommandTransformTestCase(SimpleTestCase):
+    def test_string_response(self):
+        transform = EtreeCheckCommandTransform()
+
+        root = transform('<get_tasks_response status="200"/>')
+
+        self.assertEqual(root.tag, 'get_tasks_response')
+
+    def test_parsed_response(self):
+        parser = GmpResponseParser()
+        parser.feed(b'<get_tasks_response status="404" status_text="Foo"/>')
+
+        transform = EtreeCheckCommandTransform()
+
+        with self.assertRaises(GvmResponseError):
+            transform(parser.root)
+
+
+class IncrementalUnixSocketConnectionTestCase(SimpleTestCase):
+    def setUp(self):
+        forget_supported_gmp()
+
+        self.gvmd = FakeGvmd()
+        self.gvmd.start()
+
+    def tearDown(self):
+        self.gvmd.stop()
+
+        forget_supported_gmp()
+
+    def test_gmp_commands(self):
+        self.gvmd.set_response(
+            'get_tasks',
+            '<get_tasks_response status="200" status_text="OK">'
+            '<task id="1"><name>foo</name></task>'
+            '</get_tasks_response>',
+        )
+        connection = IncrementalUnixSocketConnection(path=self.gvmd.path)
+
+        with Gmp(
+            connection=connection, transform=EtreeCheckCommandTransform()
+        ) as gmp:
+            gmp.authenticate('foo', 'bar')
+            response = gmp.get_tasks()
+
+        self.assertTrue(gmp.is_authenticated())
+        self.assertEqual(response.find('task/name').text, 'foo')
+        self.assertEqual(self.gvmd.commands['get_tasks'], 1)
+
+    def test_failed_authentication(self):
+        self.gvmd.set_response(
+            'authenticate',
+            '<authenticate_response status="400" '
+            'status_text="Authentication failed"/>',
+        )
+        connection = IncrementalUnixSocketConnection(path=self.gvmd.path)
+
+        with Gmp(
+            connection=connection, transform=EtreeCheckCommandTransform()
+        ) as gmp:
+            with self.assertRaises(GvmResponseError):
+                gmp.authenticate('foo', 'bar')
+
+            self.assertFalse(gmp.is_authenticated())
+
+    def test_keep_connection_after_error_response(self):
+        self.gvmd.set_response(
+            'get_tasks',
+            '<get_tasks_response status="404" status_text="Failed to find"/>',
+            attributes={'task_id': '1'},
+        )
+        connection = IncrementalUnixSocketConnection(path=self.gvmd.path)
+
+        with Gmp(
+            connection=connection, transform=EtreeCheckCommandTransform()
+        ) as gmp:
+            with self.assertRaises(GvmResponseError):
+                gmp.get_task('1')
+
+            response = gmp.get_tasks()
+
+            self.assertTrue(gmp.is_connected())
+
+        self.assertEqual(response.tag, 'get_tasks_response')
+        self.assertEqual(self.gvmd.connections, 2)
+
+    def test_prune_response_elements(self):
+        self.gvmd.set_response(
+            'get_results',
+            '<get_results_response status="200" status_text="OK">'
+            '<result id="1"><name>foo</name><nvt oid="1"/></result>'
+            '</get_results_response>',
+        )
+        connection = IncrementalUnixSocketConnection(path=self.gvmd.path)
+
+        with Gmp(
+            connection=connection, transform=EtreeCheckCommandTransform()
+        ) as gmp:
+            with prune_response_elements(['result/nvt']):
+                pruned = gmp.get_results()
+
+            complete = gmp.get_results()
+
+        self.assertEqual(pruned.find('result/name').text, 'foo')
+        self.assertIsNone(pruned.find('result/nvt'))
+        self.assertIsNotNone(complete.find('result/nvt'))
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import gzip
+
+from unittest.mock import patch
+
+from selene.gmp import forget_supported_gmp
+from selene.pool import PooledConnection, get_connection_pool
+from selene.tests import SeleneTestCase
+from selene.tests.benchmarks.fakegvmd import FakeGvmd
+
+TASKS_RESPONSE = (
+    '<get_tasks_response status="200" status_text="OK">'
+    '<task id="e4d3e2a0-1a3c-4b5e-9f3b-2f3d7c9d5e11"><name>foo</name></task>'
+    '<task_count>1<filtered>1</filtered></task_count>'
+    '</get_tasks_response>'
+)
+
+
+class ExportViewTestCase(SeleneTestCase):
+    def setUp(self):
+        forget_supported_gmp()
+
+        self.gvmd = FakeGvmd()
+        self.gvmd.start()
+
+        self.settings_override = self.settings(
+            SELENE={'GMP_SOCKET_PATH': self.gvmd.path}
+        )
+        self.settings_override.enable()
+
+    def tearDown(self):
+        super().tearDown()
+
+        self.settings_override.disable()
+        self.gvmd.stop()
+
+        forget_supported_gmp()
+
+    def test_require_authentication(self):
+        response = self.client.get('/export/tasks/')
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(self.gvmd.connections, 0)
+
+    def test_unknown_entity_type(self):
+        self.login('foo', 'bar')
+
+        response = self.client.get('/export/foos/')
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(self.gvmd.connections, 0)
+
+    def test_export_by_filter(self):
+        self.gvmd.set_response(
+            'get_tasks',
+            TASKS_RESPONSE,
+            attributes={'filter': 'name=foo', 'details': '1'},
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.client.get('/export/tasks/', {'filter': 'name=foo'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/xml')
+        self.assertEqual(
+            response['Content-Disposition'], 'attachment; filename="tasks.xml"'
+        )
+        self.assertEqual(
+            b''.join(response.streaming_content).decode('utf-8'),
+            TASKS_RESPONSE,
+        )
+
+    def test_export_by_ids(self):
+        self.gvmd.set_response(
+            'get_tasks',
+            TASKS_RESPONSE,
+            attributes={
+                'filter': 'uuid=e4d3e2a0-1a3c-4b5e-9f3b-2f3d7c9d5e11 '
+                'uuid=2c5a4c1e-0d7e-4f4e-8d6c-1b1f0f3e5a22 ',
+            },
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.client.get(
+            '/export/tasks/',
+            {
+                'id': [
+                    'e4d3e2a0-1a3c-4b5e-9f3b-2f3d7c9d5e11',
+                    '2c5a4c1e-0d7e-4f4e-8d6c-1b1f0f3e5a22',
+                ]
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            b''.join(response.streaming_content).decode('utf-8'),
+            TASKS_RESPONSE,
+        )
+
+    def test_invalid_id(self):
+        self.login('foo', 'bar')
+
+        response = self.client.get('/export/tasks/', {'id': 'foo'})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_export_gzip(self):
+        self.gvmd.set_response('get_tasks', TASKS_RESPONSE)
+
+        self.login('foo', 'bar')
+
+        response = self.client.get(
+            '/export/tasks/', HTTP_ACCEPT_ENCODING='gzip, deflate'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(
+            gzip.decompress(b''.join(response.streaming_content)).decode(
+                'utf-8'
+            ),
+            TASKS_RESPONSE,
+        )
+
+    def test_export_secinfo(self):
+        response_xml = (
+            '<get_info_response status="200" status_text="OK">'
+            '<info id="1.3.6.1.4.1.25623.1.0.1"><name>foo</name></info>'
+            '</get_info_response>'
+        )
+        self.gvmd.set_response(
+            'get_info',
+            response_xml,
+            attributes={'type': 'NVT', 'details': '1'},
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.client.get('/export/nvts/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            b''.join(response.streaming_content).decode('utf-8'), response_xml
+        )
+
+    def test_export_error(self):
+        self.gvmd.set_response(
+            'get_tasks',
+            '<get_tasks_response status="400" status_text="Bogus filter"/>',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.client.get('/export/tasks/')
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_release_connection_after_streaming(self):
+        self.gvmd.set_response('get_tasks', TASKS_RESPONSE)
+
+        self.login('foo', 'bar')
+
+        response = self.client.get('/export/tasks/')
+
+        self.assertEqual(
+            b''.join(response.streaming_content).decode('utf-8'),
+            TASKS_RESPONSE,
+        )
+        self.assertEqual(len(get_connection_pool(self.gvmd.path, None)), 1)
+
+    def test_close_connection_of_unread_response(self):
+        self.gvmd.set_response('get_tasks', TASKS_RESPONSE)
+
+        self.login('foo', 'bar')
+
+        with patch.object(
+            PooledConnection, 'close', autospec=True
+        ) as close_mock:
+            response = self.client.head('/export/tasks/')
+
+            self.assertEqual(response.status_code, 200)
+            close_mock.assert_not_called()
+
+            # the content of a HEAD response is never iterated
+            response.close()
+
+        close_mock.assert_called_once()
+        self.assertEqual(len(get_connection_pool(self.gvmd.path, None)), 0)
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase
+
+from gvm.protocols.gmpv208 import Gmp as Gmpv208
+from gvm.protocols.gmpv214 import Gmp as Gmpv214
+
+from selene.connections import prune_response_elements
+from selene.gmp import Gmp, MemoizedGmp, forget_supported_gmp
+from selene.tests import SeleneTestCase, GmpMockFactory
+
+
+class FakeConnection:
+    def __init__(self, version: str, path: str = '/foo/gvmd.sock'):
+        self.path = path
+        self.version = version
+        self.connect = MagicMock()
+        self.disconnect = MagicMock()
+        self.send = MagicMock()
+
+    def read(self):
+        return (
+            '<get_version_response status="200" status_text="OK">'
+            f'<version>{self.version}</version>'
+            '</get_version_response>'
+        )
+
+
+class GmpTestCase(SimpleTestCase):
+    def setUp(self):
+        forget_supported_gmp()
+
+    def tearDown(self):
+        forget_supported_gmp()
+
+    def test_determine_supported_gmp(self):
+        connection = FakeConnection('21.4')
+
+        with Gmp(connection) as gmp:
+            self.assertIsInstance(gmp, Gmpv214)
+
+        connection.send.assert_called_once()
+
+    def test_cache_supported_gmp(self):
+        connection = FakeConnection('21.4')
+        with Gmp(connection):
+            pass
+
+        connection2 = FakeConnection('20.08')
+        with Gmp(connection2) as gmp:
+            self.assertIsInstance(gmp, Gmpv214)
+
+        connection2.send.assert_not_called()
+        connection2.connect.assert_called_once_with()
+
+    def test_cache_per_path(self):
+        connection = FakeConnection('21.4')
+        with Gmp(connection):
+            pass
+
+        connection2 = FakeConnection('20.08', path='/bar/gvmd.sock')
+        with Gmp(connection2) as gmp:
+            self.assertIsInstance(gmp, Gmpv208)
+
+        connection2.send.assert_called_once()
+
+    def test_forget_supported_gmp(self):
+        connection = FakeConnection('21.4')
+        with Gmp(connection):
+            pass
+
+        forget_supported_gmp('/foo/gvmd.sock')
+
+        connection2 = FakeConnection('20.08')
+        with Gmp(connection2) as gmp:
+            self.assertIsInstance(gmp, Gmpv208)
+
+        connection2.send.assert_called_once()
+
+
+class MemoizedGmpTestCase(SimpleTestCase):
+    def setUp(self):
+        self.gmp = MagicMock()
+        self.gmp.get_task.side_effect = lambda **kwargs: object()
+        self.gmp.help.side_effect = lambda **kwargs: object()
+
+    def test_memoize_read_only_commands(self):
+        gmp = MemoizedGmp(self.gmp)
+
+        response1 = gmp.get_task(task_id='foo')
+        response2 = gmp.get_task(task_id='foo')
+
+        self.assertIs(response1, response2)
+        self.gmp.get_task.assert_called_once_with(task_id='foo')
+
+        response3 = gmp.help(help_type='brief')
+        response4 = gmp.help(help_type='brief')
+
+        self.assertIs(response3, response4)
+        self.gmp.help.assert_called_once_with(help_type='brief')
+
+    def test_key_by_arguments(self):
+        gmp = MemoizedGmp(self.gmp)
+
+        response1 = gmp.get_task(task_id='foo')
+        response2 = gmp.get_task(task_id='bar')
+
+        self.assertIsNot(response1, response2)
+        self.assertEqual(self.gmp.get_task.call_count, 2)
+
+    def test_key_by_pruned_paths(self):
+        gmp = MemoizedGmp(self.gmp)
+
+        with prune_response_elements(['task/preferences']):
+            response1 = gmp.get_task(task_id='foo')
+            response2 = gmp.get_task(task_id='foo')
+
+        response3 = gmp.get_task(task_id='foo')
+
+        self.assertIs(response1, response2)
+        self.assertIsNot(response1, response3)
+        self.assertEqual(self.gmp.get_task.call_count, 2)
+
+    def test_complete_response_for_pruned_paths(self):
+        gmp = MemoizedGmp(self.gmp)
+
+        response1 = gmp.get_task(task_id='foo')
+
+        with prune_response_elements(['task/preferences']):
+            response2 = gmp.get_task(task_id='foo')
+
+        self.assertIs(response1, response2)
+        self.gmp.get_task.assert_called_once_with(task_id='foo')
+
+    def test_clear_after_other_commands(self):
+        gmp = MemoizedGmp(self.gmp)
+
+        gmp.get_task(task_id='foo')
+        gmp.modify_task(task_id='foo', name='bar')
+        gmp.get_task(task_id='foo')
+
+        self.assertEqual(self.gmp.get_task.call_count, 2)
+
+    def test_clear_after_failed_command(self):
+        self.gmp.delete_task.side_effect = RuntimeError('failed')
+
+        gmp = MemoizedGmp(self.gmp)
+
+        gmp.get_task(task_id='foo')
+
+        with self.assertRaises(RuntimeError):
+            gmp.delete_task(task_id='foo')
+
+        gmp.get_task(task_id='foo')
+
+        self.assertEqual(self.gmp.get_task.call_count, 2)
+
+    def test_errors_are_not_memoized(self):
+        self.gmp.get_task.side_effect = RuntimeError('failed')
+
+        gmp = MemoizedGmp(self.gmp)
+
+        with self.assertRaises(RuntimeError):
+            gmp.get_task(task_id='foo')
+
+        with self.assertRaises(RuntimeError):
+            gmp.get_task(task_id='foo')
+
+        self.assertEqual(self.gmp.get_task.call_count, 2)
+
+    def test_unhashable_arguments(self):
+        gmp = MemoizedGmp(self.gmp)
+
+        gmp.get_task(task_id=['foo'])
+        gmp.get_task(task_id=['foo'])
+
+        self.assertEqual(self.gmp.get_task.call_count, 2)
+
+    def test_on_change(self):
+        self.gmp.delete_task.side_effect = RuntimeError('failed')
+        on_change = MagicMock()
+
+        gmp = MemoizedGmp(self.gmp, on_change=on_change)
+
+        gmp.get_task(task_id='foo')
+        gmp.help(format='xml')
+        on_change.assert_not_called()
+
+        gmp.modify_task(task_id='foo', name='bar')
+        on_change.assert_called_once_with(
+            'modify_task', task_id='foo', name='bar'
+        )
+
+        with self.assertRaises(RuntimeError):
+            gmp.delete_task(task_id='foo')
+
+        on_change.assert_called_with('delete_task', task_id='foo')
+
+
+@patch('selene.views.Gmp', new_callable=GmpMockFactory)
+class MemoizedGmpViewTestCase(SeleneTestCase):
+    def setUp(self):
+        self.task_id = '08b69003-5fc2-4037-a479-93b440211c73'
+        self.get_task_response = f'''
+            <get_tasks_response status="200" status_text="OK">
+                <task id="{self.task_id}">
+                    <name>foo</name>
+                </task>
+            </get_tasks_response>
+        '''
+
+    def test_repeated_commands_in_one_request(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response('get_task', self.get_task_response)
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                first: task(id: "{self.task_id}") {{
+                    name
+                }}
+                second: task(id: "{self.task_id}") {{
+                    id
+                }}
+            }}
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        json = response.json()
+
+        self.assertEqual(json['data']['first']['name'], 'foo')
+        self.assertEqual(json['data']['second']['id'], self.task_id)
+
+        mock_gmp.gmp_protocol.get_task.assert_called_once_with(
+            task_id=self.task_id
+        )
+
+    def test_memo_is_request_scoped(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response('get_task', self.get_task_response)
+
+        self.login('foo', 'bar')
+
+        for _ in range(2):
+            response = self.query(
+                f'query {{ task(id: "{self.task_id}") {{ name }} }}'
+            )
+            self.assertResponseNoErrors(response)
+
+        self.assertEqual(mock_gmp.gmp_protocol.get_task.call_count, 2)
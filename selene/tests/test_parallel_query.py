@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import threading
+
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from lxml import etree
+
+from selene.tests import SeleneTestCase, GmpMockFactory
+
+TASKS_RESPONSE = '''
+<get_tasks_response status="200" status_text="OK">
+    <task id="08b69003-5fc2-4037-a479-93b440211c73">
+        <name>foo</name>
+    </task>
+</get_tasks_response>
+'''
+
+TARGETS_RESPONSE = '''
+<get_targets_response status="200" status_text="OK">
+    <target id="5f8ba3a4-0d5c-4a3e-9c3a-56c6c7fb0b4a">
+        <name>bar</name>
+    </target>
+</get_targets_response>
+'''
+
+QUERY = '''
+query {
+    tasks {
+        nodes {
+            name
+        }
+    }
+    targets {
+        nodes {
+            name
+        }
+    }
+}
+'''
+
+
+@override_settings(SELENE={'PARALLEL_QUERY_FIELDS': 4})
+@patch('selene.views.Gmp', new_callable=GmpMockFactory)
+class ParallelQueryTestCase(SeleneTestCase):
+    def setUp(self):
+        self.threads = {}
+
+    def record_thread(self, name, response, barrier=None):
+        def command(*_args, **_kwargs):
+            self.threads[name] = threading.current_thread()
+            if barrier is not None:
+                # block until all fields are resolved at the same time
+                barrier.wait()
+            return etree.fromstring(response)
+
+        return command
+
+    def test_resolve_fields_concurrently(self, mock_gmp: GmpMockFactory):
+        barrier = threading.Barrier(2, timeout=5)
+        mock_gmp.gmp_protocol.get_tasks.side_effect = self.record_thread(
+            'tasks', TASKS_RESPONSE, barrier
+        )
+        mock_gmp.gmp_protocol.get_targets.side_effect = self.record_thread(
+            'targets', TARGETS_RESPONSE, barrier
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(QUERY)
+
+        self.assertResponseNoErrors(response)
+
+        json = response.json()
+
+        self.assertEqual(json['data']['tasks']['nodes'][0]['name'], 'foo')
+        self.assertEqual(json['data']['targets']['nodes'][0]['name'], 'bar')
+
+        self.assertIsNot(self.threads['tasks'], threading.current_thread())
+        self.assertIsNot(self.threads['targets'], threading.current_thread())
+        self.assertIsNot(self.threads['tasks'], self.threads['targets'])
+
+        # each field uses a connection of its own
+        self.assertEqual(mock_gmp.gmp.__enter__.call_count, 2)
+        self.assertEqual(mock_gmp.gmp_protocol.authenticate.call_count, 2)
+
+    def test_single_field_is_not_resolved_concurrently(
+        self, mock_gmp: GmpMockFactory
+    ):
+        mock_gmp.gmp_protocol.get_tasks.side_effect = self.record_thread(
+            'tasks', TASKS_RESPONSE
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query('query { tasks { nodes { name } } }')
+
+        self.assertResponseNoErrors(response)
+
+        self.assertIs(self.threads['tasks'], threading.current_thread())
+
+    def test_authentication_required(self, _mock_gmp: GmpMockFactory):
+        response = self.query(QUERY)
+
+        self.assertResponseAuthenticationRequired(response)
+
+    @override_settings(SELENE={'PARALLEL_QUERY_FIELDS': 0})
+    def test_disabled(self, mock_gmp: GmpMockFactory):
+        mock_gmp.gmp_protocol.get_tasks.side_effect = self.record_thread(
+            'tasks', TASKS_RESPONSE
+        )
+        mock_gmp.gmp_protocol.get_targets.side_effect = self.record_thread(
+            'targets', TARGETS_RESPONSE
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(QUERY)
+
+        self.assertResponseNoErrors(response)
+
+        self.assertIs(self.threads['tasks'], threading.current_thread())
+        self.assertIs(self.threads['targets'], threading.current_thread())
+
+        mock_gmp.gmp.__enter__.assert_called_once()
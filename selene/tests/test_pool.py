@@ -0,0 +1,565 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import caches
+from django.test import SimpleTestCase
+
+from gvm.errors import GvmError, GvmResponseError
+
+from selene.pool import (
+    CREDENTIALS_GENERATION_KEY,
+    DEFAULT_CREDENTIALS_CACHE,
+    GmpConnectionPool,
+    SessionKey,
+    get_credentials_generation,
+    revoke_credentials,
+)
+from selene.tests import SeleneTestCase, GmpMockFactory
+
+
+class FakeGmp:
+    def __init__(self):
+        self.connected = False
+
+    def __enter__(self):
+        self.connected = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disconnect()
+
+    def is_connected(self):
+        return self.connected
+
+    def disconnect(self):
+        self.connected = False
+
+
+class GmpConnectionPoolTestCase(SimpleTestCase):
+    def setUp(self):
+        self.connect = MagicMock(side_effect=FakeGmp)
+
+    def test_acquire_new_connection(self):
+        pool = GmpConnectionPool(self.connect)
+
+        connection = pool.acquire()
+
+        self.assertTrue(connection.gmp.is_connected())
+        self.connect.assert_called_once_with()
+
+    def test_reuse_released_connection(self):
+        pool = GmpConnectionPool(self.connect)
+
+        connection = pool.acquire()
+        pool.release(connection)
+
+        self.assertEqual(len(pool), 1)
+
+        connection2 = pool.acquire()
+
+        self.assertIs(connection2, connection)
+        self.assertEqual(len(pool), 0)
+        self.connect.assert_called_once_with()
+
+    def test_keys_are_separated(self):
+        pool = GmpConnectionPool(self.connect)
+
+        connection = pool.acquire('foo')
+        pool.release(connection, 'foo')
+
+        connection2 = pool.acquire('bar')
+
+        self.assertIsNot(connection2, connection)
+        self.assertEqual(self.connect.call_count, 2)
+
+        connection3 = pool.acquire('foo')
+
+        self.assertIs(connection3, connection)
+
+    def test_size_limit(self):
+        pool = GmpConnectionPool(self.connect, size=1)
+
+        connection1 = pool.acquire()
+        connection2 = pool.acquire()
+
+        pool.release(connection1)
+        pool.release(connection2)
+
+        self.assertEqual(len(pool), 1)
+        self.assertTrue(connection1.gmp.is_connected())
+        self.assertFalse(connection2.gmp.is_connected())
+
+    def test_disabled_pool(self):
+        pool = GmpConnectionPool(self.connect, size=0)
+
+        connection = pool.acquire()
+        pool.release(connection)
+
+        self.assertEqual(len(pool), 0)
+        self.assertFalse(connection.gmp.is_connected())
+
+    @patch('selene.pool.time')
+    def test_idle_timeout(self, time_mock):
+        time_mock.monotonic.return_value = 100
+        pool = GmpConnectionPool(self.connect, idle_timeout=10)
+
+        connection = pool.acquire()
+        pool.release(connection)
+
+        time_mock.monotonic.return_value = 111
+
+        connection2 = pool.acquire()
+
+        self.assertIsNot(connection2, connection)
+        self.assertFalse(connection.gmp.is_connected())
+
+    @patch('selene.pool.time')
+    def test_max_lifetime(self, time_mock):
+        time_mock.monotonic.return_value = 100
+        pool = GmpConnectionPool(self.connect, idle_timeout=10, max_lifetime=20)
+
+        connection = pool.acquire()
+
+        time_mock.monotonic.return_value = 121
+
+        pool.release(connection)
+
+        self.assertEqual(len(pool), 0)
+        self.assertFalse(connection.gmp.is_connected())
+
+    def test_broken_connection_is_not_reused(self):
+        pool = GmpConnectionPool(self.connect)
+
+        connection = pool.acquire()
+        pool.release(connection)
+
+        connection.gmp.disconnect()
+
+        connection2 = pool.acquire()
+
+        self.assertIsNot(connection2, connection)
+        self.assertEqual(self.connect.call_count, 2)
+
+    def test_use_unauthenticated_connection_for_key(self):
+        pool = GmpConnectionPool(self.connect)
+
+        connection = pool.acquire()
+        pool.release(connection)
+
+        connection2 = pool.acquire('foo')
+
+        self.assertIs(connection2, connection)
+        self.assertIsNone(connection2.key)
+
+        pool.release(connection2, 'foo')
+
+        connection3 = pool.acquire()
+
+        self.assertIsNot(connection3, connection)
+
+    def test_close_connection_of_other_generation(self):
+        pool = GmpConnectionPool(self.connect)
+
+        connection = pool.acquire('foo', generation='1')
+        connection.generation = '1'
+        pool.release(connection, 'foo')
+
+        connection2 = pool.acquire('foo', generation='1')
+
+        self.assertIs(connection2, connection)
+
+        pool.release(connection2, 'foo')
+
+        connection3 = pool.acquire('foo', generation='2')
+
+        self.assertIsNot(connection3, connection)
+        self.assertFalse(connection.gmp.is_connected())
+        self.assertEqual(len(pool), 0)
+
+    @patch('selene.pool.time')
+    def test_release_with_idle_timeout(self, time_mock):
+        time_mock.monotonic.return_value = 100
+        pool = GmpConnectionPool(self.connect, idle_timeout=60)
+
+        connection = pool.acquire()
+        pool.release(connection, 'foo', idle_timeout=10)
+
+        time_mock.monotonic.return_value = 111
+
+        connection2 = pool.acquire('foo')
+
+        self.assertIsNot(connection2, connection)
+        self.assertFalse(connection.gmp.is_connected())
+
+    def test_evict(self):
+        pool = GmpConnectionPool(self.connect)
+
+        connection1 = pool.acquire()
+        connection2 = pool.acquire()
+        connection3 = pool.acquire()
+        connection3.key = SessionKey('foo', '3')
+
+        pool.release(connection1, SessionKey('foo', '1'))
+        pool.release(connection2, SessionKey('bar', '2'))
+
+        pool.evict(lambda key: key.username == 'foo')
+
+        self.assertEqual(len(pool), 1)
+        self.assertFalse(connection1.gmp.is_connected())
+        self.assertTrue(connection2.gmp.is_connected())
+
+        # borrowed connections are closed on release
+        self.assertTrue(connection3.gmp.is_connected())
+
+        pool.release(connection3, SessionKey('foo', '3'))
+
+        self.assertFalse(connection3.gmp.is_connected())
+
+    def test_clear(self):
+        pool = GmpConnectionPool(self.connect)
+
+        connection = pool.acquire()
+        pool.release(connection)
+
+        pool.clear()
+
+        self.assertEqual(len(pool), 0)
+        self.assertFalse(connection.gmp.is_connected())
+
+
+@patch('selene.views.Gmp', new_callable=GmpMockFactory)
+class SeleneViewConnectionPoolTestCase(SeleneTestCase):
+    def setUp(self):
+        # the default settings use a cache shared by all worker processes
+        self.cache = caches[DEFAULT_CREDENTIALS_CACHE]
+        self.cache.clear()
+
+    def tearDown(self):
+        super().tearDown()
+
+        self.cache.clear()
+
+    def test_reuse_connection(self, mock_gmp: GmpMockFactory):
+        self.login('foo', 'bar')
+
+        for _ in range(3):
+            response = self.query('query { tasks { nodes { id } } }')
+            self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp.__enter__.assert_called_once()
+
+    def test_authenticate_once_per_session_with_many_queries(
+        self, mock_gmp: GmpMockFactory
+    ):
+        self.login('foo', 'bar')
+
+        for _ in range(20):
+            response = self.query('query { tasks { nodes { id } } }')
+            self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp_protocol.authenticate.assert_called_once_with('foo', 'bar')
+        mock_gmp.gmp.__enter__.assert_called_once()
+        mock_gmp.gmp_protocol.disconnect.assert_not_called()
+
+    def test_no_session_reuse_without_credentials_cache(
+        self, mock_gmp: GmpMockFactory
+    ):
+        with self.settings(SELENE={'GMP_CREDENTIALS_CACHE': None}):
+            self.login('foo', 'bar')
+
+            for _ in range(3):
+                response = self.query('query { tasks { nodes { id } } }')
+                self.assertResponseNoErrors(response)
+
+        self.assertEqual(mock_gmp.gmp_protocol.authenticate.call_count, 3)
+        self.assertEqual(mock_gmp.gmp_protocol.disconnect.call_count, 3)
+
+    def test_authenticate_once_per_session(self, mock_gmp: GmpMockFactory):
+        self.login('foo', 'bar')
+
+        for _ in range(3):
+            response = self.query('query { tasks { nodes { id } } }')
+            self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp_protocol.authenticate.assert_called_once_with('foo', 'bar')
+
+    def test_authenticate_after_login(self, mock_gmp: GmpMockFactory):
+        response = self.query(
+            'mutation { login(username: "foo", password: "bar") { ok } }'
+        )
+        self.assertResponseNoErrors(response)
+
+        response = self.query('query { tasks { nodes { id } } }')
+        self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp_protocol.authenticate.assert_called_once_with('foo', 'bar')
+        mock_gmp.gmp.__enter__.assert_called_once()
+
+    def test_authenticate_for_different_sessions(
+        self, mock_gmp: GmpMockFactory
+    ):
+        self.login('foo', 'bar')
+
+        response = self.query('query { tasks { nodes { id } } }')
+        self.assertResponseNoErrors(response)
+
+        # start a new session
+        self.client.cookies.clear()
+        self.login('foo', 'bar')
+
+        response = self.query('query { tasks { nodes { id } } }')
+        self.assertResponseNoErrors(response)
+
+        self.assertEqual(mock_gmp.gmp_protocol.authenticate.call_count, 2)
+
+    def test_authenticate_again_after_logout(self, mock_gmp: GmpMockFactory):
+        self.login('foo', 'bar')
+
+        response = self.query('query { tasks { nodes { id } } }')
+        self.assertResponseNoErrors(response)
+
+        response = self.query('mutation { logout { ok } }')
+        self.assertResponseNoErrors(response)
+
+        self.client.cookies.clear()
+        self.login('foo', 'bar')
+
+        response = self.query('query { tasks { nodes { id } } }')
+        self.assertResponseNoErrors(response)
+
+        self.assertEqual(mock_gmp.gmp_protocol.authenticate.call_count, 2)
+
+    def test_discard_connection_after_logout(self, mock_gmp: GmpMockFactory):
+        self.login('foo', 'bar')
+
+        response = self.query('query { tasks { nodes { id } } }')
+        self.assertResponseNoErrors(response)
+
+        response = self.query('mutation { logout { ok } }')
+        self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp_protocol.disconnect.assert_called_once_with()
+
+        self.client.cookies.clear()
+        self.login('foo', 'bar')
+
+        response = self.query('query { tasks { nodes { id } } }')
+        self.assertResponseNoErrors(response)
+
+        self.assertEqual(mock_gmp.gmp.__enter__.call_count, 2)
+
+    def test_authenticate_again_after_revocation(
+        self, mock_gmp: GmpMockFactory
+    ):
+        self.login('foo', 'bar')
+
+        response = self.query('query { tasks { nodes { id } } }')
+        self.assertResponseNoErrors(response)
+
+        # another worker process has changed a user
+        generation = get_credentials_generation(self.cache)
+        self.cache.set(CREDENTIALS_GENERATION_KEY, 'other', None)
+
+        self.assertNotEqual(get_credentials_generation(self.cache), generation)
+
+        response = self.query('query { tasks { nodes { id } } }')
+        self.assertResponseNoErrors(response)
+
+        self.assertEqual(mock_gmp.gmp_protocol.authenticate.call_count, 2)
+        mock_gmp.gmp_protocol.disconnect.assert_called_once_with()
+
+    def test_reuse_connection_of_login_after_revocation(
+        self, mock_gmp: GmpMockFactory
+    ):
+        revoke_credentials(self.cache)
+
+        response = self.query(
+            'mutation { login(username: "foo", password: "bar") { ok } }'
+        )
+        self.assertResponseNoErrors(response)
+
+        response = self.query('query { tasks { nodes { id } } }')
+        self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp_protocol.authenticate.assert_called_once_with('foo', 'bar')
+
+    def test_revoke_after_deleting_users(self, mock_gmp: GmpMockFactory):
+        user_id = 'f3ba5a4c-4ef2-4a7e-9a4c-8b1c1e7d2f00'
+        mock_gmp.mock_response(
+            'get_users',
+            f'''
+            <get_users_response status="200" status_text="OK">
+                <user id="{user_id}"><name>bar</name></user>
+            </get_users_response>
+            ''',
+        )
+
+        self.login('foo', 'bar')
+
+        generation = get_credentials_generation(self.cache)
+
+        response = self.query(
+            f'''
+            mutation {{
+                deleteUsersByIds(input: {{ids: ["{user_id}"]}}) {{
+                    ok
+                }}
+            }}
+            '''
+        )
+        self.assertResponseNoErrors(response)
+
+        self.assertNotEqual(get_credentials_generation(self.cache), generation)
+
+        response = self.query('query { tasks { nodes { id } } }')
+        self.assertResponseNoErrors(response)
+
+        self.assertEqual(mock_gmp.gmp_protocol.authenticate.call_count, 2)
+
+    def test_revoke_after_changing_password(self, mock_gmp: GmpMockFactory):
+        self.login('foo', 'bar')
+
+        response = self.query('query { tasks { nodes { id } } }')
+        self.assertResponseNoErrors(response)
+
+        generation = get_credentials_generation(self.cache)
+
+        response = self.query(
+            '''
+            mutation {
+                modifyUserSettingByName(name: "Password", value: "baz") {
+                    ok
+                }
+            }
+            '''
+        )
+        self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp_protocol.modify_setting.assert_called_with(
+            name='Password', value='baz'
+        )
+        self.assertNotEqual(get_credentials_generation(self.cache), generation)
+        # the connection authenticated with the old password is closed
+        mock_gmp.gmp_protocol.disconnect.assert_called()
+
+        self.login('foo', 'baz')
+
+        response = self.query('query { tasks { nodes { id } } }')
+        self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp_protocol.authenticate.assert_called_with('foo', 'baz')
+
+    def test_keep_credentials_after_changing_settings(
+        self, mock_gmp: GmpMockFactory
+    ):
+        self.login('foo', 'bar')
+
+        generation = get_credentials_generation(self.cache)
+
+        response = self.query(
+            '''
+            mutation {
+                modifyUserSetting(
+                    id: "5f5a8712-8017-11e1-8556-406186ea4fc5",
+                    value: "20"
+                ) {
+                    ok
+                }
+            }
+            '''
+        )
+        self.assertResponseNoErrors(response)
+
+        self.assertEqual(get_credentials_generation(self.cache), generation)
+        mock_gmp.gmp_protocol.disconnect.assert_not_called()
+
+    def test_revoke_credentials(self, _mock_gmp: GmpMockFactory):
+        cache = self.cache
+
+        revoke_credentials(cache)
+        generation = get_credentials_generation(cache)
+
+        self.assertIsNotNone(generation)
+
+        revoke_credentials(cache)
+
+        self.assertNotEqual(get_credentials_generation(cache), generation)
+        self.assertIsNone(get_credentials_generation(None))
+
+
+@patch('selene.views.Gmp', new_callable=GmpMockFactory)
+class SeleneViewLazyConnectionTestCase(SeleneTestCase):
+    def test_current_user_does_not_connect(self, mock_gmp: GmpMockFactory):
+        self.login('foo', 'bar')
+
+        response = self.query('query { currentUser { username } }')
+        self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp.__enter__.assert_not_called()
+        mock_gmp.gmp_protocol.authenticate.assert_not_called()
+
+    def test_logout_does_not_connect(self, mock_gmp: GmpMockFactory):
+        self.login('foo', 'bar')
+
+        response = self.query('mutation { logout { ok } }')
+        self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp.__enter__.assert_not_called()
+
+    def test_introspection_does_not_connect(self, mock_gmp: GmpMockFactory):
+        response = self.query('query { __schema { queryType { name } } }')
+        self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp.__enter__.assert_not_called()
+
+    def test_connect_on_first_gmp_usage(self, mock_gmp: GmpMockFactory):
+        self.login('foo', 'bar')
+
+        response = self.query(
+            'query { currentUser { username } tasks { nodes { id } } }'
+        )
+        self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp.__enter__.assert_called_once()
+        mock_gmp.gmp_protocol.authenticate.assert_called_once_with('foo', 'bar')
+
+    def test_failed_authentication(self, mock_gmp: GmpMockFactory):
+        mock_gmp.gmp_protocol.authenticate.side_effect = GvmResponseError(
+            status='400', message='Authentication failed'
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query('query { tasks { nodes { id } } }')
+
+        self.assertEqual(response.status_code, 403)
+        mock_gmp.gmp_protocol.disconnect.assert_called_once_with()
+
+    def test_connection_error(self, mock_gmp: GmpMockFactory):
+        mock_gmp.gmp_protocol.authenticate.side_effect = GvmError(
+            'Remote closed the connection'
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query('query { tasks { nodes { id } } }')
+
+        self.assertEqual(response.status_code, 500)
+        mock_gmp.gmp_protocol.disconnect.assert_called_once_with()
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import base64
+
+from django.test import SimpleTestCase
+
+from gvm.connections import UnixSocketConnection
+from gvm.errors import GvmError, GvmResponseError, GvmServerError
+
+from selene.streaming import (
+    Base64Decoder,
+    ReportContentStream,
+    check_response_status,
+)
+from selene.tests.benchmarks.fakegvmd import FakeGvmd
+
+
+class Base64DecoderTestCase(SimpleTestCase):
+    def test_decode_pieces(self):
+        content = bytes(range(256))
+        encoded = base64.encodebytes(content).decode('ascii')
+
+        decoder = Base64Decoder()
+        decoded = b''.join(
+            decoder.decode(encoded[i : i + 7])
+            for i in range(0, len(encoded), 7)
+        )
+        decoder.finish()
+
+        self.assertEqual(decoded, content)
+
+    def test_incomplete_data(self):
+        decoder = Base64Decoder()
+        decoder.decode('Zm9vY')
+
+        with self.assertRaises(GvmError):
+            decoder.finish()
+
+
+class CheckResponseStatusTestCase(SimpleTestCase):
+    def test_ok(self):
+        check_response_status({'status': '200', 'status_text': 'OK'})
+
+    def test_errors(self):
+        with self.assertRaises(GvmResponseError):
+            check_response_status({'status': '404', 'status_text': 'Failed'})
+
+        with self.assertRaises(GvmServerError):
+            check_response_status({'status': '503', 'status_text': 'Down'})
+
+        with self.assertRaises(GvmServerError):
+            check_response_status({})
+
+
+class ReportContentStreamTestCase(SimpleTestCase):
+    def setUp(self):
+        self.gvmd = FakeGvmd()
+        self.gvmd.start()
+
+        self.connection = UnixSocketConnection(path=self.gvmd.path)
+        self.connection.connect()
+
+    def tearDown(self):
+        self.connection.disconnect()
+        self.gvmd.stop()
+
+    def test_stream_in_small_chunks(self):
+        self.gvmd.set_response(
+            'get_reports',
+            '<get_reports_response status="200" status_text="OK">'
+            '<report id="1" content_type="text/plain" extension="txt">'
+            '<report_format id="2"><name>TXT</name></report_format>'
+            'Zm9v\nYmFy'
+            '</report>'
+            '<report_count>1<filtered>1</filtered></report_count>'
+            '</get_reports_response>',
+        )
+
+        stream = ReportContentStream(self.connection, read_size=16)
+        stream.send('<get_reports report_id="1"/>')
+        stream.read_header()
+
+        self.assertEqual(stream.content_type, 'text/plain')
+        self.assertEqual(stream.extension, 'txt')
+        self.assertEqual(b''.join(stream), b'foobar')
+        self.assertTrue(stream.finished)
+
+    def test_fail_early(self):
+        self.gvmd.set_response(
+            'get_reports',
+            '<get_reports_response status="400" status_text="Bogus"/>',
+        )
+
+        stream = ReportContentStream(self.connection)
+        stream.send('<get_reports report_id="1"/>')
+
+        with self.assertRaises(GvmResponseError):
+            stream.read_header()
+
+    def test_no_report(self):
+        self.gvmd.set_response(
+            'get_reports',
+            '<get_reports_response status="200" status_text="OK">'
+            '<report_count>0<filtered>0</filtered></report_count>'
+            '</get_reports_response>',
+        )
+
+        stream = ReportContentStream(self.connection)
+        stream.send('<get_reports report_id="1"/>')
+
+        with self.assertRaises(GvmError):
+            stream.read_header()
@@ -275,6 +275,19 @@ class GetSubelementTestCase(TestCase):
         self.assertIsNotNone(subelement)
         self.assertEqual(subelement.tag, 'bar')
 
+    def test_first_subelement(self):
+        element = et.fromstring(
+            "<foo><!-- bar --><bar>1</bar><bar>2</bar></foo>"
+        )
+
+        self.assertEqual(get_subelement(element, 'bar').text, '1')
+
+    def test_subelement_path(self):
+        element = et.fromstring("<foo><bar><baz>ipsum</baz></bar></foo>")
+
+        self.assertEqual(get_subelement(element, 'bar/baz').text, 'ipsum')
+        self.assertIsNone(get_subelement(element, 'baz'))
+
 
 class CsvToListTestCase(TestCase):
     def test_none(self):
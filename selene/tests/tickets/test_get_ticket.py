@@ -20,7 +20,7 @@ from unittest.mock import patch
 
 from selene.tests import SeleneTestCase, GmpMockFactory
 
-from selene.tests.entity import make_test_get_entity
+from selene.tests.entity import make_test_get_entity, make_test_load_entities
 
 
 @patch('selene.views.Gmp', new_callable=GmpMockFactory)
@@ -169,3 +169,4 @@ class TicketTestCase(SeleneTestCase):
 class TicketGetEntityTestCase(SeleneTestCase):
     gmp_name = 'ticket'
     test_get_entity = make_test_get_entity(gmp_name)
+    test_load_entities = make_test_load_entities(gmp_name)
@@ -266,6 +266,34 @@ class ModifyUserTestCase(SeleneTestCase):
 
         mock_gmp.gmp_protocol.modify_user.assert_called_once()
 
+    def test_modify_user_set_password_reauthenticates(
+        self, mock_gmp: GmpMockFactory
+    ):
+        mock_gmp.mock_response('get_user', self.get_users_response)
+
+        self.login('allmodtest1fr4', 'bar')
+
+        response = self.query(
+            f'''
+            mutation {{
+                modifyUserSetPassword(input: {{
+                    id: "{self.id1}",
+                    password: "{self.password}"
+                }}) {{
+                    ok
+                }}
+            }}
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        response = self.query('query { tasks { nodes { id } } }')
+
+        self.assertResponseNoErrors(response)
+
+        self.assertEqual(mock_gmp.gmp_protocol.authenticate.call_count, 2)
+
     def test_modify_user_set_auth_src(self, mock_gmp: GmpMockFactory):
         mock_gmp.mock_response('get_user', self.get_users_response)
 
@@ -296,6 +324,34 @@ class ModifyUserTestCase(SeleneTestCase):
 
         mock_gmp.gmp_protocol.modify_user.assert_called_once()
 
+    def test_modify_user_set_auth_src_reauthenticates(
+        self, mock_gmp: GmpMockFactory
+    ):
+        mock_gmp.mock_response('get_user', self.get_users_response)
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            mutation {{
+                modifyUserSetAuthSource(input: {{
+                    id: "{self.id1}",
+                    authSource: FILE,
+                }}) {{
+                    ok
+                }}
+            }}
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        response = self.query('query { tasks { nodes { id } } }')
+
+        self.assertResponseNoErrors(response)
+
+        self.assertEqual(mock_gmp.gmp_protocol.authenticate.call_count, 2)
+
     def test_modify_user_set_ifaces_allow(self, mock_gmp: GmpMockFactory):
         mock_gmp.mock_response('get_user', self.get_users_response)
 
@@ -146,3 +146,33 @@ class FilterStringTestCase(unittest.TestCase):
         self.assertEqual(
             str(filter_string), "first=1 foo=bar first=123 first=321"
         )
+
+    def test_rows(self):
+        filter_string = parse_filter_string('foo=bar rows=10')
+
+        self.assertEqual(filter_string.rows, 10)
+
+    def test_rows_all(self):
+        filter_string = parse_filter_string('rows=-1 foo=bar')
+
+        self.assertEqual(filter_string.rows, -1)
+
+    def test_rows_last_term(self):
+        filter_string = parse_filter_string('rows=1 foo=bar').add_rows(123)
+
+        self.assertEqual(filter_string.rows, 123)
+
+    def test_no_rows(self):
+        self.assertIsNone(parse_filter_string('irows=1 foo=bar').rows)
+        self.assertIsNone(parse_filter_string('rows=abc').rows)
+        self.assertIsNone(parse_filter_string(None).rows)
+
+    def test_first(self):
+        filter_string = parse_filter_string('foo=bar first=21 rows=10')
+
+        self.assertEqual(filter_string.first, 21)
+
+    def test_no_first(self):
+        self.assertIsNone(parse_filter_string('rows=1 foo=bar').first)
+        self.assertIsNone(parse_filter_string('first=abc').first)
+        self.assertIsNone(parse_filter_string(None).first)
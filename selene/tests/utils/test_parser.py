@@ -16,6 +16,8 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import datetime
+
 from unittest import TestCase
 
 from uuid import UUID
@@ -25,6 +27,7 @@ from selene.schema.parser import (
     parse_datetime,
     parse_uuid,
     parse_int,
+    parse_nvt_tags,
     parse_yes_no,
 )
 
@@ -61,6 +64,56 @@ class ParseDateTimeTestCase(TestCase):
         self.assertEqual(dt.second, 21)
         self.assertEqual(dt.tzinfo.tzname(dt), 'UTC')
 
+    def test_time_zone_offset(self):
+        dt = parse_datetime('2020-01-15T11:30:10+01:00')
+        self.assertEqual(
+            dt,
+            datetime.datetime(
+                2020,
+                1,
+                15,
+                11,
+                30,
+                10,
+                tzinfo=datetime.timezone(datetime.timedelta(hours=1)),
+            ),
+        )
+
+        dt = parse_datetime('2020-01-15T11:30:10-05:30')
+        self.assertEqual(
+            dt.utcoffset(), -datetime.timedelta(hours=5, minutes=30)
+        )
+
+    def test_other_formats(self):
+        dt = parse_datetime('2020-11-20T02:30:00.000+0000')
+        self.assertEqual(
+            dt,
+            datetime.datetime(
+                2020, 11, 20, 2, 30, tzinfo=datetime.timezone.utc
+            ),
+        )
+
+        dt = parse_datetime('2020-1-8 14:36:21Z')
+        self.assertEqual(
+            dt,
+            datetime.datetime(
+                2020, 1, 8, 14, 36, 21, tzinfo=datetime.timezone.utc
+            ),
+        )
+
+    def test_invalid_datetime(self):
+        self.assertIsNone(parse_datetime('2020-01-08T14:36:2xZ'))
+        self.assertIsNone(parse_datetime('2020-01-15T11:30:10+01:00 foo'))
+
+        with self.assertRaises(ValueError):
+            parse_datetime('2020-13-08T14:36:21Z')
+
+    def test_memoize(self):
+        self.assertIs(
+            parse_datetime('2020-01-08T14:36:21Z'),
+            parse_datetime('2020-01-08T14:36:21Z'),
+        )
+
 
 class ParseUuidTestCase(TestCase):
     def test_none(self):
@@ -76,6 +129,12 @@ class ParseUuidTestCase(TestCase):
         with self.assertRaises(ValueError):
             parse_uuid('foo')
 
+    def test_memoize(self):
+        self.assertIs(
+            parse_uuid('75d23ba8-3d23-11ea-858e-b7c2cb43e815'),
+            parse_uuid('75d23ba8-3d23-11ea-858e-b7c2cb43e815'),
+        )
+
 
 class ParseIntTestCase(TestCase):
     def test_none(self):
@@ -117,3 +176,29 @@ class ParseYesNoTestCase(TestCase):
         self.assertFalse(parse_yes_no(1))
         self.assertFalse(parse_yes_no(True))
         self.assertFalse(parse_yes_no(False))
+
+
+class ParseNvtTagsTestCase(TestCase):
+    def test_none(self):
+        self.assertEqual(parse_nvt_tags(None), {})
+        self.assertEqual(parse_nvt_tags(''), {})
+
+    def test_tags(self):
+        self.assertEqual(
+            parse_nvt_tags(
+                'cvss_base_vector=AV:N/AC:L|summary=foo=bar| insight=baz '
+            ),
+            {
+                'cvss_base_vector': 'AV:N/AC:L',
+                'summary': 'foo=bar',
+                'insight': 'baz',
+            },
+        )
+
+    def test_first_tag_wins(self):
+        self.assertEqual(
+            parse_nvt_tags('summary=foo|summary=bar'), {'summary': 'foo'}
+        )
+
+    def test_ignore_tags_without_value(self):
+        self.assertEqual(parse_nvt_tags('foo|summary=bar|'), {'summary': 'bar'})
@@ -20,10 +20,23 @@ from django.urls import path
 
 from django.views.generic.base import RedirectView
 
-from selene.views import main, GraphqlDocView
+from selene.views import (
+    main,
+    ExportView,
+    GraphqlDocView,
+    ReportDownloadView,
+)
 
 urlpatterns = [  # pylint: disable=invalid-name
     path('', RedirectView.as_view(pattern_name='selene-graphql')),
     path('graphql/', main(), name='selene-graphql'),
     path('docs/', GraphqlDocView.as_view(), name='selene-graphql-docs'),
+    path(
+        'reports/<uuid:report_id>/download/',
+        ReportDownloadView.as_view(),
+        name='selene-report-download',
+    ),
+    path(
+        'export/<str:export_name>/', ExportView.as_view(), name='selene-export'
+    ),
 ]
@@ -16,7 +16,10 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Dict, Tuple
+import threading
+
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import graphdoc
 
@@ -24,55 +27,427 @@ from graphene_django.views import GraphQLView
 from graphql.error import GraphQLError
 
 from django.conf import settings
-from django.http import HttpResponse
+from django.contrib.sessions.backends.base import SessionBase
+from django.core.cache import caches
+from django.http import (
+    Http404,
+    HttpResponse,
+    HttpResponseBadRequest,
+    StreamingHttpResponse,
+)
+from django.utils.cache import patch_vary_headers
 from django.views import View
 
-from gvm.connections import UnixSocketConnection
 from gvm.errors import GvmError, GvmResponseError, GvmClientError
-from gvm.protocols.gmp import Gmp
-from gvm.transforms import EtreeCheckCommandTransform
 
+from selene.cache import (
+    DEFAULT_ENTITY_CACHE_TIMEOUT,
+    DEFAULT_SECINFO_CACHE_TIMEOUT,
+    DEFAULT_SECINFO_FEED_CHECK_INTERVAL,
+    EntityCachedGmp,
+    SecInfoCachedGmp,
+)
+from selene.connections import (
+    EtreeCheckCommandTransform,
+    IncrementalUnixSocketConnection,
+)
 from selene.errors import SeleneError, AuthenticationRequired
+from selene.executor import ParallelQueryExecutor
+from selene.gmp import Gmp, MemoizedGmp, forget_supported_gmp
+from selene.pool import (
+    DEFAULT_CREDENTIALS_CACHE,
+    DEFAULT_POOL_IDLE_TIMEOUT,
+    DEFAULT_POOL_MAX_LIFETIME,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_SESSION_IDLE_TIMEOUT,
+    GmpConnectionPool,
+    PooledConnection,
+    SessionKey,
+    changes_credentials,
+    evict_session_connections,
+    get_connection_pool,
+    get_credentials_generation,
+    revoke_credentials,
+)
 from selene.schema import schema
+from selene.schema.capabilities import (
+    DEFAULT_CAPABILITIES_CACHE_TIMEOUT,
+    CapabilitiesCache,
+    changes_capabilities,
+)
+from selene.schema.entities import (
+    ExportCommand,
+    get_export_command,
+    get_export_filter_by_ids,
+)
+from selene.schema.parser import parse_uuid
+from selene.schema.reports.cache import (
+    DEFAULT_REPORT_CACHE_MAX_SIZE,
+    ReportCache,
+)
+from selene.streaming import (
+    GmpResponseStream,
+    ReportContentStream,
+    StreamContent,
+    XmlResponseStream,
+    build_gmp_command,
+    get_gvm_connection,
+    gzip_chunks,
+)
+
+DEFAULT_SETTINGS = {
+    'GMP_SOCKET_PATH': '/var/run/gvmd.sock',
+    'GMP_POOL_SIZE': DEFAULT_POOL_SIZE,
+    'GMP_POOL_IDLE_TIMEOUT': DEFAULT_POOL_IDLE_TIMEOUT,
+    'GMP_POOL_MAX_LIFETIME': DEFAULT_POOL_MAX_LIFETIME,
+    'GMP_SESSION_IDLE_TIMEOUT': DEFAULT_SESSION_IDLE_TIMEOUT,
+    'GMP_CREDENTIALS_CACHE': DEFAULT_CREDENTIALS_CACHE,
+    'PARALLEL_QUERY_FIELDS': 0,
+    'SECINFO_CACHE': None,
+    'SECINFO_CACHE_TIMEOUT': DEFAULT_SECINFO_CACHE_TIMEOUT,
+    'SECINFO_FEED_CHECK_INTERVAL': DEFAULT_SECINFO_FEED_CHECK_INTERVAL,
+    'SECINFO_COALESCE': True,
+    'SECINFO_LOCK_DIR': None,
+    'SECINFO_SHARED': False,
+    'ENTITY_CACHE': None,
+    'ENTITY_CACHE_TIMEOUT': DEFAULT_ENTITY_CACHE_TIMEOUT,
+    'REPORT_CACHE_DIR': None,
+    'REPORT_CACHE_MAX_SIZE': DEFAULT_REPORT_CACHE_MAX_SIZE,
+    'CAPABILITIES_CACHE': None,
+    'CAPABILITIES_CACHE_TIMEOUT': DEFAULT_CAPABILITIES_CACHE_TIMEOUT,
+}
+
+
+def create_gmp(socket_path: str, transform: Callable[[str], Any]) -> Gmp:
+    connection = IncrementalUnixSocketConnection(path=socket_path)
+    return Gmp(connection=connection, transform=transform)
+
+
+def get_session_key(request) -> Optional[SessionKey]:
+    username = request.session.get('username')
+    if not username:
+        return None
+
+    if request.session.session_key is None:
+        # a new session (e.g. directly after the login) gets its key when
+        # being saved
+        request.session.save()
+
+    return SessionKey(username, request.session.session_key)
+
+
+class LazyGmpConnector:
+    """Borrow GMP connections from the pool on first usage
+
+    Many requests like querying the current user, logging out or loading
+    GraphiQL don't need to talk to gvmd at all. Therefore a connection is
+    only acquired and authenticated when a resolver accesses the gmp instance
+    of the request for the first time.
+
+    A GMP connection must not be used by several threads at once. If fields
+    are resolved concurrently each thread gets a connection of its own.
+
+    Errors are stored and re-raised on every further access. They are
+    evaluated by the view after the query has been executed.
+
+    Pooled connections authenticated for an outdated generation of the
+    credentials are not reused. The current generation is read from the
+    credentials cache once per request. Without a credentials cache the
+    connections authenticated for a session are closed after the request
+    because their revocation couldn't be seen by other worker processes.
+    """
+
+    def __init__(
+        self,
+        pool: GmpConnectionPool,
+        session_key: Optional[SessionKey],
+        session: SessionBase,
+        *,
+        credentials_cache: Any = None,
+    ):
+        self.pool = pool
+        self.session_key = session_key
+        self.session = session
+        self.credentials_cache = credentials_cache
+
+        self.connections: List[PooledConnection] = []
+        self.connection_error: Optional[Exception] = None
+        self.authentication_error: Optional[GvmResponseError] = None
+        self.is_broken = False
+
+        self._generation: Optional[str] = None
+        self._generation_loaded = False
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def get_gmp(self) -> Gmp:
+        if self.authentication_error is not None:
+            raise self.authentication_error
+        if self.connection_error is not None:
+            raise self.connection_error
+
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._connect()
+            self._local.connection = connection
+
+        return connection.gmp
+
+    def _get_generation(self) -> Optional[str]:
+        with self._lock:
+            if not self._generation_loaded:
+                self._generation = get_credentials_generation(
+                    self.credentials_cache
+                )
+                self._generation_loaded = True
+            return self._generation
+
+    def _connect(self) -> PooledConnection:
+        # read before authenticating. a later revocation must not be missed.
+        generation = self._get_generation()
+
+        try:
+            connection = self.pool.acquire(
+                self.session_key, generation=generation
+            )
+        except (ConnectionError, GvmError) as e:
+            self.connection_error = e
+            raise
+
+        with self._lock:
+            self.connections.append(connection)
+
+        if self.session_key and connection.key != self.session_key:
+            try:
+                connection.gmp.authenticate(
+                    self.session['username'], self.session['password']
+                )
+            except GvmResponseError as e:
+                self.authentication_error = e
+                raise
+            except (ConnectionError, GvmError) as e:
+                self.connection_error = e
+                raise
+
+            connection.key = self.session_key
+            connection.generation = generation
+
+        return connection
+
+    def _take_connections(self) -> List[PooledConnection]:
+        with self._lock:
+            connections = self.connections
+            self.connections = []
+        return connections
+
+    def discard(self):
+        for connection in self._take_connections():
+            self.pool.discard(connection)
 
-DEFAULT_SETTINGS = {'GMP_SOCKET_PATH': '/var/run/gvmd.sock'}
+    def release(
+        self,
+        current_session_key: Optional[SessionKey],
+        *,
+        session_idle_timeout: float = None,
+    ):
+        """Return the connections to the pool after the request has been
+        processed
+
+        Args:
+            current_session_key: Session key at the end of the request
+            session_idle_timeout: Idle timeout for authenticated connections
+        """
+        session_changed = (
+            self.session_key is not None
+            and self.session_key != current_session_key
+        )
+
+        if session_changed:
+            # the session has ended or changed. connections may still be
+            # authenticated for the previous user.
+            evict_session_connections(session_key=self.session_key.session_key)
+
+        for connection in self._take_connections():
+            if not connection.gmp.is_connected():
+                self.is_broken = True
+
+            if session_changed or (
+                current_session_key is not None
+                and self.credentials_cache is None
+            ):
+                self.pool.discard(connection)
+                continue
+
+            if current_session_key is not None:
+                # the connection may have been authenticated by the login
+                connection.generation = self._generation
+
+            self.pool.release(
+                connection,
+                current_session_key,
+                idle_timeout=(
+                    session_idle_timeout if current_session_key else None
+                ),
+            )
+
+
+class LazyGmp:
+    """Proxy for the GMP connection of the current thread of a request"""
+
+    def __init__(self, connector: LazyGmpConnector):
+        self._connector = connector
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connector.get_gmp(), name)
 
 
 class HttpResponeAuthenticationRequired(HttpResponse):
     status_code = 401
 
 
-class SeleneView(GraphQLView):
+class GmpConnectionPoolMixin:
+    """Provide the SELENE settings and the pool of gvmd connections to a
+    view"""
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.settings = getattr(settings, 'SELENE', DEFAULT_SETTINGS)
+        self.settings = {
+            **DEFAULT_SETTINGS,
+            **getattr(settings, 'SELENE', {}),
+        }
         self.transform = EtreeCheckCommandTransform()
 
+    def get_connection_pool(self) -> GmpConnectionPool:
+        socket_path = self.settings['GMP_SOCKET_PATH']
+        return get_connection_pool(
+            socket_path,
+            partial(create_gmp, socket_path, self.transform),
+            size=self.settings['GMP_POOL_SIZE'],
+            idle_timeout=self.settings['GMP_POOL_IDLE_TIMEOUT'],
+            max_lifetime=self.settings['GMP_POOL_MAX_LIFETIME'],
+        )
+
+    def get_credentials_cache(self) -> Any:
+        cache_alias = self.settings['GMP_CREDENTIALS_CACHE']
+        return caches[cache_alias] if cache_alias else None
+
+
+class SeleneView(GmpConnectionPoolMixin, GraphQLView):
+    def get_query_executor(self) -> Optional[ParallelQueryExecutor]:
+        max_workers = self.settings['PARALLEL_QUERY_FIELDS']
+        if max_workers > 1:
+            return ParallelQueryExecutor(max_workers)
+        return None
+
+    def get_report_cache(self) -> Optional[ReportCache]:
+        directory = self.settings['REPORT_CACHE_DIR']
+        if not directory:
+            return None
+
+        return ReportCache(directory, self.settings['REPORT_CACHE_MAX_SIZE'])
+
+    def get_capabilities_cache(self) -> Optional[CapabilitiesCache]:
+        cache_alias = self.settings['CAPABILITIES_CACHE']
+        if not cache_alias:
+            return None
+
+        return CapabilitiesCache(
+            caches[cache_alias],
+            timeout=self.settings['CAPABILITIES_CACHE_TIMEOUT'],
+        )
+
+    def get_gmp(self, request, connector: LazyGmpConnector) -> Any:
+        gmp = LazyGmp(connector)
+
+        cache_alias = self.settings['SECINFO_CACHE']
+        username = request.session.get('username')
+        if username and (cache_alias or self.settings['SECINFO_COALESCE']):
+            gmp = SecInfoCachedGmp(
+                gmp,
+                caches[cache_alias] if cache_alias else None,
+                None if self.settings['SECINFO_SHARED'] else username,
+                timeout=self.settings['SECINFO_CACHE_TIMEOUT'],
+                feed_check_interval=self.settings[
+                    'SECINFO_FEED_CHECK_INTERVAL'
+                ],
+                lock_dir=self.settings['SECINFO_LOCK_DIR'],
+            )
+
+        entity_cache_alias = self.settings['ENTITY_CACHE']
+        if entity_cache_alias and username:
+            gmp = EntityCachedGmp(
+                gmp,
+                caches[entity_cache_alias],
+                username,
+                timeout=self.settings['ENTITY_CACHE_TIMEOUT'],
+            )
+
+        return gmp
+
+    def on_gmp_change(self, request, command: str, *args, **kwargs):
+        if changes_capabilities(command):
+            capabilities_cache = self.get_capabilities_cache()
+            if capabilities_cache is not None:
+                capabilities_cache.invalidate()
+
+        if changes_credentials(command, *args, **kwargs):
+            revoke_credentials(self.get_credentials_cache())
+
     def get_response(
         self, request, data, show_graphiql=False
     ) -> Tuple[str, int]:
         try:
-
-            connection = UnixSocketConnection(
-                path=self.settings['GMP_SOCKET_PATH']
+            connector = LazyGmpConnector(
+                self.get_connection_pool(),
+                get_session_key(request),
+                request.session,
+                credentials_cache=self.get_credentials_cache(),
+            )
+            request.gmp = MemoizedGmp(
+                self.get_gmp(request, connector),
+                on_change=partial(self.on_gmp_change, request),
             )
+            request.report_cache = self.get_report_cache()
+            request.capabilities_cache = self.get_capabilities_cache()
 
-            with Gmp(connection=connection, transform=self.transform) as gmp:
-                request.gmp = gmp
+            executor = self.get_query_executor()
+            if executor is not None:
+                self.executor = executor
 
-                if request.session.get('username'):
-                    username = request.session['username']
-                    password = request.session['password']
-                    try:
-                        gmp.authenticate(username, password)
-                    except GvmResponseError as e:
-                        result = self.get_error_result(
-                            request, e, show_graphiql
-                        )
-                        return result, 403
+            try:
+                response = super().get_response(request, data, show_graphiql)
+            except Exception:
+                connector.discard()
+                raise
+            finally:
+                if executor is not None:
+                    executor.shutdown()
 
-                return super().get_response(request, data, show_graphiql)
+            if connector.authentication_error is not None:
+                connector.discard()
+                result = self.get_error_result(
+                    request, connector.authentication_error, show_graphiql
+                )
+                return result, 403
+
+            if connector.connection_error is not None:
+                try:
+                    connector.discard()
+                finally:
+                    raise connector.connection_error
+
+            connector.release(
+                get_session_key(request),
+                session_idle_timeout=self.settings['GMP_SESSION_IDLE_TIMEOUT'],
+            )
+
+            if connector.is_broken:
+                # the connection broke while processing the request. maybe
+                # gvmd has been restarted with a different version.
+                forget_supported_gmp(self.settings['GMP_SOCKET_PATH'])
+
+            return response
 
         except GvmClientError as e:
             # not sure if the session should get flushed
@@ -81,6 +456,8 @@ class SeleneView(GraphQLView):
             result = self.get_error_result(request, e, pretty=show_graphiql)
             return result, 400
         except (ConnectionError, GvmError) as e:
+            forget_supported_gmp(self.settings['GMP_SOCKET_PATH'])
+
             result = self.get_error_result(request, e, pretty=show_graphiql)
             return result, 500
         except AuthenticationRequired as e:
@@ -120,6 +497,265 @@ class SeleneView(GraphQLView):
         return super().format_error(graphql_error)
 
 
+class GmpStreamingHttpResponse(StreamingHttpResponse):
+    """Streaming HTTP response of a GMP response stream
+
+    The content of the stream may be wrapped, e.g. for compressing it. django
+    closes the response after sending it or when the client has gone away.
+    Closing the response closes the content of the stream too, which returns
+    its gvmd connection. Further arguments are passed on to
+    StreamingHttpResponse.
+
+    Args:
+        stream_content: The content of the stream
+    """
+
+    def __init__(self, *args, stream_content: StreamContent, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.stream_content = stream_content
+
+    def close(self):
+        try:
+            super().close()
+        finally:
+            self.stream_content.close()
+
+
+class GmpStreamingView(GmpConnectionPoolMixin, View):
+    """Base class for views streaming a GMP response to the client
+
+    The command is sent by the view itself over a pooled gvmd connection. Its
+    response is passed on to the client chunk by chunk while it is read from
+    the gvmd socket. Therefore large responses are never held in memory
+    completely.
+
+    Subclasses parse the query parameters via get_command_arguments, create
+    the GMP command via create_command and the HTTP response via
+    create_response.
+    """
+
+    stream_class = XmlResponseStream
+
+    def get(self, request, **kwargs):
+        session_key = get_session_key(request)
+        if session_key is None:
+            return HttpResponeAuthenticationRequired('Not Authorized')
+
+        try:
+            arguments = self.get_command_arguments(request, **kwargs)
+        except ValueError as e:
+            return HttpResponseBadRequest(str(e))
+
+        connector = LazyGmpConnector(
+            self.get_connection_pool(),
+            session_key,
+            request.session,
+            credentials_cache=self.get_credentials_cache(),
+        )
+
+        try:
+            gmp = connector.get_gmp()
+            stream = self.stream_class(get_gvm_connection(gmp))
+            stream.send(self.create_command(gmp, **arguments))
+            stream.read_header()
+        except GvmResponseError as e:
+            connector.discard()
+
+            if connector.authentication_error is not None:
+                return HttpResponse(str(e), status=403)
+
+            status = 404 if e.status == '404' else 400
+            return HttpResponse(str(e), status=status)
+        except (ConnectionError, GvmError, OSError) as e:
+            connector.discard()
+            forget_supported_gmp(self.settings['GMP_SOCKET_PATH'])
+            return HttpResponse(str(e), status=500)
+
+        content = StreamContent(
+            stream, partial(self.finish_stream, connector, session_key)
+        )
+        return self.create_response(request, content, stream, **arguments)
+
+    def get_command_arguments(self, request, **kwargs) -> Dict[str, Any]:
+        """Return the arguments for create_command
+
+        Raises ValueError for invalid query parameters.
+        """
+        raise NotImplementedError()
+
+    def create_command(self, gmp: Any, **arguments) -> str:
+        raise NotImplementedError()
+
+    def create_response(
+        self,
+        request,
+        content: StreamContent,
+        stream: GmpResponseStream,
+        **arguments,
+    ) -> GmpStreamingHttpResponse:
+        """Return the HTTP response for the content of the stream
+
+        The content must be passed as stream_content of the response for
+        returning the connection after the response has been sent.
+        """
+        raise NotImplementedError()
+
+    def finish_stream(
+        self,
+        connector: LazyGmpConnector,
+        session_key: SessionKey,
+        finished: bool,
+    ):
+        if finished:
+            connector.release(
+                session_key,
+                session_idle_timeout=self.settings['GMP_SESSION_IDLE_TIMEOUT'],
+            )
+        else:
+            # the client has gone away, the content hasn't been requested or
+            # an error occurred. the rest of the response would still be
+            # pending on the connection.
+            connector.discard()
+
+
+class ReportDownloadView(GmpStreamingView):
+    """Download a report rendered by a report format
+
+    Base64 encoded report content is decoded on the fly. This avoids holding
+    the whole report in memory like querying it via GraphQL does.
+
+    The report format must be passed as report_format_id query parameter.
+    Optionally a delta_report_id and a filter can be passed.
+    """
+
+    stream_class = ReportContentStream
+
+    def get_command_arguments(self, request, **kwargs) -> Dict[str, Any]:
+        try:
+            report_format_id = parse_uuid(request.GET.get('report_format_id'))
+            delta_report_id = parse_uuid(request.GET.get('delta_report_id'))
+        except ValueError:
+            raise ValueError('Invalid report format or report ID') from None
+
+        if report_format_id is None:
+            raise ValueError('report_format_id is required')
+
+        return {
+            'report_id': kwargs['report_id'],
+            'report_format_id': report_format_id,
+            'delta_report_id': delta_report_id,
+            'filter_string': request.GET.get('filter', ''),
+        }
+
+    def create_command(self, gmp: Any, **arguments) -> str:
+        delta_report_id = arguments['delta_report_id']
+        return build_gmp_command(
+            gmp,
+            'get_report',
+            str(arguments['report_id']),
+            filter=arguments['filter_string'],
+            report_format_id=str(arguments['report_format_id']),
+            delta_report_id=str(delta_report_id) if delta_report_id else None,
+            ignore_pagination=True,
+            details=True,
+        )
+
+    def create_response(
+        self,
+        request,
+        content: StreamContent,
+        stream: ReportContentStream,
+        **arguments,
+    ) -> GmpStreamingHttpResponse:
+        response = GmpStreamingHttpResponse(
+            content,
+            content_type=stream.content_type or 'application/octet-stream',
+            stream_content=content,
+        )
+
+        filename = f'report-{arguments["report_id"]}'
+        if stream.extension:
+            filename = f'{filename}.{stream.extension}'
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+
+        return response
+
+
+class ExportView(GmpStreamingView):
+    """Export entities as XML
+
+    The entities can be selected by a filter query parameter or by several
+    id query parameters. All entity types which can be exported via the
+    ExportByFilter and ExportByIds mutations are supported. The response is
+    compressed with gzip if the client accepts it.
+    """
+
+    def get_command_arguments(self, request, **kwargs) -> Dict[str, Any]:
+        export_name = kwargs['export_name']
+        export_command = get_export_command(export_name)
+        if export_command is None:
+            raise Http404(f'Unknown entity type {export_name}')
+
+        entity_ids = request.GET.getlist('id')
+        if entity_ids:
+            try:
+                entity_ids = [parse_uuid(entity_id) for entity_id in entity_ids]
+            except ValueError:
+                raise ValueError('Invalid ID') from None
+
+            filter_string = get_export_filter_by_ids(entity_ids)
+        else:
+            filter_string = request.GET.get('filter', '')
+
+        return {
+            'export_name': export_name,
+            'export_command': export_command,
+            'filter_string': filter_string,
+        }
+
+    def create_command(self, gmp: Any, **arguments) -> str:
+        export_command: ExportCommand = arguments['export_command']
+
+        kwargs = dict(export_command.kwargs)
+        if export_command.details:
+            # not all get_entities function has details argument
+            kwargs['details'] = True
+
+        return build_gmp_command(
+            gmp,
+            export_command.name,
+            filter=arguments['filter_string'],
+            **kwargs,
+        )
+
+    def create_response(
+        self,
+        request,
+        content: StreamContent,
+        stream: XmlResponseStream,
+        **arguments,
+    ) -> GmpStreamingHttpResponse:
+        if 'gzip' in request.META.get('HTTP_ACCEPT_ENCODING', ''):
+            response = GmpStreamingHttpResponse(
+                gzip_chunks(content),
+                content_type='application/xml',
+                stream_content=content,
+            )
+            response['Content-Encoding'] = 'gzip'
+        else:
+            response = GmpStreamingHttpResponse(
+                content, content_type='application/xml', stream_content=content
+            )
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        filename = f'{arguments["export_name"]}.xml'
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+
+        return response
+
+
 def main():
     return SeleneView.as_view(graphiql=True, schema=schema)
 